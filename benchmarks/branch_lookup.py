@@ -0,0 +1,89 @@
+"""Time a single branch existence check against repositories with many branches.
+
+Creates one repository with M local branches and compares a full branch
+listing (`git for-each-ref refs/heads/`, the snapshot the repository layer
+loads for listing and upstream queries) with the direct ref lookup used by
+`branch_exists`. Both are measured with loose refs and again after
+`git pack-refs --all`, since long-lived repositories keep most refs packed.
+
+Usage:
+    uv run python benchmarks/branch_lookup.py [--branches M] [--rounds R]
+"""
+
+import argparse
+import os
+import subprocess
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from bench.repository import git as git_repository
+
+_GIT_ENV = {
+    **os.environ,
+    "GIT_AUTHOR_NAME": "bench",
+    "GIT_AUTHOR_EMAIL": "bench@example.com",
+    "GIT_COMMITTER_NAME": "bench",
+    "GIT_COMMITTER_EMAIL": "bench@example.com",
+}
+
+
+def _make_repo(path: Path, branches: int) -> None:
+    """Create a repository with one commit and `branches` extra local branches."""
+    path.mkdir()
+    subprocess.run(["git", "init", "-q", "-b", "main"], cwd=path, check=True)
+    subprocess.run(
+        ["git", "commit", "-q", "--allow-empty", "-m", "init"],
+        cwd=path,
+        check=True,
+        env=_GIT_ENV,
+    )
+    refs = "".join(f"create refs/heads/branch-{i} HEAD\n" for i in range(branches))
+    subprocess.run(
+        ["git", "update-ref", "--stdin"], cwd=path, input=refs, text=True, check=True
+    )
+
+
+def _time(fn: Callable[[], object], rounds: int) -> float:
+    """Return the mean wall time of `fn` in milliseconds, with a cold cache."""
+    total = 0.0
+    for _ in range(rounds):
+        git_repository.clear_git_cache()
+        start = time.perf_counter()
+        fn()
+        total += time.perf_counter() - start
+    return total / rounds * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--branches", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo_path = Path(tmp) / "repo"
+        _make_repo(repo_path, args.branches)
+        target = f"branch-{args.branches - 1}"
+
+        rows: list[tuple[str, float, float]] = []
+        for layout in ["loose", "packed"]:
+            if layout == "packed":
+                subprocess.run(["git", "pack-refs", "--all"], cwd=repo_path, check=True)
+            listing = _time(
+                lambda: git_repository.list_local_branches(repo_path), args.rounds
+            )
+            lookup = _time(
+                lambda: git_repository.branch_exists(target, repo_path), args.rounds
+            )
+            rows.append((layout, listing, lookup))
+
+    print(f"branches={args.branches} rounds={args.rounds}")
+    print(f"{'refs':<8}{'listing ms':>12}{'lookup ms':>12}")
+    for layout, listing, lookup in rows:
+        print(f"{layout:<8}{listing:>12.2f}{lookup:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
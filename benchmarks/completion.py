@@ -0,0 +1,131 @@
+"""Measure shell completion latency for task names on a large workbench.
+
+Generates a workbench with T tasks (every other one completed) and D
+discussions, then times `bench task implement <TAB>` as a bash completion in a
+fresh interpreter, the way the shell invokes it:
+
+- "typer": the full CLI (`bench.cli.app`), i.e. the path before the fast path.
+- "cold": the `bench` entry point with the completion index removed.
+- "warm": the `bench` entry point with an up-to-date completion index.
+
+Exits non-zero if the warm completion exceeds the budget.
+
+Usage:
+    uv run python benchmarks/completion.py [--tasks T] [--budget-ms 50]
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from bench.repository.filesystem import (
+    CACHE_DIR_NAME,
+    create_bench_scaffold,
+    save_yaml_file,
+)
+
+_FAST_SNIPPET = "from bench.launcher import main; main()"
+_TYPER_SNIPPET = "from bench.cli import app; app(prog_name='bench')"
+
+
+def _make_workbench(root: Path, tasks: int, discussions: int) -> Path:
+    """Create a project with one workbench holding many tasks; return the workbench path."""
+    create_bench_scaffold(root)
+    wb_path = root / "workbench" / "wb"
+    bench_path = wb_path / "bench"
+    (bench_path / "tasks").mkdir(parents=True)
+    (bench_path / "discussions").mkdir()
+    save_yaml_file(
+        bench_path / "workbench-config.yaml",
+        {"name": "wb", "source": "src", "git-branch": "wb", "repos": []},
+    )
+    for i in range(tasks):
+        task_dir = (
+            bench_path / "tasks" / f"2026{1 + i % 12:02d}{1 + i % 28:02d} - task-{i}"
+        )
+        task_dir.mkdir()
+        save_yaml_file(
+            task_dir / "task.yaml",
+            {"name": f"task-{i}", "completed": "2026-01-01" if i % 2 else None},
+        )
+    for i in range(discussions):
+        (bench_path / "discussions" / f"20260101 - topic-{i}.md").write_text("")
+
+    # Recently modified files are never trusted from the index; age everything.
+    past = time.time() - 60
+    for path in [wb_path, *wb_path.rglob("*")]:
+        os.utime(path, (past, past))
+    return wb_path
+
+
+def _time(cwd: Path, snippet: str, rounds: int, before: object = None) -> float:
+    """Return the mean wall time of one completion subprocess in milliseconds."""
+    env = {
+        **os.environ,
+        "_BENCH_COMPLETE": "complete_bash",
+        "COMP_WORDS": "bench task implement task-1",
+        "COMP_CWORD": "3",
+    }
+    total = 0.0
+    for _ in range(rounds):
+        if callable(before):
+            before()
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-c", snippet],
+            cwd=cwd,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        total += time.perf_counter() - start
+        if "task-10" not in result.stdout.split():
+            raise SystemExit(f"unexpected completion output: {result.stdout[:200]!r}")
+    return total / rounds * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=2000)
+    parser.add_argument("--discussions", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=50.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        wb_path = _make_workbench(Path(tmp), args.tasks, args.discussions)
+        cache_dir = wb_path / "bench" / CACHE_DIR_NAME
+
+        def drop_index() -> None:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+
+        rows = [
+            ("typer", _time(wb_path, _TYPER_SNIPPET, max(args.rounds // 2, 1))),
+            (
+                "cold",
+                _time(wb_path, _FAST_SNIPPET, max(args.rounds // 2, 1), drop_index),
+            ),
+            ("warm", _time(wb_path, _FAST_SNIPPET, args.rounds)),
+        ]
+
+    print(f"tasks={args.tasks} discussions={args.discussions}")
+    print(f"{'path':<8}{'ms':>10}")
+    for path, ms in rows:
+        print(f"{path:<8}{ms:>10.2f}")
+
+    warm_ms = rows[-1][1]
+    if warm_ms > args.budget_ms:
+        raise SystemExit(
+            f"warm completion {warm_ms:.1f} ms exceeds {args.budget_ms} ms"
+        )
+    print(f"warm completion within {args.budget_ms:.0f} ms budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Measure config loading and tab-completion latency with and without the config cache.
+
+Generates a project whose base-config.yaml lists S sources and W workbenches,
+then measures:
+
+- `detect_mode` in-process, with every cache cleared ("parse"), with only the
+  on-disk cache ("disk", i.e. a fresh process on an unchanged project) and
+  with the in-process memo ("memo").
+- End-to-end `bench workbench activate <TAB>` completion in a subprocess,
+  with the on-disk cache removed before every run ("cold") and kept ("warm").
+
+Usage:
+    uv run python benchmarks/config_cache.py [--sources S] [--workbenches W]
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from bench.repository.filesystem import (
+    BASE_CONFIG_FILENAME,
+    CACHE_DIR_NAME,
+    create_bench_scaffold,
+    load_yaml_file,
+    save_yaml_file,
+)
+from bench.service import mode_detection
+
+_COMPLETE_SNIPPET = "from bench.cli import app; app(prog_name='bench')"
+
+
+def _make_project(root: Path, sources: int, workbenches: int) -> Path:
+    """Create a bench project with a large base config and return its .bench dir."""
+    create_bench_scaffold(root)
+    bench_dir = root / ".bench"
+    config_path = bench_dir / BASE_CONFIG_FILENAME
+    data = load_yaml_file(config_path)
+    data["sources"] = [
+        {
+            "name": f"source-{i}",
+            "repos": [{"dir": f"repo-{j}", "source-branch": "main"} for j in range(5)],
+        }
+        for i in range(sources)
+    ]
+    data["workbenches"] = [
+        {
+            "name": f"wb-{i}",
+            "source": f"source-{i % max(sources, 1)}",
+            "git-branch": f"wb-{i}",
+            "status": "inactive" if i % 2 else "active",
+        }
+        for i in range(workbenches)
+    ]
+    save_yaml_file(config_path, data)
+    # Configs written within the last moments are never cached; age the file.
+    past = time.time() - 60
+    os.utime(config_path, (past, past))
+    return bench_dir
+
+
+def _time(fn: Callable[[], object], rounds: int) -> float:
+    """Return the mean wall time of `fn` in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sources", type=int, default=50)
+    parser.add_argument("--workbenches", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        bench_dir = _make_project(root, args.sources, args.workbenches)
+        cache_dir = bench_dir / CACHE_DIR_NAME
+
+        def drop_disk_cache() -> None:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+
+        def parse() -> None:
+            drop_disk_cache()
+            mode_detection._config_memo.clear()
+            mode_detection.detect_mode(root)
+
+        def disk() -> None:
+            mode_detection._config_memo.clear()
+            mode_detection.detect_mode(root)
+
+        in_process = [
+            ("parse", _time(parse, args.rounds)),
+            ("disk", _time(disk, args.rounds)),
+            ("memo", _time(lambda: mode_detection.detect_mode(root), args.rounds)),
+        ]
+
+        env = {
+            **os.environ,
+            "_BENCH_COMPLETE": "complete_bash",
+            "COMP_WORDS": "bench workbench activate ",
+            "COMP_CWORD": "3",
+        }
+
+        def complete() -> None:
+            subprocess.run(
+                [sys.executable, "-c", _COMPLETE_SNIPPET],
+                cwd=root,
+                env=env,
+                capture_output=True,
+                check=True,
+            )
+
+        def complete_cold() -> None:
+            drop_disk_cache()
+            complete()
+
+        completion_rounds = max(args.rounds // 4, 1)
+        completion = [
+            ("cold", _time(complete_cold, completion_rounds)),
+            ("warm", _time(complete, completion_rounds)),
+        ]
+
+    print(f"sources={args.sources} workbenches={args.workbenches}")
+    print(f"{'detect_mode':<14}{'ms':>10}")
+    for mode, ms in in_process:
+        print(f"{mode:<14}{ms:>10.2f}")
+    print(f"{'completion':<14}{'ms':>10}")
+    for mode, ms in completion:
+        print(f"{mode:<14}{ms:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Count git subprocess spawns for the per-repo queries bench commands make.
+
+Builds N throwaway repositories with M branches each and runs the query mix
+of `source add` / `workbench create` / `workbench delete` against every repo:
+validate the repo, list its branches, check the workbench branch and look up
+its upstream. The "uncached" column clears the git cache before every query,
+which reproduces the one-process-per-query behavior of the repository layer
+before batching; the "cached" column is the current behavior.
+
+Usage:
+    uv run python benchmarks/git_spawns.py [--repos N] [--branches M]
+"""
+
+import argparse
+import os
+import subprocess
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from bench.repository import git as git_repository
+
+_GIT_ENV = {
+    **os.environ,
+    "GIT_AUTHOR_NAME": "bench",
+    "GIT_AUTHOR_EMAIL": "bench@example.com",
+    "GIT_COMMITTER_NAME": "bench",
+    "GIT_COMMITTER_EMAIL": "bench@example.com",
+}
+
+
+def _make_repo(path: Path, branches: int) -> None:
+    """Create a repository with one commit and `branches` extra local branches."""
+    path.mkdir()
+    subprocess.run(["git", "init", "-q", "-b", "main"], cwd=path, check=True)
+    subprocess.run(
+        ["git", "commit", "-q", "--allow-empty", "-m", "init"],
+        cwd=path,
+        check=True,
+        env=_GIT_ENV,
+    )
+    refs = "".join(f"create refs/heads/branch-{i} HEAD\n" for i in range(branches))
+    subprocess.run(
+        ["git", "update-ref", "--stdin"], cwd=path, input=refs, text=True, check=True
+    )
+
+
+def _measure(repos: list[Path], uncached: bool) -> tuple[int, float]:
+    """Run the query mix over all repos and return (git spawns, seconds)."""
+    spawns = 0
+    original_run = subprocess.run
+
+    def counting_run(*args: object, **kwargs: object) -> object:
+        nonlocal spawns
+        spawns += 1
+        return original_run(*args, **kwargs)  # type: ignore[arg-type]
+
+    def query(fn: Callable[[], object]) -> None:
+        if uncached:
+            git_repository.clear_git_cache()
+        fn()
+
+    git_repository.clear_git_cache()
+    git_repository.subprocess.run = counting_run  # type: ignore[assignment]
+    try:
+        start = time.perf_counter()
+        for repo_path in repos:
+            query(lambda: git_repository.is_git_repository(repo_path))
+            query(lambda: git_repository.list_local_branches(repo_path))
+            query(lambda: git_repository.branch_exists("my-workbench", repo_path))
+            query(lambda: git_repository.branch_exists("main", repo_path))
+            query(lambda: git_repository._has_upstream("main", repo_path))
+        elapsed = time.perf_counter() - start
+    finally:
+        git_repository.subprocess.run = original_run
+    return spawns, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repos", type=int, default=25)
+    parser.add_argument("--branches", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repos = [Path(tmp) / f"repo-{i}" for i in range(args.repos)]
+        for repo_path in repos:
+            _make_repo(repo_path, args.branches)
+
+        uncached_spawns, uncached_seconds = _measure(repos, uncached=True)
+        cached_spawns, cached_seconds = _measure(repos, uncached=False)
+
+    print(f"repos={args.repos} branches/repo={args.branches}")
+    print(f"{'mode':<10}{'git spawns':>12}{'per repo':>10}{'seconds':>10}")
+    for mode, spawns, seconds in [
+        ("uncached", uncached_spawns, uncached_seconds),
+        ("cached", cached_spawns, cached_seconds),
+    ]:
+        print(f"{mode:<10}{spawns:>12}{spawns / args.repos:>10.1f}{seconds:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
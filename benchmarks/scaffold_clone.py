@@ -0,0 +1,125 @@
+"""Compare workbench scaffold creation time and disk usage per clone mode.
+
+Builds a project bench directory whose files/ and maps/ hold F files of S KiB
+each (discussions/, prompts/ and scripts/ stay small), then creates W
+workbench scaffolds with every directory set to each clone mode in turn and
+reports:
+
+- ms/wb: mean create_workbench_scaffold wall time per workbench
+- inode MiB: blocks of the inodes the W scaffolds added to the bench
+  directory (hardlinks and shared blobs add none; reflinked files still
+  count in full)
+- fs MiB: growth of the filesystem's used space (the only number that shows
+  reflink sharing)
+- methods: how the files of one cloned tree were created
+
+Reflinks need a filesystem that supports them (e.g., Btrfs or XFS); point
+--dir at one to see them, otherwise REFLINK falls back to copies.
+
+Usage:
+    uv run python benchmarks/scaffold_clone.py [--files F] [--file-kb S] \\
+        [--workbenches W] [--dir DIR]
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from bench.model import CloneMode
+from bench.repository.blobstore import BLOB_STORE_DIR_NAME, clone_shared_tree
+from bench.repository.filesystem import clone_tree, create_workbench_scaffold
+
+_DATA_DIRS = ["files", "maps"]
+_SMALL_DIRS = ["discussions", "prompts", "scripts"]
+
+
+def _make_project(bench_dir: Path, files: int, file_kb: int) -> None:
+    """Create a bench directory with `files` files of `file_kb` KiB per data dir."""
+    bench_dir.mkdir(parents=True)
+    (bench_dir / "AGENTS.md").write_text("# Agents\n")
+    for dir_name in _DATA_DIRS:
+        for i in range(files):
+            path = bench_dir / dir_name / f"part-{i % 10}" / f"{dir_name}-{i}.md"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(os.urandom(file_kb * 1024))
+    for dir_name in _SMALL_DIRS:
+        (bench_dir / dir_name).mkdir()
+        (bench_dir / dir_name / ".gitkeep").touch()
+
+
+def _fs_used(path: Path) -> int:
+    """Return the bytes in use on the filesystem holding `path`."""
+    os.sync()
+    st = os.statvfs(path)
+    return (st.f_blocks - st.f_bfree) * st.f_frsize
+
+
+def _inode_bytes(root: Path) -> int:
+    """Return the allocated bytes of the distinct inodes under `root`."""
+    seen: set[tuple[int, int]] = set()
+    total = 0
+    for dirpath, _dirnames, filenames in os.walk(root):
+        for filename in filenames:
+            st = os.lstat(os.path.join(dirpath, filename))
+            if (st.st_dev, st.st_ino) not in seen:
+                seen.add((st.st_dev, st.st_ino))
+                total += st.st_blocks * 512
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--file-kb", type=int, default=256)
+    parser.add_argument("--workbenches", type=int, default=5)
+    parser.add_argument("--dir", default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        root = Path(tmp)
+        bench_dir = root / ".bench"
+        _make_project(bench_dir, args.files, args.file_kb)
+        data_mib = 2 * args.files * args.file_kb / 1024
+
+        print(
+            f"data per workbench: {data_mib:.0f} MiB in {2 * args.files} files, "
+            f"workbenches={args.workbenches}"
+        )
+        print(f"{'mode':<10}{'ms/wb':>10}{'inode MiB':>12}{'fs MiB':>10}  methods")
+        for mode in CloneMode:
+            if mode == CloneMode.SHARED:
+                counts = clone_shared_tree(
+                    bench_dir / "maps", root / "probe", bench_dir / BLOB_STORE_DIR_NAME
+                )
+            else:
+                counts = clone_tree(bench_dir / "maps", root / "probe", mode)
+            shutil.rmtree(root / "probe")
+
+            inodes_before = _inode_bytes(bench_dir)
+            used_before = _fs_used(root)
+            start = time.perf_counter()
+            for i in range(args.workbenches):
+                create_workbench_scaffold(
+                    root,
+                    ".bench",
+                    f"wb-{i}",
+                    {"name": f"wb-{i}"},
+                    clone_modes={d: mode for d in _DATA_DIRS + _SMALL_DIRS},
+                )
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            fs_bytes = _fs_used(root) - used_before
+            inode_bytes = _inode_bytes(bench_dir) - inodes_before
+
+            methods = ", ".join(f"{k}={v}" for k, v in counts.items() if v)
+            print(
+                f"{mode.value:<10}{elapsed_ms / args.workbenches:>10.1f}"
+                f"{inode_bytes / 2**20:>12.1f}{fs_bytes / 2**20:>10.1f}  {methods}"
+            )
+            shutil.rmtree(bench_dir / "workbench")
+
+
+if __name__ == "__main__":
+    main()
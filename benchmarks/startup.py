@@ -0,0 +1,107 @@
+"""Guard `bench` CLI startup: imported modules and wall-clock time per command.
+
+Runs a few cheap commands in a fresh interpreter against a scratch project:
+
+- once under `python -X importtime`, failing if a command imports the CLI
+  module of any other top-level subcommand (subcommands are loaded lazily, see
+  bench.cli._lazy), and printing the slowest imports of the first command;
+- R more times for the mean wall-clock time, failing if `--budget-ms` is given
+  and any command exceeds it.
+
+Usage:
+    uv run python benchmarks/startup.py [--rounds R] [--budget-ms MS]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from bench.cli._lazy import LAZY_SUBCOMMANDS
+from bench.repository.filesystem import create_bench_scaffold
+
+_ENTRY = "import sys; sys.argv[0] = 'bench'; from bench.launcher import main; main()"
+
+_COMMANDS: list[list[str]] = [
+    ["status"],
+    ["workbench", "list"],
+    ["source", "list"],
+]
+
+
+def _run(
+    args: list[str], cwd: Path, importtime: bool
+) -> subprocess.CompletedProcess[str]:
+    """Run one bench command in a fresh interpreter."""
+    flags = ["-X", "importtime"] if importtime else []
+    return subprocess.run(
+        [sys.executable, *flags, "-c", _ENTRY, *args],
+        cwd=cwd,
+        env={**os.environ, "COLUMNS": "120"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _imports(stderr: str) -> list[tuple[str, int]]:
+    """Parse `-X importtime` output into (module, cumulative microseconds)."""
+    modules: list[tuple[str, int]] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        modules.append((name.strip(), int(cumulative)))
+    return modules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    failures: list[str] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        create_bench_scaffold(root)
+
+        rows: list[tuple[str, int, float]] = []
+        for i, command in enumerate(_COMMANDS):
+            label = " ".join(command)
+            imports = _imports(_run(command, root, importtime=True).stderr)
+            imported = {name for name, _ in imports}
+            for name, module in LAZY_SUBCOMMANDS.items():
+                if name != command[0] and module in imported:
+                    failures.append(f"'bench {label}' imports {module}")
+
+            if i == 0:
+                print(f"slowest imports for 'bench {label}' (cumulative ms):")
+                for name, micros in sorted(imports, key=lambda m: -m[1])[: args.top]:
+                    print(f"  {micros / 1000:>8.1f}  {name}")
+                print()
+
+            start = time.perf_counter()
+            for _ in range(args.rounds):
+                _run(command, root, importtime=False)
+            mean_ms = (time.perf_counter() - start) / args.rounds * 1000
+            rows.append((label, len(imports), mean_ms))
+            if args.budget_ms is not None and mean_ms > args.budget_ms:
+                failures.append(
+                    f"'bench {label}' took {mean_ms:.1f} ms (budget {args.budget_ms} ms)"
+                )
+
+    print(f"{'command':<18}{'modules':>9}{'ms':>10}")
+    for label, modules, mean_ms in rows:
+        print(f"{label:<18}{modules:>9}{mean_ms:>10.1f}")
+
+    if failures:
+        raise SystemExit("\n".join(["", *failures]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,309 @@
+"""Time bench's hot paths on a synthetic project and emit the results as JSON.
+
+Generates a project with N git repositories of M branches each, one source
+over all of them, W workbenches (created through the workbench service, so
+with real git worktrees), T tasks per workbench and D shared discussions. A
+stub `opencode` that exits at once is put first on PATH, so nothing reaches
+a real agent. Then times, R rounds each:
+
+- in-process: `detect_mode` (config memo cleared), `list_tasks`,
+  `list_workbenches`, `find_task_folder`, and `create_workbench` followed by
+  `retire_workbench` on a fresh workbench per round;
+- in a fresh interpreter (P rounds each): `bench task implement <TAB>`
+  completion in a workbench and `bench status` startup at the project root.
+
+The JSON document (bench version, Python, parameters, and min / median /
+mean / max milliseconds per benchmark) goes to stdout or --output. With
+--compare, medians are checked against an earlier document and the script
+exits non-zero if any is more than --tolerance percent slower.
+
+Usage:
+    uv run python benchmarks/suite.py [--repos N] [--branches M]
+        [--workbenches W] [--tasks T] [--discussions D] [--rounds R]
+        [--process-rounds P] [--output FILE] [--compare FILE] [--tolerance PCT]
+"""
+
+import argparse
+import contextlib
+import importlib.metadata
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from bench.model.task import TaskFilter
+from bench.model.workbench import WorkbenchFilter
+from bench.repository.filesystem import (
+    BENCH_DIR_NAME_DEFAULT,
+    BENCH_SUBDIR_NAME,
+    DISCUSSIONS_DIR_NAME,
+    TASKS_DIR_NAME,
+    WORKBENCH_DIR_NAME,
+    find_task_folder,
+    save_yaml_file,
+)
+from bench.service import mode_detection
+from bench.service.init import initialize_project
+from bench.service.source import add_source
+from bench.service.task import list_tasks
+from bench.service.workbench import (
+    create_workbench,
+    list_workbenches,
+    retire_workbenches,
+)
+
+_ENTRY = "import sys; sys.argv[0] = 'bench'; from bench.launcher import main; main()"
+
+_GIT_ENV = {
+    "GIT_AUTHOR_NAME": "bench",
+    "GIT_AUTHOR_EMAIL": "bench@example.com",
+    "GIT_COMMITTER_NAME": "bench",
+    "GIT_COMMITTER_EMAIL": "bench@example.com",
+}
+
+_STUB_OPENCODE = "#!/bin/sh\nexit 0\n"
+
+
+def _make_repo(path: Path, branches: int) -> None:
+    """Create a repository with one commit and `branches` extra local branches."""
+    path.mkdir()
+    subprocess.run(["git", "init", "-q", "-b", "main"], cwd=path, check=True)
+    (path / "README.md").write_text(f"# {path.name}\n")
+    subprocess.run(["git", "add", "README.md"], cwd=path, check=True)
+    subprocess.run(["git", "commit", "-q", "-m", "init"], cwd=path, check=True)
+    refs = "".join(f"create refs/heads/branch-{i} HEAD\n" for i in range(branches))
+    subprocess.run(
+        ["git", "update-ref", "--stdin"], cwd=path, input=refs, text=True, check=True
+    )
+
+
+def _make_tasks(wb_path: Path, tasks: int) -> None:
+    """Write task folders into a workbench (every other one completed)."""
+    tasks_dir = wb_path / BENCH_SUBDIR_NAME / TASKS_DIR_NAME
+    for i in range(tasks):
+        task_dir = tasks_dir / f"2026{1 + i % 12:02d}{1 + i % 28:02d} - task-{i}"
+        task_dir.mkdir(parents=True)
+        save_yaml_file(
+            task_dir / "task.yaml",
+            {"name": f"task-{i}", "completed": "2026-01-01" if i % 2 else None},
+        )
+        (task_dir / "spec.md").write_text(f"# task-{i}\n")
+
+
+def _make_project(root: Path, args: argparse.Namespace) -> list[Path]:
+    """Generate the synthetic project under root and return its workbench paths."""
+    repos = [f"repo-{i}" for i in range(args.repos)]
+    for repo in repos:
+        _make_repo(root / repo, args.branches)
+
+    os.chdir(root)
+    initialize_project(root)
+    discussions_dir = root / BENCH_DIR_NAME_DEFAULT / DISCUSSIONS_DIR_NAME
+    for i in range(args.discussions):
+        (discussions_dir / f"20260101 - topic-{i}.md").write_text(f"# topic-{i}\n")
+    add_source("src", [f"{repo}:main" for repo in repos])
+
+    wb_paths: list[Path] = []
+    for i in range(args.workbenches):
+        os.chdir(root)
+        create_workbench("src", f"wb-{i}")
+        wb_path = root / WORKBENCH_DIR_NAME / f"wb-{i}"
+        _make_tasks(wb_path, args.tasks)
+        wb_paths.append(wb_path)
+
+    # Recently modified files are never trusted from a cache; age everything
+    # bench reads
+    past = time.time() - 60
+    for path in [root / BENCH_DIR_NAME_DEFAULT, *wb_paths]:
+        for item in [path, *path.rglob("*")]:
+            if not item.is_symlink():
+                os.utime(item, (past, past))
+    return wb_paths
+
+
+def _measure(
+    fn: Callable[[int], object], rounds: int, before: Callable[[], object] | None = None
+) -> list[float]:
+    """Return the wall time of each of `rounds` calls of fn(round), in milliseconds."""
+    times: list[float] = []
+    for i in range(rounds):
+        if before is not None:
+            before()
+        start = time.perf_counter()
+        fn(i)
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def _summary(times: list[float]) -> dict[str, float | int]:
+    return {
+        "rounds": len(times),
+        "min_ms": round(min(times), 3),
+        "median_ms": round(statistics.median(times), 3),
+        "mean_ms": round(statistics.fmean(times), 3),
+        "max_ms": round(max(times), 3),
+    }
+
+
+def _run_bench(args: list[str], cwd: Path, env: dict[str, str]) -> None:
+    """Run the bench entry point in a fresh interpreter."""
+    subprocess.run(
+        [sys.executable, "-c", _ENTRY, *args],
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        check=True,
+    )
+
+
+def _run_suite(root: Path, args: argparse.Namespace) -> dict[str, list[float]]:
+    wb_paths = _make_project(root, args)
+    wb_path = wb_paths[0]
+    tasks_dir = wb_path / BENCH_SUBDIR_NAME / TASKS_DIR_NAME
+    last_task = f"task-{args.tasks - 1}"
+    results: dict[str, list[float]] = {}
+
+    os.chdir(wb_path)
+    results["detect_mode"] = _measure(
+        lambda _: mode_detection.detect_mode(wb_path),
+        args.rounds,
+        before=mode_detection._config_memo.clear,
+    )
+    results["list_tasks"] = _measure(lambda _: list_tasks(TaskFilter.ALL), args.rounds)
+    results["find_task_folder"] = _measure(
+        lambda _: find_task_folder(tasks_dir, last_task), args.rounds
+    )
+
+    os.chdir(root)
+    results["list_workbenches"] = _measure(
+        lambda _: list_workbenches(WorkbenchFilter.ALL), args.rounds
+    )
+    results["create_workbench"] = _measure(
+        lambda i: create_workbench("src", f"round-{i}"), args.rounds
+    )
+    results["retire_workbench"] = _measure(
+        lambda i: retire_workbenches([f"round-{i}"]), args.rounds
+    )
+
+    env = {
+        **os.environ,
+        "_BENCH_COMPLETE": "complete_bash",
+        "COMP_WORDS": "bench task implement task-1",
+        "COMP_CWORD": "3",
+    }
+    results["completion"] = _measure(
+        lambda _: _run_bench([], wb_path, env), args.process_rounds
+    )
+    results["startup"] = _measure(
+        lambda _: _run_bench(["status"], root, dict(os.environ)),
+        args.process_rounds,
+    )
+    return results
+
+
+def _bench_version() -> str:
+    try:
+        return importlib.metadata.version("bench")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _compare(report: dict[str, object], baseline_path: Path, tolerance: float) -> bool:
+    """Print each benchmark's median against a baseline report; return False on a regression."""
+    document = json.loads(baseline_path.read_text())
+    baseline = document["results"]
+    results = report["results"]
+    assert isinstance(results, dict)
+    if document.get("params") != report["params"]:
+        print(
+            f"warning: {baseline_path} was generated with other parameters "
+            f"({document.get('params')})",
+            file=sys.stderr,
+        )
+    ok = True
+    print(
+        f"{'benchmark':<18}{'baseline ms':>12}{'ms':>10}{'change':>9}",
+        file=sys.stderr,
+    )
+    for name, current in results.items():
+        before = baseline.get(name)
+        if before is None:
+            print(f"{name:<18}{'-':>12}{current['median_ms']:>10.2f}", file=sys.stderr)
+            continue
+        change = (current["median_ms"] / before["median_ms"] - 1) * 100
+        regressed = change > tolerance
+        ok = ok and not regressed
+        print(
+            f"{name:<18}{before['median_ms']:>12.2f}{current['median_ms']:>10.2f}"
+            f"{change:>+8.0f}%{'  REGRESSION' if regressed else ''}",
+            file=sys.stderr,
+        )
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repos", type=int, default=5)
+    parser.add_argument("--branches", type=int, default=200)
+    parser.add_argument("--workbenches", type=int, default=5)
+    parser.add_argument("--tasks", type=int, default=500)
+    parser.add_argument("--discussions", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--process-rounds", type=int, default=5)
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--compare", type=Path)
+    parser.add_argument("--tolerance", type=float, default=20.0)
+    args = parser.parse_args()
+    if args.workbenches < 1 or args.tasks < 1:
+        parser.error("--workbenches and --tasks must be at least 1")
+
+    cwd = Path.cwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        stub_dir = Path(tmp) / "bin"
+        stub_dir.mkdir()
+        stub = stub_dir / "opencode"
+        stub.write_text(_STUB_OPENCODE)
+        stub.chmod(0o755)
+        os.environ.update(_GIT_ENV)
+        os.environ["PATH"] = f"{stub_dir}{os.pathsep}{os.environ['PATH']}"
+
+        root = Path(tmp) / "project"
+        root.mkdir()
+        # Services report progress on stdout; keep it for the JSON document
+        try:
+            with contextlib.redirect_stdout(sys.stderr):
+                results = _run_suite(root, args)
+        finally:
+            os.chdir(cwd)
+
+    report: dict[str, object] = {
+        "bench": _bench_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": {
+            "repos": args.repos,
+            "branches": args.branches,
+            "workbenches": args.workbenches,
+            "tasks": args.tasks,
+            "discussions": args.discussions,
+        },
+        "results": {name: _summary(times) for name, times in results.items()},
+    }
+    document = json.dumps(report, indent=2)
+    if args.output is not None:
+        args.output.write_text(document + "\n")
+    else:
+        print(document)
+
+    if args.compare is not None and not _compare(report, args.compare, args.tolerance):
+        raise SystemExit(f"a benchmark regressed by more than {args.tolerance:g}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Measure task listing and lookup with and without the task index.
+
+Generates a workbench tasks directory with T tasks (every other one
+completed), then times the repository functions behind `task list`,
+`task create` (name uniqueness) and every command that resolves a task name:
+
+- "cold": the task index is deleted before every call, so each call scans
+  the directory and parses every task.yaml, as before the index existed.
+- "warm": the index is up to date.
+
+Usage:
+    uv run python benchmarks/task_index.py [--tasks T] [--rounds R]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from bench.repository.filesystem import (
+    CACHE_DIR_NAME,
+    TASK_INDEX_FILENAME,
+    find_task_folder,
+    list_task_entries,
+    list_task_names,
+    save_yaml_file,
+)
+
+
+def _make_tasks(tasks_dir: Path, tasks: int) -> None:
+    """Create `tasks` task folders with task.yaml and the standard markdown files."""
+    tasks_dir.mkdir(parents=True)
+    for i in range(tasks):
+        task_dir = tasks_dir / f"2026{1 + i % 12:02d}{1 + i % 28:02d} - task-{i}"
+        task_dir.mkdir()
+        save_yaml_file(
+            task_dir / "task.yaml",
+            {
+                "name": f"task-{i}",
+                "completed": "2026-01-01" if i % 2 else None,
+                "repos": [],
+            },
+        )
+        for filename in ["spec.md", "files.md", "impl.md", "notes.md", "journal.md"]:
+            (task_dir / filename).write_text("x" if i % 3 else "")
+
+    # Recently modified files are never trusted from the index; age everything.
+    past = time.time() - 60
+    for path in [tasks_dir, *tasks_dir.rglob("*")]:
+        os.utime(path, (past, past))
+
+
+def _time(fn: Callable[[], object], rounds: int) -> float:
+    """Return the mean wall time of `fn` in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tasks_dir = Path(tmp) / "bench" / "tasks"
+        _make_tasks(tasks_dir, args.tasks)
+        index_path = tasks_dir.parent / CACHE_DIR_NAME / TASK_INDEX_FILENAME
+        last_task = f"task-{args.tasks - 1}"
+
+        operations: list[tuple[str, Callable[[], object]]] = [
+            ("list_task_entries", lambda: list_task_entries(tasks_dir)),
+            ("list_task_names", lambda: list_task_names(tasks_dir)),
+            ("find_task_folder", lambda: find_task_folder(tasks_dir, last_task)),
+        ]
+
+        rows: list[tuple[str, float, float]] = []
+        for label, fn in operations:
+
+            def cold(fn: Callable[[], object] = fn) -> None:
+                index_path.unlink(missing_ok=True)
+                fn()
+
+            cold_ms = _time(cold, args.rounds)
+            fn()
+            warm_ms = _time(fn, args.rounds)
+            rows.append((label, cold_ms, warm_ms))
+
+    print(f"tasks={args.tasks}")
+    print(f"{'operation':<20}{'cold ms':>10}{'warm ms':>10}")
+    for label, cold_ms, warm_ms in rows:
+        print(f"{label:<20}{cold_ms:>10.1f}{warm_ms:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
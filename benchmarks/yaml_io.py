@@ -0,0 +1,98 @@
+"""Compare pure-Python and libyaml load/dump of base-config.yaml.
+
+Builds base configs with N workbench entries (and N / 10 sources) and times
+parsing and serializing them with PyYAML's pure-Python SafeLoader/SafeDumper
+against the loader and dumper the repository layer actually uses (libyaml's
+CSafeLoader/CSafeDumper when available). Also checks that both dumpers emit
+byte-identical documents and exits non-zero if they do not.
+
+Usage:
+    uv run python benchmarks/yaml_io.py [--sizes 10,1000,10000] [--rounds R]
+"""
+
+import argparse
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+import yaml
+
+from bench.repository.filesystem import YamlDumper, YamlLoader
+
+
+def _make_config(workbenches: int) -> dict[str, Any]:
+    """Return a base-config mapping with `workbenches` workbench entries."""
+    sources = max(workbenches // 10, 1)
+    return {
+        "sources": [
+            {
+                "name": f"source-{i}",
+                "repos": [
+                    {"dir": f"repo-{j}", "source-branch": "main"} for j in range(5)
+                ],
+            }
+            for i in range(sources)
+        ],
+        "workbenches": [
+            {
+                "name": f"wb-{i}",
+                "source": f"source-{i % sources}",
+                "git-branch": f"feature/wb-{i}",
+                "status": "inactive" if i % 2 else "active",
+            }
+            for i in range(workbenches)
+        ],
+        "models": {"task": "anthropic/claude-opus-4-6", "discuss": None},
+        "concurrency": {"worktrees": 4},
+    }
+
+
+def _dump(data: dict[str, Any], dumper: type) -> str:
+    return yaml.dump(data, Dumper=dumper, default_flow_style=False, sort_keys=False)
+
+
+def _time(fn: Callable[[], object], rounds: int) -> float:
+    """Return the mean wall time of `fn` in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="10,1000,10000")
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"libyaml: {YamlLoader is not yaml.SafeLoader}")
+    print(
+        f"{'workbenches':>12}{'py load':>10}{'c load':>10}"
+        f"{'py dump':>10}{'c dump':>10}{'identical':>11}"
+    )
+    mismatches = 0
+    for size in (int(s) for s in args.sizes.split(",")):
+        data = _make_config(size)
+        text = _dump(data, yaml.SafeDumper)
+        identical = _dump(data, YamlDumper) == text
+        if not identical or yaml.load(text, Loader=YamlLoader) != data:
+            mismatches += 1
+        rounds = max(args.rounds * 10 // max(size // 100, 1), 1)
+        timings = [
+            _time(lambda: yaml.load(text, Loader=yaml.SafeLoader), rounds),
+            _time(lambda: yaml.load(text, Loader=YamlLoader), rounds),
+            _time(lambda: _dump(data, yaml.SafeDumper), rounds),
+            _time(lambda: _dump(data, YamlDumper), rounds),
+        ]
+        print(
+            f"{size:>12}"
+            + "".join(f"{ms:>10.1f}" for ms in timings)
+            + f"{'yes' if identical else 'NO':>11}"
+        )
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
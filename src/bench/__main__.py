@@ -0,0 +1,4 @@
+from bench.launcher import main
+
+if __name__ == "__main__":
+    main()
@@ -1,34 +1,33 @@
 from pathlib import Path
+from typing import Annotated
 
 import typer
 
-from bench.cli import discuss as discuss_module
-from bench.cli import init as init_module
-from bench.cli import map as map_module
-from bench.cli import populate as populate_module
-from bench.cli import source as source_module
-from bench.cli import status as status_module
-from bench.cli import task as task_module
-from bench.cli import workbench as workbench_module
-from bench.service.mode_detection import detect_mode
-from bench.view.status import display_status
+from bench.cli._lazy import LazyGroup
 
-app: typer.Typer = typer.Typer()
+app: typer.Typer = typer.Typer(cls=LazyGroup)
 
-# Register subcommands
-init_module.register(app)
-populate_module.register(app)
-source_module.register(app)
-map_module.register(app)
-workbench_module.register(app)
-discuss_module.register(app)
-task_module.register(app)
-status_module.register(app)
+# Subcommands are registered lazily; see bench.cli._lazy.LAZY_SUBCOMMANDS.
 
 
 @app.callback(invoke_without_command=True)
-def main(ctx: typer.Context) -> None:
+def main(
+    ctx: typer.Context,
+    profile: Annotated[
+        bool,
+        typer.Option(
+            "--profile",
+            help="Profile the command and write a report, call graph and "
+            "flame graph stacks to the current directory (or set BENCH_PROFILE)",
+        ),
+    ] = False,
+) -> None:
     """Orchestration layer for agent coding."""
+    # --profile is acted on by bench.launcher before the CLI is imported, so
+    # that imports are profiled too; it is declared here for --help
     if ctx.invoked_subcommand is None:
+        from bench.service.mode_detection import detect_mode
+        from bench.view.status import display_status
+
         context = detect_mode(Path.cwd())
         display_status(context)
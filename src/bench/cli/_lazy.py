@@ -0,0 +1,49 @@
+import importlib
+
+import typer
+from click import Command, Context
+from typer.core import TyperGroup
+
+# Top-level subcommand name -> CLI module that registers it, in the order they
+# are listed in --help. A module (and the services and views it imports) is
+# only imported when its command is looked up, so `bench status` does not pay
+# for `bench task`. Every module must expose `register(app: typer.Typer)`.
+LAZY_SUBCOMMANDS: dict[str, str] = {
+    "init": "bench.cli.init",
+    "populate": "bench.cli.populate",
+    "source": "bench.cli.source",
+    "map": "bench.cli.map",
+    "workbench": "bench.cli.workbench",
+    "discuss": "bench.cli.discuss",
+    "task": "bench.cli.task",
+    "queue": "bench.cli.queue",
+    "stats": "bench.cli.stats",
+    "status": "bench.cli.status",
+}
+
+
+class LazyGroup(TyperGroup):
+    """Root command group that imports subcommand modules on first lookup."""
+
+    def list_commands(self, ctx: Context) -> list[str]:
+        eager = [
+            name for name in super().list_commands(ctx) if name not in LAZY_SUBCOMMANDS
+        ]
+        return [*LAZY_SUBCOMMANDS, *eager]
+
+    def get_command(self, ctx: Context, cmd_name: str) -> Command | None:
+        module_name = LAZY_SUBCOMMANDS.get(cmd_name)
+        if module_name is None or cmd_name in self.commands:
+            return super().get_command(ctx, cmd_name)
+
+        # Let the module register itself on a throwaway app, then graft the
+        # resulting click command onto this group.
+        holder = typer.Typer(add_completion=False)
+        importlib.import_module(module_name).register(holder)
+        command = typer.main.get_command(holder)
+        if isinstance(command, TyperGroup):
+            command = command.get_command(ctx, cmd_name)
+        if command is None:
+            return None
+        self.add_command(command, cmd_name)
+        return command
@@ -5,7 +5,12 @@ import typer
 from rich.console import Console
 
 from bench.service.map import init_maps, update_maps
-from bench.view.map import display_map_error, display_map_status
+from bench.view.map import (
+    display_map_error,
+    display_map_init_summary,
+    display_map_status,
+    display_map_update_summary,
+)
 
 console = Console()
 
@@ -24,15 +29,27 @@ def map_init(
         str | None,
         typer.Option("--model", help="Override the AI model for this run"),
     ] = None,
+    parallel: Annotated[
+        bool,
+        typer.Option(
+            "--parallel",
+            help="Map each repository in its own agent session, concurrently "
+            "(up to concurrency.maps at a time)",
+        ),
+    ] = False,
 ) -> None:
     """Generate initial maps for all (or selected) repositories."""
     try:
         display_map_status("Initializing repository maps...")
-        init_maps(Path.cwd(), model, only_repo)
+        summary = init_maps(Path.cwd(), model, only_repo, parallel)
+        display_map_init_summary(summary)
     except (ValueError, RuntimeError) as e:
         display_map_error(str(e))
         raise typer.Exit(code=1)
 
+    if summary["failures"]:
+        raise typer.Exit(code=1)
+
 
 map_app.command("init")(map_init)
 
@@ -49,6 +66,14 @@ def map_update(
         str | None,
         typer.Option("--model", help="Override the AI model for this run"),
     ] = None,
+    full: Annotated[
+        bool,
+        typer.Option(
+            "--full",
+            help="Have the agent explore every repository in full, even ones "
+            "unchanged since they were last mapped",
+        ),
+    ] = False,
     yes: Annotated[
         bool,
         typer.Option("--yes", "-y", help="Skip confirmation prompt"),
@@ -63,7 +88,8 @@ def map_update(
             )
 
         display_map_status("Updating repository maps...")
-        update_maps(Path.cwd(), model, only_repo)
+        summary = update_maps(Path.cwd(), model, only_repo, full)
+        display_map_update_summary(summary)
     except typer.Abort:
         console.print("[dim]Map update cancelled.[/dim]")
         raise typer.Exit(code=0)
@@ -0,0 +1,153 @@
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from bench.model import TaskFilter, WorkbenchStatus
+from bench.service.mode_detection import detect_mode
+from bench.service.queue import (
+    add_queue_jobs,
+    list_queue_jobs,
+    remove_queue_jobs,
+    run_queue,
+)
+from bench.view.queue import (
+    display_queue_added,
+    display_queue_error,
+    display_queue_removed,
+    display_queue_run_summary,
+    display_queue_status,
+)
+
+queue_app: typer.Typer = typer.Typer(
+    help="Queue task implementations and run them in the background."
+)
+
+
+def _complete_task_name(incomplete: str) -> list[str]:
+    """Provide tab-completion for open task names of the current workbench."""
+    try:
+        from bench.service.task import list_tasks
+
+        entries = list_tasks(TaskFilter.OPEN)
+        return [e.name for e in entries if e.name.startswith(incomplete)]
+    except Exception:
+        return []
+
+
+def _complete_active_workbench_name(incomplete: str) -> list[str]:
+    """Provide tab-completion for active workbench names."""
+    try:
+        context = detect_mode(Path.cwd())
+        if context.base_config is None:
+            return []
+        return [
+            w.name
+            for w in context.base_config.workbenches
+            if w.name.startswith(incomplete) and w.status == WorkbenchStatus.ACTIVE
+        ]
+    except Exception:
+        return []
+
+
+def queue_add(
+    tasks: Annotated[
+        list[str],
+        typer.Argument(
+            help="Names of the tasks to implement, in the order to run them",
+            autocompletion=_complete_task_name,
+            show_default=False,
+        ),
+    ],
+    workbench: Annotated[
+        str | None,
+        typer.Option(
+            "--workbench",
+            "-w",
+            help="Workbench the tasks belong to (defaults to the current workbench)",
+            autocompletion=_complete_active_workbench_name,
+        ),
+    ] = None,
+) -> None:
+    """Queue `task implement` runs for tasks of a workbench."""
+    try:
+        jobs = add_queue_jobs(tasks, workbench)
+        display_queue_added(jobs)
+    except (ValueError, RuntimeError) as e:
+        display_queue_error(str(e))
+        raise typer.Exit(code=1)
+
+
+queue_app.command("add")(queue_add)
+
+
+def queue_run(
+    max_jobs: Annotated[
+        int | None,
+        typer.Option(
+            "--max-jobs",
+            help="Maximum number of jobs running at the same time "
+            "(defaults to concurrency.jobs)",
+            min=1,
+        ),
+    ] = None,
+) -> None:
+    """Run queued jobs until the queue is drained, one job per workbench at a time."""
+    try:
+        summary = run_queue(max_jobs)
+        display_queue_run_summary(summary)
+    except (ValueError, RuntimeError) as e:
+        display_queue_error(str(e))
+        raise typer.Exit(code=1)
+
+    if summary["interrupted"]:
+        raise typer.Exit(code=130)
+    if summary["failed"]:
+        raise typer.Exit(code=1)
+
+
+queue_app.command("run")(queue_run)
+
+
+def queue_status() -> None:
+    """List the jobs in the queue with their status."""
+    try:
+        jobs = list_queue_jobs()
+        display_queue_status(jobs)
+    except (ValueError, RuntimeError) as e:
+        display_queue_error(str(e))
+        raise typer.Exit(code=1)
+
+
+queue_app.command("status")(queue_status)
+
+
+def queue_remove(
+    job_ids: Annotated[
+        list[int] | None,
+        typer.Argument(help="Ids of the jobs to remove", show_default=False),
+    ] = None,
+    finished: Annotated[
+        bool,
+        typer.Option("--finished", help="Remove every done or failed job"),
+    ] = False,
+) -> None:
+    """Remove queued or finished jobs from the queue."""
+    if not job_ids and not finished:
+        display_queue_error("Give the ids of the jobs to remove, or --finished.")
+        raise typer.Exit(code=1)
+
+    try:
+        removed = remove_queue_jobs(job_ids or [], finished)
+        display_queue_removed(removed)
+    except (ValueError, RuntimeError) as e:
+        display_queue_error(str(e))
+        raise typer.Exit(code=1)
+
+
+queue_app.command("remove")(queue_remove)
+
+
+def register(app: typer.Typer) -> None:
+    """Register the queue subcommand group on the given Typer app."""
+    app.add_typer(queue_app, name="queue")
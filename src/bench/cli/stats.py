@@ -0,0 +1,44 @@
+from typing import Annotated
+
+import typer
+
+from bench.model.telemetry import StatsGroup
+from bench.service.stats import summarize_sessions
+from bench.view.stats import display_stats, display_stats_error
+
+stats_app: typer.Typer = typer.Typer(
+    help="Summarize recorded agent session time, tokens and cost.",
+    invoke_without_command=True,
+)
+
+
+@stats_app.callback()
+def stats(
+    by: Annotated[
+        StatsGroup,
+        typer.Option(
+            "--by",
+            help="Group sessions by implementation phase, model, workbench, "
+            "week or command",
+        ),
+    ] = StatsGroup.PHASE,
+    since: Annotated[
+        str | None,
+        typer.Option(
+            "--since",
+            help="Only count sessions started on or after this date (YYYY-MM-DD)",
+        ),
+    ] = None,
+) -> None:
+    """Summarize recorded agent session time, tokens and cost."""
+    try:
+        rows = summarize_sessions(by, since)
+        display_stats(rows, by)
+    except (ValueError, OSError) as e:
+        display_stats_error(str(e))
+        raise typer.Exit(code=1)
+
+
+def register(app: typer.Typer) -> None:
+    """Register the stats command on the given Typer app."""
+    app.add_typer(stats_app, name="stats")
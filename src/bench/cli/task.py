@@ -9,15 +9,14 @@ from bench.service.task import (
     complete_task,
     create_task,
     list_tasks,
+    plan_task_implement,
     refine_task,
     resolve_task,
     resolve_task_for_followup,
     resolve_task_for_implement,
     run_task_followup,
     run_task_interview,
-    run_task_phase,
-    validate_task_phase,
-    validate_task_phase_outputs,
+    run_task_phases,
 )
 from bench.view.task import (
     display_task_completed,
@@ -26,9 +25,10 @@ from bench.view.task import (
     display_task_followup_complete,
     display_task_followup_start,
     display_task_implement_complete,
-    display_task_implement_phase_complete,
-    display_task_implement_phase_start,
+    display_task_implement_resume,
     display_task_implement_start,
+    display_task_implement_stopped,
+    display_task_implement_up_to_date,
     display_task_list,
     display_task_refine_complete,
     display_task_refine_start,
@@ -161,8 +161,22 @@ def task_implement(
             autocompletion=_complete_task_name,
         ),
     ],
+    from_phase: Annotated[
+        str | None,
+        typer.Option(
+            "--from-phase",
+            help="Run from this phase (number or name) to the end, ignoring checkpoints",
+        ),
+    ] = None,
+    only_phase: Annotated[
+        str | None,
+        typer.Option(
+            "--only-phase",
+            help="Run only this phase (number or name), ignoring checkpoints",
+        ),
+    ] = None,
 ) -> None:
-    """Implement a task through sequential AI-assisted phases."""
+    """Implement a task through AI-assisted phases, running independent ones concurrently."""
     try:
         # Resolve task
         summary = resolve_task_for_implement(name)
@@ -170,6 +184,9 @@ def task_implement(
         task_folder_path_raw = summary["task_folder_path"]
         assert isinstance(task_folder_path_raw, Path)
         task_folder_path: Path = task_folder_path_raw
+        prompts_dir_raw = summary["prompts_dir"]
+        assert isinstance(prompts_dir_raw, Path)
+        prompts_dir: Path = prompts_dir_raw
 
         # Get implementation flow from workbench config
         implementation_flow_raw = summary["implementation_flow"]
@@ -180,8 +197,6 @@ def task_implement(
             if isinstance(step, ImplementationStep)
         ]
 
-        # Derive phase info for display
-        phase_names = [step.name for step in implementation_flow]
         total_phases = len(implementation_flow)
 
         # Validate that there are phases to run
@@ -191,39 +206,49 @@ def task_implement(
             )
             raise typer.Exit(code=1)
 
-        # Display start
-        display_task_implement_start(name, folder_name, phase_names, total_phases)
-
-        # Execute phases
-        for i, step in enumerate(implementation_flow, 1):
-            # Pre-flight validation
-            validate_task_phase(task_folder_path, step, name)
-
-            # Display phase start
-            display_task_implement_phase_start(i, total_phases, step.name)
-
-            # Run phase
-            exit_code = run_task_phase(folder_name, step)
-
-            if exit_code != 0:
-                display_task_error(
-                    f"Phase '{step.name}' failed: opencode exited with code {exit_code}"
-                )
-                raise typer.Exit(code=exit_code)
-
-            # Display phase complete
-            display_task_implement_phase_complete(i, total_phases, step.name)
+        # Decide which phases to run (resume from checkpoints unless overridden)
+        plan = plan_task_implement(
+            task_folder_path, implementation_flow, prompts_dir, from_phase, only_phase
+        )
+        phases = plan.phases
 
-            # Inter-phase output validation
-            validate_task_phase_outputs(task_folder_path, step)
+        if not phases:
+            display_task_implement_up_to_date(name, total_phases)
+            return
 
-        # Display overall completion
-        display_task_implement_complete(name, total_phases)
+        # Display start
+        phase_names = [implementation_flow[i - 1].name for i in phases]
+        display_task_implement_start(name, folder_name, phase_names, len(phases))
+        display_task_implement_resume(plan.up_to_date, total_phases, plan.changed)
+
+        # Execute phases, independent ones concurrently
+        max_concurrent_phases = summary["max_concurrent_phases"]
+        assert isinstance(max_concurrent_phases, int)
+        result = run_task_phases(
+            name,
+            folder_name,
+            task_folder_path,
+            implementation_flow,
+            prompts_dir,
+            phases,
+            max_concurrent_phases,
+        )
+        failures = result["failures"]
+        assert isinstance(failures, dict)
+        not_started = result["not_started"]
+        assert isinstance(not_started, list)
 
     except (ValueError, RuntimeError, FileNotFoundError) as e:
         display_task_error(str(e))
         raise typer.Exit(code=1)
 
+    if failures:
+        display_task_implement_stopped(name, len(failures), len(not_started))
+        raise typer.Exit(code=1)
+
+    # Display overall completion
+    display_task_implement_complete(name, len(phases))
+
 
 task_app.command("implement")(task_implement)
 
@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from pathlib import Path
 from typing import Annotated
 
@@ -9,11 +10,11 @@ from bench.service.source import list_sources
 from rich.console import Console
 
 from bench.service.workbench import (
-    activate_workbench,
+    activate_workbenches,
     create_workbench,
-    delete_workbench,
+    delete_workbenches,
     list_workbenches,
-    retire_workbench,
+    retire_workbenches,
     update_workbench,
 )
 from bench.view.workbench import (
@@ -171,14 +172,36 @@ def workbench_update(
 workbench_app.command("update")(workbench_update)
 
 
+def _confirm_workbenches(action: str, consequence: str) -> Callable[[list[str]], None]:
+    """Return a callback that asks to confirm an action on the selected workbenches."""
+
+    def confirm(names: list[str]) -> None:
+        if len(names) == 1:
+            subject = f'workbench "{names[0]}"'
+        else:
+            subject = f"{len(names)} workbenches ({', '.join(names)})"
+        typer.confirm(f"{action} {subject}? {consequence}", abort=True)
+
+    return confirm
+
+
 def workbench_retire(
-    name: Annotated[
-        str,
+    names: Annotated[
+        list[str] | None,
         typer.Argument(
-            help="Name of the workbench to retire",
+            help="Names or glob patterns of the workbenches to retire",
             autocompletion=_complete_active_workbench_name,
+            show_default=False,
         ),
-    ],
+    ] = None,
+    older_than: Annotated[
+        int | None,
+        typer.Option(
+            "--older-than",
+            help="Only retire workbenches created at least this many days ago",
+            min=0,
+        ),
+    ] = None,
     yes: Annotated[
         bool,
         typer.Option(
@@ -188,23 +211,19 @@ def workbench_retire(
         ),
     ] = False,
 ) -> None:
-    """Retire a workbench by removing its workspace directory."""
+    """Retire workbenches by removing their workspace directories."""
     try:
-        if not yes:
-            context = detect_mode(Path.cwd())
-            if context.base_config is not None:
-                wb = next(
-                    (w for w in context.base_config.workbenches if w.name == name),
-                    None,
-                )
-                if wb is not None:
-                    typer.confirm(
-                        f'Retire workbench "{name}"? This will remove the workspace directory '
-                        f"and prune associated worktrees.",
-                        abort=True,
-                    )
-
-        summary = retire_workbench(name)
+        summary = retire_workbenches(
+            names or [],
+            older_than,
+            confirm=None
+            if yes
+            else _confirm_workbenches(
+                "Retire",
+                "This will remove the workspace directory and prune associated "
+                "worktrees.",
+            ),
+        )
         display_workbench_retired(summary)
     except typer.Abort:
         _console = Console()
@@ -214,18 +233,39 @@ def workbench_retire(
         display_workbench_error(str(e))
         raise typer.Exit(code=1)
 
+    if summary["failures"]:
+        raise typer.Exit(code=1)
+
 
 workbench_app.command("retire")(workbench_retire)
 
 
 def workbench_delete(
-    name: Annotated[
-        str,
+    names: Annotated[
+        list[str] | None,
         typer.Argument(
-            help="Name of the workbench to delete",
+            help="Names or glob patterns of the workbenches to delete",
             autocompletion=_complete_workbench_name,
+            show_default=False,
         ),
-    ],
+    ] = None,
+    active: Annotated[
+        bool,
+        typer.Option("--active", help="Only delete active workbenches"),
+    ] = False,
+    inactive: Annotated[
+        bool,
+        typer.Option("--inactive", help="Only delete inactive workbenches"),
+    ] = False,
+    older_than: Annotated[
+        int | None,
+        typer.Option(
+            "--older-than",
+            help="Only delete workbenches created (or, if inactive, retired) "
+            "at least this many days ago",
+            min=0,
+        ),
+    ] = None,
     yes: Annotated[
         bool,
         typer.Option(
@@ -235,17 +275,31 @@ def workbench_delete(
         ),
     ] = False,
 ) -> None:
-    """Permanently delete a workbench, its data, and git branches."""
+    """Permanently delete workbenches, their data, and git branches."""
+    if active and inactive:
+        display_workbench_error("--active and --inactive are mutually exclusive.")
+        raise typer.Exit(code=1)
+
+    status: WorkbenchStatus | None = None
+    if active:
+        status = WorkbenchStatus.ACTIVE
+    elif inactive:
+        status = WorkbenchStatus.INACTIVE
+
     try:
-        if not yes:
-            typer.confirm(
-                f'Delete workbench "{name}"? This will permanently remove the '
-                f"workspace directory, .bench/workbench/{name}/ data, and "
-                f"associated git branches. This cannot be undone.",
-                abort=True,
-            )
-
-        summary = delete_workbench(name)
+        summary = delete_workbenches(
+            names or [],
+            status,
+            older_than,
+            confirm=None
+            if yes
+            else _confirm_workbenches(
+                "Delete",
+                "This will permanently remove the workspace directory, "
+                ".bench/workbench/ data, and associated git branches. "
+                "This cannot be undone.",
+            ),
+        )
         display_workbench_deleted(summary)
     except typer.Abort:
         _console = Console()
@@ -255,27 +309,42 @@ def workbench_delete(
         display_workbench_error(str(e))
         raise typer.Exit(code=1)
 
+    if summary["failures"]:
+        raise typer.Exit(code=1)
+
 
 workbench_app.command("delete")(workbench_delete)
 
 
 def workbench_activate(
-    name: Annotated[
-        str,
+    names: Annotated[
+        list[str] | None,
         typer.Argument(
-            help="Name of the workbench to activate",
+            help="Names or glob patterns of the workbenches to activate",
             autocompletion=_complete_inactive_workbench_name,
+            show_default=False,
         ),
-    ],
+    ] = None,
+    older_than: Annotated[
+        int | None,
+        typer.Option(
+            "--older-than",
+            help="Only activate workbenches retired at least this many days ago",
+            min=0,
+        ),
+    ] = None,
 ) -> None:
-    """Activate a retired workbench by recreating its workspace and worktrees."""
+    """Activate retired workbenches by recreating their workspaces and worktrees."""
     try:
-        summary = activate_workbench(name)
+        summary = activate_workbenches(names or [], older_than)
         display_workbench_activated(summary)
     except (ValueError, RuntimeError) as e:
         display_workbench_error(str(e))
         raise typer.Exit(code=1)
 
+    if summary["failures"]:
+        raise typer.Exit(code=1)
+
 
 workbench_app.command("activate")(workbench_activate)
 
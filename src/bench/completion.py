@@ -0,0 +1,490 @@
+import marshal
+import os
+import sys
+import time
+from collections.abc import Callable
+
+# Shell completion fast path.
+#
+# Typer answers completions by importing bench.cli, which pulls in every command
+# module, rich, pydantic and yaml before a single name is produced. This module
+# answers the name completions bench defines itself (task, discussion, repo,
+# workbench and source names) using only the standard library, reading the
+# names from a small index under the bench directory's `.cache/`. Index sections
+# are validated against file and directory mtimes and rebuilt from disk only
+# when stale; yaml is imported lazily for the rebuild. Anything this module
+# does not recognize returns None so the caller falls back to Typer.
+#
+# Startup time is the whole budget here, so the module sticks to os.path
+# strings (no pathlib), marshal (json and shlex pull in re) and no typing. The
+# layout constants below duplicate bench.repository.filesystem for the same
+# reason: importing it (and the bench.repository package) costs more than the
+# whole completion. Keep them in sync.
+
+BENCH_DIR_NAMES: list[str] = [".bench", "bench"]
+BASE_CONFIG_FILENAME: str = "base-config.yaml"
+WORKBENCH_CONFIG_FILENAME: str = "workbench-config.yaml"
+CACHE_DIR_NAME: str = ".cache"
+BENCH_SUBDIR_NAME: str = "bench"
+TASKS_DIR_NAME: str = "tasks"
+DISCUSSIONS_DIR_NAME: str = "discussions"
+TASK_YAML_FILENAME: str = "task.yaml"
+TASK_INDEX_FILENAME: str = "tasks.marshal"
+_TASK_INDEX_VERSION: int = 1
+
+COMPLETE_VAR: str = "_BENCH_COMPLETE"
+INDEX_FILENAME: str = "completion.marshal"
+
+# Bump when the layout of the index file changes.
+_INDEX_VERSION: int = 2
+
+# Files and directories modified within this window are never trusted from the
+# index: a change in the same mtime tick would otherwise go unnoticed.
+_RACY_WINDOW_NS: int = 2_000_000_000
+
+
+def _signature(path: str) -> tuple[int, int, int] | None:
+    """Return (mtime_ns, size, inode) for a path, or None if it is missing or racy."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if time.time_ns() - st.st_mtime_ns < _RACY_WINDOW_NS:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _task_index_signature(path: str) -> tuple | None:
+    """Return a signature as the task index stores it: () if missing, None if racy."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return ()
+    if time.time_ns() - st.st_mtime_ns < _RACY_WINDOW_NS:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _load_yaml(path: str) -> dict | None:
+    """Parse a YAML mapping, or return None if it is missing or malformed."""
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    try:
+        with open(path) as f:
+            data = yaml.load(f, Loader=loader)
+    except OSError, yaml.YAMLError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _split_date_prefixed(name: str) -> tuple[str, str] | None:
+    """Split a 'YYYYMMDD - <rest>' name into (date, rest), or None if it does not match."""
+    parts = name.split(" - ", maxsplit=1)
+    if len(parts) != 2 or len(parts[0]) != 8 or not parts[0].isdigit():
+        return None
+    return (parts[0], parts[1])
+
+
+class _Index:
+    """The completion index of one bench directory, refreshed section by section."""
+
+    def __init__(self, cwd: str, bench_dir: str, config_path: str) -> None:
+        self.cwd = cwd
+        self.config_path = config_path
+        self.cache_dir = os.path.join(bench_dir, CACHE_DIR_NAME)
+        self.data: dict = {}
+        self.dirty = False
+        try:
+            with open(os.path.join(self.cache_dir, INDEX_FILENAME), "rb") as f:
+                data = marshal.loads(f.read())
+            if isinstance(data, dict) and data.get("version") == _INDEX_VERSION:
+                self.data = data
+        except OSError, ValueError, EOFError, TypeError:
+            pass
+        self.data["version"] = _INDEX_VERSION
+
+    def _config(self) -> dict:
+        """Return the cached config section, re-reading the config file when it changed."""
+        signature = _signature(self.config_path)
+        section = self.data.get("config")
+        if signature is not None and section and section["signature"] == signature:
+            return section
+        raw = _load_yaml(self.config_path) or {}
+        section = {
+            "signature": signature,
+            "sources": [s.get("name", "") for s in raw.get("sources") or []],
+            "workbenches": [
+                [w.get("name", ""), w.get("status", "active")]
+                for w in raw.get("workbenches") or []
+            ],
+            "repos": [r.get("dir", "") for r in raw.get("repos") or []],
+        }
+        self.data["config"] = section
+        self.dirty = True
+        return section
+
+    def sources(self) -> list[str]:
+        return self._config()["sources"]
+
+    def workbenches(self, status: str | None = None) -> list[str]:
+        return [
+            name
+            for name, wb_status in self._config()["workbenches"]
+            if status is None or wb_status == status
+        ]
+
+    def repos(self) -> list[str]:
+        return self._config()["repos"]
+
+    def open_tasks(self) -> list[str]:
+        """Return open task names from the workbench's task index.
+
+        The task index is maintained by bench.repository.filesystem; this
+        mirrors its validation (tasks directory signature for the folder set,
+        task.yaml signature per entry) and writes back any entries it had to
+        re-read, so the next `task list` benefits too.
+        """
+        tasks_dir = os.path.join(self.cwd, BENCH_SUBDIR_NAME, TASKS_DIR_NAME)
+        index_path = os.path.join(self.cache_dir, TASK_INDEX_FILENAME)
+        loaded = None
+        try:
+            with open(index_path, "rb") as f:
+                loaded = marshal.loads(f.read())
+        except OSError, ValueError, EOFError, TypeError:
+            pass
+        index: dict = {"version": _TASK_INDEX_VERSION, "dir": None}
+        if isinstance(loaded, dict) and loaded.get("version") == _TASK_INDEX_VERSION:
+            index = loaded
+        tasks = index.get("tasks")
+        if not isinstance(tasks, dict):
+            tasks = {}
+            index["tasks"] = tasks
+        dirty = False
+
+        dir_signature = _task_index_signature(tasks_dir)
+        if dir_signature is None or dir_signature != index["dir"]:
+            try:
+                folder_names = [
+                    entry.name
+                    for entry in os.scandir(tasks_dir)
+                    if entry.is_dir() and _split_date_prefixed(entry.name)
+                ]
+            except OSError:
+                folder_names = []
+            tasks = {name: tasks.get(name, {}) for name in folder_names}
+            index["tasks"] = tasks
+            index["dir"] = dir_signature
+            dirty = True
+
+        names: list[str] = []
+        for folder_name in sorted(tasks):
+            entry = tasks[folder_name]
+            if not isinstance(entry, dict):
+                entry = tasks[folder_name] = {}
+            yaml_path = os.path.join(tasks_dir, folder_name, TASK_YAML_FILENAME)
+            signature = _task_index_signature(yaml_path)
+            if signature is None or entry.get(TASK_YAML_FILENAME) != signature:
+                entry.clear()
+                entry[TASK_YAML_FILENAME] = signature
+                raw = _load_yaml(yaml_path)
+                if raw is None:
+                    entry["name"] = None
+                else:
+                    default_name = folder_name.split(" - ", maxsplit=1)[1]
+                    entry["name"] = raw.get("name", default_name)
+                    entry["completed"] = raw.get("completed")
+                    entry["repos"] = raw.get("repos", [])
+                dirty = True
+            name = entry.get("name")
+            if name is not None and entry.get("completed") is None:
+                names.append(name)
+
+        if dirty:
+            self._write_blob(TASK_INDEX_FILENAME, index)
+        return names
+
+    def discussions(self) -> list[str]:
+        """Return discussion names, rescanning the directory only when it changed."""
+        discussions_dir = os.path.join(
+            self.cwd, BENCH_SUBDIR_NAME, DISCUSSIONS_DIR_NAME
+        )
+        section = self.data.get("discussions")
+        dir_signature = _signature(discussions_dir)
+        if (
+            dir_signature is not None
+            and section
+            and section["signature"] == dir_signature
+        ):
+            return section["names"]
+
+        names: list[str] = []
+        try:
+            filenames = sorted(
+                entry.name for entry in os.scandir(discussions_dir) if entry.is_file()
+            )
+        except OSError:
+            filenames = []
+        for filename in filenames:
+            if not filename.endswith(".md"):
+                continue
+            parts = _split_date_prefixed(filename[: -len(".md")])
+            if parts is not None:
+                names.append(parts[1])
+
+        self.data["discussions"] = {"signature": dir_signature, "names": names}
+        self.dirty = True
+        return names
+
+    def save(self) -> None:
+        """Write the index back if any section was rebuilt, best-effort."""
+        if self.dirty:
+            self._write_blob(INDEX_FILENAME, self.data)
+
+    def _write_blob(self, name: str, data: dict) -> None:
+        """Atomically write `data` with marshal to the cache directory, best-effort."""
+        try:
+            if not os.path.isdir(self.cache_dir):
+                os.makedirs(self.cache_dir, exist_ok=True)
+                with open(os.path.join(self.cache_dir, ".gitignore"), "w") as f:
+                    f.write("*\n")
+            tmp_path = os.path.join(self.cache_dir, f".{name}.{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                marshal.dump(data, f)
+            os.replace(tmp_path, os.path.join(self.cache_dir, name))
+        except OSError, ValueError:
+            pass
+
+
+def _workbench_index(cwd: str) -> _Index | None:
+    """Open the index of the workbench at `cwd`, or None if `cwd` is not a workbench."""
+    for dir_name in BENCH_DIR_NAMES:
+        bench_dir = os.path.join(cwd, dir_name)
+        config_path = os.path.join(bench_dir, WORKBENCH_CONFIG_FILENAME)
+        if os.path.isfile(config_path):
+            return _Index(cwd, bench_dir, config_path)
+    return None
+
+
+def _root_index(cwd: str, exact: bool) -> _Index | None:
+    """Open the index of the project root at or above `cwd` (only at `cwd` if exact)."""
+    current = cwd
+    while True:
+        for dir_name in BENCH_DIR_NAMES:
+            bench_dir = os.path.join(current, dir_name)
+            config_path = os.path.join(bench_dir, BASE_CONFIG_FILENAME)
+            if os.path.isfile(config_path):
+                return _Index(cwd, bench_dir, config_path)
+        parent = os.path.dirname(current)
+        if exact or parent == current:
+            return None
+        current = parent
+
+
+# Completers mirror the `autocompletion=` callbacks of bench.cli. Task,
+# discussion and repo names require workbench mode; sources require the project
+# root itself; workbench names use the nearest project root.
+def _complete_open_tasks(cwd: str) -> list[str]:
+    index = _workbench_index(cwd)
+    return _finish(index, index.open_tasks) if index else []
+
+
+def _complete_discussions(cwd: str) -> list[str]:
+    index = _workbench_index(cwd)
+    return _finish(index, index.discussions) if index else []
+
+
+def _complete_repos(cwd: str) -> list[str]:
+    index = _workbench_index(cwd)
+    return _finish(index, index.repos) if index else []
+
+
+def _complete_sources(cwd: str) -> list[str]:
+    if _workbench_index(cwd) is not None:
+        return []
+    index = _root_index(cwd, exact=True)
+    return _finish(index, index.sources) if index else []
+
+
+def _workbench_completer(status: str | None) -> Callable[[str], list[str]]:
+    def complete(cwd: str) -> list[str]:
+        index = _root_index(cwd, exact=False)
+        return _finish(index, lambda: index.workbenches(status)) if index else []
+
+    return complete
+
+
+def _finish(index: _Index, names: Callable[[], list[str]]) -> list[str]:
+    """Read names from an index section and persist any refresh."""
+    result = names()
+    index.save()
+    return result
+
+
+NameCompleter = Callable[[str], list[str]]
+
+# Command path -> (completer for the first positional argument, completers for
+# value-taking options). Any token outside this table makes the fast path defer
+# to Typer, so an unknown flag can never produce a wrong completion.
+_COMMANDS: dict[
+    tuple[str, str], tuple[NameCompleter | None, dict[str, NameCompleter]]
+] = {
+    ("task", "create"): (
+        None,
+        {"--add-discussion": _complete_discussions, "--only-repo": _complete_repos},
+    ),
+    ("task", "refine"): (
+        _complete_open_tasks,
+        {"--add-discussion": _complete_discussions},
+    ),
+    ("task", "implement"): (_complete_open_tasks, {}),
+    ("task", "followup"): (
+        _complete_open_tasks,
+        {"--add-discussion": _complete_discussions},
+    ),
+    ("task", "complete"): (_complete_open_tasks, {}),
+    ("queue", "add"): (
+        _complete_open_tasks,
+        {
+            "--workbench": _workbench_completer("active"),
+            "-w": _workbench_completer("active"),
+        },
+    ),
+    ("discuss", "start"): (None, {"--only-repo": _complete_repos}),
+    ("workbench", "create"): (_complete_sources, {}),
+    ("workbench", "update"): (_workbench_completer("active"), {}),
+    ("workbench", "retire"): (_workbench_completer("active"), {}),
+    ("workbench", "delete"): (_workbench_completer(None), {}),
+    ("workbench", "activate"): (_workbench_completer("inactive"), {}),
+    ("source", "update"): (_complete_sources, {}),
+    ("source", "remove"): (_complete_sources, {}),
+}
+
+# Commands whose positional argument takes any number of values, each
+# completed with the same completer.
+_VARIADIC: set[tuple[str, str]] = {
+    ("queue", "add"),
+    ("workbench", "retire"),
+    ("workbench", "delete"),
+    ("workbench", "activate"),
+}
+
+
+def _split_arg_string(string: str) -> list[str]:
+    """Split a command line like click.shell_completion.split_arg_string."""
+    if not any(char in string for char in "\"'\\"):
+        return string.split()
+
+    import shlex
+
+    lex = shlex.shlex(string, posix=True)
+    lex.whitespace_split = True
+    lex.commenters = ""
+    out: list[str] = []
+    try:
+        for token in lex:
+            out.append(token)
+    except ValueError:
+        # Unclosed quote: keep the partial last token
+        out.append(lex.token)
+    return out
+
+
+def _completion_args(shell: str) -> tuple[list[str], str] | None:
+    """Read (args, incomplete) from the environment the way Typer's shell classes do."""
+    if shell == "bash":
+        try:
+            cwords = _split_arg_string(os.environ["COMP_WORDS"])
+            cword = int(os.environ["COMP_CWORD"])
+        except KeyError, ValueError:
+            return None
+        incomplete = cwords[cword] if cword < len(cwords) else ""
+        return (cwords[1:cword], incomplete)
+
+    completion_args = os.environ.get("_TYPER_COMPLETE_ARGS", "")
+    args = _split_arg_string(completion_args)[1:]
+    if args and not completion_args.endswith(" "):
+        return (args[:-1], args[-1])
+    return (args, "")
+
+
+def _resolve(args: list[str], incomplete: str) -> NameCompleter | None:
+    """Pick the completer for the word being completed, or None to defer to Typer."""
+    if len(args) < 2 or incomplete.startswith("-"):
+        return None
+    command = _COMMANDS.get((args[0], args[1]))
+    if command is None:
+        return None
+    positional_completer, option_completers = command
+
+    positionals = 0
+    pending_option: str | None = None
+    for token in args[2:]:
+        if pending_option is not None:
+            pending_option = None
+        elif token in option_completers:
+            pending_option = token
+        elif token.startswith("-"):
+            return None
+        else:
+            positionals += 1
+
+    if pending_option is not None:
+        return option_completers[pending_option]
+    if positionals == 0 or (args[0], args[1]) in _VARIADIC:
+        return positional_completer
+    return None
+
+
+def _escape_zsh(value: str) -> str:
+    return (
+        value.replace('"', '""')
+        .replace("'", "''")
+        .replace("$", "\\$")
+        .replace("`", "\\`")
+        .replace(":", r"\\:")
+    )
+
+
+def complete() -> int | None:
+    """Answer a shell completion request from the index, if this module handles it.
+
+    Returns:
+        The process exit code once the completion has been written to stdout,
+        or None if the request must be handled by Typer instead.
+    """
+    instruction, _, shell = os.environ.get(COMPLETE_VAR, "").partition("_")
+    if instruction != "complete" or shell not in ("bash", "zsh", "fish"):
+        return None
+
+    completion_args = _completion_args(shell)
+    if completion_args is None:
+        return None
+    args, incomplete = completion_args
+    completer = _resolve(args, incomplete)
+    if completer is None:
+        return None
+
+    try:
+        names = completer(os.path.realpath(os.getcwd()))
+    except Exception:
+        names = []
+    matches = [name for name in names if name.startswith(incomplete)]
+
+    if shell == "bash":
+        sys.stdout.write("\n".join(matches) + "\n")
+    elif shell == "zsh":
+        if matches:
+            items = "\n".join(f'"{_escape_zsh(name)}"' for name in matches)
+            sys.stdout.write(f"_arguments '*: :(({items}))'\n")
+        else:
+            sys.stdout.write("_files\n")
+    else:
+        action = os.environ.get("_TYPER_COMPLETE_FISH_ACTION", "")
+        if action == "is-args":
+            return 0 if matches else 1
+        if action == "get-args" and matches:
+            sys.stdout.write("\n".join(matches) + "\n")
+        else:
+            sys.stdout.write("\n")
+    return 0
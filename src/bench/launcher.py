@@ -0,0 +1,55 @@
+import os
+import sys
+
+from bench.completion import COMPLETE_VAR
+
+# Profile the command when set: to "1" for files in the current directory, or
+# to the directory to write them to (see bench.profiling)
+PROFILE_ENV_VAR: str = "BENCH_PROFILE"
+
+# Global option with the same effect, given before the subcommand
+PROFILE_OPTION: str = "--profile"
+
+
+def _profile_requested(argv: list[str]) -> bool:
+    """Return True if BENCH_PROFILE is set or --profile precedes the subcommand."""
+    if os.environ.get(PROFILE_ENV_VAR):
+        return True
+    for arg in argv:
+        if arg == PROFILE_OPTION:
+            return True
+        if not arg.startswith("-"):
+            break
+    return False
+
+
+def _run_app() -> None:
+    from bench.cli import app
+
+    app()
+
+
+def main() -> None:
+    """Console entry point for `bench`.
+
+    Shell completion requests are answered by bench.completion without
+    importing the CLI; everything else (and any completion the fast path does
+    not handle) runs the Typer application. A profiled command is wrapped by
+    bench.profiling before the CLI is imported, so its imports are profiled
+    too.
+    """
+    if COMPLETE_VAR in os.environ:
+        from bench.completion import complete
+
+        exit_code = complete()
+        if exit_code is not None:
+            sys.stdout.flush()
+            sys.exit(exit_code)
+
+    if _profile_requested(sys.argv[1:]):
+        from bench.profiling import profile_command
+
+        profile_command(_run_app)
+        return
+
+    _run_app()
@@ -1,26 +1,67 @@
-from bench.model.config import BaseConfig, ImplementationStep, Models, WorkbenchConfig
+from bench.model.config import (
+    BaseConfig,
+    CloneMode,
+    Concurrency,
+    ImplementationStep,
+    Models,
+    ScaffoldClone,
+    SessionTimeouts,
+    WorkbenchConfig,
+)
 from bench.model.context import BenchContext
 from bench.model.discuss import DiscussionEntry
-from bench.model.git import FileStatus, GitFileChange, GitStatus
+from bench.model.git import FileStatus, GitDiffEntry, GitFileChange, GitStatus
+from bench.model.map import MapRepoState, MapState
 from bench.model.mode import BenchMode
-from bench.model.opencode import OpenCodeResult
+from bench.model.opencode import OpenCodeResult, OpenCodeRun
+from bench.model.queue import JobQueue, JobStatus, QueueJob
+from bench.model.script import ScriptEntry, ScriptRun, ScriptsManifest
 from bench.model.source import Source, SourceRepo
-from bench.model.task import TaskConfig, TaskEntry, TaskFilter
+from bench.model.task import (
+    ImplementPlan,
+    PhaseCheckpoint,
+    TaskCheckpoints,
+    TaskConfig,
+    TaskEntry,
+    TaskFilter,
+)
+from bench.model.telemetry import SessionRecord, SessionTags, StatsGroup, StatsRow
 from bench.model.workbench import WorkbenchEntry, WorkbenchFilter, WorkbenchStatus
 
 __all__ = [
     "BaseConfig",
     "BenchContext",
     "BenchMode",
+    "CloneMode",
+    "Concurrency",
     "DiscussionEntry",
     "FileStatus",
     "ImplementationStep",
+    "ImplementPlan",
+    "GitDiffEntry",
     "GitFileChange",
     "GitStatus",
+    "JobQueue",
+    "JobStatus",
+    "MapRepoState",
+    "MapState",
     "Models",
     "OpenCodeResult",
+    "OpenCodeRun",
+    "PhaseCheckpoint",
+    "QueueJob",
+    "ScaffoldClone",
+    "ScriptEntry",
+    "ScriptRun",
+    "ScriptsManifest",
+    "SessionRecord",
+    "SessionTags",
+    "SessionTimeouts",
     "Source",
     "SourceRepo",
+    "StatsGroup",
+    "StatsRow",
+    "TaskCheckpoints",
     "TaskConfig",
     "TaskEntry",
     "TaskFilter",
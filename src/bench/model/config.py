@@ -1,36 +1,111 @@
+from enum import Enum
+
 from pydantic import BaseModel, ConfigDict, Field
 
 from bench.model.source import Source, SourceRepo
 from bench.model.workbench import WorkbenchEntry
 
 
+class SessionTimeouts(BaseModel):
+    """Wall-clock limits, in seconds, of headless agent sessions per command.
+
+    None means no limit. task covers `task implement` and `populate agents`,
+    map covers `map init` and `map update`.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    task: int | None = Field(default=None, ge=1)
+    map: int | None = Field(default=None, ge=1)
+
+
 class Models(BaseModel):
-    """AI model configuration for coding agent tasks."""
+    """AI model configuration for coding agent tasks.
+
+    Headless sessions that time out or fail with a transient error (e.g., a
+    rate limit) are retried up to `retries` times, waiting retry_backoff
+    seconds before the first retry and twice as long before each next one.
+    """
+
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
     task: str = "anthropic/claude-opus-4-6"
     discuss: str = "anthropic/claude-opus-4-6"
     map: str = "anthropic/claude-opus-4-6"
+    timeouts: SessionTimeouts = Field(default_factory=SessionTimeouts)
+    retries: int = Field(default=2, ge=0)
+    retry_backoff: float = Field(alias="retry-backoff", default=30.0, gt=0)
+
+
+class Concurrency(BaseModel):
+    """Worker pool limits for operations that fan out across repositories, phases, jobs or scripts."""
+
+    model_config = ConfigDict(frozen=True)
+
+    worktrees: int = Field(default=4, ge=1)
+    teardown: int = Field(default=4, ge=1)
+    maps: int = Field(default=4, ge=1)
+    phases: int = Field(default=4, ge=1)
+    jobs: int = Field(default=2, ge=1)
+    scripts: int = Field(default=4, ge=1)
+
+
+class CloneMode(str, Enum):
+    """How a project directory is cloned into a new workbench's scaffold."""
+
+    COPY = "copy"
+    REFLINK = "reflink"
+    HARDLINK = "hardlink"
+    SHARED = "shared"
+
+
+class ScaffoldClone(BaseModel):
+    """Clone mode of each project directory copied into new workbenches."""
+
+    model_config = ConfigDict(frozen=True)
+
+    discussions: CloneMode = CloneMode.REFLINK
+    files: CloneMode = CloneMode.REFLINK
+    maps: CloneMode = CloneMode.REFLINK
+    prompts: CloneMode = CloneMode.REFLINK
+    scripts: CloneMode = CloneMode.REFLINK
 
 
 class ImplementationStep(BaseModel):
-    """A single step in the implementation workflow pipeline."""
+    """A single step in the implementation workflow pipeline.
+
+    depends_on names the earlier steps this one waits for; when omitted, the
+    dependencies are derived from the steps' required and output files.
+    timeout (seconds) overrides models.timeouts.task for this step.
+    """
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
     name: str
     prompt: str
     required_files: list[str] = Field(alias="required-files", default_factory=list)
     output_files: list[str] = Field(alias="output-files", default_factory=list)
+    depends_on: list[str] | None = Field(alias="depends-on", default=None)
+    timeout: int | None = Field(default=None, ge=1)
 
 
 class BaseConfig(BaseModel):
-    """Schema for .bench/base-config.yaml (project root config)."""
+    """Schema for .bench/base-config.yaml (project root config).
 
-    model_config = ConfigDict(populate_by_name=True)
+    Config models are frozen: one validated instance is shared by every
+    caller in a process (see detect_mode), so its lists must not be
+    modified either. Changes go through the YAML file.
+    """
+
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
     sources: list[Source] = []
     workbenches: list[WorkbenchEntry] = []
     models: Models = Field(default_factory=Models)
+    concurrency: Concurrency = Field(default_factory=Concurrency)
+    scaffold_clone: ScaffoldClone = Field(
+        alias="scaffold-clone", default_factory=ScaffoldClone
+    )
     implementation_flow_template: list[ImplementationStep] = Field(
         alias="implementation-flow-template", default_factory=list
     )
@@ -39,7 +114,7 @@ class BaseConfig(BaseModel):
 class WorkbenchConfig(BaseModel):
     """Schema for .bench/workbench-config.yaml (workbench-specific config)."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
     name: str
     source: str
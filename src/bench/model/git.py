@@ -24,6 +24,14 @@ class GitFileChange(BaseModel):
     staged: bool
 
 
+class GitDiffEntry(BaseModel):
+    """A single file change between two commits, from git diff --name-status."""
+
+    path: str
+    status: FileStatus
+    previous_path: str | None = None  # Source path of a rename or copy
+
+
 class GitStatus(BaseModel):
     """Parsed output of git status for a repository."""
 
@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+
+
+class MapRepoState(BaseModel):
+    """The repository state a repo's maps were last generated from."""
+
+    commit: str | None = None  # None if the repo is not a git repo with commits
+
+
+class MapState(BaseModel):
+    """Schema for a maps directory's map-state.yaml file."""
+
+    repos: dict[str, MapRepoState] = {}
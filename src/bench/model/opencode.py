@@ -7,3 +7,20 @@ class OpenCodeResult(BaseModel):
     stdout: str
     stderr: str
     return_code: int
+
+
+class OpenCodeRun(BaseModel):
+    """Outcome of one headless opencode session.
+
+    output_tail holds the end of the session's output, so failures can be
+    classified. Token and cost figures are totals over the session's
+    step_finish events, and None if it printed none.
+    """
+
+    return_code: int
+    timed_out: bool = False
+    duration: float
+    output_tail: str = ""
+    input_tokens: int | None = None
+    output_tokens: int | None = None
+    cost: float | None = None  # USD
@@ -0,0 +1,39 @@
+from enum import Enum
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class JobStatus(str, Enum):
+    """Status of a job in the project's job queue."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class QueueJob(BaseModel):
+    """A `task implement` run queued for a workbench, as stored in queue.yaml."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    id: int
+    workbench: str
+    task: str
+    status: JobStatus = JobStatus.QUEUED
+    added: str  # ISO timestamp
+    started: str | None = None  # ISO timestamp of the last start
+    finished: str | None = None  # ISO timestamp of the last finish
+    exit_code: int | None = Field(alias="exit-code", default=None)
+    runner_pid: int | None = Field(alias="runner-pid", default=None)
+    pid: int | None = None  # the `bench task implement` process while running
+    error: str | None = None
+
+
+class JobQueue(BaseModel):
+    """Schema for .bench/queue.yaml: the project's job queue."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    next_id: int = Field(alias="next-id", default=1)
+    jobs: list[QueueJob] = []
@@ -0,0 +1,35 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ScriptEntry(BaseModel):
+    """A setup script's dependencies and time limit, as declared in scripts.yaml.
+
+    depends_on names the scripts this one waits for and needs to succeed;
+    when omitted, the script is ordered by its file name (see
+    create_workbench). timeout is in seconds.
+    """
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    name: str
+    depends_on: list[str] | None = Field(alias="depends-on", default=None)
+    timeout: int | None = Field(default=None, ge=1)
+
+
+class ScriptsManifest(BaseModel):
+    """Schema for bench/scripts/scripts.yaml: how setup scripts are run.
+
+    timeout (seconds) limits the whole run; scripts still running when it
+    is reached are stopped and no further scripts start.
+    """
+
+    timeout: int | None = Field(default=None, ge=1)
+    scripts: list[ScriptEntry] = []
+
+
+class ScriptRun(BaseModel):
+    """Outcome of one setup script."""
+
+    exit_code: int
+    timed_out: bool = False
+    duration: float
@@ -4,7 +4,7 @@ from pydantic import BaseModel, ConfigDict, Field
 class SourceRepo(BaseModel):
     """A single repository-to-branch mapping within a source."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
     dir: str
     source_branch: str = Field(alias="source-branch")
@@ -13,5 +13,7 @@ class SourceRepo(BaseModel):
 class Source(BaseModel):
     """A named source: a collection of repository-to-branch mappings."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     repos: list[SourceRepo] = []
@@ -12,6 +12,34 @@ class TaskConfig(BaseModel):
     repos: list[str] = []
 
 
+class PhaseCheckpoint(BaseModel):
+    """A completed implementation phase, recorded in the task's checkpoints.yaml."""
+
+    name: str
+    prompt: str
+    prompt_digest: str | None = None  # SHA-256 of the prompt file when it ran
+    completed: str  # ISO timestamp
+    files: dict[str, str | None] = {}  # SHA-256 of each flow file afterwards
+
+
+class TaskCheckpoints(BaseModel):
+    """Schema for a task's checkpoints.yaml: the completed phases of its flow."""
+
+    phases: list[PhaseCheckpoint] = []
+    files: dict[
+        str, str | None
+    ] = {}  # SHA-256 of each flow file after the last run phase
+
+
+class ImplementPlan(BaseModel):
+    """The implementation phases of a task to run, by 1-based number in the flow."""
+
+    phases: list[int]  # In flow order; empty if every phase is up to date
+    up_to_date: list[int] = []  # Skipped, with a valid checkpoint
+    changed: list[str] = []  # Flow files changed since the last run
+    dependencies: dict[int, set[int]] = {}  # The phases each phase waits for
+
+
 class TaskFilter(str, Enum):
     """Filter mode for task listing."""
 
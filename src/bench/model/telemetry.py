@@ -0,0 +1,57 @@
+from enum import Enum
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class SessionTags(BaseModel):
+    """What an agent session was run for, recorded with each of its attempts."""
+
+    command: str  # e.g., "task implement", "map init"
+    workbench: str | None = None
+    task: str | None = None
+    phase: str | None = None  # implementation step name (task implement only)
+
+
+class SessionRecord(SessionTags):
+    """One agent session attempt, as stored in the telemetry ledger (telemetry.jsonl).
+
+    Token and cost figures are only present when opencode reported them.
+    """
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    time: str  # ISO timestamp of the start of the attempt
+    model: str
+    interactive: bool = False
+    attempt: int = 1
+    prompt_chars: int = Field(alias="prompt-chars")
+    duration: float  # seconds
+    exit_code: int = Field(alias="exit-code")
+    timed_out: bool = Field(alias="timed-out", default=False)
+    input_tokens: int | None = Field(alias="input-tokens", default=None)
+    output_tokens: int | None = Field(alias="output-tokens", default=None)
+    cost: float | None = None  # USD
+
+
+class StatsGroup(str, Enum):
+    """What `bench stats` groups session records by."""
+
+    PHASE = "phase"
+    MODEL = "model"
+    WORKBENCH = "workbench"
+    WEEK = "week"
+    COMMAND = "command"
+
+
+class StatsRow(BaseModel):
+    """Aggregated session records sharing one key of a StatsGroup."""
+
+    key: str
+    sessions: int
+    failed: int
+    total_duration: float
+    mean_duration: float
+    max_duration: float
+    input_tokens: int | None = None  # None when no record reported tokens
+    output_tokens: int | None = None
+    cost: float | None = None
@@ -1,3 +1,4 @@
+import datetime
 from enum import Enum
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -21,9 +22,11 @@ class WorkbenchFilter(str, Enum):
 class WorkbenchEntry(BaseModel):
     """A workbench entry as stored in base-config.yaml under the `workbenches` list."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
     name: str
     source: str
     git_branch: str = Field(alias="git-branch")
     status: WorkbenchStatus = WorkbenchStatus.ACTIVE
+    created: datetime.date | None = None
+    retired: datetime.date | None = None
@@ -0,0 +1,196 @@
+import cProfile
+import datetime
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from pathlib import Path
+
+from bench.launcher import PROFILE_ENV_VAR
+from bench.repository.spawns import recorded_spawns, start_spawn_recording
+
+# Seconds between two samples of every thread's stack
+SAMPLE_INTERVAL_SECONDS: float = 0.005
+
+# Functions listed in the report, by cumulative time
+_REPORT_FUNCTIONS: int = 40
+
+# Where the main thread's time goes, by the outermost library frame in each
+# sampled stack (so `import pydantic` counts as an import, not as pydantic)
+_CATEGORIES: list[tuple[str, tuple[str, ...]]] = [
+    ("imports", ("<frozen importlib._bootstrap",)),
+    ("subprocesses", ("/subprocess.py",)),
+    ("yaml", ("/yaml/",)),
+    ("pydantic", ("/pydantic/", "/pydantic_core/")),
+    ("rich", ("/rich/",)),
+]
+
+# (function name, file name, first line number), outermost frame first
+Stack = tuple[tuple[str, str, int], ...]
+
+
+class _Sampler(threading.Thread):
+    """Samples the stack of every other thread at a fixed interval."""
+
+    def __init__(self, interval: float) -> None:
+        super().__init__(name="bench-profile-sampler", daemon=True)
+        self.interval = interval
+        self.stacks: Counter[tuple[str, Stack]] = Counter()
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        own = threading.get_ident()
+        while not self._stopped.wait(self.interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                frames: list[tuple[str, str, int]] = []
+                current = frame
+                while current is not None:
+                    code = current.f_code
+                    frames.append((code.co_name, code.co_filename, code.co_firstlineno))
+                    current = current.f_back
+                thread = names.get(ident, str(ident))
+                self.stacks[(thread, tuple(reversed(frames)))] += 1
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self.join()
+
+
+def _output_base() -> Path:
+    """Return the path prefix of this command's profile files.
+
+    Files go to the directory BENCH_PROFILE names, or to the current
+    directory when it is set to "1" (or only --profile was given).
+    """
+    value = os.environ.get(PROFILE_ENV_VAR, "")
+    directory = Path(value) if value and value != "1" else Path.cwd()
+    directory.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+    return directory / f"bench-profile-{stamp}-{os.getpid()}"
+
+
+def _frame_label(name: str, filename: str, line: int) -> str:
+    """Label a frame for a collapsed stack: function and module-relative path."""
+    for marker in ("/site-packages/", "/src/"):
+        if marker in filename:
+            filename = filename.split(marker, 1)[1]
+            break
+    return f"{name} ({filename}:{line})".replace(";", ",")
+
+
+def _category(stack: Stack) -> str:
+    for _, filename, _ in stack:
+        for category, markers in _CATEGORIES:
+            if any(marker in filename for marker in markers):
+                return category
+    return "other"
+
+
+def _write_collapsed(path: Path, stacks: Counter[tuple[str, Stack]]) -> None:
+    """Write samples as collapsed stacks (flamegraph.pl, speedscope, inferno)."""
+    with open(path, "w") as f:
+        for (thread, stack), count in sorted(stacks.items()):
+            labels = [thread.replace(";", ","), *(_frame_label(*fr) for fr in stack)]
+            f.write(f"{';'.join(labels)} {count}\n")
+
+
+def _write_reports(
+    base: Path, profiler: cProfile.Profile, sampler: _Sampler, elapsed: float
+) -> None:
+    """Write the profile files and print a summary on stderr."""
+    spawns = recorded_spawns()
+    paths = {
+        suffix: base.with_name(base.name + suffix)
+        for suffix in (".txt", ".prof", ".collapsed", ".spawns.json")
+    }
+
+    profiler.dump_stats(paths[".prof"])
+    _write_collapsed(paths[".collapsed"], sampler.stacks)
+    paths[".spawns.json"].write_text(json.dumps(spawns, indent=2) + "\n")
+
+    # Main thread time by category
+    main_name = threading.main_thread().name
+    categories: Counter[str] = Counter()
+    for (thread, stack), count in sampler.stacks.items():
+        if thread == main_name:
+            categories[_category(stack)] += count
+    samples = sum(categories.values())
+
+    # Subprocesses by kind
+    by_kind: dict[str, list[float]] = {}
+    for spawn in spawns:
+        by_kind.setdefault(spawn["kind"], []).append(spawn["duration"])
+
+    summary = [f"Profiled in {elapsed:.3f}s ({samples} main-thread samples)"]
+    if samples:
+        shares = ", ".join(
+            f"{name} {count / samples:.0%}" for name, count in categories.most_common()
+        )
+        summary.append(f"  Main thread: {shares}")
+    for kind, durations in sorted(by_kind.items()):
+        summary.append(
+            f"  {kind}: {len(durations)} subprocess(es), {sum(durations):.3f}s total, "
+            f"{max(durations):.3f}s longest"
+        )
+
+    with open(paths[".txt"], "w") as f:
+        f.write(
+            "\n".join(summary)
+            + "\n\nSubprocesses (start, duration, kind, cwd, command):\n"
+        )
+        for spawn in sorted(spawns, key=lambda s: s["start"]):
+            status = "" if spawn["ok"] else " [failed to complete]"
+            f.write(
+                f"  {spawn['start']:9.3f}s {spawn['duration']:9.3f}s "
+                f"{spawn['kind']:<9} {spawn['cwd']}: {' '.join(spawn['args'])}{status}\n"
+            )
+        f.write("\nFunctions (main thread) by cumulative time:\n")
+        stats = pstats.Stats(profiler, stream=f)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(_REPORT_FUNCTIONS)
+
+    summary.append(
+        f"  Report: {paths['.txt']} "
+        f"(also {', '.join(p.name for s, p in paths.items() if s != '.txt')})"
+    )
+    sys.stderr.write("\n".join(summary) + "\n")
+
+
+def profile_command(run: Callable[[], object]) -> None:
+    """Run a bench command under cProfile and a stack sampler.
+
+    Called by bench.launcher before the CLI is imported, so imports are
+    profiled too. cProfile times every function of the main thread; the
+    sampler records every thread's stack each SAMPLE_INTERVAL_SECONDS,
+    covering worker threads (parallel phases, worktrees) as well.
+    Subprocesses started by the repository layer are recorded with their
+    durations (see timed_spawn). Once the command ends, however it ends,
+    four files are written next to each other (see _output_base):
+
+    - <base>.txt: summary, subprocesses and the slowest functions
+    - <base>.prof: cProfile data (pstats, snakeviz)
+    - <base>.collapsed: sampled stacks for flame graphs
+    - <base>.spawns.json: the subprocess records
+
+    Args:
+        run: Runs the command (it may raise SystemExit, as Typer apps do).
+    """
+    base = _output_base()
+    start_spawn_recording()
+    sampler = _Sampler(SAMPLE_INTERVAL_SECONDS)
+    profiler = cProfile.Profile()
+    started = time.perf_counter()
+    sampler.start()
+    profiler.enable()
+    try:
+        run()
+    finally:
+        profiler.disable()
+        sampler.stop()
+        _write_reports(base, profiler, sampler, time.perf_counter() - started)
@@ -1,6 +1,8 @@
 from bench.repository.filesystem import (
     BASE_CONFIG_FILENAME,
     BENCH_DIR_NAME_DEFAULT,
+    CACHE_DIR_NAME,
+    CHANGES_PLACEHOLDER,
     DEFAULT_IMPLEMENTATION_FLOW_TEMPLATE,
     DIRECTORIES_PLACEHOLDER,
     DISCUSS_PROMPT_FILENAME,
@@ -10,32 +12,50 @@ from bench.repository.filesystem import (
     FILES_MD_FILENAME,
     IMPL_MD_FILENAME,
     JOURNAL_MD_FILENAME,
+    LOGS_DIR_NAME,
     MAPS_DIR_NAME,
     MAPS_LOCATION_PLACEHOLDER,
     MAPS_PLACEHOLDER,
     MAP_INIT_PROMPT_FILENAME,
     MAP_INIT_PROMPT_TEMPLATE,
+    MAP_INIT_REPO_PROMPT_FILENAME,
+    MAP_INIT_REPO_PROMPT_TEMPLATE,
+    MAP_METAMAP_PROMPT_FILENAME,
+    MAP_METAMAP_PROMPT_TEMPLATE,
     MAP_UPDATE_PROMPT_FILENAME,
+    MAP_STATE_FILENAME,
     MAP_UPDATE_PROMPT_TEMPLATE,
     METAMAP_FILENAME,
     NOTES_MD_FILENAME,
     POPULATE_AGENTS_PROMPT_FILENAME,
     POPULATE_AGENTS_PROMPT_TEMPLATE,
     PROMPT_SEED_FILES,
+    QUEUE_FILENAME,
     REPO_DIR_NAME,
     REPOSITORIES_PLACEHOLDER,
+    SCRIPTS_MANIFEST_FILENAME,
+    SESSIONS_LOG_FILENAME,
     SPEC_MD_FILENAME,
     SPEC_TEMPLATE,
+    TASK_CHECKPOINTS_FILENAME,
     TASK_FOLLOWUP_FILENAME,
     TASK_FOLLOWUP_TEMPLATE,
+    TASK_INDEX_FILENAME,
     TASK_PLACEHOLDER,
     TASK_YAML_FILENAME,
+    TELEMETRY_FILENAME,
+    append_log_line,
+    append_telemetry_record,
     build_discussion_block,
+    clone_tree,
     create_bench_scaffold,
     create_task_scaffold,
     create_workbench_scaffold,
     create_workbench_workspace,
     discover_scripts,
+    file_digest,
+    file_signature,
+    find_map_files_mentioning,
     find_bench_root,
     find_task_folder,
     find_workbench_marker,
@@ -45,42 +65,98 @@ from bench.repository.filesystem import (
     list_sibling_directories,
     list_task_entries,
     list_task_names,
+    load_cache_blob,
+    load_job_queue,
+    load_scripts_manifest,
+    load_task_checkpoints,
     load_task_yaml,
+    load_telemetry_records,
     load_yaml_file,
+    locked_file,
+    locked_yaml_update,
     read_prompt_file,
     remove_workbench_scaffold,
     remove_workbench_workspace,
+    render_changes_block,
     render_repositories_block,
     resolve_discussion_paths,
-    run_script,
+    save_cache_blob,
+    save_job_queue,
+    save_task_checkpoints,
     save_task_yaml,
     save_yaml_file,
     task_file_exists_and_nonempty,
+    task_lock_path,
     task_spec_exists,
+    update_task_index,
 )
 from bench.repository.git import (
     GIT_EXECUTABLE,
     add_worktree,
     branch_exists,
+    branches_exist,
+    clear_git_cache,
     create_branch,
     delete_branch,
+    diff_name_status,
     git_status,
+    head_commit,
     is_git_repository,
     list_local_branches,
     prune_worktrees,
     push_branch,
     remove_worktree,
 )
+from bench.repository.blobstore import (
+    BLOB_STORE_DIR_NAME,
+    clone_shared_tree,
+    prune_blob_store,
+    share_tree,
+    unshare_tree,
+)
+from bench.repository.logfile import (
+    LOG_BACKUPS,
+    LOG_MAX_BYTES,
+    SessionLog,
+    rotate_log,
+)
+from bench.repository.spawns import (
+    MAX_RECORDED_ARG_CHARS,
+    recorded_spawns,
+    start_spawn_recording,
+    timed_spawn,
+)
+from bench.repository.registry import (
+    ConfigRegistry,
+    load_registry,
+    locked_registry,
+)
+from bench.repository.process import (
+    BENCH_MODULE,
+    process_alive,
+    run_bench_command,
+)
+from bench.repository.script import (
+    run_script,
+    terminate_scripts,
+)
+from bench.repository._process_group import TERMINATE_GRACE_SECONDS
 from bench.repository.opencode import (
     OPENCODE_EXECUTABLE,
     run_command,
     run_prompt,
     run_prompt_interactive,
+    terminate_sessions,
 )
 
 __all__ = [
     "BASE_CONFIG_FILENAME",
     "BENCH_DIR_NAME_DEFAULT",
+    "BENCH_MODULE",
+    "BLOB_STORE_DIR_NAME",
+    "CACHE_DIR_NAME",
+    "CHANGES_PLACEHOLDER",
+    "ConfigRegistry",
     "DEFAULT_IMPLEMENTATION_FLOW_TEMPLATE",
     "DIRECTORIES_PLACEHOLDER",
     "DISCUSS_PROMPT_FILENAME",
@@ -91,12 +167,21 @@ __all__ = [
     "GIT_EXECUTABLE",
     "IMPL_MD_FILENAME",
     "JOURNAL_MD_FILENAME",
+    "LOGS_DIR_NAME",
+    "LOG_BACKUPS",
+    "LOG_MAX_BYTES",
     "MAPS_DIR_NAME",
+    "MAX_RECORDED_ARG_CHARS",
     "MAPS_LOCATION_PLACEHOLDER",
     "MAPS_PLACEHOLDER",
     "MAP_INIT_PROMPT_FILENAME",
     "MAP_INIT_PROMPT_TEMPLATE",
+    "MAP_INIT_REPO_PROMPT_FILENAME",
+    "MAP_INIT_REPO_PROMPT_TEMPLATE",
+    "MAP_METAMAP_PROMPT_FILENAME",
+    "MAP_METAMAP_PROMPT_TEMPLATE",
     "MAP_UPDATE_PROMPT_FILENAME",
+    "MAP_STATE_FILENAME",
     "MAP_UPDATE_PROMPT_TEMPLATE",
     "METAMAP_FILENAME",
     "NOTES_MD_FILENAME",
@@ -104,28 +189,47 @@ __all__ = [
     "POPULATE_AGENTS_PROMPT_FILENAME",
     "POPULATE_AGENTS_PROMPT_TEMPLATE",
     "PROMPT_SEED_FILES",
+    "QUEUE_FILENAME",
     "REPO_DIR_NAME",
     "REPOSITORIES_PLACEHOLDER",
+    "SCRIPTS_MANIFEST_FILENAME",
+    "SESSIONS_LOG_FILENAME",
+    "SessionLog",
     "SPEC_MD_FILENAME",
     "SPEC_TEMPLATE",
+    "TASK_CHECKPOINTS_FILENAME",
     "TASK_FOLLOWUP_FILENAME",
     "TASK_FOLLOWUP_TEMPLATE",
+    "TASK_INDEX_FILENAME",
     "TASK_PLACEHOLDER",
     "TASK_YAML_FILENAME",
+    "TELEMETRY_FILENAME",
+    "TERMINATE_GRACE_SECONDS",
     "add_worktree",
+    "append_log_line",
+    "append_telemetry_record",
     "branch_exists",
+    "branches_exist",
     "build_discussion_block",
+    "clear_git_cache",
+    "clone_shared_tree",
+    "clone_tree",
     "create_bench_scaffold",
     "create_branch",
     "create_task_scaffold",
     "delete_branch",
+    "diff_name_status",
     "discover_scripts",
+    "file_digest",
+    "file_signature",
+    "find_map_files_mentioning",
     "create_workbench_scaffold",
     "create_workbench_workspace",
     "find_bench_root",
     "find_task_folder",
     "find_workbench_marker",
     "git_status",
+    "head_commit",
     "inject_discussions_into_spec",
     "is_git_repository",
     "list_discussion_files",
@@ -134,22 +238,48 @@ __all__ = [
     "list_sibling_directories",
     "list_task_entries",
     "list_task_names",
+    "load_cache_blob",
+    "load_job_queue",
+    "load_scripts_manifest",
+    "load_task_checkpoints",
+    "load_registry",
     "load_task_yaml",
+    "load_telemetry_records",
     "load_yaml_file",
+    "locked_file",
+    "locked_registry",
+    "locked_yaml_update",
+    "process_alive",
+    "prune_blob_store",
     "prune_worktrees",
     "push_branch",
     "read_prompt_file",
+    "recorded_spawns",
     "remove_workbench_scaffold",
     "remove_workbench_workspace",
     "remove_worktree",
+    "render_changes_block",
     "render_repositories_block",
     "resolve_discussion_paths",
+    "rotate_log",
+    "run_bench_command",
     "run_script",
+    "terminate_scripts",
+    "save_cache_blob",
+    "save_job_queue",
+    "save_task_checkpoints",
     "run_command",
     "run_prompt",
     "run_prompt_interactive",
+    "terminate_sessions",
     "save_task_yaml",
     "save_yaml_file",
+    "share_tree",
+    "start_spawn_recording",
     "task_file_exists_and_nonempty",
+    "task_lock_path",
     "task_spec_exists",
+    "timed_spawn",
+    "unshare_tree",
+    "update_task_index",
 ]
@@ -0,0 +1,126 @@
+import os
+import signal
+import subprocess
+import threading
+import time
+from collections.abc import Callable
+from typing import IO, Any
+
+# Seconds a process gets to exit after SIGTERM before it is killed
+TERMINATE_GRACE_SECONDS: float = 10.0
+
+# Seconds to wait for a process's output to be drained once it has exited
+DRAIN_TIMEOUT_SECONDS: float = 5.0
+
+# Bytes read from a process's output at a time
+_READ_CHUNK_BYTES: int = 64 * 1024
+
+# Longest line passed on by pump_output; the rest of a longer line is dropped
+MAX_LINE_BYTES: int = 1024 * 1024
+
+
+def _signal_process(
+    process: subprocess.Popen[Any], signum: int, own_group: bool
+) -> None:
+    """Send a signal to a process, or to its whole process group."""
+    try:
+        if own_group:
+            os.killpg(process.pid, signum)
+        else:
+            process.send_signal(signum)
+    except ProcessLookupError:
+        pass
+
+
+def stop_processes(
+    processes: set[subprocess.Popen[Any]], own_group: bool = True
+) -> None:
+    """Stop processes with SIGTERM, then SIGKILL those still running after a grace period.
+
+    With own_group, the processes were started in their own process group
+    (process_group=0) and the signals go to the whole group, so whatever
+    they left behind in it is killed too.
+    """
+    for process in processes:
+        _signal_process(process, signal.SIGTERM, own_group)
+    deadline = time.monotonic() + TERMINATE_GRACE_SECONDS
+    for process in processes:
+        try:
+            process.wait(timeout=max(0.0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            pass
+        _signal_process(process, signal.SIGKILL, own_group)
+        process.wait()
+
+
+class ProcessGroups:
+    """Processes running in their own process group, tracked until waited for.
+
+    Such processes do not get the terminal's Ctrl-C, so on an interrupt the
+    ones waited for on worker threads must be stopped explicitly (see
+    terminate), or their threads would keep the command from exiting.
+    """
+
+    def __init__(self) -> None:
+        self._processes: set[subprocess.Popen[Any]] = set()
+        self._lock = threading.Lock()
+
+    def add(self, process: subprocess.Popen[Any]) -> None:
+        with self._lock:
+            self._processes.add(process)
+
+    def discard(self, process: subprocess.Popen[Any]) -> None:
+        with self._lock:
+            self._processes.discard(process)
+
+    def terminate(self) -> None:
+        """Stop every tracked process with its process group (see stop_processes)."""
+        with self._lock:
+            processes = set(self._processes)
+        stop_processes(processes)
+
+
+def pump_output(
+    stream: IO[bytes],
+    on_chunk: Callable[[bytes], None] | None = None,
+    on_line: Callable[[bytes], None] | None = None,
+) -> None:
+    """Pass a process's output on as it arrives, until the stream closes.
+
+    Reads in chunks of at most _READ_CHUNK_BYTES and passes each to
+    on_chunk, and each line, without its line ending and cut to
+    MAX_LINE_BYTES, to on_line; memory stays bounded whatever the process
+    prints.
+    """
+    line = bytearray()
+    try:
+        while chunk := os.read(stream.fileno(), _READ_CHUNK_BYTES):
+            if on_chunk is not None:
+                on_chunk(chunk)
+            if on_line is None:
+                continue
+            *complete, rest = chunk.split(b"\n")
+            for piece in complete:
+                line += piece
+                on_line(bytes(line[:MAX_LINE_BYTES]))
+                line.clear()
+            line += rest
+            del line[MAX_LINE_BYTES:]
+        if line and on_line is not None:
+            on_line(bytes(line))
+    except ValueError:
+        # The stream, or what the output is copied to, was closed: the
+        # caller stopped waiting for the output
+        pass
+
+
+def drain_output(pump: threading.Thread, stream: IO[Any]) -> None:
+    """Wait for the thread reading a process's output, once the process has exited.
+
+    A process that left the group may still hold the pipe open, so reading
+    stops after DRAIN_TIMEOUT_SECONDS rather than waiting for it; the stream
+    is only closed once the thread is done with it.
+    """
+    pump.join(DRAIN_TIMEOUT_SECONDS)
+    if not pump.is_alive():
+        stream.close()
@@ -0,0 +1,176 @@
+import hashlib
+import os
+import shutil
+import stat
+from pathlib import Path
+
+# Content-addressed store of shared scaffold files, inside the bench directory
+BLOB_STORE_DIR_NAME: str = ".blobs"
+
+_WRITE_BITS: int = stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH
+
+
+def _is_shared(st: os.stat_result) -> bool:
+    """Return True if a file is a read-only link to a blob.
+
+    Shared files are hardlinks to a blob and have every write bit cleared,
+    which is how they are told apart from ordinary files without hashing.
+    """
+    return st.st_nlink > 1 and not st.st_mode & _WRITE_BITS
+
+
+def _blob_path(store: Path, digest: str) -> Path:
+    return store / digest[:2] / digest
+
+
+def _file_digest(path: Path) -> str:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _iter_files(tree: Path) -> list[tuple[Path, os.stat_result]]:
+    """Return every regular file under tree (not following symlinks) with its lstat."""
+    files: list[tuple[Path, os.stat_result]] = []
+    for dirpath, _dirnames, filenames in os.walk(tree):
+        for filename in filenames:
+            path = Path(dirpath) / filename
+            st = path.lstat()
+            if stat.S_ISREG(st.st_mode):
+                files.append((path, st))
+    return files
+
+
+def _ensure_store(store: Path) -> None:
+    if not store.is_dir():
+        store.mkdir(parents=True, exist_ok=True)
+        (store / ".gitignore").write_text("*\n")
+
+
+def share_tree(tree: Path, store: Path) -> dict[str, int]:
+    """Turn every file under a directory into a read-only link to its blob.
+
+    Files already shared are skipped without being read, so sharing a tree
+    again only hashes files that were added or replaced since. A file whose
+    content is not in the store yet becomes the blob itself (it is
+    hardlinked into the store); a file whose content is already stored is
+    replaced by a link to the existing blob, once the blob is hashed again
+    to check it still holds that content. Either way its write bits are
+    cleared, so tools that respect permissions cannot edit the shared blob
+    in place (see unshare_tree).
+
+    Args:
+        tree: Directory whose files to share.
+        store: The blob store directory (created if missing).
+
+    Returns:
+        Number of files per outcome: {"shared", "new", "deduplicated"}.
+
+    Raises:
+        OSError: If a file cannot be read or linked.
+    """
+    _ensure_store(store)
+    counts = {"shared": 0, "new": 0, "deduplicated": 0}
+    for path, st in _iter_files(tree):
+        if _is_shared(st):
+            counts["shared"] += 1
+            continue
+
+        digest = _file_digest(path)
+        blob = _blob_path(store, digest)
+        blob.parent.mkdir(exist_ok=True)
+        os.chmod(path, stat.S_IMODE(st.st_mode) & ~_WRITE_BITS)
+
+        try:
+            blob_st = blob.stat()
+        except FileNotFoundError:
+            blob_st = None
+        if blob_st is not None and blob_st.st_ino == st.st_ino:
+            counts["shared"] += 1
+        elif blob_st is None or _file_digest(blob) != digest:
+            # New content, or a blob that was modified in place (write bits
+            # do not stop root): this file becomes the blob
+            tmp = blob.with_name(f".{digest}.{os.getpid()}.tmp")
+            os.link(path, tmp)
+            os.replace(tmp, blob)
+            counts["new"] += 1
+        else:
+            tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            os.link(blob, tmp)
+            os.replace(tmp, path)
+            counts["deduplicated"] += 1
+    return counts
+
+
+def clone_shared_tree(src: Path, dst: Path, store: Path) -> dict[str, int]:
+    """Clone a directory tree as links to shared blobs.
+
+    The source tree is shared first (see share_tree), then the copy is made
+    of hardlinks to the same blobs, so cloning an already shared tree only
+    creates directories and links: its cost depends on the number of files,
+    not their size, and the copy takes no extra disk space.
+
+    Args:
+        src: Directory to clone; its files become shared too.
+        dst: Destination directory; must not exist.
+        store: The blob store directory.
+
+    Returns:
+        The counts from sharing the source tree (see share_tree).
+
+    Raises:
+        OSError: If the tree cannot be shared or linked.
+    """
+    counts = share_tree(src, store)
+    shutil.copytree(src, dst, copy_function=os.link)
+    return counts
+
+
+def unshare_tree(tree: Path) -> int:
+    """Give every shared file under a directory a private, writable copy.
+
+    Used before something that may edit the files in place (e.g., the agent
+    behind `bench map update`) is let loose on the tree; shared files are
+    links to blobs also used by other directories, so editing one in place
+    would change all of them.
+
+    Args:
+        tree: Directory whose shared files to copy.
+
+    Returns:
+        The number of files copied.
+
+    Raises:
+        OSError: If a file cannot be copied.
+    """
+    copied = 0
+    for path, st in _iter_files(tree):
+        if not _is_shared(st):
+            continue
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        shutil.copy2(path, tmp)
+        os.chmod(tmp, stat.S_IMODE(st.st_mode) | stat.S_IWUSR)
+        os.replace(tmp, path)
+        copied += 1
+    return copied
+
+
+def prune_blob_store(store: Path) -> int:
+    """Remove blobs that no shared file links to anymore.
+
+    A blob's only link is then the store's own, so it is no longer used.
+    Does nothing if the store does not exist.
+
+    Args:
+        store: The blob store directory.
+
+    Returns:
+        The number of blobs removed.
+    """
+    removed = 0
+    if not store.is_dir():
+        return removed
+    for path, st in _iter_files(store):
+        if st.st_nlink == 1 and path.name != ".gitignore":
+            path.unlink(missing_ok=True)
+            removed += 1
+    return removed
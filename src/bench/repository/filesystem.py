@@ -1,11 +1,58 @@
+import errno
+import hashlib
+import json
+import marshal
 import os
 import shutil
-import subprocess
+import stat
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+from bench.model.config import CloneMode, Concurrency, Models
+from bench.repository.blobstore import BLOB_STORE_DIR_NAME, clone_shared_tree
+
+# Prefer libyaml's C loader and dumper; fall back to the pure-Python safe
+# implementations when PyYAML was built without libyaml. Both emit the same
+# documents for the plain dicts, lists and scalars bench writes.
+try:
+    from yaml import CSafeDumper as YamlDumper
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeDumper as YamlDumper
+    from yaml import SafeLoader as YamlLoader
+
+try:
+    import fcntl
+
+    HAS_FCNTL: bool = True
+except ImportError:  # pragma: no cover - not available on Windows
+    HAS_FCNTL = False
+
+# ioctl request that makes a file share another file's data extents
+# (copy-on-write), from <linux/fs.h>
+_FICLONE: int = 0x40049409
+
+# errno values meaning a reflink or hardlink cannot be made between two
+# paths at all (unsupported filesystem, different filesystems, ...), as
+# opposed to a failure specific to one file
+_CLONE_UNSUPPORTED_ERRNOS: frozenset[int] = frozenset(
+    {
+        errno.EOPNOTSUPP,
+        errno.ENOTTY,
+        errno.EXDEV,
+        errno.EINVAL,
+        errno.ENOSYS,
+        errno.EPERM,
+    }
+)
+
 # The canonical and fallback bench directory names
 BENCH_DIR_NAMES: list[str] = [".bench", "bench"]
 
@@ -15,10 +62,42 @@ WORKBENCH_CONFIG_FILENAME: str = "workbench-config.yaml"
 # Default bench directory name used when creating new structures
 BENCH_DIR_NAME_DEFAULT: str = ".bench"
 
+# Per-bench-directory cache of derived data (e.g., validated configs). Everything
+# under it can be deleted at any time; bench rebuilds it on demand.
+CACHE_DIR_NAME: str = ".cache"
+
+# Index of a workbench's task folders, kept in the workbench bench directory's
+# cache. It is marshal (not json) so the completion fast path can read it
+# without importing the json machinery; see bench.completion.
+TASK_INDEX_FILENAME: str = "tasks.marshal"
+
+# Output of agent sessions run in the background, kept in the bench
+# directory's cache (e.g., one log per repo for `bench map init --parallel`)
+LOGS_DIR_NAME: str = "logs"
+
+# One line per headless agent session attempt (outcome, duration, retries),
+# in a logs directory (the task folder's for `task implement`)
+SESSIONS_LOG_FILENAME: str = "sessions.log"
+
+# Project-wide queue of `task implement` jobs, in the root bench directory
+QUEUE_FILENAME: str = "queue.yaml"
+
+# Ledger of agent sessions (one JSON object per line, appended to as they
+# end), in the root bench directory; see `bench stats`
+TELEMETRY_FILENAME: str = "telemetry.jsonl"
+
+# Bump when the layout of the task index changes.
+_TASK_INDEX_VERSION: int = 1
+
+# Files modified within this window are never trusted from a cache: a second
+# change in the same mtime tick would otherwise go unnoticed.
+_RACY_WINDOW_NS: int = 2_000_000_000
+
 # Subdirectory and file names for bench scaffolding
 WORKBENCH_DIR_NAME: str = "workbench"
 FILES_DIR_NAME: str = "files"
 SCRIPTS_DIR_NAME: str = "scripts"
+SCRIPTS_MANIFEST_FILENAME: str = "scripts.yaml"
 PROMPTS_DIR_NAME: str = "prompts"
 AGENTS_MD_FILENAME: str = "AGENTS.md"
 GITKEEP_FILENAME: str = ".gitkeep"
@@ -31,9 +110,11 @@ BENCH_SUBDIR_NAME: str = "bench"
 REPO_DIR_NAME: str = "repo"
 MAPS_DIR_NAME: str = "maps"
 METAMAP_FILENAME: str = "metamap.md"
+MAP_STATE_FILENAME: str = "map-state.yaml"
 
 # Task scaffold file names
 TASK_YAML_FILENAME: str = "task.yaml"
+TASK_CHECKPOINTS_FILENAME: str = "checkpoints.yaml"
 SPEC_MD_FILENAME: str = "spec.md"
 FILES_MD_FILENAME: str = "files.md"
 IMPL_MD_FILENAME: str = "impl.md"
@@ -47,6 +128,7 @@ DISCUSSIONS_PLACEHOLDER: str = "{{DISCUSSIONS}}"
 EXISTING_DISCUSSIONS_PLACEHOLDER: str = "{{EXISTING_DISCUSSIONS}}"
 MAPS_LOCATION_PLACEHOLDER: str = "{{MAPS_LOCATION}}"
 MAPS_PLACEHOLDER: str = "{{MAPS}}"
+CHANGES_PLACEHOLDER: str = "{{CHANGES}}"
 
 SPEC_TEMPLATE: str = """\
 # Spec
@@ -76,6 +158,8 @@ TASK_UPDATE_CHANGE_DOCS_FILENAME: str = "task-update-change-docs.md"
 TASK_FOLLOWUP_FILENAME: str = "task-followup.md"
 MAP_INIT_PROMPT_FILENAME: str = "map-init.md"
 MAP_UPDATE_PROMPT_FILENAME: str = "map-update.md"
+MAP_INIT_REPO_PROMPT_FILENAME: str = "map-init-repo.md"
+MAP_METAMAP_PROMPT_FILENAME: str = "map-metamap.md"
 
 # Prompt seed templates
 TASK_CREATE_SPEC_TEMPLATE: str = """\
@@ -409,14 +493,19 @@ maps-location: {{MAPS_LOCATION}}
 
 {{REPOSITORIES}}
 
-You are updating existing markdown maps of the repositories listed above. Maps were previously generated and may be outdated.
+{{CHANGES}}
+
+You are updating existing markdown maps of the repositories listed above. Maps were previously generated and may be outdated. The <changes> block lists, for each repository, the files that changed since its maps were last generated, together with the map files that mention each changed file.
 
 Tasks:
 
 - Read `{maps-location}/metamap.md` to understand the current map structure
 - For each repository listed in <repositories>:
-  1. Read the existing `{maps-location}/<repo-name>/schema.md` and map files
-  2. Explore the repository to identify what has changed or is missing from the current maps
+  1. Read the existing `{maps-location}/<repo-name>/schema.md`
+  2. Work out what changed from the repository's entry in <changes>:
+     - Read the changed files, and the map files listed for them
+     - Use `schema.md` to find the map files that should cover changed files no map file mentions yet
+     - Only explore the rest of the repository if <changes> says the whole repository must be explored, or if a change cannot be understood without its surroundings
   3. Update the map files to reflect the current state of the repository:
      - Add documentation for new modules, classes, functions, or features
      - Update documentation for modified components
@@ -431,6 +520,54 @@ Tasks:
 This is a non-interactive session. Do not ask the user any questions.
 """
 
+MAP_INIT_REPO_PROMPT_TEMPLATE: str = """\
+maps-location: {{MAPS_LOCATION}}
+
+{{REPOSITORIES}}
+
+You are creating structured markdown maps of the repository listed above. These maps will be used by AI agents as a primary reference to understand the codebase without needing to read source files directly.
+
+Other repositories are being mapped by separate sessions at the same time. Only write inside `{maps-location}/<repo-name>/` for the repository listed above, and do not write `{maps-location}/metamap.md`; it is written once every repository is mapped.
+
+Tasks:
+
+1. Explore the repository thoroughly -- read key files, understand the architecture, identify major components, data flows, and conventions
+2. Design a schema for mapping this repository into markdown files where no single file exceeds 2500 lines
+   - Write this schema to `{maps-location}/<repo-name>/schema.md`
+   - The schema should define what each map file covers and how they relate to each other
+3. Following the schema, create comprehensive markdown map files in `{maps-location}/<repo-name>/` that document:
+   - Architecture and module structure
+   - Key abstractions, classes, functions, and their relationships
+   - Data flows and control flows
+   - Configuration and conventions
+   - Integration points between components
+4. If any map file approaches 2500 lines, split it into multiple files and update `schema.md` accordingly
+
+This is a non-interactive session. Do not ask the user any questions.
+"""
+
+MAP_METAMAP_PROMPT_TEMPLATE: str = """\
+maps-location: {{MAPS_LOCATION}}
+
+{{REPOSITORIES}}
+
+You are writing the entry point for the markdown maps of the repositories listed above. Each repository has already been mapped into `{maps-location}/<repo-name>/`, where `schema.md` describes its map files.
+
+Tasks:
+
+1. Read the `schema.md` of every repository listed in <repositories>. Do not read the other map files or the repositories themselves
+2. Write `{maps-location}/metamap.md` that serves as the top-level entry point:
+   - Summarize what each repository contains and what its map covers
+   - Provide clear navigation instructions: which `schema.md` to read for which type of information
+   - Include these instructions for AI agents consuming the maps:
+     - Start with `metamap.md` to orient yourself
+     - Read the relevant `schema.md` to find which map files contain the information you need
+     - Load map files on-demand to conserve tokens -- do not read all maps upfront
+     - Only read actual source files in the repository when the maps do not contain sufficient detail for your specific task
+
+This is a non-interactive session. Do not ask the user any questions.
+"""
+
 # Default implementation flow template (written into base-config.yaml at init)
 DEFAULT_IMPLEMENTATION_FLOW_TEMPLATE: list[dict[str, str | list[str]]] = [
     {
@@ -465,6 +602,8 @@ PROMPT_SEED_FILES: dict[str, str] = {
     POPULATE_AGENTS_PROMPT_FILENAME: POPULATE_AGENTS_PROMPT_TEMPLATE,
     MAP_INIT_PROMPT_FILENAME: MAP_INIT_PROMPT_TEMPLATE,
     MAP_UPDATE_PROMPT_FILENAME: MAP_UPDATE_PROMPT_TEMPLATE,
+    MAP_INIT_REPO_PROMPT_FILENAME: MAP_INIT_REPO_PROMPT_TEMPLATE,
+    MAP_METAMAP_PROMPT_FILENAME: MAP_METAMAP_PROMPT_TEMPLATE,
 }
 
 
@@ -562,7 +701,7 @@ def load_yaml_file(path: Path) -> dict[str, Any]:
         ValueError: If the YAML file is empty or does not contain a mapping.
     """
     with open(path) as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=YamlLoader)
 
     if data is None:
         raise ValueError(f"YAML file is empty: {path}")
@@ -574,7 +713,13 @@ def load_yaml_file(path: Path) -> dict[str, Any]:
 
 
 def save_yaml_file(path: Path, data: dict[str, Any]) -> None:
-    """Write a dictionary to a YAML file.
+    """Write a dictionary to a YAML file atomically.
+
+    The YAML is written to a temporary file in the same directory, fsync'd,
+    and renamed over the target, so readers see either the old or the new
+    file and a crash never leaves a truncated one. The directory is fsync'd
+    afterwards so the rename itself is durable. An existing file's
+    permissions are preserved.
 
     Args:
         path: Path to the YAML file.
@@ -583,8 +728,191 @@ def save_yaml_file(path: Path, data: dict[str, Any]) -> None:
     Raises:
         OSError: If the file cannot be written.
     """
-    with open(path, "w") as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+    content = yaml.dump(
+        data, Dumper=YamlDumper, default_flow_style=False, sort_keys=False
+    )
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        if path.exists():
+            shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    _fsync_directory(path.parent)
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Flush a directory entry change (e.g., a rename) to disk, where supported."""
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+@contextmanager
+def locked_file(path: Path, lock_path: Path | None = None) -> Iterator[None]:
+    """Hold an exclusive advisory lock for read-modify-write cycles on a file.
+
+    The lock is taken on a separate lock file (the file itself is replaced
+    on every save, so it cannot carry the lock) and blocks until other bench
+    processes release it. Locks are advisory: they only coordinate callers
+    that use this function. On platforms without fcntl the lock is a no-op.
+
+    Args:
+        path: Path to the file being updated.
+        lock_path: The lock file; defaults to `<name>.lock` in the `.cache`
+            directory next to `path`. Callers that update files in user
+            directories (e.g., task folders) pass one under the bench
+            directory's `.cache` instead (see task_lock_path).
+
+    Raises:
+        OSError: If the lock file or its directory cannot be created.
+    """
+    if not HAS_FCNTL:
+        yield
+        return
+
+    if lock_path is None:
+        lock_path = path.parent / CACHE_DIR_NAME / f"{path.name}.lock"
+    _ensure_cache_dir(lock_path.parent)
+    with open(lock_path, "a") as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def task_lock_path(task_folder_path: Path, filename: str) -> Path:
+    """Return the lock file for a file of a task folder (see locked_file).
+
+    Task locks live in the `.cache` directory of the bench directory holding
+    the tasks, keyed by the task folder name, so task folders only contain
+    the user's files.
+
+    Args:
+        task_folder_path: Absolute path to the task folder.
+        filename: Name of the file in the task folder being updated.
+    """
+    bench_dir = task_folder_path.parent.parent
+    return bench_dir / CACHE_DIR_NAME / f"{task_folder_path.name}.{filename}.lock"
+
+
+@contextmanager
+def locked_yaml_update(path: Path) -> Iterator[dict[str, Any]]:
+    """Load a YAML file under an exclusive lock and save it back on success.
+
+    Yields the parsed mapping for in-place mutation. When the block exits
+    normally the mapping is written back atomically (see save_yaml_file)
+    before the lock is released; if the block raises, nothing is written.
+    Validation that depends on the file's contents (e.g., name uniqueness)
+    belongs inside the block, since another process may have changed the
+    file since it was last read.
+
+    Args:
+        path: Path to the YAML file.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        yaml.YAMLError: If the file contains invalid YAML.
+        ValueError: If the YAML file is empty or does not contain a mapping.
+        OSError: If the file cannot be locked or written.
+    """
+    with locked_file(path):
+        data = load_yaml_file(path)
+        yield data
+        save_yaml_file(path, data)
+
+
+def file_signature(path: Path) -> tuple[int, int, int] | None:
+    """Return a cheap change signature for a file: (mtime_ns, size, inode).
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        The signature tuple, or None if the file cannot be stat'ed.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def file_digest(path: Path) -> str | None:
+    """Return the SHA-256 hex digest of a file's content.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        The digest, or None if the file does not exist or cannot be read.
+    """
+    try:
+        with open(path, "rb") as f:
+            return hashlib.file_digest(f, "sha256").hexdigest()
+    except OSError:
+        return None
+
+
+def load_cache_blob(cache_dir: Path, name: str) -> bytes | None:
+    """Read a cache entry written by save_cache_blob.
+
+    Args:
+        cache_dir: Path to the cache directory (e.g., .bench/.cache).
+        name: File name of the cache entry.
+
+    Returns:
+        The entry's bytes, or None if it does not exist or cannot be read.
+    """
+    try:
+        return (cache_dir / name).read_bytes()
+    except OSError:
+        return None
+
+
+def _ensure_cache_dir(cache_dir: Path) -> None:
+    """Create a cache directory with a `.gitignore` that excludes its contents."""
+    if not cache_dir.is_dir():
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        (cache_dir / ".gitignore").write_text("*\n")
+
+
+def save_cache_blob(cache_dir: Path, name: str, data: bytes) -> None:
+    """Write a cache entry, best-effort.
+
+    The entry is written to a temporary file and renamed into place so that
+    concurrent readers never see a partial entry. The cache directory is
+    created on first use with a `.gitignore` that excludes its contents.
+    Failures are ignored: a missing cache entry only costs a rebuild.
+
+    Args:
+        cache_dir: Path to the cache directory (e.g., .bench/.cache).
+        name: File name of the cache entry.
+        data: Bytes to store.
+    """
+    try:
+        _ensure_cache_dir(cache_dir)
+        tmp_path = cache_dir / f".{name}.{os.getpid()}.tmp"
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, cache_dir / name)
+    except OSError:
+        pass
 
 
 def remove_workbench_workspace(workspace_path: Path) -> None:
@@ -652,18 +980,14 @@ def create_bench_scaffold(root_path: Path) -> list[str]:
 
     # Write base-config.yaml
     config_path = bench_dir / BASE_CONFIG_FILENAME
-    # Note: the "task" default is duplicated in model/config.py (Models.task).
-    # The architecture forbids repository from importing model, so the value
-    # appears in both places intentionally.
+    # The models and concurrency defaults come from the config model, so a
+    # new project lists every setting with its default value
     save_yaml_file(
         config_path,
         {
             "sources": [],
-            "models": {
-                "task": "anthropic/claude-opus-4-6",
-                "discuss": "anthropic/claude-opus-4-6",
-                "map": "anthropic/claude-opus-4-6",
-            },
+            "models": Models().model_dump(include={"task", "discuss", "map"}),
+            "concurrency": Concurrency().model_dump(),
             "implementation-flow-template": DEFAULT_IMPLEMENTATION_FLOW_TEMPLATE,
         },
     )
@@ -701,11 +1025,99 @@ def create_bench_scaffold(root_path: Path) -> list[str]:
     return created
 
 
+def _reflink_file(src: str, dst: str) -> None:
+    """Create dst as a copy-on-write clone of src (Linux FICLONE).
+
+    Raises:
+        OSError: If the clone cannot be made; dst is not left behind.
+    """
+    if not HAS_FCNTL or not sys.platform.startswith("linux"):
+        raise OSError(errno.EOPNOTSUPP, "reflinks are not supported", dst)
+    with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+        try:
+            fcntl.ioctl(dst_file.fileno(), _FICLONE, src_file.fileno())
+        except OSError:
+            dst_file.close()
+            os.unlink(dst)
+            raise
+    shutil.copystat(src, dst)
+
+
+class _FileCloner:
+    """shutil.copytree copy_function that shares file data where it can.
+
+    Tries the methods allowed by the clone mode in order (reflink, then
+    hardlink for HARDLINK, then a plain copy) and counts what each file got.
+    A method that fails because the filesystem cannot do it is not tried
+    again for the rest of the tree.
+    """
+
+    def __init__(self, mode: CloneMode) -> None:
+        self.reflink = mode in (CloneMode.REFLINK, CloneMode.HARDLINK)
+        self.hardlink = mode == CloneMode.HARDLINK
+        self.counts: dict[str, int] = {"reflink": 0, "hardlink": 0, "copy": 0}
+
+    def __call__(self, src: str, dst: str) -> str:
+        if self.reflink:
+            try:
+                _reflink_file(src, dst)
+            except OSError as e:
+                if e.errno not in _CLONE_UNSUPPORTED_ERRNOS:
+                    raise
+                self.reflink = False
+            else:
+                self.counts["reflink"] += 1
+                return dst
+        if self.hardlink:
+            try:
+                os.link(src, dst)
+            except OSError as e:
+                if e.errno in _CLONE_UNSUPPORTED_ERRNOS:
+                    self.hardlink = False
+                elif e.errno != errno.EMLINK:
+                    raise
+            else:
+                self.counts["hardlink"] += 1
+                return dst
+        shutil.copy2(src, dst)
+        self.counts["copy"] += 1
+        return dst
+
+
+def clone_tree(src: Path, dst: Path, mode: CloneMode) -> dict[str, int]:
+    """Copy a directory tree, sharing file data with the source where possible.
+
+    - COPY copies every file (like shutil.copytree).
+    - REFLINK clones each file copy-on-write (FICLONE on Linux, e.g. Btrfs,
+      XFS, bcachefs), so the copy takes no extra space until either side is
+      modified; the files stay fully independent. Falls back to a copy where
+      the filesystem cannot reflink.
+    - HARDLINK tries a reflink, then a hardlink, then a copy. Hardlinked
+      files are the same file as the source: writing to one in place changes
+      the other, so only use it for trees treated as read-only.
+
+    Args:
+        src: Directory to copy.
+        dst: Destination directory; must not exist.
+        mode: The clone mode.
+
+    Returns:
+        Number of files cloned by each method: {"reflink", "hardlink", "copy"}.
+
+    Raises:
+        OSError: If the tree cannot be copied.
+    """
+    cloner = _FileCloner(mode)
+    shutil.copytree(src, dst, copy_function=cloner)
+    return cloner.counts
+
+
 def create_workbench_scaffold(
     root_path: Path,
     bench_dir_name: str,
     workbench_name: str,
     workbench_config_data: dict[str, Any],
+    clone_modes: dict[str, CloneMode] | None = None,
 ) -> list[str]:
     """Create the .bench/workbench/<name>/ directory structure.
 
@@ -718,6 +1130,7 @@ def create_workbench_scaffold(
         - <bench_dir>/workbench/<name>/bench/discussions/ (copied from <bench_dir>/discussions/)
         - <bench_dir>/workbench/<name>/bench/tasks/ (with .gitkeep)
         - <bench_dir>/workbench/<name>/bench/files/ (copied from <bench_dir>/files/)
+        - <bench_dir>/workbench/<name>/bench/maps/ (copied from <bench_dir>/maps/)
         - <bench_dir>/workbench/<name>/bench/prompts/ (copied from <bench_dir>/prompts/)
         - <bench_dir>/workbench/<name>/bench/scripts/ (copied from <bench_dir>/scripts/)
 
@@ -726,6 +1139,9 @@ def create_workbench_scaffold(
         bench_dir_name: The bench directory name (".bench" or "bench").
         workbench_name: The name of the workbench.
         workbench_config_data: Dict to serialize as workbench-config.yaml.
+        clone_modes: Clone mode of each copied directory, keyed by directory
+            name (see clone_tree, and clone_shared_tree for SHARED);
+            directories not listed are copied.
 
     Returns:
         A list of relative paths (strings) of created items.
@@ -767,7 +1183,7 @@ def create_workbench_scaffold(
     (tasks_dir / GITKEEP_FILENAME).touch()
     created.append(f"{rel_prefix}/{BENCH_SUBDIR_NAME}/{TASKS_DIR_NAME}/")
 
-    # 7-11. Copy discussions/, files/, maps/, prompts/, scripts/ from bench dir
+    # 7-11. Clone discussions/, files/, maps/, prompts/, scripts/ from bench dir
     for subdir_name in [
         DISCUSSIONS_DIR_NAME,
         FILES_DIR_NAME,
@@ -777,7 +1193,11 @@ def create_workbench_scaffold(
     ]:
         src_dir = bench_dir / subdir_name
         dst_dir = wb_bench_dir / subdir_name
-        shutil.copytree(src_dir, dst_dir)
+        clone_mode = (clone_modes or {}).get(subdir_name, CloneMode.COPY)
+        if clone_mode == CloneMode.SHARED:
+            clone_shared_tree(src_dir, dst_dir, bench_dir / BLOB_STORE_DIR_NAME)
+        else:
+            clone_tree(src_dir, dst_dir, clone_mode)
         created.append(f"{rel_prefix}/{BENCH_SUBDIR_NAME}/{subdir_name}/")
 
     return created
@@ -844,7 +1264,7 @@ def discover_scripts(scripts_dir: Path) -> tuple[list[Path], list[Path]]:
     """Discover executable scripts in a directory.
 
     Scans top-level files (not subdirectories) in ``scripts_dir``, excluding
-    hidden files and ``.gitkeep``.  Files with the executable bit set are
+    hidden files, ``.gitkeep`` and the ``scripts.yaml`` manifest.  Files with the executable bit set are
     returned as executable scripts; the rest are returned as non-executable
     files (so the caller can warn about them).
 
@@ -864,7 +1284,10 @@ def discover_scripts(scripts_dir: Path) -> tuple[list[Path], list[Path]]:
     for entry in scripts_dir.iterdir():
         if not entry.is_file():
             continue
-        if entry.name.startswith(".") or entry.name == GITKEEP_FILENAME:
+        if entry.name.startswith(".") or entry.name in (
+            GITKEEP_FILENAME,
+            SCRIPTS_MANIFEST_FILENAME,
+        ):
             continue
 
         if os.access(entry, os.X_OK):
@@ -878,27 +1301,23 @@ def discover_scripts(scripts_dir: Path) -> tuple[list[Path], list[Path]]:
     return (executable, non_executable)
 
 
-def run_script(script_path: Path, working_dir: Path, env_vars: dict[str, str]) -> int:
-    """Execute a single script with the given working directory and environment.
-
-    Runs the script as a subprocess, streaming stdout and stderr directly to
-    the terminal (no output capture).
+def load_scripts_manifest(scripts_dir: Path) -> dict[str, Any]:
+    """Load the scripts.yaml manifest of a scripts directory as a dict.
 
     Args:
-        script_path: Absolute path to the script to execute.
-        working_dir: Working directory for the subprocess.
-        env_vars: Extra environment variables merged on top of ``os.environ``.
+        scripts_dir: Path to the scripts directory.
 
     Returns:
-        The exit code of the script process.
+        Parsed YAML content, or an empty dict if there is no manifest.
+
+    Raises:
+        ValueError: If scripts.yaml is empty or does not contain a mapping.
+        yaml.YAMLError: If scripts.yaml contains invalid YAML.
     """
-    env = {**os.environ, **env_vars}
-    result = subprocess.run(
-        [str(script_path)],
-        cwd=working_dir,
-        env=env,
-    )
-    return result.returncode
+    manifest_path = scripts_dir / SCRIPTS_MANIFEST_FILENAME
+    if not manifest_path.is_file():
+        return {}
+    return load_yaml_file(manifest_path)
 
 
 def create_task_scaffold(
@@ -960,11 +1379,131 @@ def create_task_scaffold(
     return created
 
 
+def _split_task_folder_name(folder_name: str) -> tuple[str, str] | None:
+    """Split a 'YYYYMMDD - <name>' folder name into (date, name), or None."""
+    parts = folder_name.split(" - ", maxsplit=1)
+    if len(parts) != 2 or len(parts[0]) != 8 or not parts[0].isdigit():
+        return None
+    return (parts[0], parts[1])
+
+
+def _index_signature(path: Path) -> tuple[int, ...] | None:
+    """Return a path's signature for the task index.
+
+    Returns file_signature(path), an empty tuple if the path is missing, or
+    None if it was modified within the racy window. None is never equal to a
+    stored signature, so racy paths are always re-read.
+    """
+    signature = file_signature(path)
+    if signature is None:
+        return ()
+    if time.time_ns() - signature[0] < _RACY_WINDOW_NS:
+        return None
+    return signature
+
+
+class _TaskIndex:
+    """The task index of one tasks directory, validated against signatures.
+
+    The index maps each task folder name to the signature and fields of its
+    task.yaml. The set of folders is trusted while the tasks directory's
+    signature is unchanged, so listing and resolving task names is one stat
+    plus one file read. task.yaml is re-parsed only when its own signature
+    changes: files edited in place do not touch the directory's mtime.
+    """
+
+    def __init__(self, tasks_dir: Path) -> None:
+        self.tasks_dir = tasks_dir
+        self.cache_dir = tasks_dir.parent / CACHE_DIR_NAME
+        self.dirty = False
+        self.data: dict[str, Any] = {}
+        blob = load_cache_blob(self.cache_dir, TASK_INDEX_FILENAME)
+        if blob is not None:
+            try:
+                data = marshal.loads(blob)
+            except EOFError, ValueError, TypeError:
+                data = None
+            if isinstance(data, dict) and data.get("version") == _TASK_INDEX_VERSION:
+                self.data = data
+        if not self.data:
+            self.data = {"version": _TASK_INDEX_VERSION, "dir": None, "tasks": {}}
+
+    def folders(self) -> dict[str, dict[str, Any]]:
+        """Return the entries of all task folders, rescanning the directory if it changed."""
+        tasks: dict[str, dict[str, Any]] = self.data["tasks"]
+        dir_signature = _index_signature(self.tasks_dir)
+        if dir_signature is not None and dir_signature == self.data["dir"]:
+            return tasks
+
+        folder_names: list[str] = []
+        if self.tasks_dir.is_dir():
+            folder_names = [
+                entry.name
+                for entry in self.tasks_dir.iterdir()
+                if entry.is_dir() and _split_task_folder_name(entry.name)
+            ]
+        self.data["tasks"] = {name: tasks.get(name, {}) for name in folder_names}
+        self.data["dir"] = dir_signature
+        self.dirty = True
+        return self.data["tasks"]
+
+    def refresh(self, folder_name: str) -> dict[str, Any]:
+        """Bring one folder's task.yaml fields up to date and return its entry."""
+        tasks: dict[str, dict[str, Any]] = self.data["tasks"]
+        entry = tasks.setdefault(folder_name, {})
+        task_folder = self.tasks_dir / folder_name
+
+        yaml_signature = _index_signature(task_folder / TASK_YAML_FILENAME)
+        if yaml_signature is None or entry.get(TASK_YAML_FILENAME) != yaml_signature:
+            entry.clear()
+            entry[TASK_YAML_FILENAME] = yaml_signature
+            try:
+                raw_data = load_yaml_file(task_folder / TASK_YAML_FILENAME)
+            except FileNotFoundError, ValueError, yaml.YAMLError:
+                entry["name"] = None
+            else:
+                parts = _split_task_folder_name(folder_name)
+                entry["name"] = raw_data.get("name", parts[1] if parts else folder_name)
+                entry["completed"] = raw_data.get("completed")
+                entry["repos"] = raw_data.get("repos", [])
+            self.dirty = True
+        return entry
+
+    def save(self) -> None:
+        """Write the index back if anything changed, best-effort."""
+        if not self.dirty:
+            return
+        try:
+            blob = marshal.dumps(self.data)
+        except ValueError:
+            # task.yaml holds a value marshal cannot store (e.g., a date)
+            return
+        save_cache_blob(self.cache_dir, TASK_INDEX_FILENAME, blob)
+        self.dirty = False
+
+
+def update_task_index(tasks_dir: Path, task_folder_name: str) -> None:
+    """Record a task folder's current state in the task index.
+
+    Called after bench creates or modifies a task so the next list or lookup
+    does not have to re-read it. Best-effort: the index is a cache and is
+    rebuilt from disk when missing or stale.
+
+    Args:
+        tasks_dir: The absolute path to the workbench's bench/tasks/ directory.
+        task_folder_name: The full folder name (e.g., "20260208 - add-auth").
+    """
+    index = _TaskIndex(tasks_dir)
+    index.folders()
+    index.refresh(task_folder_name)
+    index.save()
+
+
 def list_task_names(tasks_dir: Path) -> list[str]:
     """List existing task names from a tasks directory.
 
-    Scans subdirectories matching the 'YYYYMMDD - <name>' pattern and extracts
-    the task name portion.
+    Uses the task index for subdirectories matching the 'YYYYMMDD - <name>'
+    pattern and extracts the task name portion.
 
     Args:
         tasks_dir: The absolute path to the workbench's bench/tasks/ directory.
@@ -972,25 +1511,25 @@ def list_task_names(tasks_dir: Path) -> list[str]:
     Returns:
         A list of task name strings (the portion after 'YYYYMMDD - ').
     """
-    if not tasks_dir.is_dir():
-        return []
+    index = _TaskIndex(tasks_dir)
+    folder_names = list(index.folders())
+    index.save()
 
     names: list[str] = []
-    for entry in tasks_dir.iterdir():
-        if not entry.is_dir():
-            continue
-        parts = entry.name.split(" - ", maxsplit=1)
-        if len(parts) == 2 and len(parts[0]) == 8 and parts[0].isdigit():
+    for folder_name in folder_names:
+        parts = _split_task_folder_name(folder_name)
+        if parts is not None:
             names.append(parts[1])
     return names
 
 
 def list_task_entries(tasks_dir: Path) -> list[dict[str, Any]]:
-    """Scan the tasks directory and return raw task entry data.
+    """Return raw task entry data for the tasks directory, via the task index.
 
     For each subdirectory matching the 'YYYYMMDD - <name>' pattern:
-    - Loads and parses task.yaml (skips the entry if missing/malformed)
-    - Checks existence and non-emptiness of spec.md, impl.md, files.md
+    - Uses the task.yaml fields from the task index, re-parsing task.yaml
+      only if it changed (skips the entry if missing/malformed)
+    - Checks existence and non-emptiness of spec.md, impl.md, files.md, journal.md
     - Extracts the creation date from the folder name prefix
 
     Args:
@@ -1009,40 +1548,39 @@ def list_task_entries(tasks_dir: Path) -> list[dict[str, Any]]:
 
         Entries are returned in no guaranteed order; sorting is the service layer's responsibility.
     """
-    if not tasks_dir.is_dir():
-        return []
-
+    index = _TaskIndex(tasks_dir)
     entries: list[dict[str, Any]] = []
-    for entry in tasks_dir.iterdir():
-        if not entry.is_dir():
+    for folder_name in list(index.folders()):
+        parts = _split_task_folder_name(folder_name)
+        if parts is None:
             continue
-        parts = entry.name.split(" - ", maxsplit=1)
-        if len(parts) != 2 or len(parts[0]) != 8 or not parts[0].isdigit():
-            continue
-
-        # Try to load task.yaml; skip on any error
-        try:
-            raw_data = load_yaml_file(entry / TASK_YAML_FILENAME)
-        except FileNotFoundError, ValueError, yaml.YAMLError:
+        entry = index.refresh(folder_name)
+        if entry.get("name") is None:
             continue
 
-        task_name = raw_data.get("name", parts[1])
-
+        task_folder = tasks_dir / folder_name
         entries.append(
             {
-                "name": task_name,
-                "folder_name": entry.name,
+                "name": entry["name"],
+                "folder_name": folder_name,
                 "created_date": parts[0],
-                "completed": raw_data.get("completed"),
-                "has_spec": task_file_exists_and_nonempty(entry, SPEC_MD_FILENAME),
-                "has_impl": task_file_exists_and_nonempty(entry, IMPL_MD_FILENAME),
-                "has_files": task_file_exists_and_nonempty(entry, FILES_MD_FILENAME),
+                "completed": entry["completed"],
+                "has_spec": task_file_exists_and_nonempty(
+                    task_folder, SPEC_MD_FILENAME
+                ),
+                "has_impl": task_file_exists_and_nonempty(
+                    task_folder, IMPL_MD_FILENAME
+                ),
+                "has_files": task_file_exists_and_nonempty(
+                    task_folder, FILES_MD_FILENAME
+                ),
                 "has_journal": task_file_exists_and_nonempty(
-                    entry, JOURNAL_MD_FILENAME
+                    task_folder, JOURNAL_MD_FILENAME
                 ),
-                "repos": raw_data.get("repos", []),
+                "repos": entry["repos"],
             }
         )
+    index.save()
 
     return entries
 
@@ -1050,8 +1588,8 @@ def list_task_entries(tasks_dir: Path) -> list[dict[str, Any]]:
 def find_task_folder(tasks_dir: Path, task_name: str) -> tuple[Path, str]:
     """Resolve a task name to its folder path within the tasks directory.
 
-    Scans subdirectories matching the 'YYYYMMDD - <name>' pattern where
-    the <name> portion matches the given task_name.
+    Looks up task folders matching the 'YYYYMMDD - <name>' pattern where
+    the <name> portion matches the given task_name, via the task index.
 
     Args:
         tasks_dir: The absolute path to the workbench's bench/tasks/ directory.
@@ -1064,16 +1602,15 @@ def find_task_folder(tasks_dir: Path, task_name: str) -> tuple[Path, str]:
         ValueError: If no matching task is found.
         ValueError: If multiple tasks match (includes folder names for disambiguation).
     """
-    matches: list[tuple[Path, str]] = []
+    index = _TaskIndex(tasks_dir)
+    folder_names = list(index.folders())
+    index.save()
 
-    if tasks_dir.is_dir():
-        for entry in tasks_dir.iterdir():
-            if not entry.is_dir():
-                continue
-            parts = entry.name.split(" - ", maxsplit=1)
-            if len(parts) == 2 and len(parts[0]) == 8 and parts[0].isdigit():
-                if parts[1] == task_name:
-                    matches.append((entry, entry.name))
+    matches: list[tuple[Path, str]] = []
+    for folder_name in folder_names:
+        parts = _split_task_folder_name(folder_name)
+        if parts is not None and parts[1] == task_name:
+            matches.append((tasks_dir / folder_name, folder_name))
 
     if len(matches) == 0:
         raise ValueError(f'Task "{task_name}" not found in this workbench.')
@@ -1110,8 +1647,11 @@ def task_file_exists_and_nonempty(task_folder: Path, filename: str) -> bool:
     Returns:
         True if the file exists and has non-zero length, False otherwise.
     """
-    filepath = task_folder / filename
-    return filepath.is_file() and filepath.stat().st_size > 0
+    try:
+        st = (task_folder / filename).stat()
+    except OSError:
+        return False
+    return stat.S_ISREG(st.st_mode) and st.st_size > 0
 
 
 def load_task_yaml(task_folder: Path) -> dict[str, Any]:
@@ -1147,6 +1687,133 @@ def save_task_yaml(task_folder: Path, data: dict[str, Any]) -> None:
     save_yaml_file(task_folder / TASK_YAML_FILENAME, data)
 
 
+def load_task_checkpoints(task_folder: Path) -> dict[str, Any]:
+    """Load the checkpoints.yaml file of a task folder as a dict.
+
+    Args:
+        task_folder: Absolute path to the task folder.
+
+    Returns:
+        Parsed YAML content, or an empty dict if the task has no checkpoints.
+
+    Raises:
+        ValueError: If checkpoints.yaml is empty or does not contain a mapping.
+        yaml.YAMLError: If checkpoints.yaml contains invalid YAML.
+    """
+    checkpoints_path = task_folder / TASK_CHECKPOINTS_FILENAME
+    if not checkpoints_path.is_file():
+        return {}
+    return load_yaml_file(checkpoints_path)
+
+
+def save_task_checkpoints(task_folder: Path, data: dict[str, Any]) -> None:
+    """Write the checkpoints.yaml file of a task folder.
+
+    Args:
+        task_folder: Absolute path to the task folder.
+        data: Dictionary to serialize as YAML.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    save_yaml_file(task_folder / TASK_CHECKPOINTS_FILENAME, data)
+
+
+def load_job_queue(bench_dir: Path) -> dict[str, Any]:
+    """Load the queue.yaml file of a bench directory as a dict.
+
+    Args:
+        bench_dir: Absolute path to the root bench directory (e.g., .bench).
+
+    Returns:
+        Parsed YAML content, or an empty dict if nothing was ever queued.
+
+    Raises:
+        ValueError: If queue.yaml is empty or does not contain a mapping.
+        yaml.YAMLError: If queue.yaml contains invalid YAML.
+    """
+    queue_path = bench_dir / QUEUE_FILENAME
+    if not queue_path.is_file():
+        return {}
+    return load_yaml_file(queue_path)
+
+
+def save_job_queue(bench_dir: Path, data: dict[str, Any]) -> None:
+    """Write the queue.yaml file of a bench directory.
+
+    Args:
+        bench_dir: Absolute path to the root bench directory (e.g., .bench).
+        data: Dictionary to serialize as YAML.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    save_yaml_file(bench_dir / QUEUE_FILENAME, data)
+
+
+def append_log_line(log_path: Path, line: str) -> None:
+    """Append a line to a log file, creating it and its parent directories.
+
+    Args:
+        log_path: Absolute path to the log file.
+        line: The line to append, without its trailing newline.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(log_path, "a") as f:
+        f.write(line + "\n")
+
+
+def append_telemetry_record(bench_dir: Path, record: dict[str, Any]) -> None:
+    """Append a record to the telemetry ledger of a bench directory.
+
+    The record is written as one compact JSON line in a single append, so
+    records of sessions ending at the same time do not interleave.
+
+    Args:
+        bench_dir: Absolute path to the root bench directory (e.g., .bench).
+        record: JSON-serializable dictionary to append.
+
+    Raises:
+        OSError: If the ledger cannot be written.
+    """
+    line = json.dumps(record, separators=(",", ":")) + "\n"
+    with open(bench_dir / TELEMETRY_FILENAME, "a") as f:
+        f.write(line)
+
+
+def load_telemetry_records(bench_dir: Path) -> list[dict[str, Any]]:
+    """Load every record of the telemetry ledger of a bench directory.
+
+    Lines that are not JSON objects (e.g., a record cut short by a crash)
+    are skipped.
+
+    Args:
+        bench_dir: Absolute path to the root bench directory (e.g., .bench).
+
+    Returns:
+        The records, oldest first, or an empty list if nothing was recorded.
+
+    Raises:
+        OSError: If the ledger exists but cannot be read.
+    """
+    ledger_path = bench_dir / TELEMETRY_FILENAME
+    if not ledger_path.is_file():
+        return []
+    records: list[dict[str, Any]] = []
+    with open(ledger_path) as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict):
+                records.append(record)
+    return records
+
+
 def read_prompt_file(prompt_path: Path) -> str:
     """Read a prompt template file and return its contents.
 
@@ -1214,6 +1881,87 @@ def render_repositories_block(repo_dirs: list[str]) -> str:
     return "<repositories>\n</repositories>"
 
 
+def find_map_files_mentioning(
+    repo_maps_dir: Path, paths: list[str]
+) -> dict[str, list[str]]:
+    """Find the map files of a repo that mention each of the given paths.
+
+    A map file mentions a path if it contains the full path or one of its
+    trailing parts of at least two components (e.g., "service/map.py" for
+    "src/bench/service/map.py"), since maps often abbreviate paths. Bare file
+    names are not matched; names like "__init__.py" would match everywhere.
+
+    Args:
+        repo_maps_dir: The repo's maps directory (maps/<repo>/).
+        paths: Repository-relative file paths to look for.
+
+    Returns:
+        A dict mapping each path to the sorted map file paths (relative to
+        repo_maps_dir) that mention it; paths no map file mentions map to [].
+    """
+    texts: dict[str, str] = {}
+    if repo_maps_dir.is_dir():
+        for map_file in sorted(repo_maps_dir.rglob("*.md")):
+            if map_file.is_file():
+                texts[map_file.relative_to(repo_maps_dir).as_posix()] = (
+                    map_file.read_text(errors="replace")
+                )
+
+    mentions: dict[str, list[str]] = {}
+    for path in paths:
+        parts = path.split("/")
+        needles = ["/".join(parts[i:]) for i in range(max(len(parts) - 1, 1))]
+        mentions[path] = [
+            name
+            for name, text in texts.items()
+            if any(needle in text for needle in needles)
+        ]
+    return mentions
+
+
+def render_changes_block(repo_changes: list[dict[str, Any]]) -> str:
+    """Render a <changes> block describing what changed in each repo since it was mapped.
+
+    Args:
+        repo_changes: One dict per repo, in report order, with keys "dir",
+            "since" (the commit the maps were generated from, or None if
+            unknown), "changes" (list of GitDiffEntry), "map_files" (dict
+            mapping a changed path to the map files that mention it) and
+            "omitted" (number of further changed files not listed).
+
+    Returns:
+        A string containing the <changes> block.
+    """
+    lines: list[str] = []
+    for repo in repo_changes:
+        if repo["since"] is None:
+            lines.append(
+                f"./repo/{repo['dir']}: no recorded commit to compare against "
+                "-- explore the whole repository"
+            )
+            continue
+        lines.append(f"./repo/{repo['dir']} (since {repo['since'][:12]}):")
+        for change in repo["changes"]:
+            path = change.path
+            if change.previous_path is not None:
+                path = f"{change.previous_path} => {change.path}"
+            line = f"  {change.status.value} {path}"
+            map_files = repo["map_files"].get(change.path, [])
+            if change.previous_path is not None:
+                map_files = sorted(
+                    {*map_files, *repo["map_files"].get(change.previous_path, [])}
+                )
+            if map_files:
+                line += f" (maps: {', '.join(map_files)})"
+            lines.append(line)
+        if repo["omitted"]:
+            lines.append(f"  ... and {repo['omitted']} more changed files")
+    inner = "\n".join(lines)
+    if inner:
+        return f"<changes>\n{inner}\n</changes>"
+    return "<changes>\n</changes>"
+
+
 def resolve_discussion_paths(
     discussions_dir: Path,
     discussion_names: list[str],
@@ -1,7 +1,9 @@
 import subprocess
+import threading
 from pathlib import Path
 
-from bench.model.git import FileStatus, GitFileChange, GitStatus
+from bench.model.git import FileStatus, GitDiffEntry, GitFileChange, GitStatus
+from bench.repository.spawns import timed_spawn
 
 
 GIT_EXECUTABLE: str = "git"
@@ -15,13 +17,32 @@ _STATUS_CODE_MAP: dict[str, FileStatus] = {
     "T": FileStatus.TYPE_CHANGED,
 }
 
-
-def _run_git(args: list[str], repo_path: Path) -> subprocess.CompletedProcess[str]:
+_HEADS_PREFIX: str = "refs/heads/"
+
+# Per-repository snapshot of local branches mapped to their upstream ref ("" when
+# no upstream is configured), keyed by resolved repository path. Each snapshot
+# is produced by a single `git for-each-ref` and reused for the rest of the
+# process, i.e. the length of one bench command. Helpers that change branches
+# or upstreams invalidate the snapshot of the repository they touched.
+_branch_snapshots: dict[Path, dict[str, str]] = {}
+# Per-repository results of direct ref lookups (branch name -> exists), used
+# when no full snapshot has been loaded. Shares invalidation with the snapshots.
+_ref_lookups: dict[Path, dict[str, bool]] = {}
+# Per-path results of is_git_repository(); not affected by ref changes.
+_repository_checks: dict[Path, bool] = {}
+_branch_snapshots_lock = threading.Lock()
+
+
+def _run_git(
+    args: list[str], repo_path: Path, input_text: str | None = None
+) -> subprocess.CompletedProcess[str]:
     """Execute a git command in the given repository directory.
 
     Args:
         args: Git subcommand and arguments (e.g., ["status", "--porcelain=v2"]).
         repo_path: Path to the git repository working directory.
+        input_text: Optional text written to the command's stdin (for batch
+            commands such as `git cat-file --batch-check`).
 
     Returns:
         The completed subprocess result with captured stdout and stderr.
@@ -34,13 +55,15 @@ def _run_git(args: list[str], repo_path: Path) -> subprocess.CompletedProcess[st
         raise RuntimeError(f"Not a directory: {repo_path}")
 
     try:
-        result = subprocess.run(
-            [GIT_EXECUTABLE, *args],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        with timed_spawn("git", [GIT_EXECUTABLE, *args], repo_path):
+            result = subprocess.run(
+                [GIT_EXECUTABLE, *args],
+                cwd=repo_path,
+                input=input_text,
+                capture_output=True,
+                text=True,
+                check=False,
+            )
     except FileNotFoundError:
         raise RuntimeError(
             f"Git is not installed or not found on PATH (tried: {GIT_EXECUTABLE})"
@@ -57,6 +80,64 @@ def _run_git(args: list[str], repo_path: Path) -> subprocess.CompletedProcess[st
     return result
 
 
+def _branch_snapshot(repo_path: Path) -> dict[str, str]:
+    """Return the cached local branch snapshot of a repository.
+
+    On a cache miss, one `git for-each-ref` lists every local branch together
+    with its upstream, which answers branch listing, branch existence and
+    upstream queries for the repository without spawning further processes.
+
+    Args:
+        repo_path: Path to the git repository working directory.
+
+    Returns:
+        A dict mapping local branch names to their upstream ref ("" if none).
+
+    Raises:
+        RuntimeError: If the directory is not a git repo or git is unavailable.
+    """
+    key = repo_path.resolve()
+    with _branch_snapshots_lock:
+        snapshot = _branch_snapshots.get(key)
+    if snapshot is not None:
+        return snapshot
+
+    result = _run_git(
+        ["for-each-ref", "--format=%(refname)%00%(upstream)", _HEADS_PREFIX],
+        repo_path,
+    )
+    snapshot = {}
+    for line in result.stdout.splitlines():
+        refname, _, upstream = line.partition("\0")
+        if refname.startswith(_HEADS_PREFIX):
+            snapshot[refname[len(_HEADS_PREFIX) :]] = upstream
+
+    with _branch_snapshots_lock:
+        _branch_snapshots[key] = snapshot
+    return snapshot
+
+
+def _invalidate_branch_snapshot(repo_path: Path) -> None:
+    """Drop the cached branch snapshot of a repository after a ref change."""
+    key = repo_path.resolve()
+    with _branch_snapshots_lock:
+        _branch_snapshots.pop(key, None)
+        _ref_lookups.pop(key, None)
+
+
+def clear_git_cache() -> None:
+    """Drop every cached git query result.
+
+    Long-running callers (e.g., a process that executes many bench commands)
+    call this between commands so that changes made outside the process are
+    observed.
+    """
+    with _branch_snapshots_lock:
+        _branch_snapshots.clear()
+        _ref_lookups.clear()
+        _repository_checks.clear()
+
+
 def _parse_porcelain_status_code(code: str) -> FileStatus:
     """Map a single porcelain v2 status character to a FileStatus enum value.
 
@@ -171,9 +252,67 @@ def git_status(repo_path: Path) -> GitStatus:
     return GitStatus(branch=branch, files=files, untracked=untracked)
 
 
+def head_commit(repo_path: Path) -> str:
+    """Return the full SHA of the commit HEAD points to.
+
+    Args:
+        repo_path: Path to the git repository working directory.
+
+    Returns:
+        The 40-character commit SHA.
+
+    Raises:
+        RuntimeError: If the directory is not a git repo, the repo has no
+                      commits yet, or git is unavailable.
+    """
+    return _run_git(["rev-parse", "--verify", "HEAD"], repo_path).stdout.strip()
+
+
+def diff_name_status(since: str, repo_path: Path) -> list[GitDiffEntry]:
+    """List the files changed between a commit and HEAD.
+
+    Runs `git diff --name-status -M -z <since> HEAD`, so renames are detected
+    and paths are reported verbatim (no quoting of unusual characters).
+
+    Args:
+        since: The commit to compare HEAD against.
+        repo_path: Path to the git repository working directory.
+
+    Returns:
+        One GitDiffEntry per changed file, in git's (path) order.
+
+    Raises:
+        RuntimeError: If the commit does not exist in the repo, the directory
+                      is not a git repo, or git is unavailable.
+        ValueError: If git reports an unrecognized status code.
+    """
+    result = _run_git(
+        ["diff", "--name-status", "-M", "-z", since, "HEAD", "--"], repo_path
+    )
+    fields = result.stdout.split("\0")
+    entries: list[GitDiffEntry] = []
+    i = 0
+    while i < len(fields) and fields[i]:
+        # Status letter, optionally followed by a similarity score (R100, C075)
+        status = _parse_porcelain_status_code(fields[i][0])
+        if status in (FileStatus.RENAMED, FileStatus.COPIED):
+            entries.append(
+                GitDiffEntry(
+                    path=fields[i + 2], status=status, previous_path=fields[i + 1]
+                )
+            )
+            i += 3
+        else:
+            entries.append(GitDiffEntry(path=fields[i + 1], status=status))
+            i += 2
+    return entries
+
+
 def is_git_repository(path: Path) -> bool:
     """Check if a directory is a git repository (or git worktree).
 
+    The result is cached per path for the rest of the process.
+
     Args:
         path: Path to check.
 
@@ -182,11 +321,24 @@ def is_git_repository(path: Path) -> bool:
     """
     if not path.is_dir():
         return False
+
+    key = path.resolve()
+    with _branch_snapshots_lock:
+        cached = _repository_checks.get(key)
+        if cached is None and key in _branch_snapshots:
+            cached = True
+    if cached is not None:
+        return cached
+
     try:
         _run_git(["rev-parse", "--git-dir"], path)
-        return True
+        is_repo = True
     except RuntimeError:
-        return False
+        is_repo = False
+
+    with _branch_snapshots_lock:
+        _repository_checks[key] = is_repo
+    return is_repo
 
 
 def list_local_branches(repo_path: Path) -> list[str]:
@@ -201,8 +353,7 @@ def list_local_branches(repo_path: Path) -> list[str]:
     Raises:
         RuntimeError: If the directory is not a git repo or git is unavailable.
     """
-    result = _run_git(["branch", "--format=%(refname:short)"], repo_path)
-    return [line.strip() for line in result.stdout.splitlines() if line.strip()]
+    return list(_branch_snapshot(repo_path))
 
 
 def create_branch(branch_name: str, repo_path: Path) -> None:
@@ -217,6 +368,7 @@ def create_branch(branch_name: str, repo_path: Path) -> None:
                       git repo, or git is unavailable.
     """
     _run_git(["branch", branch_name], repo_path)
+    _invalidate_branch_snapshot(repo_path)
 
 
 def add_worktree(
@@ -258,23 +410,32 @@ def add_worktree(
         ]
     else:
         args = ["worktree", "add", str(worktree_path), branch_name]
-    _run_git(args, repo_path)
+    try:
+        _run_git(args, repo_path)
+    finally:
+        if create_branch:
+            _invalidate_branch_snapshot(repo_path)
 
 
-def remove_worktree(repo_path: Path, worktree_path: Path) -> None:
+def remove_worktree(repo_path: Path, worktree_path: Path, force: bool = False) -> None:
     """Remove a git worktree.
 
     Runs `git worktree remove <worktree_path>` from the main repository.
-    Does NOT use --force; will fail if the worktree has uncommitted changes.
+    Without force, fails if the worktree has uncommitted or untracked changes;
+    with force (`--force`), the worktree is removed regardless.
 
     Args:
         repo_path: Path to the main git repository.
         worktree_path: Absolute path of the worktree to remove.
+        force: If True, remove the worktree even if it is dirty.
 
     Raises:
         RuntimeError: If the git command fails (e.g., dirty worktree).
     """
-    _run_git(["worktree", "remove", str(worktree_path)], repo_path)
+    args = ["worktree", "remove"]
+    if force:
+        args.append("--force")
+    _run_git([*args, str(worktree_path)], repo_path)
 
 
 def prune_worktrees(repo_path: Path) -> None:
@@ -292,9 +453,57 @@ def prune_worktrees(repo_path: Path) -> None:
     _run_git(["worktree", "prune"], repo_path)
 
 
+def branches_exist(branch_names: list[str], repo_path: Path) -> dict[str, bool]:
+    """Check whether several local branches exist, with one batched lookup.
+
+    Names are resolved directly as `refs/heads/<name>` through a single
+    `git cat-file --batch-check` process, which reads loose and packed refs
+    without enumerating every branch in the repository. Results are cached
+    per repository for the rest of the process; if the repository's full
+    branch snapshot is already loaded, it is used instead and no git process
+    is spawned.
+
+    Args:
+        branch_names: Names of the branches to check.
+        repo_path: Path to the git repository.
+
+    Returns:
+        A dict mapping each requested name to True if the branch exists
+        locally, False otherwise.
+
+    Raises:
+        RuntimeError: If the directory is not a git repo or git is unavailable.
+    """
+    key = repo_path.resolve()
+    with _branch_snapshots_lock:
+        snapshot = _branch_snapshots.get(key)
+        lookups = dict(_ref_lookups.get(key, {}))
+    if snapshot is not None:
+        return {name: name in snapshot for name in branch_names}
+
+    missing = [name for name in dict.fromkeys(branch_names) if name not in lookups]
+    if missing:
+        result = _run_git(
+            ["cat-file", "--batch-check=%(objectname)"],
+            repo_path,
+            input_text="".join(f"{_HEADS_PREFIX}{name}\n" for name in missing),
+        )
+        for name, line in zip(missing, result.stdout.splitlines()):
+            lookups[name] = not line.endswith(" missing")
+        with _branch_snapshots_lock:
+            _ref_lookups.setdefault(key, {}).update(
+                {name: lookups[name] for name in missing}
+            )
+
+    return {name: lookups[name] for name in branch_names}
+
+
 def branch_exists(branch_name: str, repo_path: Path) -> bool:
     """Check if a local branch exists in the repository.
 
+    Resolves `refs/heads/<branch_name>` directly (see branches_exist), so
+    the cost does not grow with the number of branches in the repository.
+
     Args:
         branch_name: Name of the branch to check.
         repo_path: Path to the git repository.
@@ -305,24 +514,26 @@ def branch_exists(branch_name: str, repo_path: Path) -> bool:
     Raises:
         RuntimeError: If the directory is not a git repo or git is unavailable.
     """
-    branches = list_local_branches(repo_path)
-    return branch_name in branches
+    return branches_exist([branch_name], repo_path)[branch_name]
 
 
-def delete_branch(branch_name: str, repo_path: Path) -> None:
+def delete_branch(branch_name: str, repo_path: Path, force: bool = False) -> None:
     """Delete a local git branch.
 
-    Runs `git branch -d <branch_name>` in the given repo directory.
+    Runs `git branch -d <branch_name>` in the given repo directory, or
+    `git branch -D <branch_name>` when force is True.
 
     Args:
         branch_name: Name of the branch to delete.
         repo_path: Path to the git repository working directory.
+        force: If True, delete the branch even if it is not fully merged.
 
     Raises:
         RuntimeError: If the git command fails (e.g., branch not found,
                       unmerged changes).
     """
-    _run_git(["branch", "-d", branch_name], repo_path)
+    _run_git(["branch", "-D" if force else "-d", branch_name], repo_path)
+    _invalidate_branch_snapshot(repo_path)
 
 
 def _has_upstream(branch_name: str, repo_path: Path) -> bool:
@@ -336,8 +547,7 @@ def _has_upstream(branch_name: str, repo_path: Path) -> bool:
         True if the branch has an upstream configured, False otherwise.
     """
     try:
-        _run_git(["config", "--get", f"branch.{branch_name}.remote"], repo_path)
-        return True
+        return bool(_branch_snapshot(repo_path).get(branch_name))
     except RuntimeError:
         return False
 
@@ -359,3 +569,4 @@ def push_branch(branch_name: str, repo_path: Path) -> None:
         _run_git(["push", "origin", branch_name], repo_path)
     else:
         _run_git(["push", "-u", "origin", branch_name], repo_path)
+        _invalidate_branch_snapshot(repo_path)
@@ -0,0 +1,101 @@
+import datetime
+import gzip
+import shutil
+from pathlib import Path
+from typing import BinaryIO
+
+# Size at which a session log is rotated into a compressed backup
+LOG_MAX_BYTES: int = 8 * 1024 * 1024
+
+# Number of compressed backups kept per log (<log>.1.gz is the newest)
+LOG_BACKUPS: int = 5
+
+
+def _backup_path(path: Path, index: int) -> Path:
+    return path.with_name(f"{path.name}.{index}.gz")
+
+
+def rotate_log(path: Path, backups: int = LOG_BACKUPS) -> None:
+    """Compress a log into <log>.1.gz, shifting older backups up by one.
+
+    The oldest backup beyond `backups` is deleted. Does nothing if the log
+    does not exist or is empty.
+
+    Args:
+        path: Absolute path to the log file.
+        backups: Number of compressed backups to keep.
+
+    Raises:
+        OSError: If the log cannot be compressed or the backups renamed.
+    """
+    if not path.is_file() or path.stat().st_size == 0:
+        return
+    _backup_path(path, backups).unlink(missing_ok=True)
+    for index in range(backups - 1, 0, -1):
+        older = _backup_path(path, index)
+        if older.exists():
+            older.rename(_backup_path(path, index + 1))
+    with open(path, "rb") as src, gzip.open(_backup_path(path, 1), "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    path.unlink()
+
+
+class SessionLog:
+    """A log file that timestamps every line and rotates itself by size.
+
+    Output is written as it arrives, in chunks of any size; each line is
+    prefixed with the local time its first byte arrived at, with
+    millisecond precision. Once the file reaches max_bytes it is rotated
+    (see rotate_log) at the next line boundary, so memory and disk use stay
+    bounded however long the session runs.
+    """
+
+    def __init__(
+        self, path: Path, max_bytes: int = LOG_MAX_BYTES, backups: int = LOG_BACKUPS
+    ) -> None:
+        """Open the log for appending, creating its parent directories.
+
+        Raises:
+            OSError: If the log file cannot be created.
+        """
+        self.path = path
+        self._max_bytes = max_bytes
+        self._backups = backups
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file: BinaryIO = open(path, "ab")
+        self._size = self._file.tell()
+        self._at_line_start = True
+
+    def write(self, data: bytes) -> None:
+        """Write a chunk of output, timestamping each line it starts."""
+        start = 0
+        while start < len(data):
+            end = data.find(b"\n", start)
+            end = len(data) if end == -1 else end + 1
+            if self._at_line_start:
+                stamp = datetime.datetime.now().isoformat(timespec="milliseconds")
+                self._size += self._file.write(f"{stamp} ".encode())
+            self._size += self._file.write(data[start:end])
+            self._at_line_start = data[end - 1] == ord("\n")
+            start = end
+            if self._at_line_start and self._size >= self._max_bytes:
+                self._rotate()
+        self._file.flush()
+
+    def _rotate(self) -> None:
+        self._file.close()
+        rotate_log(self.path, self._backups)
+        self._file = open(self.path, "ab")
+        self._size = 0
+
+    def close(self) -> None:
+        """End an unterminated last line and close the file."""
+        if not self._at_line_start:
+            self._file.write(b"\n")
+        self._file.close()
+
+    def __enter__(self) -> "SessionLog":
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
@@ -1,42 +1,122 @@
+import json
 import subprocess
+import sys
+import threading
+import time
+from contextlib import nullcontext
+from functools import partial
 from pathlib import Path
+from typing import IO, Any
 
-from bench.model.opencode import OpenCodeResult
+from bench.model.opencode import OpenCodeResult, OpenCodeRun
+from bench.repository._process_group import (
+    ProcessGroups,
+    drain_output,
+    pump_output,
+    stop_processes,
+)
+from bench.repository.logfile import SessionLog, rotate_log
+from bench.repository.spawns import timed_spawn
 
 
 OPENCODE_EXECUTABLE: str = "opencode"
 
+# Bytes kept from the end of a session's output to classify its failure
+OUTPUT_TAIL_BYTES: int = 4096
 
-def _run_opencode(args: list[str], cwd: Path) -> subprocess.CompletedProcess[str]:
+# Headless sessions currently running (see _start_session)
+_sessions = ProcessGroups()
+
+
+def _start_session(
+    args: list[str],
+    cwd: Path,
+    stdout: IO[Any] | int,
+    stderr: IO[Any] | int,
+    text: bool = False,
+) -> subprocess.Popen[Any]:
+    """Start a headless opencode process and track it until it is waited for.
+
+    The session gets its own process group, so it can be stopped together
+    with everything it spawned (tool commands, language servers), and its
+    stdin is closed since nobody can answer it. Its output must go to a
+    pipe or file: the terminal's Ctrl-C does not reach it (see
+    terminate_sessions).
+
+    Raises:
+        RuntimeError: If opencode is not installed.
+    """
+    try:
+        process = subprocess.Popen(
+            [OPENCODE_EXECUTABLE, *args],
+            cwd=cwd,
+            stdin=subprocess.DEVNULL,
+            stdout=stdout,
+            stderr=stderr,
+            text=text,
+            process_group=0,
+        )
+    except FileNotFoundError:
+        raise RuntimeError(
+            f"opencode is not installed or not found on PATH (tried: {OPENCODE_EXECUTABLE})"
+        )
+    _sessions.add(process)
+    return process
+
+
+def terminate_sessions() -> None:
+    """Stop every headless session running in this process.
+
+    Sessions have their own process group, so they do not get the
+    terminal's Ctrl-C: on an interrupt, sessions waited for on the main
+    thread are stopped by run_command itself, and this stops the ones
+    running on worker threads (see ProcessGroups).
+    """
+    _sessions.terminate()
+
+
+def _run_opencode(
+    args: list[str], cwd: Path, timeout: float | None = None
+) -> subprocess.CompletedProcess[str]:
     """Execute an opencode command in the given directory.
 
     Args:
         args: Command arguments (e.g., ["--prompt", "...", "--model", "...", "."]).
         cwd: Working directory to run opencode from.
+        timeout: Optional wall-clock limit in seconds; the command is stopped
+            with its process group once it is reached.
 
     Returns:
         The completed subprocess result with captured stdout and stderr.
 
     Raises:
         RuntimeError: If opencode is not installed, cwd is not a directory,
-                      or the command exits with a non-zero status.
+                      the command times out, or it exits with a non-zero status.
     """
     if not cwd.is_dir():
         raise RuntimeError(f"Not a directory: {cwd}")
 
-    try:
-        result = subprocess.run(
-            [OPENCODE_EXECUTABLE, *args],
-            cwd=cwd,
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=None,
-        )
-    except FileNotFoundError:
-        raise RuntimeError(
-            f"opencode is not installed or not found on PATH (tried: {OPENCODE_EXECUTABLE})"
+    with timed_spawn("opencode", [OPENCODE_EXECUTABLE, *args], cwd):
+        process = _start_session(
+            args, cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
         )
+        try:
+            stdout, stderr = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            stop_processes({process})
+            process.communicate()
+            raise RuntimeError(
+                f"opencode command timed out after {timeout:g}s: "
+                f"{' '.join([OPENCODE_EXECUTABLE, *args])}"
+            )
+        except KeyboardInterrupt:
+            stop_processes({process})
+            raise
+        finally:
+            _sessions.discard(process)
+    result = subprocess.CompletedProcess(
+        process.args, process.returncode, stdout, stderr
+    )
 
     if result.returncode != 0:
         cmd_str = " ".join([OPENCODE_EXECUTABLE, *args])
@@ -49,7 +129,9 @@ def _run_opencode(args: list[str], cwd: Path) -> subprocess.CompletedProcess[str
     return result
 
 
-def run_prompt(prompt: str, model: str, cwd: Path) -> OpenCodeResult:
+def run_prompt(
+    prompt: str, model: str, cwd: Path, timeout: float | None = None
+) -> OpenCodeResult:
     """Run opencode with a prompt and model in the given directory.
 
     Executes: opencode --prompt '<prompt>' --model <model> .
@@ -58,16 +140,19 @@ def run_prompt(prompt: str, model: str, cwd: Path) -> OpenCodeResult:
         prompt: The raw prompt text to send to opencode.
         model: The model identifier (e.g., "anthropic/claude-opus-4-6").
         cwd: Working directory to run opencode from.
+        timeout: Optional wall-clock limit in seconds.
 
     Returns:
         An OpenCodeResult with stdout, stderr, and return_code.
 
     Raises:
-        RuntimeError: If opencode is not installed or the command fails.
+        RuntimeError: If opencode is not installed, the command times out or
+                      fails.
     """
     result = _run_opencode(
         ["--prompt", prompt, "--model", model, "."],
         cwd,
+        timeout,
     )
     return OpenCodeResult(
         stdout=result.stdout,
@@ -99,13 +184,10 @@ def run_prompt_interactive(prompt: str, model: str, cwd: Path) -> int:
     if not cwd.is_dir():
         raise RuntimeError(f"Not a directory: {cwd}")
 
+    args = [OPENCODE_EXECUTABLE, "--prompt", prompt, "--model", model, "."]
     try:
-        result = subprocess.run(
-            [OPENCODE_EXECUTABLE, "--prompt", prompt, "--model", model, "."],
-            cwd=cwd,
-            check=False,
-            timeout=None,
-        )
+        with timed_spawn("opencode", args, cwd):
+            result = subprocess.run(args, cwd=cwd, check=False, timeout=None)
     except FileNotFoundError:
         raise RuntimeError(
             f"opencode is not installed or not found on PATH (tried: {OPENCODE_EXECUTABLE})"
@@ -114,39 +196,150 @@ def run_prompt_interactive(prompt: str, model: str, cwd: Path) -> int:
     return result.returncode
 
 
-def run_command(message: str, model: str, cwd: Path) -> int:
+def _add_usage(line: bytes, usage: dict[str, int | float]) -> None:
+    """Add the tokens and cost of an opencode step_finish event to usage.
+
+    opencode prints one JSON event per line in its JSON output format; a
+    step_finish event reports what one step of the session consumed, as
+    {"type": "step_finish", "part": {"tokens": {"input": N, "output": N},
+    "cost": N}}. Any other line is ignored.
+    """
+    if b'"step_finish"' not in line:
+        return
+    try:
+        event = json.loads(line)
+    except ValueError:
+        return
+    if not isinstance(event, dict) or event.get("type") != "step_finish":
+        return
+    part = event.get("part")
+    if not isinstance(part, dict):
+        return
+    tokens = part.get("tokens")
+    if isinstance(tokens, dict):
+        for key, field in (("input", "input_tokens"), ("output", "output_tokens")):
+            value = tokens.get(key)
+            if isinstance(value, int) and not isinstance(value, bool):
+                usage[field] = usage.get(field, 0) + value
+    cost = part.get("cost")
+    if isinstance(cost, (int, float)) and not isinstance(cost, bool):
+        usage["cost"] = usage.get("cost", 0.0) + cost
+
+
+def _copy_output(
+    chunk: bytes, echo: bool, log: SessionLog | None, tail: bytearray
+) -> None:
+    """Copy a chunk of a session's output to the terminal and its log.
+
+    Only the last OUTPUT_TAIL_BYTES are kept in tail.
+    """
+    if echo:
+        sys.stdout.buffer.write(chunk)
+        sys.stdout.buffer.flush()
+    if log is not None:
+        log.write(chunk)
+    tail += chunk
+    del tail[:-OUTPUT_TAIL_BYTES]
+
+
+def run_command(
+    message: str,
+    model: str,
+    cwd: Path,
+    log_path: Path | None = None,
+    timeout: float | None = None,
+    echo: bool | None = None,
+) -> OpenCodeRun:
     """Run opencode in headless mode via the `run` subcommand.
 
     Executes: opencode run --model <model> <message>
 
     Unlike run_prompt_interactive(), this does not open an interactive TUI.
-    The agent processes the message to completion and exits. stdout and stderr
-    are passed through to the terminal so the user can observe progress.
+    The agent processes the message to completion and exits. Its output
+    (stdout and stderr, merged) is read as it arrives and copied to the
+    terminal so the user can observe progress, and to log_path when given.
+    The log gets a timestamp at the start of every line and is rotated into
+    gzip-compressed backups by size (see SessionLog); an existing log from
+    an earlier session is rotated first, so every session starts a new one.
+
+    A session that runs longer than timeout is stopped: SIGTERM, then
+    SIGKILL after TERMINATE_GRACE_SECONDS, sent to its whole process group
+    (see _start_session). On Ctrl-C the session is stopped the same way
+    before the interrupt propagates.
 
     Args:
         message: The fully-substituted prompt/message text.
         model: The model identifier (e.g., "anthropic/claude-opus-4-6").
         cwd: Working directory to run opencode from.
+        log_path: Optional file to record the output to (parent directories
+            are created).
+        timeout: Optional wall-clock limit in seconds.
+        echo: Whether to copy the output to the terminal. Defaults to True
+            without a log_path and False with one, for sessions running side
+            by side whose output would interleave.
 
     Returns:
-        The exit code from the opencode process.
+        An OpenCodeRun with the exit code (negative if killed by a signal),
+        whether the session timed out, its duration, the end of its output,
+        and the tokens and cost of the step_finish events it printed, if any
+        (see _add_usage).
 
     Raises:
         RuntimeError: If opencode is not installed or cwd is not a directory.
+        OSError: If the log file cannot be created.
     """
     if not cwd.is_dir():
         raise RuntimeError(f"Not a directory: {cwd}")
 
-    try:
-        result = subprocess.run(
-            [OPENCODE_EXECUTABLE, "run", "--model", model, message],
-            cwd=cwd,
-            check=False,
-            timeout=None,
+    if echo is None:
+        echo = log_path is None
+    if log_path is not None:
+        rotate_log(log_path)
+
+    started = time.monotonic()
+    timed_out = False
+    tail = bytearray()
+    usage: dict[str, int | float] = {}
+    args = ["run", "--model", model, message]
+    with (
+        timed_spawn("opencode", [OPENCODE_EXECUTABLE, *args], cwd),
+        SessionLog(log_path) if log_path is not None else nullcontext() as log,
+    ):
+        process = _start_session(
+            args,
+            cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
         )
-    except FileNotFoundError:
-        raise RuntimeError(
-            f"opencode is not installed or not found on PATH (tried: {OPENCODE_EXECUTABLE})"
+        assert process.stdout is not None
+        pump = threading.Thread(
+            target=pump_output,
+            args=(
+                process.stdout,
+                partial(_copy_output, echo=echo, log=log, tail=tail),
+                partial(_add_usage, usage=usage),
+            ),
+            daemon=True,
         )
-
-    return result.returncode
+        pump.start()
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            timed_out = True
+            stop_processes({process})
+        except KeyboardInterrupt:
+            stop_processes({process})
+            raise
+        finally:
+            _sessions.discard(process)
+            drain_output(pump, process.stdout)
+
+    return OpenCodeRun.model_validate(
+        {
+            "return_code": process.returncode,
+            "timed_out": timed_out,
+            "duration": time.monotonic() - started,
+            "output_tail": tail.decode(errors="replace"),
+            **usage,
+        }
+    )
@@ -0,0 +1,76 @@
+import datetime
+import os
+import subprocess
+import sys
+from collections.abc import Callable
+from pathlib import Path
+
+from bench.repository.spawns import timed_spawn
+
+# Module run as `python -m` to start bench in a child process
+BENCH_MODULE: str = "bench"
+
+
+def run_bench_command(
+    args: list[str],
+    cwd: Path,
+    log_path: Path,
+    on_start: Callable[[int], None] | None = None,
+) -> int:
+    """Run a bench command in a child process, with its output in a log file.
+
+    Executes: <python> -m bench <args>, with the interpreter running this
+    process, so the child uses the same bench installation. stdout and
+    stderr are appended to log_path after a header line with the time and
+    command, and stdin is closed since nobody is there to answer prompts.
+
+    Args:
+        args: Arguments after `bench` (e.g., ["task", "implement", "add-auth"]).
+        cwd: Working directory to run the command from.
+        log_path: File to append the output to (parent directories are
+            created).
+        on_start: Optional callback invoked with the child's pid once it
+            has started.
+
+    Returns:
+        The exit code of the child process (negative if killed by a signal).
+
+    Raises:
+        RuntimeError: If cwd is not a directory.
+        OSError: If the log file cannot be written or the process cannot start.
+    """
+    if not cwd.is_dir():
+        raise RuntimeError(f"Not a directory: {cwd}")
+
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(log_path, "ab") as log_file:
+        started = datetime.datetime.now().isoformat(timespec="seconds")
+        log_file.write(f"==> {started} bench {' '.join(args)}\n".encode())
+        log_file.flush()
+        with timed_spawn("bench", ["bench", *args], cwd):
+            process = subprocess.Popen(
+                [sys.executable, "-m", BENCH_MODULE, *args],
+                cwd=cwd,
+                stdin=subprocess.DEVNULL,
+                stdout=log_file,
+                stderr=subprocess.STDOUT,
+            )
+            if on_start is not None:
+                on_start(process.pid)
+            return process.wait()
+
+
+def process_alive(pid: int) -> bool:
+    """Return True if a process with the given pid exists.
+
+    Args:
+        pid: The process id to check.
+    """
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # The process exists but belongs to another user
+        return True
+    return True
@@ -0,0 +1,169 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from bench.repository.filesystem import load_yaml_file, locked_yaml_update
+
+# Sections of base-config.yaml whose entries are indexed by their "name" key
+SOURCES_SECTION: str = "sources"
+WORKBENCHES_SECTION: str = "workbenches"
+
+
+class _Section:
+    """Insertion-ordered, name-keyed index over one list section of a config.
+
+    Entries keep the order they have on disk; new entries go to the end.
+    Entries without a usable name (or with a name already taken) are kept
+    under a private key so they are written back untouched and in place.
+    """
+
+    def __init__(self, entries: list[Any]) -> None:
+        self._entries: dict[object, Any] = {}
+        for entry in entries:
+            name = entry.get("name") if isinstance(entry, dict) else None
+            if isinstance(name, str) and name not in self._entries:
+                self._entries[name] = entry
+            else:
+                self._entries[object()] = entry
+        self.dirty = False
+
+    def names(self) -> list[str]:
+        return [key for key in self._entries if isinstance(key, str)]
+
+    def get(self, name: str) -> dict[str, Any] | None:
+        return self._entries.get(name)
+
+    def add(self, entry: dict[str, Any]) -> None:
+        name = entry["name"]
+        if name in self._entries:
+            raise KeyError(name)
+        self._entries[name] = entry
+        self.dirty = True
+
+    def remove(self, name: str) -> dict[str, Any]:
+        entry = self._entries.pop(name)
+        self.dirty = True
+        return entry
+
+    def entries(self) -> list[Any]:
+        return list(self._entries.values())
+
+
+class ConfigRegistry:
+    """Name-indexed access to the sources and workbenches of a base config.
+
+    Wraps the raw `base-config.yaml` mapping with one dict index per section,
+    so looking up, adding and removing a source or workbench by name is O(1)
+    instead of a scan over the list. Entries are the raw dicts from the
+    mapping: mutating a returned entry mutates the config. Call `to_data()`
+    (or use `locked_registry`) to get the mapping back with both sections in
+    their original on-disk order.
+    """
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        self._data = data
+        self._sections = {
+            section: _Section(data.get(section) or [])
+            for section in (SOURCES_SECTION, WORKBENCHES_SECTION)
+        }
+
+    # Sources
+
+    def source_names(self) -> list[str]:
+        """Return the names of all sources, in config order."""
+        return self._sections[SOURCES_SECTION].names()
+
+    def get_source(self, name: str) -> dict[str, Any] | None:
+        """Return the raw entry of the named source, or None."""
+        return self._sections[SOURCES_SECTION].get(name)
+
+    def add_source(self, entry: dict[str, Any]) -> None:
+        """Append a source entry.
+
+        Raises:
+            KeyError: If a source with the same name already exists.
+        """
+        self._sections[SOURCES_SECTION].add(entry)
+
+    def remove_source(self, name: str) -> dict[str, Any]:
+        """Remove and return the named source entry.
+
+        Raises:
+            KeyError: If no source has that name.
+        """
+        return self._sections[SOURCES_SECTION].remove(name)
+
+    # Workbenches
+
+    def workbench_names(self) -> list[str]:
+        """Return the names of all workbenches, in config order."""
+        return self._sections[WORKBENCHES_SECTION].names()
+
+    def get_workbench(self, name: str) -> dict[str, Any] | None:
+        """Return the raw entry of the named workbench, or None."""
+        return self._sections[WORKBENCHES_SECTION].get(name)
+
+    def add_workbench(self, entry: dict[str, Any]) -> None:
+        """Append a workbench entry.
+
+        Raises:
+            KeyError: If a workbench with the same name already exists.
+        """
+        self._sections[WORKBENCHES_SECTION].add(entry)
+
+    def remove_workbench(self, name: str) -> dict[str, Any]:
+        """Remove and return the named workbench entry.
+
+        Raises:
+            KeyError: If no workbench has that name.
+        """
+        return self._sections[WORKBENCHES_SECTION].remove(name)
+
+    def to_data(self) -> dict[str, Any]:
+        """Return the config mapping with any added or removed entries applied.
+
+        Sections that were never touched are left exactly as loaded; a
+        section missing from the file is only added once it gains an entry.
+        """
+        for section_name, section in self._sections.items():
+            if section.dirty:
+                self._data[section_name] = section.entries()
+        return self._data
+
+
+def load_registry(path: Path) -> ConfigRegistry:
+    """Load a base config file into a ConfigRegistry.
+
+    Args:
+        path: Path to base-config.yaml.
+
+    Returns:
+        A registry over the parsed config.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        yaml.YAMLError: If the file contains invalid YAML.
+        ValueError: If the YAML file is empty or does not contain a mapping.
+    """
+    return ConfigRegistry(load_yaml_file(path))
+
+
+@contextmanager
+def locked_registry(path: Path) -> Iterator[ConfigRegistry]:
+    """Lock a base config file and yield a registry over its current contents.
+
+    The file is re-read under the lock (see locked_yaml_update) and the
+    registry's changes are written back atomically when the block exits
+    normally. If the block raises, nothing is written.
+
+    Args:
+        path: Path to base-config.yaml.
+
+    Yields:
+        A registry over the freshly loaded config.
+    """
+    with locked_yaml_update(path) as data:
+        registry = ConfigRegistry(data)
+        yield registry
+        registry.to_data()
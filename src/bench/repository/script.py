@@ -0,0 +1,112 @@
+import os
+import subprocess
+import threading
+import time
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+
+from bench.model.script import ScriptRun
+from bench.repository._process_group import (
+    ProcessGroups,
+    drain_output,
+    pump_output,
+    stop_processes,
+)
+from bench.repository.spawns import timed_spawn
+
+# Scripts with captured output currently running (see run_script)
+_scripts = ProcessGroups()
+
+
+def terminate_scripts() -> None:
+    """Stop every script with captured output running in this process.
+
+    Such scripts have their own process group, so they do not get the
+    terminal's Ctrl-C; this stops them (and everything they spawned) so the
+    threads waiting for them can return.
+    """
+    _scripts.terminate()
+
+
+def _output_line(on_output: Callable[[str], None], line: bytes) -> None:
+    on_output(line.decode(errors="replace").rstrip("\r"))
+
+
+def run_script(
+    script_path: Path,
+    working_dir: Path,
+    env_vars: dict[str, str],
+    timeout: float | None = None,
+    on_output: Callable[[str], None] | None = None,
+) -> ScriptRun:
+    """Execute a single script with the given working directory and environment.
+
+    Without on_output, the script's stdin, stdout and stderr are the
+    terminal's, as for any command bench runs in the foreground. With
+    on_output, its stdout and stderr are captured and passed to on_output
+    line by line (so scripts running side by side can be told apart), its
+    stdin is closed, and it gets its own process group (see
+    terminate_scripts).
+
+    Args:
+        script_path: Absolute path to the script to execute.
+        working_dir: Working directory for the subprocess.
+        env_vars: Extra environment variables merged on top of ``os.environ``.
+        timeout: Optional wall-clock limit in seconds; the script (with its
+            process group when its output is captured) is stopped once it is
+            reached.
+        on_output: Optional callback invoked with each line of output,
+            without its line ending, on a reader thread.
+
+    Returns:
+        A ScriptRun with the exit code (negative if killed by a signal),
+        whether the script timed out and how long it ran.
+
+    Raises:
+        OSError: If the script cannot be started.
+    """
+    env = {**os.environ, **env_vars}
+    captured = on_output is not None
+    started = time.monotonic()
+    timed_out = False
+
+    with timed_spawn("script", [str(script_path)], working_dir):
+        process = subprocess.Popen(
+            [str(script_path)],
+            cwd=working_dir,
+            env=env,
+            stdin=subprocess.DEVNULL if captured else None,
+            stdout=subprocess.PIPE if captured else None,
+            stderr=subprocess.STDOUT if captured else None,
+            process_group=0 if captured else None,
+        )
+        pump: threading.Thread | None = None
+        if on_output is not None:
+            assert process.stdout is not None
+            _scripts.add(process)
+            pump = threading.Thread(
+                target=pump_output,
+                args=(process.stdout, None, partial(_output_line, on_output)),
+                daemon=True,
+            )
+            pump.start()
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            timed_out = True
+            stop_processes({process}, own_group=captured)
+        except KeyboardInterrupt:
+            stop_processes({process}, own_group=captured)
+            raise
+        finally:
+            _scripts.discard(process)
+            if pump is not None:
+                assert process.stdout is not None
+                drain_output(pump, process.stdout)
+
+    return ScriptRun(
+        exit_code=process.returncode,
+        timed_out=timed_out,
+        duration=time.monotonic() - started,
+    )
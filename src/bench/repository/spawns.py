@@ -0,0 +1,75 @@
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+# Longest argument kept in a spawn record (prompts are passed as arguments)
+MAX_RECORDED_ARG_CHARS: int = 200
+
+# Subprocesses spawned since start_spawn_recording(), or None when not
+# recording: bench commands only pay for one check per spawn
+_records: list[dict[str, Any]] | None = None
+_records_origin: float = 0.0
+_records_lock = threading.Lock()
+
+
+def start_spawn_recording() -> None:
+    """Record every subprocess started through timed_spawn from now on."""
+    global _records, _records_origin
+    with _records_lock:
+        _records = []
+        _records_origin = time.perf_counter()
+
+
+def recorded_spawns() -> list[dict[str, Any]]:
+    """Return the spawns recorded so far, in the order they ended.
+
+    Each record has "kind" (e.g., "git"), "args", "cwd", "thread", "start"
+    (seconds since recording started), "duration" (seconds) and "ok"
+    (False if the spawn raised, e.g. on Ctrl-C or a missing executable).
+    """
+    with _records_lock:
+        return list(_records or [])
+
+
+@contextmanager
+def timed_spawn(kind: str, args: list[str], cwd: Path) -> Iterator[None]:
+    """Time a subprocess from its start to the end of the with-block.
+
+    A no-op unless recording was started (see start_spawn_recording).
+
+    Args:
+        kind: What is spawned (e.g., "git", "opencode", "script").
+        args: The command line; long arguments are shortened.
+        cwd: Working directory of the subprocess.
+    """
+    if _records is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    ok = False
+    try:
+        yield
+        ok = True
+    finally:
+        duration = time.perf_counter() - start
+        record = {
+            "kind": kind,
+            "args": [
+                arg
+                if len(arg) <= MAX_RECORDED_ARG_CHARS
+                else arg[:MAX_RECORDED_ARG_CHARS] + "..."
+                for arg in args
+            ],
+            "cwd": str(cwd),
+            "thread": threading.current_thread().name,
+            "start": round(start - _records_origin, 6),
+            "duration": round(duration, 6),
+            "ok": ok,
+        }
+        with _records_lock:
+            if _records is not None:
+                _records.append(record)
@@ -1,72 +1,173 @@
-from bench.service.discuss import list_discussions, start_discussion
-from bench.service.git import create_git_branch, get_git_status, push_git_branch
-from bench.service.init import initialize_project
-from bench.service.map import init_maps, update_maps
-from bench.service.populate import (
-    populate_agents_md,
-    populate_prompts,
-    preview_populate_prompts,
-)
-from bench.service.mode_detection import detect_mode
-from bench.service.opencode import run_opencode_prompt
-from bench.service.source import add_source, list_sources, remove_source, update_source
-from bench.service.task import (
-    complete_task,
-    create_task,
-    list_tasks,
-    refine_task,
-    resolve_task,
-    resolve_task_for_followup,
-    resolve_task_for_implement,
-    run_task_followup,
-    run_task_interview,
-    run_task_phase,
-    validate_task_phase,
-    validate_task_phase_outputs,
-)
-from bench.service.workbench import (
-    activate_workbench,
-    create_workbench,
-    delete_workbench,
-    list_workbenches,
-    retire_workbench,
-    update_workbench,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from bench.service.discuss import list_discussions, start_discussion
+    from bench.service.git import create_git_branch, get_git_status, push_git_branch
+    from bench.service.init import initialize_project
+    from bench.service.map import init_maps, update_maps
+    from bench.service.populate import (
+        populate_agents_md,
+        populate_prompts,
+        preview_populate_prompts,
+    )
+    from bench.service.mode_detection import detect_mode
+    from bench.service.opencode import (
+        cancel_opencode_commands,
+        run_opencode_command,
+        run_opencode_interactive,
+        run_opencode_prompt,
+    )
+    from bench.service.queue import (
+        add_queue_jobs,
+        list_queue_jobs,
+        queue_log_path,
+        remove_queue_jobs,
+        run_queue,
+    )
+    from bench.service.source import (
+        add_source,
+        list_sources,
+        remove_source,
+        update_source,
+    )
+    from bench.service.stats import summarize_sessions
+    from bench.service.task import (
+        complete_task,
+        create_task,
+        invalidate_task_checkpoints,
+        list_tasks,
+        plan_task_implement,
+        record_task_checkpoint,
+        refine_task,
+        resolve_task,
+        resolve_task_for_followup,
+        resolve_task_for_implement,
+        run_task_followup,
+        run_task_interview,
+        run_task_phase,
+        run_task_phases,
+        validate_task_phase,
+        validate_task_phase_outputs,
+    )
+    from bench.service.workbench import (
+        activate_workbenches,
+        create_workbench,
+        delete_workbenches,
+        list_workbenches,
+        retire_workbenches,
+        update_workbench,
+    )
+
+# Re-exports are resolved on first access (PEP 562), so importing one submodule
+# (e.g., bench.service.mode_detection) does not import every sibling module with it.
+_EXPORTS: dict[str, str] = {
+    "activate_workbenches": "bench.service.workbench",
+    "add_queue_jobs": "bench.service.queue",
+    "add_source": "bench.service.source",
+    "cancel_opencode_commands": "bench.service.opencode",
+    "complete_task": "bench.service.task",
+    "create_git_branch": "bench.service.git",
+    "create_task": "bench.service.task",
+    "create_workbench": "bench.service.workbench",
+    "delete_workbenches": "bench.service.workbench",
+    "detect_mode": "bench.service.mode_detection",
+    "get_git_status": "bench.service.git",
+    "init_maps": "bench.service.map",
+    "initialize_project": "bench.service.init",
+    "invalidate_task_checkpoints": "bench.service.task",
+    "list_discussions": "bench.service.discuss",
+    "list_queue_jobs": "bench.service.queue",
+    "list_sources": "bench.service.source",
+    "list_tasks": "bench.service.task",
+    "list_workbenches": "bench.service.workbench",
+    "plan_task_implement": "bench.service.task",
+    "populate_agents_md": "bench.service.populate",
+    "populate_prompts": "bench.service.populate",
+    "preview_populate_prompts": "bench.service.populate",
+    "push_git_branch": "bench.service.git",
+    "queue_log_path": "bench.service.queue",
+    "record_task_checkpoint": "bench.service.task",
+    "refine_task": "bench.service.task",
+    "remove_queue_jobs": "bench.service.queue",
+    "remove_source": "bench.service.source",
+    "resolve_task": "bench.service.task",
+    "resolve_task_for_followup": "bench.service.task",
+    "resolve_task_for_implement": "bench.service.task",
+    "retire_workbenches": "bench.service.workbench",
+    "run_opencode_command": "bench.service.opencode",
+    "run_opencode_interactive": "bench.service.opencode",
+    "run_opencode_prompt": "bench.service.opencode",
+    "run_queue": "bench.service.queue",
+    "run_task_followup": "bench.service.task",
+    "run_task_interview": "bench.service.task",
+    "run_task_phase": "bench.service.task",
+    "run_task_phases": "bench.service.task",
+    "start_discussion": "bench.service.discuss",
+    "summarize_sessions": "bench.service.stats",
+    "update_maps": "bench.service.map",
+    "update_source": "bench.service.source",
+    "update_workbench": "bench.service.workbench",
+    "validate_task_phase": "bench.service.task",
+    "validate_task_phase_outputs": "bench.service.task",
+}
 
 __all__ = [
-    "activate_workbench",
+    "activate_workbenches",
+    "add_queue_jobs",
     "add_source",
+    "cancel_opencode_commands",
     "create_git_branch",
     "complete_task",
     "create_task",
     "create_workbench",
-    "delete_workbench",
+    "delete_workbenches",
     "detect_mode",
     "get_git_status",
     "init_maps",
     "initialize_project",
+    "invalidate_task_checkpoints",
     "list_discussions",
+    "list_queue_jobs",
     "list_sources",
     "list_tasks",
     "list_workbenches",
+    "plan_task_implement",
     "populate_agents_md",
     "populate_prompts",
     "preview_populate_prompts",
     "push_git_branch",
+    "queue_log_path",
+    "record_task_checkpoint",
     "refine_task",
+    "remove_queue_jobs",
     "remove_source",
     "resolve_task",
     "resolve_task_for_followup",
     "resolve_task_for_implement",
-    "retire_workbench",
+    "retire_workbenches",
+    "run_opencode_command",
+    "run_opencode_interactive",
     "run_opencode_prompt",
+    "run_queue",
     "run_task_followup",
     "run_task_interview",
     "run_task_phase",
+    "run_task_phases",
     "start_discussion",
+    "summarize_sessions",
     "update_maps",
     "update_source",
     "update_workbench",
     "validate_task_phase",
     "validate_task_phase_outputs",
 ]
+
+
+def __getattr__(name: str) -> object:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,218 @@
+from collections.abc import Callable, Collection, Mapping, Sequence
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from typing import TypeVar
+
+G = TypeVar("G")
+K = TypeVar("K")
+T = TypeVar("T")
+
+
+def run_parallel(
+    jobs: Sequence[tuple[K, Callable[[], T]]],
+    max_workers: int,
+    on_done: Callable[[K, T | None, Exception | None], None] | None = None,
+    on_interrupt: Callable[[], None] | None = None,
+) -> tuple[dict[K, T], dict[K, Exception]]:
+    """Run independent jobs on a bounded thread pool and collect every outcome.
+
+    Jobs are expected to be I/O bound (typically subprocess calls), so threads
+    are sufficient. A failing job never cancels the others: every job runs to
+    completion and its exception is collected for the caller to handle.
+
+    Args:
+        jobs: Sequence of (key, callable) pairs. Keys must be unique.
+        max_workers: Maximum number of jobs running at the same time.
+        on_done: Optional callback invoked on the calling thread as each job
+            finishes, with (key, result, None) on success or (key, None, error)
+            on failure. Used by callers to report progress.
+        on_interrupt: Optional callback invoked on the calling thread if it is
+            interrupted (Ctrl-C) while jobs run, before waiting for them.
+            Used to stop jobs that would otherwise keep running, such as
+            subprocesses that do not get the terminal's interrupt.
+
+    Returns:
+        A tuple of (results, errors) dicts keyed by job key.
+    """
+    results: dict[K, T] = {}
+    errors: dict[K, Exception] = {}
+    if not jobs:
+        return results, errors
+
+    workers = max(1, min(max_workers, len(jobs)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(fn): key for key, fn in jobs}
+        try:
+            for future in as_completed(futures):
+                key = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    errors[key] = e
+                    if on_done is not None:
+                        on_done(key, None, e)
+                else:
+                    results[key] = result
+                    if on_done is not None:
+                        on_done(key, result, None)
+        except KeyboardInterrupt:
+            if on_interrupt is not None:
+                on_interrupt()
+            raise
+
+    return results, errors
+
+
+def run_grouped(
+    groups: Mapping[G, Sequence[tuple[K, Callable[[], T]]]],
+    max_workers: int,
+    on_done: Callable[[G, K, T | None, Exception | None], None] | None = None,
+) -> tuple[dict[tuple[G, K], T], dict[tuple[G, K], Exception]]:
+    """Run grouped jobs on a bounded thread pool, one group at a time per worker.
+
+    Groups run concurrently, but the jobs of one group run one after another
+    on the same worker, in order. Used for git commands: git takes
+    repository-wide locks (e.g., on .git/config and the ref store), so two
+    commands in the same repository can fail when run at the same time, while
+    commands in different repositories are independent.
+
+    Args:
+        groups: Mapping of group key to its sequence of (key, callable) pairs.
+            Keys must be unique within a group.
+        max_workers: Maximum number of groups running at the same time.
+        on_done: Optional callback invoked on the calling thread for every job
+            once its group finishes, with (group, key, result, None) on success
+            or (group, key, None, error) on failure.
+
+    Returns:
+        A tuple of (results, errors) dicts keyed by (group, key).
+    """
+
+    # A job's outcome: its result in a 1-tuple, or the exception it raised
+    def make_job(
+        jobs: Sequence[tuple[K, Callable[[], T]]],
+    ) -> Callable[[], list[tuple[K, tuple[T] | Exception]]]:
+        def job() -> list[tuple[K, tuple[T] | Exception]]:
+            outcomes: list[tuple[K, tuple[T] | Exception]] = []
+            for key, fn in jobs:
+                try:
+                    outcomes.append((key, (fn(),)))
+                except Exception as e:
+                    outcomes.append((key, e))
+            return outcomes
+
+        return job
+
+    results: dict[tuple[G, K], T] = {}
+    errors: dict[tuple[G, K], Exception] = {}
+
+    def collect(
+        group: G,
+        outcomes: list[tuple[K, tuple[T] | Exception]] | None,
+        _error: Exception | None,
+    ) -> None:
+        for key, outcome in outcomes or []:
+            if isinstance(outcome, Exception):
+                errors[(group, key)] = outcome
+                if on_done is not None:
+                    on_done(group, key, None, outcome)
+            else:
+                results[(group, key)] = outcome[0]
+                if on_done is not None:
+                    on_done(group, key, outcome[0], None)
+
+    run_parallel(
+        [(group, make_job(jobs)) for group, jobs in groups.items() if jobs],
+        max_workers,
+        on_done=collect,
+    )
+    return results, errors
+
+
+def run_dag(
+    jobs: Sequence[tuple[K, Callable[[], T]]],
+    dependencies: Mapping[K, Collection[K]],
+    max_workers: int,
+    on_start: Callable[[K], None] | None = None,
+    on_done: Callable[[K, T | None, Exception | None], None] | None = None,
+    stop_on_error: bool = False,
+    on_interrupt: Callable[[], None] | None = None,
+) -> tuple[dict[K, T], dict[K, Exception]]:
+    """Run jobs on a bounded thread pool, each once the jobs it depends on succeeded.
+
+    Whenever a worker is free, the first job (in the given order) whose
+    dependencies have all succeeded is started. Dependencies on keys that are
+    not among the jobs are ignored (e.g., phases that already ran). A job
+    whose dependency failed never starts, and with stop_on_error no job
+    starts at all once one failed; jobs already running are always waited
+    for.
+
+    Args:
+        jobs: Sequence of (key, callable) pairs. Keys must be unique.
+        dependencies: Mapping of job key to the keys it depends on. Must not
+            contain cycles (jobs in a cycle never start).
+        max_workers: Maximum number of jobs running at the same time.
+        on_start: Optional callback invoked on the calling thread with the key
+            of each job just before it starts.
+        on_done: Optional callback invoked on the calling thread as each job
+            finishes, with (key, result, None) on success or (key, None, error)
+            on failure.
+        stop_on_error: Start no further jobs once one failed.
+        on_interrupt: Optional callback invoked on the calling thread if it is
+            interrupted (Ctrl-C) while jobs run (see run_parallel).
+
+    Returns:
+        A tuple of (results, errors) dicts keyed by job key. Jobs that never
+        started are in neither.
+    """
+    results: dict[K, T] = {}
+    errors: dict[K, Exception] = {}
+    if not jobs:
+        return results, errors
+
+    callables = dict(jobs)
+    waits_for = {
+        key: {d for d in dependencies.get(key, ()) if d in callables}
+        for key in callables
+    }
+    pending = [key for key, _ in jobs]
+    workers = max(1, min(max_workers, len(jobs)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        running: dict[Future[T], K] = {}
+        try:
+            while True:
+                if not (stop_on_error and errors):
+                    for key in [k for k in pending if waits_for[k] <= results.keys()]:
+                        if len(running) >= workers:
+                            break
+                        pending.remove(key)
+                        if on_start is not None:
+                            on_start(key)
+                        running[executor.submit(callables[key])] = key
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    key = running.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        errors[key] = e
+                        if on_done is not None:
+                            on_done(key, None, e)
+                    else:
+                        results[key] = result
+                        if on_done is not None:
+                            on_done(key, result, None)
+        except KeyboardInterrupt:
+            if on_interrupt is not None:
+                on_interrupt()
+            raise
+
+    return results, errors
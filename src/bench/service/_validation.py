@@ -1,6 +1,6 @@
 from pathlib import Path
 
-from bench.repository import is_git_repository, list_local_branches
+from bench.repository import branch_exists, is_git_repository, list_local_branches
 
 
 def parse_repo_arg(repo_arg: str) -> tuple[str, str]:
@@ -46,8 +46,8 @@ def validate_repo(dir_name: str, branch_name: str, root_path: Path) -> None:
     if not is_git_repository(repo_path):
         raise ValueError(f'Directory "{dir_name}" is not a git repository')
 
-    branches = list_local_branches(repo_path)
-    if branch_name not in branches:
+    if not branch_exists(branch_name, repo_path):
+        branches = list_local_branches(repo_path)
         available = ", ".join(branches) if branches else "(none)"
         raise ValueError(
             f'Branch "{branch_name}" does not exist in repository "{dir_name}". '
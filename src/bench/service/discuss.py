@@ -3,6 +3,7 @@ from pathlib import Path
 
 from bench.model.discuss import DiscussionEntry
 from bench.model.mode import BenchMode
+from bench.model.telemetry import SessionTags
 from bench.repository.filesystem import (
     BENCH_SUBDIR_NAME,
     DISCUSS_PROMPT_FILENAME,
@@ -14,8 +15,8 @@ from bench.repository.filesystem import (
     read_prompt_file,
     render_repositories_block,
 )
-from bench.repository.opencode import run_prompt_interactive
 from bench.service.mode_detection import detect_mode
+from bench.service.opencode import run_opencode_interactive
 
 
 def start_discussion(only_repos: list[str] | None = None) -> int:
@@ -94,7 +95,8 @@ def start_discussion(only_repos: list[str] | None = None) -> int:
     model = context.base_config.models.discuss
 
     # Launch interactive opencode
-    return run_prompt_interactive(prompt_text, model, context.cwd)
+    tags = SessionTags(command="discuss start", workbench=context.cwd.name)
+    return run_opencode_interactive(prompt_text, model, context.cwd, tags)
 
 
 def list_discussions() -> list[DiscussionEntry]:
@@ -1,42 +1,378 @@
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Any
 
-from bench.model.config import BaseConfig
+from bench.model.config import BaseConfig, CloneMode, Models
+from bench.model.context import BenchContext
+from bench.model.map import MapRepoState, MapState
 from bench.model.mode import BenchMode
+from bench.model.telemetry import SessionTags
 from bench.repository.filesystem import (
     BASE_CONFIG_FILENAME,
     BENCH_DIR_NAME_DEFAULT,
     BENCH_SUBDIR_NAME,
+    CACHE_DIR_NAME,
+    CHANGES_PLACEHOLDER,
+    LOGS_DIR_NAME,
     GITKEEP_FILENAME,
     MAPS_DIR_NAME,
     MAPS_LOCATION_PLACEHOLDER,
     MAP_INIT_PROMPT_FILENAME,
+    MAP_INIT_REPO_PROMPT_FILENAME,
+    MAP_METAMAP_PROMPT_FILENAME,
+    MAP_STATE_FILENAME,
     MAP_UPDATE_PROMPT_FILENAME,
     METAMAP_FILENAME,
     PROMPTS_DIR_NAME,
+    REPO_DIR_NAME,
     REPOSITORIES_PLACEHOLDER,
+    SESSIONS_LOG_FILENAME,
+    find_map_files_mentioning,
     list_repo_directories,
     list_sibling_directories,
     load_yaml_file,
     read_prompt_file,
+    render_changes_block,
     render_repositories_block,
+    save_yaml_file,
 )
-from bench.repository.opencode import run_command
+from bench.repository.git import diff_name_status, head_commit, is_git_repository
+from bench.repository.blobstore import (
+    BLOB_STORE_DIR_NAME,
+    prune_blob_store,
+    share_tree,
+    unshare_tree,
+)
+from bench.service._parallel import run_parallel
 from bench.service.mode_detection import detect_mode
+from bench.service.opencode import cancel_opencode_commands, run_opencode_command
+from bench.view.map import display_map_repo_done, display_map_status
+
+
+@contextmanager
+def _private_maps(maps_dir: Path, blob_store: Path | None) -> Iterator[None]:
+    """Give the map agents private copies of the maps for the duration of the block.
+
+    Shared map files are links to blobs used by other workbenches (see
+    bench.repository.blobstore), and the agent may edit files in place, so
+    they are copied before it runs. With a blob_store (maps are cloned in
+    SHARED mode), the maps are shared again afterwards, so files the agent
+    left unchanged, or changed to content another workbench already has,
+    go back to the store and only real divergence takes disk space.
+    """
+    unshare_tree(maps_dir)
+    try:
+        yield
+    finally:
+        if blob_store is not None:
+            share_tree(maps_dir, blob_store)
+            prune_blob_store(blob_store)
+
+
+def _maps_blob_store(context: BenchContext, base_config: BaseConfig) -> Path | None:
+    """Return the blob store maps are shared through, or None if they are not."""
+    if base_config.scaffold_clone.maps != CloneMode.SHARED:
+        return None
+    assert context.root_path is not None
+    assert context.bench_dir_name is not None
+    return context.root_path / context.bench_dir_name / BLOB_STORE_DIR_NAME
+
+
+# Changed files listed per repo in the update prompt; the agent is told how
+# many more there are and finds them itself
+_MAX_LISTED_CHANGES: int = 200
+
+
+def _repo_path(context: BenchContext, cwd: Path, repo_dir: str) -> Path:
+    """Return the directory of a repo being mapped (sibling or worktree)."""
+    if context.mode == BenchMode.ROOT:
+        assert context.root_path is not None
+        return context.root_path / repo_dir
+    return cwd / REPO_DIR_NAME / repo_dir
+
+
+def _head_commits(repo_paths: dict[str, Path]) -> dict[str, str]:
+    """Return the HEAD commit of each repo that is a git repo with commits."""
+    heads: dict[str, str] = {}
+    for repo_dir, repo_path in repo_paths.items():
+        if not is_git_repository(repo_path):
+            continue
+        try:
+            heads[repo_dir] = head_commit(repo_path)
+        except RuntimeError:
+            # No commits yet
+            continue
+    return heads
+
+
+def _load_map_state(maps_dir: Path) -> MapState:
+    """Load the maps directory's map-state.yaml, or an empty state if missing."""
+    state_path = maps_dir / MAP_STATE_FILENAME
+    if not state_path.exists():
+        return MapState()
+    return MapState(**load_yaml_file(state_path))
+
+
+def _record_map_state(maps_dir: Path, heads: dict[str, str | None]) -> None:
+    """Record the commits the maps of the given repos were generated from.
+
+    A repo recorded without a commit (not a git repo) counts as mapped, but
+    is explored in full by every update.
+    """
+    if not heads:
+        return
+    state = _load_map_state(maps_dir)
+    for repo_dir, commit in heads.items():
+        state.repos[repo_dir] = MapRepoState(commit=commit)
+    state.repos = dict(sorted(state.repos.items()))
+    save_yaml_file(maps_dir / MAP_STATE_FILENAME, state.model_dump())
+
+
+def _collect_changes(
+    repo_dir: str,
+    repo_path: Path,
+    maps_dir: Path,
+    since: str | None,
+    head: str | None,
+) -> dict[str, Any] | None:
+    """Work out what changed in a repo since its maps were generated.
+
+    Returns:
+        None if nothing changed since the recorded commit; otherwise a dict
+        for render_changes_block. "since" is None (explore the whole repo)
+        when no commit is recorded, the repo is not a git repo, or the
+        recorded commit is no longer in the repo (e.g., history was
+        rewritten).
+    """
+    repo = {
+        "dir": repo_dir,
+        "since": None,
+        "changes": [],
+        "map_files": {},
+        "omitted": 0,
+    }
+    if since is None or head is None:
+        return repo
+    if since == head:
+        return None
+    try:
+        changes = diff_name_status(since, repo_path)
+    except RuntimeError:
+        return repo
+    if not changes:
+        return None
+
+    listed = changes[:_MAX_LISTED_CHANGES]
+    repo["since"] = since
+    repo["changes"] = listed
+    repo["map_files"] = find_map_files_mentioning(
+        maps_dir / repo_dir,
+        [change.path for change in listed]
+        + [change.previous_path for change in listed if change.previous_path],
+    )
+    repo["omitted"] = len(changes) - len(listed)
+    return repo
+
+
+def _map_row(
+    repo_dir: str,
+    status: str,
+    error: str | None = None,
+    log: str | None = None,
+) -> dict[str, str | None]:
+    return {"dir": repo_dir, "status": status, "error": error, "log": log}
+
+
+def _run_map_session(
+    prompt: str,
+    model: str,
+    opencode_cwd: Path,
+    maps_dir: Path,
+    models: Models,
+    label: str,
+    log_name: str,
+    tags: SessionTags,
+    echo: bool = True,
+) -> int:
+    """Run a headless mapping session with the map timeout and retries of models.
+
+    The session's output is recorded in log_name, and its attempts in the
+    sessions log, both in the bench directory's cache, and in the project's
+    telemetry ledger under tags.
+
+    Returns:
+        The exit code from the last opencode attempt.
+    """
+    logs_dir = maps_dir.parent / CACHE_DIR_NAME / LOGS_DIR_NAME
+    return run_opencode_command(
+        prompt,
+        model,
+        opencode_cwd,
+        label,
+        log_path=logs_dir / log_name,
+        echo=echo,
+        timeout=models.timeouts.map,
+        retries=models.retries,
+        retry_backoff=models.retry_backoff,
+        sessions_log=logs_dir / SESSIONS_LOG_FILENAME,
+        tags=tags,
+    )
+
+
+def _read_parallel_prompt(prompts_dir: Path, filename: str) -> str:
+    """Read a prompt file only used by parallel map init, which older projects lack."""
+    prompt_path = prompts_dir / filename
+    if not prompt_path.exists():
+        raise ValueError(
+            f"Prompt file {filename} not found. "
+            "Run 'bench populate prompts' to create it."
+        )
+    return read_prompt_file(prompt_path)
+
+
+def _init_maps_per_repo(
+    context: BenchContext,
+    cwd: Path,
+    directories: list[str],
+    maps_dir: Path,
+    prompts_dir: Path,
+    opencode_cwd: Path,
+    maps_location: str,
+    model: str,
+    models: Models,
+    blob_store: Path | None,
+    max_workers: int,
+    tags: SessionTags,
+) -> dict[str, Any]:
+    """Map each repo in its own headless session, then write metamap.md.
+
+    Sessions run on a bounded worker pool with the map-init-repo.md prompt,
+    each writing its output to a log file in the bench directory's cache
+    instead of the terminal, and are reported as they finish. A failed
+    session does not stop the others. Each repo is recorded in
+    map-state.yaml as soon as its session succeeds, and repos already
+    recorded there are skipped, so running the command again only retries
+    the repos that failed. Once every repo is mapped, one more session
+    writes metamap.md from the repos' schema.md files (map-metamap.md).
+
+    Returns:
+        The summary described in init_maps.
+    """
+    repo_prompt = _read_parallel_prompt(prompts_dir, MAP_INIT_REPO_PROMPT_FILENAME)
+    metamap_prompt = _read_parallel_prompt(prompts_dir, MAP_METAMAP_PROMPT_FILENAME)
+    logs_dir = maps_dir.parent / CACHE_DIR_NAME / LOGS_DIR_NAME
+
+    # Phase 7: Skip repos an earlier run already mapped
+    state = _load_map_state(maps_dir)
+    rows = {d: _map_row(d, "skipped") for d in directories}
+    pending = [d for d in directories if d not in state.repos]
+    heads = _head_commits({d: _repo_path(context, cwd, d) for d in pending})
+
+    # Phase 8: Map the remaining repos concurrently
+    def make_job(repo_dir: str) -> Callable[[], int]:
+        prompt = repo_prompt.replace(MAPS_LOCATION_PLACEHOLDER, maps_location)
+        prompt = prompt.replace(
+            REPOSITORIES_PLACEHOLDER, render_repositories_block([repo_dir])
+        )
+
+        def job() -> int:
+            return _run_map_session(
+                prompt,
+                model,
+                opencode_cwd,
+                maps_dir,
+                models,
+                f'map init "{repo_dir}"',
+                f"map-init-{repo_dir}.log",
+                tags,
+                echo=False,
+            )
+
+        return job
+
+    def report(repo_dir: str, exit_code: int | None, error: Exception | None) -> None:
+        log = str(logs_dir / f"map-init-{repo_dir}.log")
+        if error is not None:
+            rows[repo_dir] = _map_row(repo_dir, "failed", str(error), log)
+        elif exit_code != 0:
+            rows[repo_dir] = _map_row(
+                repo_dir, "failed", f"opencode exited with code {exit_code}", log
+            )
+        else:
+            rows[repo_dir] = _map_row(repo_dir, "mapped", log=log)
+            _record_map_state(maps_dir, {repo_dir: heads.get(repo_dir)})
+        display_map_repo_done(rows[repo_dir])
+
+    with _private_maps(maps_dir, blob_store):
+        run_parallel(
+            [(d, make_job(d)) for d in pending],
+            max_workers,
+            on_done=report,
+            on_interrupt=cancel_opencode_commands,
+        )
+        failures = sum(1 for row in rows.values() if row["status"] == "failed")
+
+        # Phase 9: Write metamap.md once every repo is mapped
+        metamap = "pending"
+        if not failures:
+            display_map_status("Writing metamap.md...")
+            prompt = metamap_prompt.replace(MAPS_LOCATION_PLACEHOLDER, maps_location)
+            prompt = prompt.replace(
+                REPOSITORIES_PLACEHOLDER, render_repositories_block(directories)
+            )
+            exit_code = _run_map_session(
+                prompt,
+                model,
+                opencode_cwd,
+                maps_dir,
+                models,
+                "metamap",
+                "map-metamap.log",
+                tags,
+            )
+            if exit_code == 0 and (maps_dir / METAMAP_FILENAME).exists():
+                metamap = "written"
+            else:
+                metamap = "failed"
+                failures += 1
+
+    return {
+        "repos": [rows[d] for d in directories],
+        "metamap": metamap,
+        "failures": failures,
+    }
 
 
 def init_maps(
-    cwd: Path, model: str | None = None, only_repos: list[str] | None = None
-) -> None:
+    cwd: Path,
+    model: str | None = None,
+    only_repos: list[str] | None = None,
+    parallel: bool = False,
+) -> dict[str, Any]:
     """Initialize maps for repositories.
 
+    By default one agent session maps every repo and writes metamap.md. With
+    parallel, each repo is mapped by its own session (see
+    _init_maps_per_repo) and a final session writes metamap.md.
+
     Args:
         cwd: The current working directory.
         model: Optional model override. Falls back to models.map from base-config.yaml.
         only_repos: Optional list of repo names to limit mapping to.
+        parallel: Map each repo in its own session, concurrently.
+
+    Returns:
+        A dict with "repos" (one {"dir", "status", "error", "log"} dict per
+        repo, status being "mapped", "failed" or "skipped"), "metamap"
+        ("written", "failed" or "pending") and "failures" (the number of
+        failed sessions).
 
     Raises:
-        ValueError: If mode is invalid, maps already initialized, or repo names invalid.
-        RuntimeError: If opencode is not installed or returns non-zero.
+        ValueError: If mode is invalid, maps already initialized, repo names
+                    invalid, or a parallel prompt file is missing.
+        RuntimeError: If opencode is not installed, or returns non-zero
+                      (without parallel).
     """
     # Phase 1: Detect mode and validate
     context = detect_mode(cwd)
@@ -114,6 +450,26 @@ def init_maps(
         base_config = BaseConfig(**raw_config)
 
     resolved_model = model if model is not None else base_config.models.map
+    tags = SessionTags(
+        command="map init",
+        workbench=cwd.name if context.mode == BenchMode.WORKBENCH else None,
+    )
+
+    if parallel:
+        return _init_maps_per_repo(
+            context,
+            cwd,
+            directories,
+            maps_dir,
+            prompts_dir,
+            opencode_cwd,
+            maps_location,
+            resolved_model,
+            base_config.models,
+            _maps_blob_store(context, base_config),
+            base_config.concurrency.maps,
+            tags,
+        )
 
     # Phase 7: Load and substitute prompt template
     prompt_path = prompts_dir / MAP_INIT_PROMPT_FILENAME
@@ -123,23 +479,60 @@ def init_maps(
     prompt = raw_prompt.replace(MAPS_LOCATION_PLACEHOLDER, maps_location)
     prompt = prompt.replace(REPOSITORIES_PLACEHOLDER, repos_block)
 
-    # Phase 8: Execute headlessly via run_command()
-    exit_code = run_command(prompt, resolved_model, opencode_cwd)
+    # Phase 8: Execute headlessly via _run_map_session(), on private copies of any
+    # shared map files. HEAD is read first: the maps describe the repos as
+    # they are now, even if they move on while the agent runs.
+    heads = _head_commits({d: _repo_path(context, cwd, d) for d in directories})
+    with _private_maps(maps_dir, _maps_blob_store(context, base_config)):
+        exit_code = _run_map_session(
+            prompt,
+            resolved_model,
+            opencode_cwd,
+            maps_dir,
+            base_config.models,
+            "map init",
+            "map-init.log",
+            tags,
+        )
     if exit_code != 0:
         raise RuntimeError(
             f"opencode exited with code {exit_code} during map initialization"
         )
 
+    # Phase 9: Record the commits the new maps were generated from
+    _record_map_state(maps_dir, {d: heads.get(d) for d in directories})
+    return {
+        "repos": [_map_row(d, "mapped") for d in directories],
+        "metamap": "written",
+        "failures": 0,
+    }
+
 
 def update_maps(
-    cwd: Path, model: str | None = None, only_repos: list[str] | None = None
-) -> None:
-    """Update existing maps for repositories.
+    cwd: Path,
+    model: str | None = None,
+    only_repos: list[str] | None = None,
+    full: bool = False,
+) -> dict[str, list[str]]:
+    """Update existing maps for repositories that changed since they were mapped.
+
+    The commit each repo's maps were generated from is recorded in
+    maps/map-state.yaml. The agent is only given the repos whose HEAD has
+    changed since, together with the files changed (git diff --name-status)
+    and the map files that mention them. If no repo changed, the agent is
+    not run at all. Repos without a recorded commit (or that are not git
+    repos) are always updated, by exploring the whole repo.
 
     Args:
         cwd: The current working directory.
         model: Optional model override. Falls back to models.map from base-config.yaml.
         only_repos: Optional list of repo names to limit update to.
+        full: Ignore the recorded commits and have every targeted repo
+            explored in full.
+
+    Returns:
+        A dict with "updated" (repos handed to the agent) and "unchanged"
+        (repos skipped because nothing changed since they were mapped).
 
     Raises:
         ValueError: If mode is invalid, maps not initialized, repo names invalid,
@@ -222,15 +615,58 @@ def update_maps(
 
     resolved_model = model if model is not None else base_config.models.map
 
-    # Phase 7: Load and substitute prompt template
+    # Phase 7: Work out what changed in each repo since it was last mapped
+    state = _load_map_state(maps_dir)
+    repo_paths = {d: _repo_path(context, cwd, d) for d in directories}
+    heads = _head_commits(repo_paths)
+    repo_changes: list[dict[str, Any]] = []
+    unchanged: list[str] = []
+    for repo_dir in directories:
+        recorded = state.repos.get(repo_dir)
+        since = None if full or recorded is None else recorded.commit
+        repo = _collect_changes(
+            repo_dir, repo_paths[repo_dir], maps_dir, since, heads.get(repo_dir)
+        )
+        if repo is None:
+            unchanged.append(repo_dir)
+        else:
+            repo_changes.append(repo)
+    updated = [repo["dir"] for repo in repo_changes]
+
+    if not updated:
+        # Repos whose HEAD moved without changing any file (e.g., a commit and
+        # its revert) have their recorded commit moved to HEAD
+        _record_map_state(maps_dir, {d: heads[d] for d in unchanged})
+        return {"updated": [], "unchanged": unchanged}
+
+    # Phase 8: Load and substitute prompt template
     prompt_path = prompts_dir / MAP_UPDATE_PROMPT_FILENAME
     raw_prompt = read_prompt_file(prompt_path)
 
-    repos_block = render_repositories_block(directories)
+    repos_block = render_repositories_block(updated)
     prompt = raw_prompt.replace(MAPS_LOCATION_PLACEHOLDER, maps_location)
     prompt = prompt.replace(REPOSITORIES_PLACEHOLDER, repos_block)
-
-    # Phase 8: Execute headlessly via run_command()
-    exit_code = run_command(prompt, resolved_model, opencode_cwd)
+    prompt = prompt.replace(CHANGES_PLACEHOLDER, render_changes_block(repo_changes))
+
+    # Phase 9: Execute headlessly via _run_map_session(), on private copies of any
+    # shared map files
+    with _private_maps(maps_dir, _maps_blob_store(context, base_config)):
+        exit_code = _run_map_session(
+            prompt,
+            resolved_model,
+            opencode_cwd,
+            maps_dir,
+            base_config.models,
+            "map update",
+            "map-update.log",
+            SessionTags(
+                command="map update",
+                workbench=cwd.name if context.mode == BenchMode.WORKBENCH else None,
+            ),
+        )
     if exit_code != 0:
         raise RuntimeError(f"opencode exited with code {exit_code} during map update")
+
+    # Phase 10: Record the commits the updated maps were generated from
+    _record_map_state(maps_dir, {d: heads.get(d) for d in directories})
+    return {"updated": updated, "unchanged": unchanged}
@@ -1,27 +1,116 @@
+import marshal
+import time
 from pathlib import Path
+from typing import TypeVar
 
+from pydantic import BaseModel
+
+from bench.model import config as config_model
+from bench.model import source as source_model
+from bench.model import workbench as workbench_model
 from bench.model.config import BaseConfig, WorkbenchConfig
 from bench.model.context import BenchContext
 from bench.model.mode import BenchMode
 from bench.repository.filesystem import (
     BASE_CONFIG_FILENAME,
+    CACHE_DIR_NAME,
+    file_signature,
     find_bench_root,
     find_workbench_marker,
+    load_cache_blob,
     load_yaml_file,
+    save_cache_blob,
 )
 
+ConfigT = TypeVar("ConfigT", bound=BaseModel)
+
+# Bump when the layout of cached config entries changes.
+_CONFIG_CACHE_VERSION: int = 2
+
+# Config files modified within this window are not cached: a second write
+# landing in the same mtime tick with the same size would be indistinguishable
+# from the cached one (the same "racily clean" rule git applies to its index).
+_RACY_WINDOW_NS: int = 2_000_000_000
+
+# Modules whose source defines the cached config schemas. A change to any of
+# them (e.g., upgrading bench) invalidates every cached config.
+_SCHEMA_MODULES = (config_model, source_model, workbench_model)
+
+# In-process memo of validated configs: config path -> (cache key, config).
+# (cache version, config path, config signature, schema module signatures)
+_ConfigCacheKey = tuple[
+    int, str, tuple[int, int, int], tuple[tuple[int, int, int] | None, ...]
+]
+
+_config_memo: dict[Path, tuple[_ConfigCacheKey, BaseModel]] = {}
+
+
+def _config_cache_key(config_path: Path) -> _ConfigCacheKey | None:
+    """Build the cache key for a config file, or None if it must not be cached."""
+    signature = file_signature(config_path)
+    if signature is None or time.time_ns() - signature[0] < _RACY_WINDOW_NS:
+        return None
+    schema = tuple(
+        file_signature(Path(module.__file__ or "")) for module in _SCHEMA_MODULES
+    )
+    return (_CONFIG_CACHE_VERSION, str(config_path), signature, schema)
+
+
+def _load_cached_config(config_path: Path, model_cls: type[ConfigT]) -> ConfigT:
+    """Load and validate a config file, reusing a cached result when unchanged.
+
+    Lookups go through the in-process memo first, then a marshalled entry in
+    the `.cache` directory next to the config file. Both are keyed on the
+    file's path, mtime, size and inode plus the schema modules, so an
+    unchanged project skips YAML parsing. The cache entry holds plain data
+    only (the key and the config's dump), which is validated again on load:
+    the `.cache` directory is writable by anything running in the project,
+    so nothing read from it may run code. Callers share the memoized
+    instance, which is why config models are frozen. Any cache failure
+    falls back to a normal load.
+    """
+    key = _config_cache_key(config_path)
+    if key is None:
+        return model_cls(**load_yaml_file(config_path))
+
+    memo = _config_memo.get(config_path)
+    if memo is not None and memo[0] == key and isinstance(memo[1], model_cls):
+        return memo[1]
+
+    cache_dir = config_path.parent / CACHE_DIR_NAME
+    entry_name = f"{config_path.stem}.marshal"
+    blob = load_cache_blob(cache_dir, entry_name)
+    config: ConfigT | None = None
+    if blob is not None:
+        try:
+            cached_key, data = marshal.loads(blob)
+            if cached_key == key:
+                config = model_cls.model_validate(data)
+        except Exception:
+            config = None
+
+    if config is None:
+        config = model_cls(**load_yaml_file(config_path))
+        try:
+            entry = marshal.dumps((key, config.model_dump(mode="json", by_alias=True)))
+        except ValueError:
+            # A value marshal cannot store; the config is just not cached
+            pass
+        else:
+            save_cache_blob(cache_dir, entry_name, entry)
+    _config_memo[config_path] = (key, config)
+    return config
+
 
 def _load_base_config(root_path: Path, bench_dir_name: str) -> BaseConfig:
     """Load and validate the base config from a project root."""
     config_path = root_path / bench_dir_name / BASE_CONFIG_FILENAME
-    data = load_yaml_file(config_path)
-    return BaseConfig(**data)
+    return _load_cached_config(config_path, BaseConfig)
 
 
 def _load_workbench_config(config_path: Path) -> WorkbenchConfig:
     """Load and validate the workbench config."""
-    data = load_yaml_file(config_path)
-    return WorkbenchConfig(**data)
+    return _load_cached_config(config_path, WorkbenchConfig)
 
 
 def detect_mode(cwd: Path) -> BenchContext:
@@ -1,10 +1,88 @@
+import datetime
+import re
+import threading
+import time
 from pathlib import Path
 
-from bench.model.opencode import OpenCodeResult
-from bench.repository.opencode import run_prompt
+from bench.model.opencode import OpenCodeResult, OpenCodeRun
+from bench.model.telemetry import SessionRecord, SessionTags
+from bench.repository.blobstore import unshare_tree
+from bench.repository.filesystem import (
+    MAPS_DIR_NAME,
+    append_log_line,
+    append_telemetry_record,
+    find_bench_root,
+    find_workbench_marker,
+)
+from bench.repository.opencode import (
+    run_command,
+    run_prompt,
+    run_prompt_interactive,
+    terminate_sessions,
+)
+from bench.view.opencode import display_session_retry
 
+# Longest wait between two attempts of a session, in seconds
+MAX_RETRY_DELAY_SECONDS: float = 600.0
 
-def run_opencode_prompt(prompt: str, model: str, cwd: Path) -> OpenCodeResult:
+# Output of a failed session that marks the failure as transient: provider
+# outages, rate limits and dropped connections, which a later attempt can
+# get past. Matched against the end of the session's output.
+_TRANSIENT_OUTPUT = re.compile(
+    r"rate.?limit|too many requests|overloaded|service unavailable"
+    r"|bad gateway|gateway time-?out|internal server error"
+    r"|\b(?:status|code|HTTP)\W{0,3}(?:429|5\d\d)\b"
+    r"|ECONNRESET|ECONNREFUSED|ETIMEDOUT|EAI_AGAIN|socket hang up",
+    re.IGNORECASE,
+)
+
+# Set once the command is interrupted: no further session or retry starts
+_cancelled = threading.Event()
+
+# Serializes unsharing maps when several sessions start in one workbench
+_unshare_lock = threading.Lock()
+
+
+def _session_maps_dir(cwd: Path) -> Path | None:
+    """Return the maps directory of the workbench or project containing cwd."""
+    resolved = cwd.resolve()
+    for directory in (resolved, *resolved.parents):
+        marker = find_workbench_marker(directory)
+        if marker is not None:
+            return marker[0].parent / MAPS_DIR_NAME
+    root = find_bench_root(resolved)
+    if root is None:
+        return None
+    root_path, bench_dir_name = root
+    return root_path / bench_dir_name / MAPS_DIR_NAME
+
+
+def _unshare_session_maps(cwd: Path) -> None:
+    """Give the maps an agent can reach from cwd private, writable copies.
+
+    With scaffold-clone maps set to shared, map files are hardlinks to blobs
+    used by every workbench, and write bits do not stop an agent running as
+    root from editing one in place, which would change the maps of all
+    workbenches at once. Once copied the maps stay private, so only the
+    first session in a workbench pays for the copy; `bench map update`
+    shares them again.
+
+    Raises:
+        RuntimeError: If a map file cannot be copied.
+    """
+    maps_dir = _session_maps_dir(cwd)
+    if maps_dir is None or not maps_dir.is_dir():
+        return
+    with _unshare_lock:
+        try:
+            unshare_tree(maps_dir)
+        except OSError as e:
+            raise RuntimeError(f"Could not copy shared maps in {maps_dir}: {e}") from e
+
+
+def run_opencode_prompt(
+    prompt: str, model: str, cwd: Path, timeout: float | None = None
+) -> OpenCodeResult:
     """Run opencode with a prompt and model in the given directory.
 
     This is the primary entry point for other service-layer code to invoke
@@ -15,11 +93,234 @@ def run_opencode_prompt(prompt: str, model: str, cwd: Path) -> OpenCodeResult:
         prompt: The raw prompt text to send to opencode.
         model: The model identifier (e.g., "anthropic/claude-opus-4-6").
         cwd: Working directory to run opencode from.
+        timeout: Optional wall-clock limit in seconds.
 
     Returns:
         An OpenCodeResult with stdout, stderr, and return_code.
 
     Raises:
-        RuntimeError: If opencode is not installed or the command fails.
+        RuntimeError: If opencode is not installed, the command times out or
+                      fails, or shared maps cannot be copied (see
+                      _unshare_session_maps).
+    """
+    _unshare_session_maps(cwd)
+    return run_prompt(prompt, model, cwd, timeout)
+
+
+def _record_session(
+    cwd: Path,
+    tags: SessionTags,
+    model: str,
+    prompt: str,
+    started: str,
+    duration: float,
+    exit_code: int,
+    timed_out: bool = False,
+    attempt: int = 1,
+    interactive: bool = False,
+    run: OpenCodeRun | None = None,
+) -> None:
+    """Append a session attempt to the telemetry ledger of the project containing cwd.
+
+    Tokens and cost come from the headless run's usage events (see
+    OpenCodeRun) and are left out when it reported none; interactive
+    sessions have none. Telemetry never fails a command: the record is
+    dropped if cwd is not in a bench project or the ledger cannot be written.
+    """
+    root = find_bench_root(cwd)
+    if root is None:
+        return
+    root_path, bench_dir_name = root
+    record = SessionRecord.model_validate(
+        {
+            **tags.model_dump(),
+            "time": started,
+            "model": model,
+            "interactive": interactive,
+            "attempt": attempt,
+            "prompt-chars": len(prompt),
+            "duration": round(duration, 3),
+            "exit-code": exit_code,
+            "timed-out": timed_out,
+            "input-tokens": run.input_tokens if run is not None else None,
+            "output-tokens": run.output_tokens if run is not None else None,
+            "cost": run.cost if run is not None else None,
+        }
+    )
+    try:
+        append_telemetry_record(
+            root_path / bench_dir_name,
+            record.model_dump(mode="json", by_alias=True, exclude_defaults=True),
+        )
+    except OSError:
+        pass
+
+
+def run_opencode_interactive(
+    prompt: str, model: str, cwd: Path, tags: SessionTags | None = None
+) -> int:
+    """Run an interactive opencode session with terminal pass-through.
+
+    Args:
+        prompt: The raw prompt text to send to opencode.
+        model: The model identifier.
+        cwd: Working directory to run opencode from.
+        tags: What the session is run for; when given, the session is
+            recorded in the telemetry ledger (see _record_session).
+
+    Returns:
+        The exit code from the opencode process.
+
+    Raises:
+        RuntimeError: If opencode is not installed, cwd is not a directory,
+                      or shared maps cannot be copied (see
+                      _unshare_session_maps).
     """
-    return run_prompt(prompt, model, cwd)
+    _unshare_session_maps(cwd)
+    started = datetime.datetime.now().isoformat(timespec="seconds")
+    start = time.monotonic()
+    exit_code = run_prompt_interactive(prompt, model, cwd)
+    if tags is not None:
+        _record_session(
+            cwd,
+            tags,
+            model,
+            prompt,
+            started,
+            time.monotonic() - start,
+            exit_code,
+            interactive=True,
+        )
+    return exit_code
+
+
+def cancel_opencode_commands() -> None:
+    """Stop every running headless session and start no further attempt.
+
+    Passed as the interrupt handler of worker pools running sessions (see
+    run_parallel), so Ctrl-C stops sessions on every worker thread.
+    """
+    _cancelled.set()
+    terminate_sessions()
+
+
+def _transient_reason(run: OpenCodeRun, timeout: float | None) -> str | None:
+    """Return why a failed session is worth retrying, or None if it is not."""
+    if run.timed_out:
+        return f"timed out after {timeout:g}s"
+    if run.return_code > 0:
+        match = _TRANSIENT_OUTPUT.search(run.output_tail)
+        if match is not None:
+            return f'transient error ("{match.group(0)}")'
+    return None
+
+
+def _describe_run(run: OpenCodeRun, timeout: float | None) -> str:
+    if run.timed_out:
+        return f"timed out after {timeout:g}s"
+    if run.return_code == 0:
+        return "completed"
+    return f"exited with code {run.return_code}"
+
+
+def run_opencode_command(
+    message: str,
+    model: str,
+    cwd: Path,
+    label: str,
+    log_path: Path | None = None,
+    echo: bool | None = None,
+    timeout: float | None = None,
+    retries: int = 0,
+    retry_backoff: float = 30.0,
+    sessions_log: Path | None = None,
+    tags: SessionTags | None = None,
+) -> int:
+    """Run a headless opencode session, retrying it on transient failures.
+
+    A session is retried when it times out, or when it fails and the end of
+    its output shows a transient error (rate limit, provider outage, dropped
+    connection). Attempt n+1 starts
+    retry_backoff * 2**(n-1) seconds after attempt n failed (at most
+    MAX_RETRY_DELAY_SECONDS). Every attempt's outcome is appended to
+    sessions_log, and each retry is reported on the terminal.
+
+    Args:
+        message: The fully-substituted prompt/message text.
+        model: The model identifier.
+        cwd: Working directory to run opencode from.
+        label: What the session does (e.g., 'phase "Tests"'), for the log
+            and the terminal.
+        log_path: Optional file to record the session's output to (see
+            run_command). Each attempt starts a new log; earlier attempts'
+            logs are kept as compressed backups.
+        echo: Whether to copy the output to the terminal (see run_command).
+        timeout: Optional wall-clock limit of each attempt, in seconds.
+        retries: Maximum number of retries after the first attempt.
+        retry_backoff: Seconds to wait before the first retry.
+        sessions_log: Optional file to append one line per attempt to.
+        tags: What the session is run for; when given, every attempt is
+            recorded in the telemetry ledger of the bench project containing
+            cwd, with the tokens and cost opencode reported (see
+            _record_session).
+
+    Returns:
+        The exit code of the last attempt.
+
+    Raises:
+        RuntimeError: If opencode is not installed, cwd is not a directory,
+                      the last attempt timed out, or the command was
+                      cancelled (see cancel_opencode_commands), or
+                      shared maps cannot be copied (see
+                      _unshare_session_maps).
+        OSError: If the log file cannot be created.
+    """
+    _unshare_session_maps(cwd)
+    attempts = retries + 1
+    for attempt in range(1, attempts + 1):
+        if _cancelled.is_set():
+            raise RuntimeError(f"Cancelled before {label} started.")
+
+        started = datetime.datetime.now().isoformat(timespec="seconds")
+        run = run_command(message, model, cwd, log_path, timeout, echo)
+        reason = _transient_reason(run, timeout)
+        will_retry = reason is not None and attempt < attempts
+        delay = min(retry_backoff * 2 ** (attempt - 1), MAX_RETRY_DELAY_SECONDS)
+
+        if sessions_log is not None:
+            line = (
+                f"{started} {label} attempt {attempt}/{attempts}: "
+                f"{_describe_run(run, timeout)} in {run.duration:.1f}s"
+            )
+            if reason is not None and not run.timed_out:
+                line += f", {reason}"
+            if will_retry:
+                line += f", retrying in {delay:g}s"
+            append_log_line(sessions_log, line)
+        if tags is not None:
+            _record_session(
+                cwd,
+                tags,
+                model,
+                message,
+                started,
+                run.duration,
+                run.return_code,
+                timed_out=run.timed_out,
+                attempt=attempt,
+                run=run,
+            )
+
+        if not will_retry:
+            break
+        assert reason is not None
+        display_session_retry(label, reason, attempt + 1, attempts, delay)
+        if _cancelled.wait(delay):
+            raise RuntimeError(f"Cancelled before {label} was retried.")
+
+    if run.timed_out:
+        raise RuntimeError(
+            f"opencode timed out after {timeout:g}s "
+            f"({attempts} attempt{'s' if attempts > 1 else ''})"
+        )
+    return run.return_code
@@ -2,20 +2,24 @@ from pathlib import Path
 
 from bench.model.config import BaseConfig
 from bench.model.mode import BenchMode
+from bench.model.telemetry import SessionTags
 from bench.repository.filesystem import (
     BASE_CONFIG_FILENAME,
     BENCH_DIR_NAME_DEFAULT,
+    CACHE_DIR_NAME,
     DIRECTORIES_PLACEHOLDER,
+    LOGS_DIR_NAME,
     POPULATE_AGENTS_PROMPT_FILENAME,
     PROMPT_SEED_FILES,
     PROMPTS_DIR_NAME,
+    SESSIONS_LOG_FILENAME,
     list_repo_directories,
     list_sibling_directories,
     load_yaml_file,
     read_prompt_file,
 )
-from bench.repository.opencode import run_command
 from bench.service.mode_detection import detect_mode
+from bench.service.opencode import run_opencode_command
 
 
 def populate_agents_md(
@@ -113,8 +117,26 @@ def populate_agents_md(
     directory_lines = "\n".join(f"./{d}" for d in directories)
     prompt = raw_prompt.replace(DIRECTORIES_PLACEHOLDER, directory_lines)
 
-    # Phase 6: Run opencode agent
-    exit_code = run_command(prompt, resolved_model, opencode_cwd)
+    # Phase 6: Run opencode agent, with the task timeout and retries, its
+    # output recorded in the bench directory's cache
+    models = base_config.models
+    logs_dir = prompts_dir.parent / CACHE_DIR_NAME / LOGS_DIR_NAME
+    exit_code = run_opencode_command(
+        prompt,
+        resolved_model,
+        opencode_cwd,
+        "populate agents",
+        log_path=logs_dir / "populate-agents.log",
+        echo=True,
+        timeout=models.timeouts.task,
+        retries=models.retries,
+        retry_backoff=models.retry_backoff,
+        sessions_log=logs_dir / SESSIONS_LOG_FILENAME,
+        tags=SessionTags(
+            command="populate agents",
+            workbench=cwd.name if context.mode == BenchMode.WORKBENCH else None,
+        ),
+    )
     if exit_code != 0:
         raise RuntimeError(
             f"opencode exited with code {exit_code} during AGENTS.md population"
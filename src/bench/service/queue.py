@@ -0,0 +1,390 @@
+import datetime
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+
+from bench.model.context import BenchContext
+from bench.model.mode import BenchMode
+from bench.model.queue import JobQueue, JobStatus, QueueJob
+from bench.model.workbench import WorkbenchStatus
+from bench.repository.filesystem import (
+    BENCH_SUBDIR_NAME,
+    CACHE_DIR_NAME,
+    LOGS_DIR_NAME,
+    QUEUE_FILENAME,
+    TASKS_DIR_NAME,
+    WORKBENCH_DIR_NAME,
+    find_bench_root,
+    find_task_folder,
+    load_job_queue,
+    load_task_yaml,
+    locked_file,
+    save_job_queue,
+)
+from bench.repository.process import process_alive, run_bench_command
+from bench.service.mode_detection import detect_mode
+from bench.view.queue import display_queue_job_finished, display_queue_job_started
+
+
+def _now() -> str:
+    return datetime.datetime.now().isoformat(timespec="seconds")
+
+
+def _resolve_queue_context() -> tuple[BenchContext, Path]:
+    """Detect the bench project and return its context and root bench directory.
+
+    Raises:
+        ValueError: If the current directory is not inside a bench project.
+    """
+    context = detect_mode(Path.cwd())
+
+    if context.mode == BenchMode.UNINITIALIZED:
+        raise ValueError(
+            "This folder is uninitialized. Run 'bench init' to create a bench project first."
+        )
+
+    # In a workbench, bench_dir_name is the workbench's own bench directory;
+    # the queue lives in the project root's
+    root_result = (
+        find_bench_root(context.root_path) if context.root_path is not None else None
+    )
+    if root_result is None or context.base_config is None:
+        raise ValueError(
+            "This workbench is not inside a bench project. "
+            "Run this command from the project root or one of its workbenches."
+        )
+    root_path, bench_dir_name = root_result
+    return context, root_path / bench_dir_name
+
+
+def _load_queue(bench_dir: Path) -> JobQueue:
+    return JobQueue(**load_job_queue(bench_dir))
+
+
+def _save_queue(bench_dir: Path, queue: JobQueue) -> None:
+    save_job_queue(
+        bench_dir, queue.model_dump(mode="json", by_alias=True, exclude_none=True)
+    )
+
+
+def queue_log_path(bench_dir: Path, job_id: int) -> Path:
+    """Return the log file of a queued job.
+
+    Args:
+        bench_dir: Absolute path to the root bench directory.
+        job_id: The job's id.
+    """
+    return bench_dir / CACHE_DIR_NAME / LOGS_DIR_NAME / f"queue-{job_id}.log"
+
+
+def add_queue_jobs(task_names: list[str], workbench_name: str | None) -> list[QueueJob]:
+    """Queue `task implement` runs for tasks of one workbench.
+
+    Args:
+        task_names: Names of the tasks to implement, in the order to run them.
+        workbench_name: The workbench the tasks belong to. Defaults to the
+            current workbench when run from a workbench directory.
+
+    Returns:
+        The queued jobs.
+
+    Raises:
+        ValueError: If not inside a bench project, the workbench is unknown
+                    or inactive, a task is not found, already completed or
+                    already queued.
+    """
+    # Phase 1: Mode enforcement and workbench resolution
+    context, bench_dir = _resolve_queue_context()
+    assert context.base_config is not None
+
+    if workbench_name is None:
+        if context.mode != BenchMode.WORKBENCH:
+            raise ValueError(
+                "A workbench name (--workbench) is required when not running "
+                "from a workbench directory."
+            )
+        workbench_name = context.cwd.name
+
+    entry = next(
+        (w for w in context.base_config.workbenches if w.name == workbench_name),
+        None,
+    )
+    if entry is None:
+        raise ValueError(f'Workbench "{workbench_name}" not found.')
+    if entry.status != WorkbenchStatus.ACTIVE:
+        raise ValueError(
+            f'Workbench "{workbench_name}" is inactive. '
+            f"Run 'bench workbench activate {workbench_name}' first."
+        )
+
+    # Phase 2: Validate the tasks
+    tasks_dir = (
+        bench_dir
+        / WORKBENCH_DIR_NAME
+        / workbench_name
+        / BENCH_SUBDIR_NAME
+        / TASKS_DIR_NAME
+    )
+    if len(set(task_names)) != len(task_names):
+        raise ValueError("Each task can only be queued once per command.")
+    for task_name in task_names:
+        task_folder_path, _ = find_task_folder(tasks_dir, task_name)
+        if load_task_yaml(task_folder_path).get("completed") is not None:
+            raise ValueError(f'Task "{task_name}" is already completed.')
+
+    # Phase 3: Append the jobs (under the queue lock, so concurrent `queue`
+    # commands cannot interleave)
+    with locked_file(bench_dir / QUEUE_FILENAME):
+        queue = _load_queue(bench_dir)
+        pending = {
+            j.task
+            for j in queue.jobs
+            if j.workbench == workbench_name
+            and j.status in (JobStatus.QUEUED, JobStatus.RUNNING)
+        }
+        for task_name in task_names:
+            if task_name in pending:
+                raise ValueError(
+                    f'Task "{task_name}" of workbench "{workbench_name}" is '
+                    "already queued."
+                )
+
+        added = _now()
+        jobs: list[QueueJob] = []
+        for task_name in task_names:
+            jobs.append(
+                QueueJob(
+                    id=queue.next_id,
+                    workbench=workbench_name,
+                    task=task_name,
+                    added=added,
+                )
+            )
+            queue.next_id += 1
+        queue.jobs.extend(jobs)
+        _save_queue(bench_dir, queue)
+
+    return jobs
+
+
+def list_queue_jobs() -> list[QueueJob]:
+    """Return every job in the project's queue, oldest first.
+
+    Raises:
+        ValueError: If not inside a bench project or queue.yaml is invalid.
+    """
+    _, bench_dir = _resolve_queue_context()
+    return _load_queue(bench_dir).jobs
+
+
+def remove_queue_jobs(job_ids: list[int], finished: bool) -> list[QueueJob]:
+    """Remove jobs from the queue.
+
+    Args:
+        job_ids: Ids of the jobs to remove.
+        finished: Also remove every done or failed job.
+
+    Returns:
+        The removed jobs.
+
+    Raises:
+        ValueError: If not inside a bench project, a job id is unknown, or
+                    a job is running.
+    """
+    _, bench_dir = _resolve_queue_context()
+
+    with locked_file(bench_dir / QUEUE_FILENAME):
+        queue = _load_queue(bench_dir)
+        by_id = {j.id: j for j in queue.jobs}
+        for job_id in job_ids:
+            job = by_id.get(job_id)
+            if job is None:
+                raise ValueError(f"Job {job_id} not found.")
+            if job.status == JobStatus.RUNNING:
+                raise ValueError(f"Job {job_id} is running and cannot be removed.")
+
+        removed = [
+            j
+            for j in queue.jobs
+            if j.id in job_ids
+            or (finished and j.status in (JobStatus.DONE, JobStatus.FAILED))
+        ]
+        if removed:
+            queue.jobs = [j for j in queue.jobs if j not in removed]
+            _save_queue(bench_dir, queue)
+
+    return removed
+
+
+def run_queue(max_jobs: int | None = None) -> dict[str, object]:
+    """Run queued jobs until none is left that this runner can start.
+
+    Each job runs `bench task implement <task>` in its workbench, as a child
+    process whose output goes to the job's log (see queue_log_path). Jobs
+    start in queue order, up to max_jobs at a time across every runner of
+    the project, and never two at once in the same workbench: a job waits
+    while another job of its workbench is running. Jobs added while the
+    runner is going are picked up too.
+
+    Job state lives in queue.yaml, so a runner survives restarts:
+
+    - Jobs left running by a runner that no longer exists (and whose
+      `bench task implement` process has ended too) are queued again when
+      the next runner starts. `task implement` resumes from its checkpoints.
+    - On Ctrl-C, the runner waits for its running jobs to stop (the
+      interrupt reaches them too) and queues them again.
+
+    Args:
+        max_jobs: Maximum number of jobs running at the same time. Defaults
+            to `concurrency.jobs` in base-config.yaml.
+
+    Returns:
+        A dict with "done" and "failed" (the jobs this runner finished),
+        "recovered" (number of stale jobs queued again), "queued" (number of
+        jobs still queued) and "interrupted" (whether Ctrl-C stopped the
+        runner).
+
+    Raises:
+        ValueError: If not inside a bench project or queue.yaml is invalid.
+    """
+    # Phase 1: Mode enforcement and limits
+    context, bench_dir = _resolve_queue_context()
+    assert context.root_path is not None
+    assert context.base_config is not None
+    root_path = context.root_path
+    limit = max_jobs or context.base_config.concurrency.jobs
+    queue_path = bench_dir / QUEUE_FILENAME
+    runner_pid = os.getpid()
+
+    # Phase 2: Queue again the jobs of runners that no longer exist
+    recovered = 0
+    with locked_file(queue_path):
+        queue = _load_queue(bench_dir)
+        for job in queue.jobs:
+            if job.status != JobStatus.RUNNING:
+                continue
+            runner_alive = job.runner_pid is not None and process_alive(job.runner_pid)
+            child_alive = job.pid is not None and process_alive(job.pid)
+            if not runner_alive and not child_alive:
+                job.status = JobStatus.QUEUED
+                job.runner_pid = None
+                job.pid = None
+                recovered += 1
+        if recovered:
+            _save_queue(bench_dir, queue)
+
+    # Phase 3: Run jobs, claiming them under the queue lock
+    done: list[QueueJob] = []
+    failed: list[QueueJob] = []
+
+    def claim() -> list[QueueJob]:
+        with locked_file(queue_path):
+            queue = _load_queue(bench_dir)
+            running = [j for j in queue.jobs if j.status == JobStatus.RUNNING]
+            busy = {j.workbench for j in running}
+            slots = limit - len(running)
+            claimed: list[QueueJob] = []
+            for job in queue.jobs:
+                if slots <= 0:
+                    break
+                if job.status != JobStatus.QUEUED or job.workbench in busy:
+                    continue
+                if not (root_path / WORKBENCH_DIR_NAME / job.workbench).is_dir():
+                    job.status = JobStatus.FAILED
+                    job.finished = _now()
+                    job.error = f'Workbench "{job.workbench}" is not active.'
+                    failed.append(job)
+                    display_queue_job_finished(job, None)
+                    continue
+                job.status = JobStatus.RUNNING
+                job.started = _now()
+                job.finished = None
+                job.exit_code = None
+                job.error = None
+                job.runner_pid = runner_pid
+                job.pid = None
+                busy.add(job.workbench)
+                slots -= 1
+                claimed.append(job)
+            _save_queue(bench_dir, queue)
+        return claimed
+
+    def update(job_id: int, **changes: object) -> QueueJob | None:
+        with locked_file(queue_path):
+            queue = _load_queue(bench_dir)
+            job = next((j for j in queue.jobs if j.id == job_id), None)
+            if job is None:
+                return None
+            for field, value in changes.items():
+                setattr(job, field, value)
+            _save_queue(bench_dir, queue)
+            return job
+
+    def make_job(job: QueueJob) -> int:
+        def on_start(pid: int) -> None:
+            update(job.id, pid=pid)
+
+        return run_bench_command(
+            ["task", "implement", job.task],
+            root_path / WORKBENCH_DIR_NAME / job.workbench,
+            queue_log_path(bench_dir, job.id),
+            on_start=on_start,
+        )
+
+    interrupted = False
+    futures: dict[Future[int], QueueJob] = {}
+    with ThreadPoolExecutor(max_workers=limit) as executor:
+        try:
+            while True:
+                for job in claim():
+                    display_queue_job_started(job, queue_log_path(bench_dir, job.id))
+                    futures[executor.submit(make_job, job)] = job
+                if not futures:
+                    break
+
+                finished, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    job = futures.pop(future)
+                    try:
+                        exit_code = future.result()
+                    except (OSError, RuntimeError) as e:
+                        exit_code, error = None, str(e)
+                    else:
+                        error = None
+                    status = JobStatus.DONE if exit_code == 0 else JobStatus.FAILED
+                    updated = update(
+                        job.id,
+                        status=status,
+                        finished=_now(),
+                        exit_code=exit_code,
+                        error=error,
+                        runner_pid=None,
+                        pid=None,
+                    )
+                    result = updated or job
+                    (done if status == JobStatus.DONE else failed).append(result)
+                    display_queue_job_finished(
+                        result, queue_log_path(bench_dir, job.id)
+                    )
+        except KeyboardInterrupt:
+            # The interrupt reached the jobs' processes too; once they have
+            # stopped, put their jobs back in the queue
+            interrupted = True
+            wait(futures)
+            for job in futures.values():
+                update(
+                    job.id,
+                    status=JobStatus.QUEUED,
+                    started=None,
+                    runner_pid=None,
+                    pid=None,
+                )
+
+    queued = sum(1 for j in _load_queue(bench_dir).jobs if j.status == JobStatus.QUEUED)
+    return {
+        "done": done,
+        "failed": failed,
+        "recovered": recovered,
+        "queued": queued,
+        "interrupted": interrupted,
+    }
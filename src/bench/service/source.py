@@ -3,8 +3,7 @@ from pathlib import Path
 from bench.model import BenchMode
 from bench.repository import (
     BASE_CONFIG_FILENAME,
-    load_yaml_file,
-    save_yaml_file,
+    locked_registry,
 )
 from bench.model import Source
 from bench.service._validation import parse_repo_arg, validate_repo
@@ -76,35 +75,24 @@ def add_source(name: str, repo_args: list[str]) -> str:
     for dir_name, branch_name in parsed_repos:
         validate_repo(dir_name, branch_name, context.root_path)
 
-    # Phase 3: Load existing config
+    # Phase 3: Load existing config (locked; written back when the block exits)
     config_path = context.root_path / context.bench_dir_name / BASE_CONFIG_FILENAME
-    data = load_yaml_file(config_path)
-
-    # Ensure sources list exists
-    if "sources" not in data:
-        data["sources"] = []
-
-    # Phase 4: Check for duplicate source name
-    existing_names: list[str] = [
-        s["name"] for s in data["sources"] if isinstance(s, dict) and "name" in s
-    ]
-    if name in existing_names:
-        raise ValueError(
-            f'Source "{name}" already exists. Source names must be unique.'
-        )
-
-    # Phase 5: Build and append the new source entry
-    source_entry: dict[str, object] = {"name": name, "repos": []}
-    if parsed_repos:
-        source_entry["repos"] = [
-            {"dir": dir_name, "source-branch": branch_name}
-            for dir_name, branch_name in parsed_repos
-        ]
+    with locked_registry(config_path) as registry:
+        # Phase 4: Check for duplicate source name
+        if registry.get_source(name) is not None:
+            raise ValueError(
+                f'Source "{name}" already exists. Source names must be unique.'
+            )
 
-    data["sources"].append(source_entry)
+        # Phase 5: Build and append the new source entry
+        source_entry: dict[str, object] = {"name": name, "repos": []}
+        if parsed_repos:
+            source_entry["repos"] = [
+                {"dir": dir_name, "source-branch": branch_name}
+                for dir_name, branch_name in parsed_repos
+            ]
 
-    # Phase 6: Write back
-    save_yaml_file(config_path, data)
+        registry.add_source(source_entry)
 
     return f'Source "{name}" added successfully'
 
@@ -160,71 +148,60 @@ def update_source(
         dir_name, branch_name = parse_repo_arg(arg)
         parsed_removes.append((dir_name, branch_name))
 
-    # Load existing config
+    # Load existing config (locked; written back when the block exits)
     config_path = context.root_path / context.bench_dir_name / BASE_CONFIG_FILENAME
-    data = load_yaml_file(config_path)
-
-    # Find the source by name
-    source_entry: dict[str, object] | None = None
-    for s in data.get("sources", []):
-        if isinstance(s, dict) and s.get("name") == name:
-            source_entry = s
-            break
-
-    if source_entry is None:
-        existing_names = [
-            s["name"]
-            for s in data.get("sources", [])
-            if isinstance(s, dict) and "name" in s
-        ]
-        available = ", ".join(existing_names) if existing_names else "(none)"
-        raise ValueError(f'Source "{name}" not found. Available sources: {available}')
-
-    repos_list: list[dict[str, str]] = source_entry.get("repos", [])
-
-    # Phase: Validate removals (all-or-nothing)
-    for dir_name, branch_name in parsed_removes:
-        found = any(
-            r.get("dir") == dir_name and r.get("source-branch") == branch_name
-            for r in repos_list
-        )
-        if not found:
-            available = ", ".join(
-                f"{r['dir']}:{r['source-branch']}" for r in repos_list
-            )
+    with locked_registry(config_path) as registry:
+        # Find the source by name
+        source_entry = registry.get_source(name)
+        if source_entry is None:
+            existing_names = registry.source_names()
+            available = ", ".join(existing_names) if existing_names else "(none)"
             raise ValueError(
-                f'Repo "{dir_name}:{branch_name}" not found in source "{name}". '
-                f"Available repos: {available or '(none)'}"
+                f'Source "{name}" not found. Available sources: {available}'
             )
 
-    # Phase: Apply removals (create filtered list)
-    remove_set = {(d, b) for d, b in parsed_removes}
-    remaining_repos = [
-        r
-        for r in repos_list
-        if (r.get("dir"), r.get("source-branch")) not in remove_set
-    ]
-
-    # Phase: Validate additions (against remaining repos after removal)
-    existing_dirs = {r.get("dir") for r in remaining_repos}
+        repos_list: list[dict[str, str]] = source_entry.get("repos", [])
 
-    for dir_name, branch_name in parsed_adds:
-        if dir_name in existing_dirs:
-            raise ValueError(
-                f'Repository directory "{dir_name}" already exists in source "{name}". '
-                f"Remove it first or use a different directory."
+        # Phase: Validate removals (all-or-nothing)
+        for dir_name, branch_name in parsed_removes:
+            found = any(
+                r.get("dir") == dir_name and r.get("source-branch") == branch_name
+                for r in repos_list
             )
-        validate_repo(dir_name, branch_name, context.root_path)
-        existing_dirs.add(dir_name)  # prevent duplicates within the add list itself
+            if not found:
+                available = ", ".join(
+                    f"{r['dir']}:{r['source-branch']}" for r in repos_list
+                )
+                raise ValueError(
+                    f'Repo "{dir_name}:{branch_name}" not found in source "{name}". '
+                    f"Available repos: {available or '(none)'}"
+                )
+
+        # Phase: Apply removals (create filtered list)
+        remove_set = {(d, b) for d, b in parsed_removes}
+        remaining_repos = [
+            r
+            for r in repos_list
+            if (r.get("dir"), r.get("source-branch")) not in remove_set
+        ]
+
+        # Phase: Validate additions (against remaining repos after removal)
+        existing_dirs = {r.get("dir") for r in remaining_repos}
 
-    # Phase: Apply additions
-    for dir_name, branch_name in parsed_adds:
-        remaining_repos.append({"dir": dir_name, "source-branch": branch_name})
+        for dir_name, branch_name in parsed_adds:
+            if dir_name in existing_dirs:
+                raise ValueError(
+                    f'Repository directory "{dir_name}" already exists in source "{name}". '
+                    f"Remove it first or use a different directory."
+                )
+            validate_repo(dir_name, branch_name, context.root_path)
+            existing_dirs.add(dir_name)  # prevent duplicates within the add list itself
 
-    source_entry["repos"] = remaining_repos
+        # Phase: Apply additions
+        for dir_name, branch_name in parsed_adds:
+            remaining_repos.append({"dir": dir_name, "source-branch": branch_name})
 
-    # Save
-    save_yaml_file(config_path, data)
+        source_entry["repos"] = remaining_repos
 
     removed_count = len(parsed_removes)
     added_count = len(parsed_adds)
@@ -265,23 +242,14 @@ def remove_source(name: str) -> str:
     assert context.bench_dir_name is not None
 
     config_path = context.root_path / context.bench_dir_name / BASE_CONFIG_FILENAME
-    data = load_yaml_file(config_path)
-
-    sources_list = data.get("sources", [])
-    source_index: int | None = None
-    for i, s in enumerate(sources_list):
-        if isinstance(s, dict) and s.get("name") == name:
-            source_index = i
-            break
-
-    if source_index is None:
-        existing_names = [
-            s["name"] for s in sources_list if isinstance(s, dict) and "name" in s
-        ]
-        available = ", ".join(existing_names) if existing_names else "(none)"
-        raise ValueError(f'Source "{name}" not found. Available sources: {available}')
+    with locked_registry(config_path) as registry:
+        if registry.get_source(name) is None:
+            existing_names = registry.source_names()
+            available = ", ".join(existing_names) if existing_names else "(none)"
+            raise ValueError(
+                f'Source "{name}" not found. Available sources: {available}'
+            )
 
-    del data["sources"][source_index]
-    save_yaml_file(config_path, data)
+        registry.remove_source(name)
 
     return f'Source "{name}" removed successfully'
@@ -0,0 +1,102 @@
+import datetime
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from bench.model.telemetry import SessionRecord, StatsGroup, StatsRow
+from bench.repository.filesystem import find_bench_root, load_telemetry_records
+
+
+def _group_key(record: SessionRecord, group: StatsGroup) -> str:
+    """Return the key a record is aggregated under."""
+    if group == StatsGroup.PHASE:
+        # Sessions outside implementation flows are grouped by command
+        return record.phase or record.command
+    if group == StatsGroup.MODEL:
+        return record.model
+    if group == StatsGroup.WORKBENCH:
+        return record.workbench or "(root)"
+    if group == StatsGroup.WEEK:
+        year, week, _ = datetime.date.fromisoformat(record.time[:10]).isocalendar()
+        return f"{year}-W{week:02d}"
+    return record.command
+
+
+def _sum_reported(values: list[int | None]) -> int | None:
+    reported = [v for v in values if v is not None]
+    return sum(reported) if reported else None
+
+
+def summarize_sessions(
+    group: StatsGroup = StatsGroup.PHASE, since: str | None = None
+) -> list[StatsRow]:
+    """Aggregate the project's telemetry ledger.
+
+    Every agent session attempt (task phases, map and populate sessions,
+    interactive sessions) is recorded in the root bench directory's
+    telemetry.jsonl as it ends (see run_opencode_command). Records are
+    grouped by group; a session counts as failed when it exited with a
+    non-zero code or timed out. Token and cost totals only cover the
+    sessions that reported them.
+
+    Args:
+        group: What to group the records by.
+        since: Optional date (YYYY-MM-DD); only sessions started on or after
+            it are counted.
+
+    Returns:
+        One StatsRow per key. Weeks are in chronological order; other keys
+        are ordered by total duration, longest first.
+
+    Raises:
+        ValueError: If not inside a bench project or since is not a date.
+    """
+    # Phase 1: Locate the root bench directory and validate the filter
+    root = find_bench_root(Path.cwd())
+    if root is None:
+        raise ValueError("Not inside a bench project. Run 'bench init' first.")
+    root_path, bench_dir_name = root
+    if since is not None:
+        try:
+            since = datetime.date.fromisoformat(since).isoformat()
+        except ValueError:
+            raise ValueError(f'Invalid date "{since}" (expected YYYY-MM-DD).')
+
+    # Phase 2: Load the records, skipping any written by an incompatible version
+    records: list[SessionRecord] = []
+    for raw in load_telemetry_records(root_path / bench_dir_name):
+        try:
+            record = SessionRecord(**raw)
+        except ValidationError:
+            continue
+        if since is None or record.time[:10] >= since:
+            records.append(record)
+
+    # Phase 3: Group and aggregate
+    groups: dict[str, list[SessionRecord]] = {}
+    for record in records:
+        groups.setdefault(_group_key(record, group), []).append(record)
+
+    rows: list[StatsRow] = []
+    for key, members in groups.items():
+        durations = [r.duration for r in members]
+        costs = [r.cost for r in members if r.cost is not None]
+        rows.append(
+            StatsRow(
+                key=key,
+                sessions=len(members),
+                failed=sum(1 for r in members if r.exit_code != 0 or r.timed_out),
+                total_duration=sum(durations),
+                mean_duration=sum(durations) / len(durations),
+                max_duration=max(durations),
+                input_tokens=_sum_reported([r.input_tokens for r in members]),
+                output_tokens=_sum_reported([r.output_tokens for r in members]),
+                cost=sum(costs) if costs else None,
+            )
+        )
+
+    if group == StatsGroup.WEEK:
+        rows.sort(key=lambda row: row.key)
+    else:
+        rows.sort(key=lambda row: row.total_duration, reverse=True)
+    return rows
@@ -1,42 +1,72 @@
 import datetime
+from collections.abc import Callable
 from pathlib import Path
 
 from bench.model.config import ImplementationStep, WorkbenchConfig
 from bench.model.mode import BenchMode
-from bench.model.task import TaskConfig, TaskEntry, TaskFilter
+from bench.model.task import (
+    ImplementPlan,
+    PhaseCheckpoint,
+    TaskCheckpoints,
+    TaskConfig,
+    TaskEntry,
+    TaskFilter,
+)
+from bench.model.telemetry import SessionTags
 from bench.repository.filesystem import (
     BENCH_SUBDIR_NAME,
     DISCUSSIONS_DIR_NAME,
     DISCUSSIONS_PLACEHOLDER,
     IMPL_MD_FILENAME,
     JOURNAL_MD_FILENAME,
+    LOGS_DIR_NAME,
     MAPS_DIR_NAME,
     MAPS_PLACEHOLDER,
     METAMAP_FILENAME,
     PROMPTS_DIR_NAME,
     REPOSITORIES_PLACEHOLDER,
+    SESSIONS_LOG_FILENAME,
     SPEC_MD_FILENAME,
     TASK_CREATE_SPEC_FILENAME,
+    TASK_CHECKPOINTS_FILENAME,
     TASK_FOLLOWUP_FILENAME,
     TASK_PLACEHOLDER,
     TASK_REFINE_SPEC_FILENAME,
+    TASK_YAML_FILENAME,
     TASKS_DIR_NAME,
     build_discussion_block,
     create_task_scaffold,
+    file_digest,
     find_task_folder,
     inject_discussions_into_spec,
     list_task_entries,
     list_task_names,
+    load_task_checkpoints,
     load_task_yaml,
+    locked_file,
     read_prompt_file,
     render_repositories_block,
     resolve_discussion_paths,
+    save_task_checkpoints,
     save_task_yaml,
     task_file_exists_and_nonempty,
+    task_lock_path,
     task_spec_exists,
+    update_task_index,
 )
-from bench.repository.opencode import run_command, run_prompt_interactive
+from bench.service._parallel import run_dag
 from bench.service.mode_detection import detect_mode
+from bench.service.opencode import (
+    cancel_opencode_commands,
+    run_opencode_command,
+    run_opencode_interactive,
+)
+from bench.view.task import (
+    display_task_implement_concurrent,
+    display_task_implement_phase_complete,
+    display_task_implement_phase_failed,
+    display_task_implement_phase_start,
+)
 
 
 def _substitute_prompt_placeholders(
@@ -160,6 +190,9 @@ def create_task(
         spec_path = tasks_dir / task_folder_name / SPEC_MD_FILENAME
         inject_discussions_into_spec(spec_path, discussion_paths)
 
+    # Phase 5c: Record the new task in the task index
+    update_task_index(tasks_dir, task_folder_name)
+
     # Phase 6: Return summary
     return {
         "name": task_name,
@@ -210,24 +243,30 @@ def complete_task(task_name: str) -> dict[str, object]:
     # Phase 3: Find the task folder
     task_folder_path, folder_name = find_task_folder(tasks_dir, task_name)
 
-    # Phase 4: Load task.yaml and validate via TaskConfig model
-    raw_data = load_task_yaml(task_folder_path)
-    task_config = TaskConfig(**raw_data)
-
-    # Phase 5: Check if already completed
-    if task_config.completed is not None:
-        raise ValueError(
-            f'Task "{task_name}" is already marked as complete '
-            f"(completed: {task_config.completed})."
-        )
+    # Phase 4: Load task.yaml and validate via TaskConfig model (locked through
+    # Phase 7 so concurrent `task complete` calls cannot interleave)
+    with locked_file(
+        task_folder_path / TASK_YAML_FILENAME,
+        task_lock_path(task_folder_path, TASK_YAML_FILENAME),
+    ):
+        raw_data = load_task_yaml(task_folder_path)
+        task_config = TaskConfig(**raw_data)
+
+        # Phase 5: Check if already completed
+        if task_config.completed is not None:
+            raise ValueError(
+                f'Task "{task_name}" is already marked as complete '
+                f"(completed: {task_config.completed})."
+            )
 
-    # Phase 6: Set the completed date (YYYY-MM-DD ISO 8601)
-    completed_date = datetime.date.today().isoformat()
-    task_config_dict = task_config.model_dump()
-    task_config_dict["completed"] = completed_date
+        # Phase 6: Set the completed date (YYYY-MM-DD ISO 8601)
+        completed_date = datetime.date.today().isoformat()
+        task_config_dict = task_config.model_dump()
+        task_config_dict["completed"] = completed_date
 
-    # Phase 7: Save back to disk
-    save_task_yaml(task_folder_path, task_config_dict)
+        # Phase 7: Save back to disk and record it in the task index
+        save_task_yaml(task_folder_path, task_config_dict)
+        update_task_index(tasks_dir, folder_name)
 
     # Phase 8: Return summary for the view layer
     return {
@@ -308,7 +347,12 @@ def run_task_interview(
     model = context.base_config.models.task
 
     # Launch interactive opencode
-    return run_prompt_interactive(prompt_text, model, context.cwd)
+    tags = SessionTags(
+        command="task create",
+        workbench=context.cwd.name,
+        task=raw_task_data.get("name"),
+    )
+    return run_opencode_interactive(prompt_text, model, context.cwd, tags)
 
 
 def resolve_task(task_name: str) -> dict[str, str]:
@@ -428,7 +472,12 @@ def refine_task(
     model = context.base_config.models.task
 
     # Launch interactive opencode
-    return run_prompt_interactive(prompt_text, model, context.cwd)
+    tags = SessionTags(
+        command="task refine",
+        workbench=context.cwd.name,
+        task=raw_task_data.get("name"),
+    )
+    return run_opencode_interactive(prompt_text, model, context.cwd, tags)
 
 
 def list_tasks(task_filter: TaskFilter) -> list[TaskEntry]:
@@ -505,8 +554,9 @@ def resolve_task_for_implement(task_name: str) -> dict[str, object]:
 
     Returns:
         A dict with "name" (str), "folder_name" (str),
-        "task_folder_path" (Path), and "implementation_flow"
-        (list[ImplementationStep]) keys.
+        "task_folder_path" (Path), "prompts_dir" (Path),
+        "implementation_flow" (list[ImplementationStep]) and
+        "max_concurrent_phases" (int) keys.
 
     Raises:
         ValueError: If mode is not WORKBENCH or task not found/ambiguous.
@@ -524,6 +574,7 @@ def resolve_task_for_implement(task_name: str) -> dict[str, object]:
             "The 'task implement' command can only be run from a workbench directory."
         )
 
+    assert context.base_config is not None
     assert context.workbench_config is not None
 
     # Phase 2: Resolve the tasks directory path
@@ -537,7 +588,9 @@ def resolve_task_for_implement(task_name: str) -> dict[str, object]:
         "name": task_name,
         "folder_name": folder_name,
         "task_folder_path": task_folder_path,
+        "prompts_dir": context.cwd / BENCH_SUBDIR_NAME / PROMPTS_DIR_NAME,
         "implementation_flow": context.workbench_config.implementation_flow,
+        "max_concurrent_phases": context.base_config.concurrency.phases,
     }
 
 
@@ -561,22 +614,37 @@ def validate_task_phase(
             )
 
 
-def run_task_phase(task_folder_name: str, phase: ImplementationStep) -> int:
+def run_task_phase(
+    task_folder_name: str,
+    phase: ImplementationStep,
+    log_path: Path | None = None,
+    echo: bool | None = None,
+) -> int:
     """Execute a single implementation phase by launching opencode.
 
     Reads the phase's prompt template, substitutes {{TASK}} and {{REPOSITORIES}}
     placeholders, and launches opencode with terminal pass-through.
 
+    The session is limited to the phase's timeout (or models.timeouts.task)
+    and retried on transient failures (see run_opencode_command); every
+    attempt is recorded in logs/sessions.log in the task folder and in the
+    project's telemetry ledger.
+
     Args:
         task_folder_name: The full task folder name (e.g., "20260208 - add-auth").
         phase: The implementation step to execute.
+        log_path: Optional file to record opencode's output to, with a
+            timestamp on every line (see run_command).
+        echo: Whether to also pass the output through to the terminal.
+            Defaults to True without a log_path and False with one.
 
     Returns:
-        The exit code from the opencode process.
+        The exit code from the last opencode attempt.
 
     Raises:
         ValueError: If mode is not WORKBENCH.
-        RuntimeError: If opencode is not installed.
+        RuntimeError: If opencode is not installed, the phase timed out on
+                      every attempt or was cancelled.
         FileNotFoundError: If the prompt template is missing.
     """
     # Mode enforcement
@@ -614,11 +682,29 @@ def run_task_phase(task_folder_name: str, phase: ImplementationStep) -> int:
         cwd=context.cwd,
     )
 
-    # Get the model
-    model = context.base_config.models.task
+    # Get the model and session limits
+    models = context.base_config.models
+    timeout = phase.timeout if phase.timeout is not None else models.timeouts.task
 
     # Launch opencode run (headless agent execution)
-    return run_command(prompt_text, model, context.cwd)
+    return run_opencode_command(
+        prompt_text,
+        models.task,
+        context.cwd,
+        f'phase "{phase.name}"',
+        log_path=log_path,
+        echo=echo,
+        timeout=timeout,
+        retries=models.retries,
+        retry_backoff=models.retry_backoff,
+        sessions_log=task_folder / LOGS_DIR_NAME / SESSIONS_LOG_FILENAME,
+        tags=SessionTags(
+            command="task implement",
+            workbench=context.cwd.name,
+            task=raw_task_data.get("name"),
+            phase=phase.name,
+        ),
+    )
 
 
 def validate_task_phase_outputs(
@@ -643,6 +729,409 @@ def validate_task_phase_outputs(
             )
 
 
+def _flow_files(implementation_flow: list[ImplementationStep]) -> list[str]:
+    """Return every file the phases of a flow require or produce, in first-use order."""
+    files: dict[str, None] = {}
+    for step in implementation_flow:
+        for filename in [*step.required_files, *step.output_files]:
+            files[filename] = None
+    return list(files)
+
+
+def _resolve_phase(implementation_flow: list[ImplementationStep], phase: str) -> int:
+    """Resolve a phase given by 1-based number or name to its number.
+
+    Raises:
+        ValueError: If no phase has that number or name.
+    """
+    if phase.isdigit() and 1 <= int(phase) <= len(implementation_flow):
+        return int(phase)
+    for i, step in enumerate(implementation_flow, 1):
+        if step.name == phase:
+            return i
+    available = ", ".join(
+        f"{i}. {step.name}" for i, step in enumerate(implementation_flow, 1)
+    )
+    raise ValueError(f"Unknown phase '{phase}'. Phases: {available}")
+
+
+def _phase_dependencies(
+    implementation_flow: list[ImplementationStep],
+) -> dict[int, set[int]]:
+    """Return the earlier phases each phase of a flow waits for, by 1-based number.
+
+    A phase's depends-on names them explicitly. Otherwise they are derived
+    from the files, and a phase waits for every earlier phase that:
+
+    - produces a file it requires,
+    - requires or produces a file it produces (so a file is not rewritten
+      while an earlier phase still uses it), or
+    - declares no output files. Such a phase works on the repositories,
+      where its effects cannot be tracked, so every later phase waits for it.
+
+    The default flow is a chain under these rules.
+
+    Raises:
+        ValueError: If depends-on names a phase that is not listed before it.
+    """
+    dependencies: dict[int, set[int]] = {}
+    for number, step in enumerate(implementation_flow, 1):
+        earlier = list(enumerate(implementation_flow[: number - 1], 1))
+        if step.depends_on is not None:
+            waits_for: set[int] = set()
+            for name in step.depends_on:
+                matches = {i for i, other in earlier if other.name == name}
+                if not matches:
+                    raise ValueError(
+                        f"Phase '{step.name}' depends on '{name}', which is not "
+                        "a phase listed before it in the implementation flow."
+                    )
+                waits_for |= matches
+        else:
+            required = set(step.required_files)
+            outputs = set(step.output_files)
+            waits_for = {
+                i
+                for i, other in earlier
+                if not other.output_files
+                or required & set(other.output_files)
+                or outputs & {*other.required_files, *other.output_files}
+            }
+        dependencies[number] = waits_for
+    return dependencies
+
+
+def _with_dependents(dependencies: dict[int, set[int]], phases: set[int]) -> set[int]:
+    """Return phases together with every phase that (transitively) waits for them."""
+    result = set(phases)
+    for number in sorted(dependencies):
+        if dependencies[number] & result:
+            result.add(number)
+    return result
+
+
+def _load_checkpoints(
+    task_folder_path: Path,
+    implementation_flow: list[ImplementationStep],
+    prompts_dir: Path,
+) -> tuple[TaskCheckpoints, dict[int, PhaseCheckpoint]]:
+    """Load a task's checkpoints and those that still describe the current flow.
+
+    A phase's checkpoint is found by phase name and prompt. It is valid if
+    the prompt file has not changed since the phase ran and every phase it
+    depends on has a valid checkpoint too.
+
+    Returns:
+        A tuple of (checkpoints, valid): everything recorded, and the valid
+        checkpoints by 1-based phase number.
+    """
+    checkpoints = TaskCheckpoints(**load_task_checkpoints(task_folder_path))
+    recorded = {(c.name, c.prompt): c for c in checkpoints.phases}
+    dependencies = _phase_dependencies(implementation_flow)
+    valid: dict[int, PhaseCheckpoint] = {}
+    for number, step in enumerate(implementation_flow, 1):
+        checkpoint = recorded.get((step.name, step.prompt))
+        if (
+            checkpoint is not None
+            and checkpoint.prompt_digest == file_digest(prompts_dir / step.prompt)
+            and all(d in valid for d in dependencies[number])
+        ):
+            valid[number] = checkpoint
+    return checkpoints, valid
+
+
+def plan_task_implement(
+    task_folder_path: Path,
+    implementation_flow: list[ImplementationStep],
+    prompts_dir: Path,
+    from_phase: str | None = None,
+    only_phase: str | None = None,
+) -> ImplementPlan:
+    """Decide which implementation phases to run.
+
+    Without overrides, the phases with a valid checkpoint in the task's
+    checkpoints.yaml are skipped, unless files were changed outside of bench
+    since: checkpoints.yaml holds the SHA-256 of every file the flow requires
+    or produces, as they were when the last phase run ended (successfully or
+    not, so a failed phase's partial edits do not count). A completed phase
+    that requires a changed file, or whose output file is missing, runs
+    again. Every phase that depends on a phase that runs runs too.
+
+    Args:
+        task_folder_path: Absolute path to the task folder.
+        implementation_flow: The workbench's implementation flow.
+        prompts_dir: The workbench's prompts directory.
+        from_phase: Run from this phase (number or name) to the end.
+        only_phase: Run only this phase (number or name).
+
+    Returns:
+        An ImplementPlan with the phases to run (empty if every phase is up
+        to date), the phases skipped as up to date, the flow files changed
+        since the last run, and the phases each phase waits for.
+
+    Raises:
+        ValueError: If both overrides are given, a phase is unknown, a
+                    depends-on entry is invalid, or checkpoints.yaml is invalid.
+    """
+    total_phases = len(implementation_flow)
+    dependencies = _phase_dependencies(implementation_flow)
+    if from_phase is not None and only_phase is not None:
+        raise ValueError("--from-phase and --only-phase are mutually exclusive.")
+    if only_phase is not None:
+        number = _resolve_phase(implementation_flow, only_phase)
+        return ImplementPlan(phases=[number], dependencies=dependencies)
+    if from_phase is not None:
+        number = _resolve_phase(implementation_flow, from_phase)
+        return ImplementPlan(
+            phases=list(range(number, total_phases + 1)), dependencies=dependencies
+        )
+
+    recorded, checkpoints = _load_checkpoints(
+        task_folder_path, implementation_flow, prompts_dir
+    )
+    stale = {i for i in range(1, total_phases + 1) if i not in checkpoints}
+    changed: list[str] = []
+    if checkpoints:
+        current = {
+            filename: file_digest(task_folder_path / filename)
+            for filename in _flow_files(implementation_flow)
+        }
+        changed = [
+            f for f, digest in current.items() if digest != recorded.files.get(f)
+        ]
+        for i in checkpoints:
+            step = implementation_flow[i - 1]
+            if any(f in changed for f in step.required_files) or any(
+                current[f] is None for f in step.output_files
+            ):
+                stale.add(i)
+
+    phases = _with_dependents(dependencies, stale)
+    return ImplementPlan(
+        phases=sorted(phases),
+        up_to_date=[i for i in range(1, total_phases + 1) if i not in phases],
+        changed=changed,
+        dependencies=dependencies,
+    )
+
+
+def invalidate_task_checkpoints(
+    task_folder_path: Path,
+    implementation_flow: list[ImplementationStep],
+    phase_number: int,
+) -> None:
+    """Drop the checkpoints of a phase and every phase that depends on it.
+
+    Called before a phase runs: once it starts, its files and those of the
+    phases after it no longer match what was recorded, even if it fails.
+
+    Args:
+        task_folder_path: Absolute path to the task folder.
+        implementation_flow: The workbench's implementation flow.
+        phase_number: 1-based number of the phase about to run.
+    """
+    dropped = {
+        (step.name, step.prompt)
+        for i, step in enumerate(implementation_flow, 1)
+        if i
+        in _with_dependents(_phase_dependencies(implementation_flow), {phase_number})
+    }
+    with locked_file(
+        task_folder_path / TASK_CHECKPOINTS_FILENAME,
+        task_lock_path(task_folder_path, TASK_CHECKPOINTS_FILENAME),
+    ):
+        checkpoints = TaskCheckpoints(**load_task_checkpoints(task_folder_path))
+        kept = [c for c in checkpoints.phases if (c.name, c.prompt) not in dropped]
+        if len(kept) == len(checkpoints.phases):
+            return
+        checkpoints.phases = kept
+        save_task_checkpoints(task_folder_path, checkpoints.model_dump())
+
+
+def record_task_checkpoint(
+    task_folder_path: Path,
+    implementation_flow: list[ImplementationStep],
+    prompts_dir: Path,
+    phase_number: int,
+    completed: bool = True,
+) -> bool:
+    """Record the end of a phase run, with the digests of the flow's files.
+
+    Called after every phase run. The digests are always recorded, so
+    plan_task_implement can tell files changed outside of bench from the
+    phase's own edits. A completed phase is also checkpointed, but only if
+    every phase it depends on has a valid checkpoint (e.g., `--only-phase 3`
+    on a task whose phase 2 never ran checkpoints nothing).
+
+    Args:
+        task_folder_path: Absolute path to the task folder.
+        implementation_flow: The workbench's implementation flow.
+        prompts_dir: The workbench's prompts directory.
+        phase_number: 1-based number of the phase that ran.
+        completed: Whether the phase succeeded and produced its outputs.
+
+    Returns:
+        True if the phase was checkpointed.
+    """
+    step = implementation_flow[phase_number - 1]
+    dependencies = _phase_dependencies(implementation_flow)
+    files = {
+        filename: file_digest(task_folder_path / filename)
+        for filename in _flow_files(implementation_flow)
+    }
+    with locked_file(
+        task_folder_path / TASK_CHECKPOINTS_FILENAME,
+        task_lock_path(task_folder_path, TASK_CHECKPOINTS_FILENAME),
+    ):
+        _, valid = _load_checkpoints(task_folder_path, implementation_flow, prompts_dir)
+        valid.pop(phase_number, None)
+        checkpointed = completed and all(d in valid for d in dependencies[phase_number])
+        if checkpointed:
+            valid[phase_number] = PhaseCheckpoint(
+                name=step.name,
+                prompt=step.prompt,
+                prompt_digest=file_digest(prompts_dir / step.prompt),
+                completed=datetime.datetime.now().isoformat(timespec="seconds"),
+                files=files,
+            )
+        save_task_checkpoints(
+            task_folder_path,
+            TaskCheckpoints(
+                phases=[valid[i] for i in sorted(valid)], files=files
+            ).model_dump(),
+        )
+    return checkpointed
+
+
+def run_task_phases(
+    task_name: str,
+    task_folder_name: str,
+    task_folder_path: Path,
+    implementation_flow: list[ImplementationStep],
+    prompts_dir: Path,
+    phases: list[int],
+    max_workers: int,
+) -> dict[str, object]:
+    """Run implementation phases, each once the phases it depends on completed.
+
+    Phases that do not depend on each other (see plan_task_implement) run
+    concurrently as separate headless opencode sessions, up to max_workers
+    at a time, with each session's output written only to its log. When no
+    two phases can overlap, they run one after another with their output
+    passed through to the terminal as well. Every phase's output is recorded
+    in logs/phase-<n>.log in the task folder (see run_command). Each phase
+    is validated, run, validated again and checkpointed, and its start and
+    end are reported as they happen. Once a phase fails, no further phases
+    start; phases already running are waited for.
+
+    Args:
+        task_name: The task name (for error messages).
+        task_folder_name: The full task folder name.
+        task_folder_path: Absolute path to the task folder.
+        implementation_flow: The workbench's implementation flow.
+        prompts_dir: The workbench's prompts directory.
+        phases: 1-based numbers of the phases to run (see plan_task_implement).
+        max_workers: Maximum number of phases running at the same time.
+
+    Returns:
+        A dict with "completed" (numbers of the phases that completed),
+        "failures" (error message by number of each failed phase) and
+        "not_started" (numbers of the phases that never started).
+    """
+    total_phases = len(implementation_flow)
+    dependencies = _phase_dependencies(implementation_flow)
+    ancestors: dict[int, set[int]] = {}
+    for number in sorted(dependencies):
+        ancestors[number] = set(dependencies[number]).union(
+            *(ancestors[d] for d in dependencies[number])
+        )
+    concurrent = max_workers > 1 and any(
+        a < b and a not in ancestors[b] for a in phases for b in phases
+    )
+    logs_dir = task_folder_path / LOGS_DIR_NAME
+    if concurrent:
+        display_task_implement_concurrent(max_workers, logs_dir)
+
+    def log_path(number: int) -> Path:
+        return logs_dir / f"phase-{number}.log"
+
+    def shown_log_path(number: int) -> Path | None:
+        # Only point at the log when the output is not on the terminal
+        return log_path(number) if concurrent else None
+
+    def make_job(number: int) -> Callable[[], None]:
+        step = implementation_flow[number - 1]
+
+        def job() -> None:
+            # Pre-flight validation
+            validate_task_phase(task_folder_path, step, task_name)
+
+            # Checkpoints of this phase and its dependents no longer hold
+            # once it starts
+            invalidate_task_checkpoints(task_folder_path, implementation_flow, number)
+
+            try:
+                exit_code = run_task_phase(
+                    task_folder_name, step, log_path(number), echo=not concurrent
+                )
+                if exit_code != 0:
+                    raise RuntimeError(f"opencode exited with code {exit_code}")
+            except RuntimeError:
+                record_task_checkpoint(
+                    task_folder_path, implementation_flow, prompts_dir, number, False
+                )
+                raise
+
+            # Output validation; the phase is only checkpointed (so a later
+            # run can skip it) once its outputs exist
+            try:
+                validate_task_phase_outputs(task_folder_path, step)
+            except ValueError:
+                record_task_checkpoint(
+                    task_folder_path, implementation_flow, prompts_dir, number, False
+                )
+                raise
+            record_task_checkpoint(
+                task_folder_path, implementation_flow, prompts_dir, number
+            )
+
+        return job
+
+    def on_start(number: int) -> None:
+        display_task_implement_phase_start(
+            number,
+            total_phases,
+            implementation_flow[number - 1].name,
+            shown_log_path(number),
+        )
+
+    def on_done(number: int, _result: object, error: Exception | None) -> None:
+        name = implementation_flow[number - 1].name
+        if error is None:
+            display_task_implement_phase_complete(
+                number, total_phases, name, shown_log_path(number)
+            )
+        else:
+            display_task_implement_phase_failed(
+                number, total_phases, name, str(error), shown_log_path(number)
+            )
+
+    completed, errors = run_dag(
+        [(number, make_job(number)) for number in phases],
+        dependencies,
+        max_workers if concurrent else 1,
+        on_start=on_start,
+        on_done=on_done,
+        stop_on_error=True,
+        on_interrupt=cancel_opencode_commands,
+    )
+    return {
+        "completed": sorted(completed),
+        "failures": {number: str(errors[number]) for number in sorted(errors)},
+        "not_started": [n for n in phases if n not in completed and n not in errors],
+    }
+
+
 def resolve_task_for_followup(task_name: str) -> dict[str, str]:
     """Resolve a task name and validate it is ready for followup.
 
@@ -767,6 +1256,11 @@ def run_task_followup(
 
     # Phase 7: Launch interactive opencode session
     model = context.base_config.models.task
+    tags = SessionTags(
+        command="task followup",
+        workbench=context.cwd.name,
+        task=raw_task_data.get("name"),
+    )
 
     # Phase 8: Return exit code
-    return run_prompt_interactive(prompt_text, model, context.cwd)
+    return run_opencode_interactive(prompt_text, model, context.cwd, tags)
@@ -1,33 +1,574 @@
+import datetime
+import re
+import time
+from collections.abc import Callable
+from fnmatch import fnmatchcase
 from pathlib import Path
+from typing import Any
 
 from bench.model import BenchMode, WorkbenchEntry, WorkbenchFilter, WorkbenchStatus
-from bench.model.source import SourceRepo
+from bench.model.script import ScriptEntry, ScriptRun, ScriptsManifest
+from bench.model.source import Source, SourceRepo
 from bench.repository import (
     BASE_CONFIG_FILENAME,
+    BLOB_STORE_DIR_NAME,
     add_worktree,
     branch_exists,
     create_workbench_scaffold,
     create_workbench_workspace,
     delete_branch,
     discover_scripts,
+    load_registry,
+    load_scripts_manifest,
     load_yaml_file,
+    locked_registry,
+    locked_yaml_update,
+    prune_blob_store,
     prune_worktrees,
     remove_workbench_scaffold,
     remove_workbench_workspace,
     remove_worktree,
     run_script,
-    save_yaml_file,
+    terminate_scripts,
 )
 from bench.view.workbench import (
     display_script_completed,
     display_script_failed,
     display_script_not_executable,
+    display_script_output,
     display_script_running,
+    display_script_skipped,
+    display_script_timed_out,
+    display_scripts_concurrent,
+    display_scripts_finished,
+    display_scripts_invalid,
+    display_teardown_progress,
+    display_worktree_created,
+    display_worktree_failed,
+    display_worktree_rolled_back,
 )
+from bench.service._parallel import run_dag, run_grouped, run_parallel
 from bench.service._validation import parse_repo_arg, validate_repo
 from bench.service.mode_detection import detect_mode
 
 
+def _progress_label(workbench_name: str, repo_dir: str, several: bool) -> str:
+    """Return the name a repo is reported under in progress output.
+
+    When several workbenches are processed together, the repo name is
+    qualified with its workbench so interleaved progress lines stay readable.
+    """
+    return f"{workbench_name}: {repo_dir}" if several else repo_dir
+
+
+# Leading number of a setup script's file name (e.g., "10" in "10-install.sh")
+_SCRIPT_PREFIX = re.compile(r"(\d+)[-_.]")
+
+
+def _script_prefix(name: str) -> int | None:
+    match = _SCRIPT_PREFIX.match(name)
+    return int(match.group(1)) if match else None
+
+
+def _script_dependencies(
+    names: list[str], manifest: ScriptsManifest
+) -> dict[str, set[str]]:
+    """Return the scripts each setup script waits for, by file name.
+
+    Scripts are ordered by file name. A script listed in scripts.yaml with
+    depends-on waits for the scripts it names. Any other script waits for
+    every script before it, except those with the same number prefix:
+    10-api.sh and 10-web.sh run side by side, after 00-tools.sh and before
+    20-seed.sh. Scripts without a number prefix thus run one at a time, in
+    order, as they always did.
+
+    Args:
+        names: File names of the executable scripts, sorted.
+        manifest: The scripts directory's manifest (empty if there is none).
+
+    Raises:
+        ValueError: If scripts.yaml lists a script twice or one that is not
+                    an executable script, or if depends-on names a script
+                    that does not come before it.
+    """
+    entries: dict[str, ScriptEntry] = {}
+    for entry in manifest.scripts:
+        if entry.name in entries:
+            raise ValueError(f"scripts.yaml lists '{entry.name}' more than once.")
+        if entry.name not in names:
+            raise ValueError(
+                f"scripts.yaml lists '{entry.name}', which is not an executable "
+                "script in the scripts directory."
+            )
+        entries[entry.name] = entry
+
+    dependencies: dict[str, set[str]] = {}
+    for index, name in enumerate(names):
+        earlier = names[:index]
+        entry = entries.get(name)
+        if entry is not None and entry.depends_on is not None:
+            for other in entry.depends_on:
+                if other not in earlier:
+                    raise ValueError(
+                        f"Script '{name}' depends on '{other}', which is not a "
+                        "script whose file name sorts before it."
+                    )
+            dependencies[name] = set(entry.depends_on)
+        else:
+            prefix = _script_prefix(name)
+            dependencies[name] = {
+                other
+                for other in earlier
+                if prefix is None or _script_prefix(other) != prefix
+            }
+    return dependencies
+
+
+def _run_setup_scripts(
+    scripts: list[Path],
+    dependencies: dict[str, set[str]],
+    manifest: ScriptsManifest,
+    working_dir: Path,
+    env_vars: dict[str, str],
+    max_workers: int,
+) -> None:
+    """Run a new workbench's setup scripts, each once the scripts it waits for ended.
+
+    Scripts that do not wait for each other run concurrently, up to
+    max_workers at a time, with their output captured and each line
+    prefixed with the script's name. When no two scripts can overlap, they
+    run one after another on the terminal, as before. A failing script is
+    reported as a warning; only the scripts that name it in depends-on are
+    skipped. Scripts are stopped at their own timeout and at the manifest's
+    overall timeout, after which no further scripts start.
+    """
+    paths = {path.name: path for path in scripts}
+    timeouts = {entry.name: entry.timeout for entry in manifest.scripts}
+    required = {
+        entry.name: set(entry.depends_on)
+        for entry in manifest.scripts
+        if entry.depends_on is not None
+    }
+    ancestors: dict[str, set[str]] = {}
+    for name in paths:
+        ancestors[name] = set(dependencies[name]).union(
+            *(ancestors[d] for d in dependencies[name])
+        )
+    concurrent = max_workers > 1 and any(
+        a < b and a not in ancestors[b] for a in paths for b in paths
+    )
+    if concurrent:
+        display_scripts_concurrent(max_workers)
+
+    started = time.monotonic()
+    deadline = None if manifest.timeout is None else started + manifest.timeout
+    failed: set[str] = set()
+    skipped: dict[str, str] = {}
+    finished: set[str] = set()
+    start_errors: dict[str, str] = {}
+
+    def make_job(name: str) -> Callable[[], ScriptRun | None]:
+        def on_output(line: str) -> None:
+            display_script_output(name, line)
+
+        def job() -> ScriptRun | None:
+            if name in skipped:
+                return None
+            timeout = timeouts.get(name)
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                timeout = remaining if timeout is None else min(timeout, remaining)
+            try:
+                return run_script(
+                    paths[name],
+                    working_dir,
+                    env_vars,
+                    timeout=timeout,
+                    on_output=on_output if concurrent else None,
+                )
+            except OSError as e:
+                # Counts as a failure, so the scripts waiting for it still
+                # run unless they name it in depends-on
+                start_errors[name] = f"could not be started: {e}"
+                return None
+
+        return job
+
+    def on_start(name: str) -> None:
+        # Called on this thread before the job is submitted, so the job sees
+        # the decision
+        if required.get(name, set()) & (failed | skipped.keys()):
+            skipped[name] = "a script it depends on did not succeed"
+        elif deadline is not None and time.monotonic() >= deadline:
+            skipped[name] = f"the overall timeout ({manifest.timeout}s) was reached"
+        if name in skipped:
+            display_script_skipped(name, skipped[name])
+        else:
+            display_script_running(name)
+
+    def on_done(name: str, run: ScriptRun | None, error: Exception | None) -> None:
+        finished.add(name)
+        if error is not None or name in start_errors:
+            failed.add(name)
+            skipped[name] = start_errors.get(name, str(error))
+            display_script_skipped(name, skipped[name])
+        elif run is None:
+            return
+        elif run.timed_out:
+            failed.add(name)
+            display_script_timed_out(name, run.duration)
+        elif run.exit_code != 0:
+            failed.add(name)
+            display_script_failed(name, run.exit_code, run.duration)
+        else:
+            display_script_completed(name, run.duration)
+
+    run_dag(
+        [(name, make_job(name)) for name in paths],
+        dependencies,
+        max_workers if concurrent else 1,
+        on_start=on_start,
+        on_done=on_done,
+        on_interrupt=terminate_scripts,
+    )
+    # run_dag never starts the jobs waiting for one that raised
+    for name in paths:
+        if name not in finished:
+            skipped[name] = "a script it waits for could not be run"
+            display_script_skipped(name, skipped[name])
+    ran = len(paths) - len(skipped)
+    if len(paths) > 1:
+        display_scripts_finished(ran, time.monotonic() - started)
+
+
+def _roll_back_worktrees(
+    root_path: Path,
+    targets: list[tuple[str, str, list[tuple[str, str | None, bool]]]],
+    max_workers: int,
+    several: bool,
+) -> None:
+    """Remove worktrees created for workbenches, with the branches created for them.
+
+    Args:
+        root_path: The project root directory.
+        targets: List of (workbench_name, git_branch, plan) tuples as for
+            _create_worktrees, listing only the worktrees to remove.
+        max_workers: Maximum number of repositories worked on at the same time.
+        several: Whether progress lines name the workbench.
+    """
+
+    def make_rollback(
+        workbench_name: str, git_branch: str, repo_dir: str, branch_created: bool
+    ) -> Callable[[], None]:
+        def rollback() -> None:
+            repo_path = root_path / repo_dir
+            remove_worktree(
+                repo_path,
+                root_path / "workbench" / workbench_name / "repo" / repo_dir,
+            )
+            if branch_created:
+                delete_branch(git_branch, repo_path, force=True)
+
+        return rollback
+
+    def report_rollback(
+        repo_dir: str,
+        workbench_name: str,
+        _result: object,
+        error: Exception | None,
+    ) -> None:
+        label = _progress_label(workbench_name, repo_dir, several)
+        if error is None:
+            display_worktree_rolled_back(label)
+        else:
+            display_worktree_failed(label, f"rollback failed: {error}")
+
+    rollbacks: dict[str, list[tuple[str, Callable[[], None]]]] = {}
+    for name, git_branch, plan in targets:
+        for repo_dir, _, needs_creation in plan:
+            rollbacks.setdefault(repo_dir, []).append(
+                (name, make_rollback(name, git_branch, repo_dir, needs_creation))
+            )
+    run_grouped(rollbacks, max_workers, on_done=report_rollback)
+
+
+def _create_worktrees(
+    root_path: Path,
+    targets: list[tuple[str, str, list[tuple[str, str | None, bool]]]],
+    max_workers: int,
+) -> tuple[dict[str, list[dict[str, str]]], dict[str, str]]:
+    """Create the worktrees of one or more workbenches, all-or-nothing each.
+
+    Worktrees are created on a bounded worker pool shared by all workbenches,
+    one job per repository (see run_grouped), and reported as they finish.
+    If any repo of a workbench fails, every worktree created for that
+    workbench is removed again (together with branches this call created),
+    so no workbench is left with a partial set of worktrees. Other
+    workbenches are not affected.
+
+    Args:
+        root_path: The project root directory.
+        targets: List of (workbench_name, git_branch, plan) tuples, where plan
+            is a list of (repo_dir, source_branch, needs_creation) tuples in
+            the order the repos should be reported in the summary.
+        max_workers: Maximum number of repositories worked on at the same time.
+
+    Returns:
+        A tuple of (summaries, failures): summaries maps each workbench whose
+        worktrees were all created to a list of {"dir": ..., "worktree_path":
+        ...} dicts in plan order; failures maps each other workbench to an
+        error message listing the repos that failed.
+    """
+    several = len(targets) > 1
+    branches = {name: git_branch for name, git_branch, _ in targets}
+
+    def worktree_path(workbench_name: str, repo_dir: str) -> Path:
+        return root_path / "workbench" / workbench_name / "repo" / repo_dir
+
+    def make_job(
+        workbench_name: str,
+        repo_dir: str,
+        source_branch: str | None,
+        needs_creation: bool,
+    ) -> Callable[[], None]:
+        def job() -> None:
+            add_worktree(
+                repo_path=root_path / repo_dir,
+                worktree_path=worktree_path(workbench_name, repo_dir),
+                branch_name=branches[workbench_name],
+                start_point=source_branch,
+                create_branch=needs_creation,
+            )
+
+        return job
+
+    def report(
+        repo_dir: str, workbench_name: str, _result: object, error: Exception | None
+    ) -> None:
+        label = _progress_label(workbench_name, repo_dir, several)
+        if error is None:
+            display_worktree_created(label)
+        else:
+            display_worktree_failed(label, str(error))
+
+    groups: dict[str, list[tuple[str, Callable[[], None]]]] = {}
+    for name, _, plan in targets:
+        for repo_dir, source_branch, needs_creation in plan:
+            groups.setdefault(repo_dir, []).append(
+                (name, make_job(name, repo_dir, source_branch, needs_creation))
+            )
+
+    created, errors = run_grouped(groups, max_workers, on_done=report)
+    failed = {name for _, name in errors}
+
+    if failed:
+        _roll_back_worktrees(
+            root_path,
+            [
+                (
+                    name,
+                    git_branch,
+                    [entry for entry in plan if (entry[0], name) in created],
+                )
+                for name, git_branch, plan in targets
+                if name in failed
+            ],
+            max_workers,
+            several,
+        )
+
+    summaries: dict[str, list[dict[str, str]]] = {}
+    failures: dict[str, str] = {}
+    for name, _, plan in targets:
+        if name in failed:
+            failed_repos = [
+                f"  {repo_dir}: {errors[(repo_dir, name)]}"
+                for repo_dir, _, _ in plan
+                if (repo_dir, name) in errors
+            ]
+            failures[name] = (
+                f"Failed to create worktrees for {len(failed_repos)} repo(s):\n"
+                + "\n".join(failed_repos)
+            )
+        else:
+            summaries[name] = [
+                {
+                    "dir": repo_dir,
+                    "worktree_path": str(
+                        worktree_path(name, repo_dir).relative_to(root_path)
+                    ),
+                }
+                for repo_dir, _, _ in plan
+            ]
+    return summaries, failures
+
+
+def _teardown_workbenches(
+    root_path: Path,
+    targets: list[tuple[str, list[str], Path | None, str | None]],
+    max_workers: int,
+) -> tuple[dict[str, list[dict[str, str | None]]], dict[str, str]]:
+    """Tear down the worktrees and branches of one or more workbenches.
+
+    1. For every workbench with a workspace_path, each worktree still present
+       under it is removed with `git worktree remove --force`. Each workspace
+       directory is then removed with whatever is left in it (including the
+       files of any worktree git failed to remove), and the repos without a
+       cleanly removed worktree are pruned so git forgets any stale
+       registration.
+    2. For every workbench with a git_branch, the branch is deleted
+       (`git branch -d`) in every repo where it exists.
+
+    Git work for all workbenches runs on one bounded worker pool, one job per
+    repository (see run_grouped), and each step is reported as it finishes.
+    A failure in one repo or workbench never stops the others: it is recorded
+    for the caller to report. Repos whose directory is missing are skipped.
+
+    Args:
+        root_path: The project root directory.
+        targets: List of (workbench_name, repo_dirs, workspace_path,
+            git_branch) tuples. repo_dirs are in report order; workspace_path
+            is the workspace directory to remove, or None to skip worktree
+            removal (e.g., for an inactive workbench); git_branch is the
+            branch to delete, or None to keep branches.
+        max_workers: Maximum number of repositories worked on at the same time.
+
+    Returns:
+        A tuple of (rows, workspace_errors). rows maps each workbench to one
+        dict per repo, in repo_dirs order, with keys "dir", "worktree"
+        ("removed", "failed" or "absent"), "branch" ("deleted", "failed" or
+        "absent") and "error" (None, or the failure messages).
+        workspace_errors maps each workbench whose workspace directory could
+        not be removed to the error message.
+    """
+    several = len(targets) > 1
+    rows: dict[tuple[str, str], dict[str, str]] = {}
+    errors: dict[tuple[str, str], list[str]] = {}
+    for name, repo_dirs, _, _ in targets:
+        for repo_dir in repo_dirs:
+            rows[(repo_dir, name)] = {
+                "dir": repo_dir,
+                "worktree": "absent",
+                "branch": "absent",
+            }
+            errors[(repo_dir, name)] = []
+    present = {
+        repo_dir
+        for repo_dir in {repo_dir for repo_dir, _ in rows}
+        if (root_path / repo_dir).is_dir()
+    }
+
+    # Step 1: worktrees, then the workspace directories, then pruning
+    def make_remove(repo_dir: str, worktree_path: Path) -> Callable[[], None]:
+        def job() -> None:
+            remove_worktree(root_path / repo_dir, worktree_path, force=True)
+
+        return job
+
+    def report_remove(
+        repo_dir: str, workbench_name: str, _result: object, error: Exception | None
+    ) -> None:
+        if error is None:
+            rows[(repo_dir, workbench_name)]["worktree"] = "removed"
+        else:
+            rows[(repo_dir, workbench_name)]["worktree"] = "failed"
+            errors[(repo_dir, workbench_name)].append(str(error))
+        display_teardown_progress(
+            _progress_label(workbench_name, repo_dir, several),
+            "worktree",
+            None if error is None else str(error),
+        )
+
+    removals: dict[str, list[tuple[str, Callable[[], None]]]] = {}
+    for name, repo_dirs, workspace_path, _ in targets:
+        if workspace_path is None:
+            continue
+        for repo_dir in repo_dirs:
+            worktree_path = workspace_path / "repo" / repo_dir
+            if repo_dir in present and worktree_path.exists():
+                removals.setdefault(repo_dir, []).append(
+                    (name, make_remove(repo_dir, worktree_path))
+                )
+    run_grouped(removals, max_workers, on_done=report_remove)
+
+    workspace_errors: dict[str, str] = {}
+    stale: dict[str, list[str]] = {}
+    for name, repo_dirs, workspace_path, _ in targets:
+        if workspace_path is None:
+            continue
+        if workspace_path.is_dir():
+            try:
+                remove_workbench_workspace(workspace_path)
+            except OSError as e:
+                workspace_errors[name] = (
+                    f"Failed to remove workspace directory {workspace_path}: {e}"
+                )
+        for repo_dir in repo_dirs:
+            if repo_dir in present and rows[(repo_dir, name)]["worktree"] != "removed":
+                stale.setdefault(repo_dir, []).append(name)
+
+    def make_prune(repo_dir: str) -> Callable[[], None]:
+        def job() -> None:
+            prune_worktrees(root_path / repo_dir)
+
+        return job
+
+    _, prune_errors = run_parallel(
+        [(repo_dir, make_prune(repo_dir)) for repo_dir in stale], max_workers
+    )
+    for repo_dir, error in prune_errors.items():
+        for name in stale[repo_dir]:
+            errors[(repo_dir, name)].append(str(error))
+
+    # Step 2: branches
+    def make_delete(repo_dir: str, git_branch: str) -> Callable[[], bool]:
+        def job() -> bool:
+            repo_path = root_path / repo_dir
+            if not branch_exists(git_branch, repo_path):
+                return False
+            delete_branch(git_branch, repo_path)
+            return True
+
+        return job
+
+    def report_delete(
+        repo_dir: str,
+        workbench_name: str,
+        deleted: bool | None,
+        error: Exception | None,
+    ) -> None:
+        label = _progress_label(workbench_name, repo_dir, several)
+        if error is not None:
+            rows[(repo_dir, workbench_name)]["branch"] = "failed"
+            errors[(repo_dir, workbench_name)].append(str(error))
+            display_teardown_progress(label, "branch", str(error))
+        elif deleted:
+            rows[(repo_dir, workbench_name)]["branch"] = "deleted"
+            display_teardown_progress(label, "branch", None)
+
+    deletions: dict[str, list[tuple[str, Callable[[], bool]]]] = {}
+    for name, repo_dirs, _, git_branch in targets:
+        if git_branch is None:
+            continue
+        for repo_dir in repo_dirs:
+            if repo_dir in present:
+                deletions.setdefault(repo_dir, []).append(
+                    (name, make_delete(repo_dir, git_branch))
+                )
+    run_grouped(deletions, max_workers, on_done=report_delete)
+
+    return {
+        name: [
+            {
+                **rows[(repo_dir, name)],
+                "error": "; ".join(errors[(repo_dir, name)]) or None,
+            }
+            for repo_dir in repo_dirs
+        ]
+        for name, repo_dirs, _, _ in targets
+    }, workspace_errors
+
+
 def create_workbench(
     source_name: str,
     workbench_name: str,
@@ -74,19 +615,15 @@ def create_workbench(
 
     # Phase 3: Load config & find source
     config_path = context.root_path / context.bench_dir_name / BASE_CONFIG_FILENAME
-    data = load_yaml_file(config_path)
+    registry = load_registry(config_path)
 
-    source = None
-    for s in context.base_config.sources:
-        if s.name == source_name:
-            source = s
-            break
-
-    if source is None:
-        available = ", ".join(s.name for s in context.base_config.sources) or "(none)"
+    source_entry = registry.get_source(source_name)
+    if source_entry is None:
+        available = ", ".join(registry.source_names()) or "(none)"
         raise ValueError(
             f'Source "{source_name}" not found. Available sources: {available}'
         )
+    source = Source(**source_entry)
 
     if not source.repos:
         raise ValueError(
@@ -94,10 +631,7 @@ def create_workbench(
         )
 
     # Phase 4: Validate workbench name uniqueness
-    existing_wb_names = [
-        w.get("name") for w in data.get("workbenches", []) if isinstance(w, dict)
-    ]
-    if workbench_name in existing_wb_names:
+    if registry.get_workbench(workbench_name) is not None:
         raise ValueError(
             f'Workbench "{workbench_name}" already exists in configuration.'
         )
@@ -134,6 +668,12 @@ def create_workbench(
                 "prompt": step.prompt,
                 "required-files": step.required_files,
                 "output-files": step.output_files,
+                **(
+                    {"depends-on": step.depends_on}
+                    if step.depends_on is not None
+                    else {}
+                ),
+                **({"timeout": step.timeout} if step.timeout is not None else {}),
             }
             for step in context.base_config.implementation_flow_template
         ],
@@ -145,6 +685,7 @@ def create_workbench(
         context.bench_dir_name,
         workbench_name,
         workbench_config_data,
+        clone_modes=context.base_config.scaffold_clone.model_dump(),
     )
 
     # Phase 8: Create workspace with symlinks
@@ -154,50 +695,54 @@ def create_workbench(
         workbench_name,
     )
 
-    # Phase 9: Create worktrees
-    repo_summaries: list[dict[str, str]] = []
-    for repo, needs_creation in repo_branch_info:
-        repo_path = context.root_path / repo.dir
-        worktree_path = (
-            context.root_path / "workbench" / workbench_name / "repo" / repo.dir
+    # Phase 9: Create worktrees (concurrently; all-or-nothing)
+    worktree_targets: list[tuple[str, str, list[tuple[str, str | None, bool]]]] = [
+        (
+            workbench_name,
+            git_branch,
+            [
+                (repo.dir, repo.source_branch, needs_creation)
+                for repo, needs_creation in repo_branch_info
+            ],
         )
-
-        if needs_creation:
-            add_worktree(
-                repo_path=repo_path,
-                worktree_path=worktree_path,
-                branch_name=git_branch,
-                start_point=repo.source_branch,
-                create_branch=True,
-            )
-        else:
-            add_worktree(
-                repo_path=repo_path,
-                worktree_path=worktree_path,
-                branch_name=git_branch,
+    ]
+    repo_summaries, worktree_failures = _create_worktrees(
+        context.root_path,
+        worktree_targets,
+        context.base_config.concurrency.worktrees,
+    )
+    if worktree_failures:
+        remove_workbench_workspace(wb_dir)
+        remove_workbench_scaffold(bench_wb_dir)
+        raise RuntimeError(worktree_failures[workbench_name])
+
+    # Phase 10: Update base-config.yaml. Re-read under the lock so entries
+    # written by concurrent bench commands since Phase 3 are kept, and check
+    # the name again: a concurrent create may have registered it since Phase 4.
+    with locked_registry(config_path) as registry:
+        clash = registry.get_workbench(workbench_name) is not None
+        if not clash:
+            registry.add_workbench(
+                {
+                    "name": workbench_name,
+                    "source": source_name,
+                    "git-branch": git_branch,
+                    "status": "active",
+                    "created": datetime.date.today().isoformat(),
+                }
             )
-
-        repo_summaries.append(
-            {
-                "dir": repo.dir,
-                "worktree_path": str(worktree_path.relative_to(context.root_path)),
-            }
+    if clash:
+        _roll_back_worktrees(
+            context.root_path,
+            worktree_targets,
+            context.base_config.concurrency.worktrees,
+            several=False,
+        )
+        remove_workbench_workspace(wb_dir)
+        remove_workbench_scaffold(bench_wb_dir)
+        raise ValueError(
+            f'Workbench "{workbench_name}" already exists in configuration.'
         )
-
-    # Phase 10: Update base-config.yaml
-    if "workbenches" not in data:
-        data["workbenches"] = []
-
-    data["workbenches"].append(
-        {
-            "name": workbench_name,
-            "source": source_name,
-            "git-branch": git_branch,
-            "status": "active",
-        }
-    )
-
-    save_yaml_file(config_path, data)
 
     # Phase 11: Execute setup scripts
     scripts_dir = context.root_path / "workbench" / workbench_name / "bench" / "scripts"
@@ -222,19 +767,29 @@ def create_workbench(
             ),
         }
 
-        for script_path in executable_scripts:
-            display_script_running(script_path.name)
-            exit_code = run_script(script_path, workspace_dir, env_vars)
-            if exit_code == 0:
-                display_script_completed(script_path.name)
-            else:
-                display_script_failed(script_path.name, exit_code)
+        try:
+            manifest = ScriptsManifest(**load_scripts_manifest(scripts_dir))
+            dependencies = _script_dependencies(
+                [p.name for p in executable_scripts], manifest
+            )
+        except (ValueError, OSError) as e:
+            # The workbench exists by now; script failures are warnings too
+            display_scripts_invalid(str(e))
+        else:
+            _run_setup_scripts(
+                executable_scripts,
+                dependencies,
+                manifest,
+                workspace_dir,
+                env_vars,
+                context.base_config.concurrency.scripts,
+            )
 
     return {
         "name": workbench_name,
         "source": source_name,
         "git_branch": git_branch,
-        "repos": repo_summaries,
+        "repos": repo_summaries[workbench_name],
     }
 
 
@@ -289,20 +844,11 @@ def update_workbench(
 
     # Phase 4: Verify workbench exists in base-config.yaml
     config_path = context.root_path / context.bench_dir_name / BASE_CONFIG_FILENAME
-    data = load_yaml_file(config_path)
-
-    workbench_entry: dict[str, object] | None = None
-    for w in data.get("workbenches", []):
-        if isinstance(w, dict) and w.get("name") == workbench_name:
-            workbench_entry = w
-            break
+    registry = load_registry(config_path)
 
+    workbench_entry = registry.get_workbench(workbench_name)
     if workbench_entry is None:
-        existing_names = [
-            w["name"]
-            for w in data.get("workbenches", [])
-            if isinstance(w, dict) and "name" in w
-        ]
+        existing_names = registry.workbench_names()
         available = ", ".join(existing_names) if existing_names else "(none)"
         raise ValueError(
             f'Workbench "{workbench_name}" not found. '
@@ -316,7 +862,9 @@ def update_workbench(
             f"Activate it first with `bench workbench activate`."
         )
 
-    # Phase 6: Load workbench-config.yaml
+    # Phase 6: Load workbench-config.yaml (locked for the whole update, so two
+    # concurrent updates of one workbench cannot drop each other's repos; the
+    # file is written back when the block exits without error)
     wb_config_path = (
         context.root_path
         / context.bench_dir_name
@@ -325,85 +873,84 @@ def update_workbench(
         / "bench"
         / "workbench-config.yaml"
     )
-    wb_data = load_yaml_file(wb_config_path)
-
-    git_branch: str = wb_data.get("git-branch", workbench_name)
-    repos_list: list[dict[str, str]] = wb_data.get("repos", [])
-
-    # Phase 7: Validate removals (all-or-nothing)
-    existing_repo_dirs = {r.get("dir") for r in repos_list}
-    for dir_name in remove_repo_args:
-        if dir_name not in existing_repo_dirs:
-            available = (
-                ", ".join(sorted(existing_repo_dirs))
-                if existing_repo_dirs
-                else "(none)"
-            )
-            raise ValueError(
-                f'Repo "{dir_name}" not found in workbench "{workbench_name}". '
-                f"Available repos: {available}"
-            )
-
-    # Phase 8: Apply removals to in-memory repos list
-    remove_set = set(remove_repo_args)
-    remaining_repos = [r for r in repos_list if r.get("dir") not in remove_set]
-
-    # Phase 9: Validate additions (against remaining repos)
-    remaining_dirs = {r.get("dir") for r in remaining_repos}
-    for dir_name, branch_name in parsed_adds:
-        if dir_name in remaining_dirs:
-            raise ValueError(
-                f'Repository directory "{dir_name}" already exists '
-                f'in workbench "{workbench_name}".'
-            )
-        validate_repo(dir_name, branch_name, context.root_path)
-        remaining_dirs.add(dir_name)  # prevent duplicates within the add list
-
-    # Phase 10: Check git branch existence for additions
-    add_info: list[tuple[str, str, bool]] = []  # (dir, source_branch, needs_creation)
-    for dir_name, source_branch in parsed_adds:
-        repo_path = context.root_path / dir_name
-        exists = branch_exists(git_branch, repo_path)
-        add_info.append((dir_name, source_branch, not exists))
-
-    # Phase 11: Execute removals — remove git worktrees
-    for dir_name in remove_repo_args:
-        worktree_path = (
-            context.root_path / "workbench" / workbench_name / "repo" / dir_name
-        )
-        repo_path = context.root_path / dir_name
-        remove_worktree(repo_path, worktree_path)
-
-    # Phase 12: Execute additions — create git worktrees
-    for dir_name, source_branch, needs_creation in add_info:
-        repo_path = context.root_path / dir_name
-        worktree_path = (
-            context.root_path / "workbench" / workbench_name / "repo" / dir_name
-        )
-        if needs_creation:
-            add_worktree(
-                repo_path=repo_path,
-                worktree_path=worktree_path,
-                branch_name=git_branch,
-                start_point=source_branch,
-                create_branch=True,
+    with locked_yaml_update(wb_config_path) as wb_data:
+        git_branch: str = wb_data.get("git-branch", workbench_name)
+        repos_list: list[dict[str, str]] = wb_data.get("repos", [])
+
+        # Phase 7: Validate removals (all-or-nothing)
+        existing_repo_dirs = {r.get("dir") for r in repos_list}
+        for dir_name in remove_repo_args:
+            if dir_name not in existing_repo_dirs:
+                available = (
+                    ", ".join(sorted(existing_repo_dirs))
+                    if existing_repo_dirs
+                    else "(none)"
+                )
+                raise ValueError(
+                    f'Repo "{dir_name}" not found in workbench "{workbench_name}". '
+                    f"Available repos: {available}"
+                )
+
+        # Phase 8: Apply removals to in-memory repos list
+        remove_set = set(remove_repo_args)
+        remaining_repos = [r for r in repos_list if r.get("dir") not in remove_set]
+
+        # Phase 9: Validate additions (against remaining repos)
+        remaining_dirs = {r.get("dir") for r in remaining_repos}
+        for dir_name, branch_name in parsed_adds:
+            if dir_name in remaining_dirs:
+                raise ValueError(
+                    f'Repository directory "{dir_name}" already exists '
+                    f'in workbench "{workbench_name}".'
+                )
+            validate_repo(dir_name, branch_name, context.root_path)
+            remaining_dirs.add(dir_name)  # prevent duplicates within the add list
+
+        # Phase 10: Check git branch existence for additions
+        # (dir, source_branch, needs_creation)
+        add_info: list[tuple[str, str, bool]] = []
+        for dir_name, source_branch in parsed_adds:
+            repo_path = context.root_path / dir_name
+            exists = branch_exists(git_branch, repo_path)
+            add_info.append((dir_name, source_branch, not exists))
+
+        # Phase 11: Execute removals — remove git worktrees
+        for dir_name in remove_repo_args:
+            worktree_path = (
+                context.root_path / "workbench" / workbench_name / "repo" / dir_name
             )
-        else:
-            add_worktree(
-                repo_path=repo_path,
-                worktree_path=worktree_path,
-                branch_name=git_branch,
+            repo_path = context.root_path / dir_name
+            remove_worktree(repo_path, worktree_path)
+
+        # Phase 12: Execute additions — create git worktrees
+        for dir_name, source_branch, needs_creation in add_info:
+            repo_path = context.root_path / dir_name
+            worktree_path = (
+                context.root_path / "workbench" / workbench_name / "repo" / dir_name
             )
+            if needs_creation:
+                add_worktree(
+                    repo_path=repo_path,
+                    worktree_path=worktree_path,
+                    branch_name=git_branch,
+                    start_point=source_branch,
+                    create_branch=True,
+                )
+            else:
+                add_worktree(
+                    repo_path=repo_path,
+                    worktree_path=worktree_path,
+                    branch_name=git_branch,
+                )
 
-    # Phase 13: Update workbench-config.yaml
-    # Apply removals
-    updated_repos = [r for r in repos_list if r.get("dir") not in remove_set]
-    # Apply additions
-    for dir_name, source_branch, _ in add_info:
-        updated_repos.append({"dir": dir_name, "source-branch": source_branch})
+        # Phase 13: Update workbench-config.yaml
+        # Apply removals
+        updated_repos = [r for r in repos_list if r.get("dir") not in remove_set]
+        # Apply additions
+        for dir_name, source_branch, _ in add_info:
+            updated_repos.append({"dir": dir_name, "source-branch": source_branch})
 
-    wb_data["repos"] = updated_repos
-    save_yaml_file(wb_config_path, wb_data)
+        wb_data["repos"] = updated_repos
 
     # Phase 14: Return summary message
     removed_count = len(remove_repo_args)
@@ -417,28 +964,172 @@ def update_workbench(
     return f'Workbench "{workbench_name}" updated: {", ".join(parts)}'
 
 
-def retire_workbench(workbench_name: str) -> dict[str, object]:
-    """Retire a workbench by removing its workspace and pruning worktrees.
+def _is_glob(pattern: str) -> bool:
+    """Return True if a workbench argument is a glob pattern rather than a name."""
+    return any(char in pattern for char in "*?[")
+
+
+def _workbench_age_date(
+    entry: WorkbenchEntry, scaffold_root: Path
+) -> datetime.date | None:
+    """Return the date a workbench's age is measured from.
+
+    That is the date it was retired for an inactive workbench and the date it
+    was created for an active one. Entries written before these dates were
+    recorded fall back to the modification date of their
+    workbench-config.yaml; None if that is missing too.
+    """
+    if entry.status == WorkbenchStatus.INACTIVE:
+        recorded = entry.retired or entry.created
+    else:
+        recorded = entry.created
+    if recorded is not None:
+        return recorded
+
+    config_path = scaffold_root / entry.name / "bench" / "workbench-config.yaml"
+    try:
+        return datetime.date.fromtimestamp(config_path.stat().st_mtime)
+    except OSError:
+        return None
+
+
+def _select_workbenches(
+    workbenches: list[WorkbenchEntry],
+    patterns: list[str],
+    status: WorkbenchStatus | None,
+    status_message: str,
+    older_than_days: int | None,
+    scaffold_root: Path,
+) -> list[WorkbenchEntry]:
+    """Resolve workbench names, glob patterns and filters to config entries.
+
+    A workbench is selected if it has the given status (when one is given),
+    matches any of the names or patterns (when any are given), and is older
+    than older_than_days (when given, see _workbench_age_date). Plain names
+    must exist and have the given status; patterns may match nothing.
+
+    Args:
+        workbenches: The workbench entries of the base config.
+        patterns: Workbench names and fnmatch-style glob patterns.
+        status: The status selected workbenches must have, or None for any.
+        status_message: Error message for a plain name with the wrong status,
+            with a "{name}" placeholder.
+        older_than_days: Minimum age in days, or None for any age.
+        scaffold_root: The .bench/workbench directory.
+
+    Returns:
+        The selected entries, in config order.
+
+    Raises:
+        ValueError: If neither patterns nor older_than_days are given, or a
+            plain name is not found or has the wrong status.
+    """
+    if not patterns and older_than_days is None:
+        raise ValueError(
+            "Specify at least one workbench name or pattern, or --older-than."
+        )
+
+    by_name = {entry.name: entry for entry in workbenches}
+    for pattern in patterns:
+        if _is_glob(pattern):
+            continue
+        entry = by_name.get(pattern)
+        if entry is None:
+            available = ", ".join(by_name) if by_name else "(none)"
+            raise ValueError(
+                f'Workbench "{pattern}" not found. Available workbenches: {available}'
+            )
+        if status is not None and entry.status != status:
+            raise ValueError(status_message.format(name=pattern))
+
+    selected = [
+        entry
+        for entry in workbenches
+        if (status is None or entry.status == status)
+        and (not patterns or any(fnmatchcase(entry.name, p) for p in patterns))
+    ]
+    if older_than_days is not None:
+        cutoff = datetime.date.today() - datetime.timedelta(days=older_than_days)
+        selected = [
+            entry
+            for entry in selected
+            if (age_date := _workbench_age_date(entry, scaffold_root)) is not None
+            and age_date <= cutoff
+        ]
+    return selected
+
+
+def _load_workbench_config(
+    root_path: Path, bench_dir_name: str, workbench_name: str
+) -> dict[str, Any]:
+    """Load a workbench's workbench-config.yaml from its scaffold.
+
+    Raises:
+        ValueError: If the file is missing, empty or not a mapping.
+    """
+    wb_config_path = (
+        root_path
+        / bench_dir_name
+        / "workbench"
+        / workbench_name
+        / "bench"
+        / "workbench-config.yaml"
+    )
+    try:
+        return load_yaml_file(wb_config_path)
+    except FileNotFoundError:
+        raise ValueError(
+            f'Workbench "{workbench_name}" config file does not exist: {wb_config_path}'
+        )
+
+
+def _count_failures(results: list[dict[str, object]]) -> int:
+    """Return the number of workbenches that failed or have a failed repo."""
+    failures = 0
+    for result in results:
+        repos = result["repos"]
+        assert isinstance(repos, list)
+        if result["error"] or any(
+            isinstance(row, dict) and row.get("error") for row in repos
+        ):
+            failures += 1
+    return failures
+
 
-    Removes the workspace directory (<project-root>/workbench/<name>),
-    prunes git worktree references for each repo, and marks the workbench
-    entry as inactive in base-config.yaml. The .bench/workbench/<name>/
-    directory is preserved.
+def retire_workbenches(
+    patterns: list[str],
+    older_than_days: int | None = None,
+    confirm: Callable[[list[str]], None] | None = None,
+) -> dict[str, object]:
+    """Retire one or more workbenches by removing their worktrees and workspaces.
+
+    Selects the active workbenches matching the given names, glob patterns
+    and age filter (see _select_workbenches). Their worktrees are removed on
+    one worker pool shared by all of them, then their workspace directories
+    (see _teardown_workbenches); a repo whose worktree git fails to remove is
+    reported without stopping the others. Their branches and
+    .bench/workbench/<name>/ data are preserved, and all of them are marked
+    inactive in a single update of base-config.yaml.
 
     Args:
-        workbench_name: Name of the workbench to retire.
+        patterns: Workbench names and glob patterns.
+        older_than_days: Only retire workbenches created at least this many
+            days ago, or None for any age.
+        confirm: Optional callback called with the selected names before
+            anything is changed; it raises to cancel.
 
     Returns:
         A dict with summary info for the view layer:
         {
-            "name": str,
-            "repos_pruned": int,
-            "bench_dir_preserved": str,  # path to .bench/workbench/<name>/
+            "workbenches": list[dict],  # one per selected workbench:
+                # {"name", "repos" (per-repo rows, see _teardown_workbenches),
+                #  "error" (str | None), "bench_dir_preserved"}
+            "failures": int,  # workbenches with an error or a failed repo
         }
 
     Raises:
-        ValueError: If mode is not ROOT, workbench not found, already inactive,
-            or workspace directory missing.
+        ValueError: If mode is not ROOT, no selection is given, or a plain
+            name is not found or already inactive.
     """
     # Phase 1: Mode enforcement
     context = detect_mode(Path.cwd())
@@ -458,104 +1149,128 @@ def retire_workbench(workbench_name: str) -> dict[str, object]:
     assert context.bench_dir_name is not None
     assert context.base_config is not None
 
-    # Phase 3: Load base-config.yaml (raw dict for mutation)
+    # Phase 3: Select workbenches (from the config loaded by detect_mode)
     config_path = context.root_path / context.bench_dir_name / BASE_CONFIG_FILENAME
-    data = load_yaml_file(config_path)
-
-    # Phase 4: Find workbench entry
-    workbench_entry: dict[str, object] | None = None
-    for w in data.get("workbenches", []):
-        if isinstance(w, dict) and w.get("name") == workbench_name:
-            workbench_entry = w
-            break
-
-    if workbench_entry is None:
-        existing_names = [
-            w["name"]
-            for w in data.get("workbenches", [])
-            if isinstance(w, dict) and "name" in w
-        ]
-        available = ", ".join(existing_names) if existing_names else "(none)"
-        raise ValueError(
-            f'Workbench "{workbench_name}" not found. '
-            f"Available workbenches: {available}"
-        )
-
-    # Phase 5: Check status
-    if workbench_entry.get("status") == "inactive":
-        raise ValueError(f'Workbench "{workbench_name}" is already inactive.')
-
-    # Phase 6: Validate workspace directory exists
-    workspace_path = context.root_path / "workbench" / workbench_name
-    if not workspace_path.is_dir():
-        raise ValueError(
-            f'Workbench "{workbench_name}" workspace directory does not exist: '
-            f"{workspace_path}. The workbench may already be retired."
+    scaffold_root = context.root_path / context.bench_dir_name / "workbench"
+    selected = _select_workbenches(
+        context.base_config.workbenches,
+        patterns,
+        WorkbenchStatus.ACTIVE,
+        'Workbench "{name}" is already inactive.',
+        older_than_days,
+        scaffold_root,
+    )
+    if not selected:
+        return {"workbenches": [], "failures": 0}
+
+    # Phase 4: Confirm
+    if confirm is not None:
+        confirm([entry.name for entry in selected])
+
+    # Phase 5: Validate workspace directories and load each repo list
+    results: dict[str, dict[str, object]] = {}
+    targets: list[tuple[str, list[str], Path | None, str | None]] = []
+    for entry in selected:
+        results[entry.name] = {
+            "name": entry.name,
+            "repos": [],
+            "error": None,
+            "bench_dir_preserved": str(scaffold_root / entry.name),
+        }
+        workspace_path = context.root_path / "workbench" / entry.name
+        if not workspace_path.is_dir():
+            results[entry.name]["error"] = (
+                f'Workbench "{entry.name}" workspace directory does not exist: '
+                f"{workspace_path}. The workbench may already be retired."
+            )
+            continue
+        try:
+            wb_data = _load_workbench_config(
+                context.root_path, context.bench_dir_name, entry.name
+            )
+        except ValueError as e:
+            results[entry.name]["error"] = str(e)
+            continue
+        repos_list: list[dict[str, str]] = wb_data.get("repos", [])
+        targets.append(
+            (
+                entry.name,
+                [repo["dir"] for repo in repos_list if repo.get("dir")],
+                workspace_path,
+                None,
+            )
         )
 
-    # Phase 7: Load workbench-config.yaml for repo list
-    wb_config_path = (
-        context.root_path
-        / context.bench_dir_name
-        / "workbench"
-        / workbench_name
-        / "bench"
-        / "workbench-config.yaml"
-    )
-    wb_data = load_yaml_file(wb_config_path)
-    repos_list: list[dict[str, str]] = wb_data.get("repos", [])
-
-    # Phase 8: Remove workspace directory
-    remove_workbench_workspace(workspace_path)
-
-    # Phase 9: Prune worktrees for each repo
-    repos_pruned = 0
-    for repo in repos_list:
-        repo_dir = repo.get("dir")
-        if repo_dir:
-            repo_path = context.root_path / repo_dir
-            if repo_path.is_dir():
-                prune_worktrees(repo_path)
-                repos_pruned += 1
-
-    # Phase 10: Update base-config.yaml — set status to inactive
-    workbench_entry["status"] = "inactive"
-    save_yaml_file(config_path, data)
-
-    # Phase 11: Return summary
-    bench_dir_preserved = str(
-        context.root_path / context.bench_dir_name / "workbench" / workbench_name
+    # Phase 6: Remove worktrees (concurrently), then the workspace directories
+    repo_rows, workspace_errors = _teardown_workbenches(
+        context.root_path, targets, context.base_config.concurrency.teardown
     )
+    for name, rows in repo_rows.items():
+        results[name]["repos"] = rows
+    for name, message in workspace_errors.items():
+        results[name]["error"] = message
+
+    # Phase 7: Mark every torn-down workbench inactive in one update of
+    # base-config.yaml (re-read under the lock so concurrent changes to other
+    # entries are kept)
+    retired = [name for name in repo_rows if name not in workspace_errors]
+    if retired:
+        today = datetime.date.today().isoformat()
+        with locked_registry(config_path) as registry:
+            for name in retired:
+                workbench_entry = registry.get_workbench(name)
+                if workbench_entry is not None:
+                    workbench_entry["status"] = "inactive"
+                    workbench_entry["retired"] = today
+
+    # Phase 8: Return summary
+    workbench_results = list(results.values())
     return {
-        "name": workbench_name,
-        "repos_pruned": repos_pruned,
-        "bench_dir_preserved": bench_dir_preserved,
+        "workbenches": workbench_results,
+        "failures": _count_failures(workbench_results),
     }
 
 
-def delete_workbench(workbench_name: str) -> dict[str, object]:
-    """Permanently delete a workbench and all its data.
+def delete_workbenches(
+    patterns: list[str],
+    status: WorkbenchStatus | None = None,
+    older_than_days: int | None = None,
+    confirm: Callable[[list[str]], None] | None = None,
+) -> dict[str, object]:
+    """Permanently delete one or more workbenches and all their data.
 
-    Removes the workspace directory (if active), scaffold data, git branches,
-    and the config entry from base-config.yaml. Works on both active and
-    inactive workbenches.
+    Selects the workbenches matching the given names, glob patterns, status
+    and age filter (see _select_workbenches). For all of them at once, on one
+    shared worker pool (see _teardown_workbenches), removes the worktrees and
+    workspace directories of the active ones and the workbench branch in
+    every repo. Then removes each scaffold and drops every deleted entry from
+    base-config.yaml in a single update. A repo whose worktree or branch
+    cannot be removed (e.g., an unmerged branch) is reported in the summary
+    without stopping the others.
 
     Args:
-        workbench_name: Name of the workbench to delete.
+        patterns: Workbench names and glob patterns.
+        status: Only delete workbenches with this status, or None for any.
+        older_than_days: Only delete workbenches at least this many days old
+            (see _workbench_age_date), or None for any age.
+        confirm: Optional callback called with the selected names before
+            anything is changed; it raises to cancel.
 
     Returns:
         A dict with summary info for the view layer:
         {
-            "name": str,
-            "was_active": bool,
-            "workspace_removed": str | None,
-            "scaffold_removed": str,
-            "branches_deleted": list[str],
+            "workbenches": list[dict],  # one per selected workbench:
+                # {"name", "was_active", "workspace_removed" (str | None),
+                #  "scaffold_removed", "branches_deleted" (list[str]),
+                #  "repos" (per-repo rows, see _teardown_workbenches),
+                #  "error" (str | None)}
+            "failures": int,  # workbenches with an error or a failed repo
         }
 
     Raises:
         RuntimeError: If mode is not ROOT or context fields missing.
-        ValueError: If workbench not found in config.
+        ValueError: If no selection is given, or a plain name is not found
+            or does not have the given status.
     """
     # Phase 1: Mode enforcement
     context = detect_mode(Path.cwd())
@@ -575,116 +1290,138 @@ def delete_workbench(workbench_name: str) -> dict[str, object]:
     assert context.bench_dir_name is not None
     assert context.base_config is not None
 
-    # Phase 3: Load base-config.yaml (raw dict for mutation)
+    # Phase 3: Select workbenches (from the config loaded by detect_mode)
     config_path = context.root_path / context.bench_dir_name / BASE_CONFIG_FILENAME
-    data = load_yaml_file(config_path)
-
-    # Phase 4: Find workbench entry
-    workbench_index: int | None = None
-    workbench_entry: dict[str, object] | None = None
-    for i, w in enumerate(data.get("workbenches", [])):
-        if isinstance(w, dict) and w.get("name") == workbench_name:
-            workbench_index = i
-            workbench_entry = w
-            break
-
-    if workbench_entry is None or workbench_index is None:
-        existing_names = [
-            w["name"]
-            for w in data.get("workbenches", [])
-            if isinstance(w, dict) and "name" in w
-        ]
-        available = ", ".join(existing_names) if existing_names else "(none)"
-        raise ValueError(
-            f'Workbench "{workbench_name}" not found. '
-            f"Available workbenches: {available}"
+    scaffold_root = context.root_path / context.bench_dir_name / "workbench"
+    selected = _select_workbenches(
+        context.base_config.workbenches,
+        patterns,
+        status,
+        f'Workbench "{{name}}" is not {status.value}.' if status is not None else "",
+        older_than_days,
+        scaffold_root,
+    )
+    if not selected:
+        return {"workbenches": [], "failures": 0}
+
+    # Phase 4: Confirm
+    if confirm is not None:
+        confirm([entry.name for entry in selected])
+
+    # Phase 5: Load each workbench-config.yaml
+    results: dict[str, dict[str, object]] = {}
+    targets: list[tuple[str, list[str], Path | None, str | None]] = []
+    for entry in selected:
+        was_active = entry.status == WorkbenchStatus.ACTIVE
+        workspace_path = context.root_path / "workbench" / entry.name
+        workspace_removed = (
+            str(workspace_path) if was_active and workspace_path.is_dir() else None
+        )
+        results[entry.name] = {
+            "name": entry.name,
+            "was_active": was_active,
+            "workspace_removed": workspace_removed,
+            "scaffold_removed": str(scaffold_root / entry.name),
+            "branches_deleted": [],
+            "repos": [],
+            "error": None,
+        }
+        try:
+            wb_data = _load_workbench_config(
+                context.root_path, context.bench_dir_name, entry.name
+            )
+        except ValueError as e:
+            results[entry.name]["error"] = str(e)
+            continue
+        repos_list: list[dict[str, str]] = wb_data.get("repos", [])
+        git_branch: str = wb_data.get("git-branch", entry.name)
+        targets.append(
+            (
+                entry.name,
+                [repo["dir"] for repo in repos_list if repo.get("dir")],
+                workspace_path if workspace_removed else None,
+                git_branch,
+            )
         )
 
-    was_active = workbench_entry.get("status") == "active"
-
-    # Phase 5: Load workbench-config.yaml
-    wb_config_path = (
-        context.root_path
-        / context.bench_dir_name
-        / "workbench"
-        / workbench_name
-        / "bench"
-        / "workbench-config.yaml"
+    # Phase 6: Remove worktrees and workspace directories of the active
+    # workbenches, then delete the git branches (concurrently across repos)
+    repo_rows, workspace_errors = _teardown_workbenches(
+        context.root_path, targets, context.base_config.concurrency.teardown
     )
-    wb_data = load_yaml_file(wb_config_path)
-    git_branch: str = wb_data.get("git-branch", workbench_name)
-    repos_list: list[dict[str, str]] = wb_data.get("repos", [])
-
-    # Phase 6: If ACTIVE, perform retire steps (remove workspace + prune worktrees)
-    workspace_removed: str | None = None
-    if was_active:
-        workspace_path = context.root_path / "workbench" / workbench_name
-        if workspace_path.is_dir():
-            remove_workbench_workspace(workspace_path)
-            workspace_removed = str(workspace_path)
-        for repo in repos_list:
-            repo_dir = repo.get("dir")
-            if repo_dir:
-                repo_path = context.root_path / repo_dir
-                if repo_path.is_dir():
-                    prune_worktrees(repo_path)
-
-    # Phase 7: Delete git branches
-    branches_deleted: list[str] = []
-    for repo in repos_list:
-        repo_dir = repo.get("dir")
-        if not repo_dir:
+    for name, message in workspace_errors.items():
+        results[name]["error"] = message
+        results[name]["workspace_removed"] = None
+
+    # Phase 7: Remove scaffold directories
+    deleted: list[str] = []
+    for name, rows in repo_rows.items():
+        results[name]["repos"] = rows
+        results[name]["branches_deleted"] = [
+            str(row["dir"]) for row in rows if row["branch"] == "deleted"
+        ]
+        if name in workspace_errors:
             continue
-        repo_path = context.root_path / repo_dir
-        if not repo_path.is_dir():
+        try:
+            remove_workbench_scaffold(scaffold_root / name)
+        except OSError as e:
+            results[name]["error"] = (
+                f"Failed to remove scaffold directory {scaffold_root / name}: {e}"
+            )
             continue
-        if branch_exists(git_branch, repo_path):
-            delete_branch(git_branch, repo_path)
-            branches_deleted.append(repo_dir)
-
-    # Phase 8: Remove scaffold directory
-    scaffold_path = (
-        context.root_path / context.bench_dir_name / "workbench" / workbench_name
-    )
-    remove_workbench_scaffold(scaffold_path)
-
-    # Phase 9: Remove entry from base-config.yaml
-    del data["workbenches"][workbench_index]
-    save_yaml_file(config_path, data)
-
-    # Phase 10: Return summary
+        deleted.append(name)
+    if deleted:
+        # Drop map blobs only the deleted scaffolds were still linking to
+        prune_blob_store(scaffold_root.parent / BLOB_STORE_DIR_NAME)
+
+    # Phase 8: Remove every deleted entry from base-config.yaml in one update
+    # (re-read under the lock so concurrent changes to other entries are kept)
+    if deleted:
+        with locked_registry(config_path) as registry:
+            for name in deleted:
+                if registry.get_workbench(name) is not None:
+                    registry.remove_workbench(name)
+
+    # Phase 9: Return summary
+    workbench_results = list(results.values())
     return {
-        "name": workbench_name,
-        "was_active": was_active,
-        "workspace_removed": workspace_removed,
-        "scaffold_removed": str(scaffold_path),
-        "branches_deleted": branches_deleted,
+        "workbenches": workbench_results,
+        "failures": _count_failures(workbench_results),
     }
 
 
-def activate_workbench(workbench_name: str) -> dict[str, object]:
-    """Activate a retired workbench by recreating its workspace and worktrees.
+def activate_workbenches(
+    patterns: list[str],
+    older_than_days: int | None = None,
+) -> dict[str, object]:
+    """Activate one or more retired workbenches.
 
-    Recreates the workspace directory (<project-root>/workbench/<name>) with
-    symlinks, creates git worktrees for each repo, and marks the workbench
-    entry as active in base-config.yaml.
+    Selects the inactive workbenches matching the given names, glob patterns
+    and age filter (see _select_workbenches). For each, recreates the
+    workspace directory (<project-root>/workbench/<name>) with symlinks; the
+    git worktrees of all of them are then created on one shared worker pool
+    (see _create_worktrees). A workbench whose worktrees cannot all be
+    created is rolled back and stays inactive; the others are marked active
+    in a single update of base-config.yaml.
 
     Args:
-        workbench_name: Name of the workbench to activate.
+        patterns: Workbench names and glob patterns.
+        older_than_days: Only activate workbenches retired at least this many
+            days ago, or None for any age.
 
     Returns:
         A dict with summary info for the view layer:
         {
-            "name": str,
-            "source": str,
-            "git_branch": str,
-            "repos": list[dict[str, str]],  # each: {"dir": ..., "worktree_path": ...}
+            "workbenches": list[dict],  # one per selected workbench:
+                # {"name", "source", "git_branch",
+                #  "repos" (each: {"dir": ..., "worktree_path": ...}),
+                #  "error" (str | None)}
+            "failures": int,  # workbenches that could not be activated
         }
 
     Raises:
-        ValueError: If mode is not ROOT, workbench not found, already active,
-            bench dir missing, or workspace already exists.
-        RuntimeError: If git worktree creation fails.
+        ValueError: If mode is not ROOT, no selection is given, or a plain
+            name is not found or already active.
     """
     # Phase 1: Mode enforcement
     context = detect_mode(Path.cwd())
@@ -704,117 +1441,105 @@ def activate_workbench(workbench_name: str) -> dict[str, object]:
     assert context.bench_dir_name is not None
     assert context.base_config is not None
 
-    # Phase 3: Load base-config.yaml (raw dict for mutation)
+    # Phase 3: Select workbenches (from the config loaded by detect_mode)
     config_path = context.root_path / context.bench_dir_name / BASE_CONFIG_FILENAME
-    data = load_yaml_file(config_path)
-
-    # Phase 4: Find workbench entry
-    workbench_entry: dict[str, object] | None = None
-    for w in data.get("workbenches", []):
-        if isinstance(w, dict) and w.get("name") == workbench_name:
-            workbench_entry = w
-            break
-
-    if workbench_entry is None:
-        existing_names = [
-            w["name"]
-            for w in data.get("workbenches", [])
-            if isinstance(w, dict) and "name" in w
-        ]
-        available = ", ".join(existing_names) if existing_names else "(none)"
-        raise ValueError(
-            f'Workbench "{workbench_name}" not found. '
-            f"Available workbenches: {available}"
-        )
-
-    # Phase 5: Check status — must be inactive
-    if workbench_entry.get("status") != "inactive":
-        raise ValueError(f'Workbench "{workbench_name}" is already active.')
-
-    # Phase 6: Validate bench workbench dir exists
-    bench_wb_dir = (
-        context.root_path / context.bench_dir_name / "workbench" / workbench_name
-    )
-    if not bench_wb_dir.is_dir():
-        raise ValueError(
-            f'Workbench "{workbench_name}" bench directory does not exist: '
-            f"{bench_wb_dir}. The workbench data may have been deleted."
-        )
-
-    # Phase 7: Validate workspace directory does NOT exist
-    workspace_path = context.root_path / "workbench" / workbench_name
-    if workspace_path.exists():
-        raise ValueError(
-            f'Workbench "{workbench_name}" workspace directory already exists: '
-            f"{workspace_path}. Remove it first before activating."
-        )
-
-    # Phase 8: Load workbench-config.yaml
-    wb_config_path = (
-        context.root_path
-        / context.bench_dir_name
-        / "workbench"
-        / workbench_name
-        / "bench"
-        / "workbench-config.yaml"
-    )
-    wb_data = load_yaml_file(wb_config_path)
-    git_branch: str = wb_data.get("git-branch", workbench_name)
-    source_name: str = wb_data.get("source", "")
-    repos_list: list[dict[str, str]] = wb_data.get("repos", [])
-
-    # Phase 9: Recreate workspace directory with symlinks
-    create_workbench_workspace(
-        context.root_path,
-        context.bench_dir_name,
-        workbench_name,
+    scaffold_root = context.root_path / context.bench_dir_name / "workbench"
+    selected = _select_workbenches(
+        context.base_config.workbenches,
+        patterns,
+        WorkbenchStatus.INACTIVE,
+        'Workbench "{name}" is already active.',
+        older_than_days,
+        scaffold_root,
     )
 
-    # Phase 10: Recreate worktrees
-    repo_summaries: list[dict[str, str]] = []
-    for repo in repos_list:
-        repo_dir = repo.get("dir")
-        source_branch = repo.get("source-branch")
-        if not repo_dir:
+    # Phase 4: Validate directories, load each workbench-config.yaml and
+    # recreate the workspace directories with symlinks
+    results: dict[str, dict[str, object]] = {}
+    targets: list[tuple[str, str, list[tuple[str, str | None, bool]]]] = []
+    for entry in selected:
+        results[entry.name] = {
+            "name": entry.name,
+            "source": entry.source,
+            "git_branch": entry.git_branch,
+            "repos": [],
+            "error": None,
+        }
+        bench_wb_dir = scaffold_root / entry.name
+        workspace_path = context.root_path / "workbench" / entry.name
+        if not bench_wb_dir.is_dir():
+            results[entry.name]["error"] = (
+                f'Workbench "{entry.name}" bench directory does not exist: '
+                f"{bench_wb_dir}. The workbench data may have been deleted."
+            )
             continue
-
-        repo_path = context.root_path / repo_dir
-        worktree_path = (
-            context.root_path / "workbench" / workbench_name / "repo" / repo_dir
-        )
-
-        if branch_exists(git_branch, repo_path):
-            add_worktree(
-                repo_path=repo_path,
-                worktree_path=worktree_path,
-                branch_name=git_branch,
+        if workspace_path.exists():
+            results[entry.name]["error"] = (
+                f'Workbench "{entry.name}" workspace directory already exists: '
+                f"{workspace_path}. Remove it first before activating."
             )
-        else:
-            add_worktree(
-                repo_path=repo_path,
-                worktree_path=worktree_path,
-                branch_name=git_branch,
-                start_point=source_branch,
-                create_branch=True,
+            continue
+        try:
+            wb_data = _load_workbench_config(
+                context.root_path, context.bench_dir_name, entry.name
             )
+        except ValueError as e:
+            results[entry.name]["error"] = str(e)
+            continue
+        git_branch: str = wb_data.get("git-branch", entry.name)
+        repos_list: list[dict[str, str]] = wb_data.get("repos", [])
+        results[entry.name]["source"] = wb_data.get("source", "")
+        results[entry.name]["git_branch"] = git_branch
+
+        try:
+            create_workbench_workspace(
+                context.root_path,
+                context.bench_dir_name,
+                entry.name,
+            )
+            repo_targets = [
+                (
+                    repo["dir"],
+                    repo.get("source-branch"),
+                    not branch_exists(git_branch, context.root_path / repo["dir"]),
+                )
+                for repo in repos_list
+                if repo.get("dir")
+            ]
+        except (OSError, RuntimeError) as e:
+            # Leave nothing behind, so the workbench can be activated again
+            if workspace_path.is_dir():
+                remove_workbench_workspace(workspace_path)
+            results[entry.name]["error"] = str(e)
+            continue
+        targets.append((entry.name, git_branch, repo_targets))
 
-        repo_summaries.append(
-            {
-                "dir": repo_dir,
-                "worktree_path": str(worktree_path.relative_to(context.root_path)),
-            }
-        )
-
-    # Phase 11: Update base-config.yaml — set status to active
-    workbench_entry["status"] = "active"
-    save_yaml_file(config_path, data)
-
-    # Phase 12: Return summary
+    # Phase 5: Recreate worktrees (concurrently; all-or-nothing per workbench)
+    repo_summaries, worktree_failures = _create_worktrees(
+        context.root_path, targets, context.base_config.concurrency.worktrees
+    )
+    for name, message in worktree_failures.items():
+        remove_workbench_workspace(context.root_path / "workbench" / name)
+        results[name]["error"] = message
+    for name, repos in repo_summaries.items():
+        results[name]["repos"] = repos
+
+    # Phase 6: Mark every activated workbench active in one update of
+    # base-config.yaml (re-read under the lock so concurrent changes to other
+    # entries are kept)
+    if repo_summaries:
+        with locked_registry(config_path) as registry:
+            for name in repo_summaries:
+                workbench_entry = registry.get_workbench(name)
+                if workbench_entry is not None:
+                    workbench_entry["status"] = "active"
+                    workbench_entry.pop("retired", None)
+
+    # Phase 7: Return summary
+    workbench_results = list(results.values())
     return {
-        "name": workbench_name,
-        "source": source_name,
-        "git_branch": git_branch,
-        "repos": repo_summaries,
+        "workbenches": workbench_results,
+        "failures": _count_failures(workbench_results),
     }
 
 
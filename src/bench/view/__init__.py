@@ -1,55 +1,168 @@
-from bench.view.discuss import (
-    display_discuss_error,
-    display_discuss_list,
-    display_discuss_start,
-)
-from bench.view.init import display_init_error, display_init_success
-from bench.view.map import display_map_error, display_map_status
-from bench.view.populate import (
-    display_populate_agents_error,
-    display_populate_agents_start,
-    display_populate_agents_warning,
-    display_populate_prompts_complete,
-    display_populate_prompts_error,
-    display_populate_prompts_preview,
-    display_populate_prompts_start,
-    display_populate_prompts_up_to_date,
-)
-from bench.view.source import (
-    display_source_added,
-    display_source_error,
-    display_source_list,
-    display_source_removed,
-    display_source_updated,
-)
-from bench.view.status import display_status
-from bench.view.task import (
-    display_task_completed,
-    display_task_created,
-    display_task_error,
-    display_task_followup_complete,
-    display_task_followup_start,
-    display_task_implement_complete,
-    display_task_implement_phase_complete,
-    display_task_implement_phase_start,
-    display_task_implement_start,
-    display_task_list,
-    display_task_refine_complete,
-    display_task_refine_start,
-)
-from bench.view.workbench import (
-    display_script_completed,
-    display_script_failed,
-    display_script_not_executable,
-    display_script_running,
-    display_workbench_activated,
-    display_workbench_created,
-    display_workbench_deleted,
-    display_workbench_error,
-    display_workbench_list,
-    display_workbench_retired,
-    display_workbench_updated,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from bench.view.discuss import (
+        display_discuss_error,
+        display_discuss_list,
+        display_discuss_start,
+    )
+    from bench.view.init import display_init_error, display_init_success
+    from bench.view.map import (
+        display_map_error,
+        display_map_init_summary,
+        display_map_repo_done,
+        display_map_status,
+        display_map_update_summary,
+    )
+    from bench.view.opencode import display_session_retry
+    from bench.view.populate import (
+        display_populate_agents_error,
+        display_populate_agents_start,
+        display_populate_agents_warning,
+        display_populate_prompts_complete,
+        display_populate_prompts_error,
+        display_populate_prompts_preview,
+        display_populate_prompts_start,
+        display_populate_prompts_up_to_date,
+    )
+    from bench.view.queue import (
+        display_queue_added,
+        display_queue_error,
+        display_queue_job_finished,
+        display_queue_job_started,
+        display_queue_removed,
+        display_queue_run_summary,
+        display_queue_status,
+    )
+    from bench.view.source import (
+        display_source_added,
+        display_source_error,
+        display_source_list,
+        display_source_removed,
+        display_source_updated,
+    )
+    from bench.view.stats import display_stats, display_stats_error
+    from bench.view.status import display_status
+    from bench.view.task import (
+        display_task_completed,
+        display_task_created,
+        display_task_error,
+        display_task_followup_complete,
+        display_task_followup_start,
+        display_task_implement_complete,
+        display_task_implement_concurrent,
+        display_task_implement_phase_complete,
+        display_task_implement_phase_failed,
+        display_task_implement_phase_start,
+        display_task_implement_resume,
+        display_task_implement_start,
+        display_task_implement_stopped,
+        display_task_implement_up_to_date,
+        display_task_list,
+        display_task_refine_complete,
+        display_task_refine_start,
+    )
+    from bench.view.workbench import (
+        display_script_completed,
+        display_script_failed,
+        display_script_not_executable,
+        display_script_output,
+        display_script_running,
+        display_script_skipped,
+        display_script_timed_out,
+        display_scripts_concurrent,
+        display_scripts_finished,
+        display_scripts_invalid,
+        display_teardown_progress,
+        display_workbench_activated,
+        display_workbench_created,
+        display_workbench_deleted,
+        display_workbench_error,
+        display_workbench_list,
+        display_workbench_retired,
+        display_workbench_updated,
+        display_worktree_created,
+        display_worktree_failed,
+        display_worktree_rolled_back,
+    )
+
+# Re-exports are resolved on first access (PEP 562), so importing one submodule
+# (e.g., bench.view.status) does not import every sibling module with it.
+_EXPORTS: dict[str, str] = {
+    "display_discuss_error": "bench.view.discuss",
+    "display_discuss_list": "bench.view.discuss",
+    "display_discuss_start": "bench.view.discuss",
+    "display_init_error": "bench.view.init",
+    "display_init_success": "bench.view.init",
+    "display_map_error": "bench.view.map",
+    "display_map_init_summary": "bench.view.map",
+    "display_map_repo_done": "bench.view.map",
+    "display_map_status": "bench.view.map",
+    "display_map_update_summary": "bench.view.map",
+    "display_populate_agents_error": "bench.view.populate",
+    "display_populate_agents_start": "bench.view.populate",
+    "display_populate_agents_warning": "bench.view.populate",
+    "display_populate_prompts_complete": "bench.view.populate",
+    "display_populate_prompts_error": "bench.view.populate",
+    "display_populate_prompts_preview": "bench.view.populate",
+    "display_populate_prompts_start": "bench.view.populate",
+    "display_populate_prompts_up_to_date": "bench.view.populate",
+    "display_queue_added": "bench.view.queue",
+    "display_queue_error": "bench.view.queue",
+    "display_queue_job_finished": "bench.view.queue",
+    "display_queue_job_started": "bench.view.queue",
+    "display_queue_removed": "bench.view.queue",
+    "display_queue_run_summary": "bench.view.queue",
+    "display_queue_status": "bench.view.queue",
+    "display_script_completed": "bench.view.workbench",
+    "display_script_failed": "bench.view.workbench",
+    "display_script_not_executable": "bench.view.workbench",
+    "display_script_output": "bench.view.workbench",
+    "display_script_running": "bench.view.workbench",
+    "display_script_skipped": "bench.view.workbench",
+    "display_script_timed_out": "bench.view.workbench",
+    "display_scripts_concurrent": "bench.view.workbench",
+    "display_scripts_finished": "bench.view.workbench",
+    "display_scripts_invalid": "bench.view.workbench",
+    "display_session_retry": "bench.view.opencode",
+    "display_source_added": "bench.view.source",
+    "display_source_error": "bench.view.source",
+    "display_source_list": "bench.view.source",
+    "display_source_removed": "bench.view.source",
+    "display_source_updated": "bench.view.source",
+    "display_stats": "bench.view.stats",
+    "display_stats_error": "bench.view.stats",
+    "display_status": "bench.view.status",
+    "display_task_completed": "bench.view.task",
+    "display_task_created": "bench.view.task",
+    "display_task_error": "bench.view.task",
+    "display_task_followup_complete": "bench.view.task",
+    "display_task_followup_start": "bench.view.task",
+    "display_task_implement_complete": "bench.view.task",
+    "display_task_implement_concurrent": "bench.view.task",
+    "display_task_implement_phase_complete": "bench.view.task",
+    "display_task_implement_phase_failed": "bench.view.task",
+    "display_task_implement_phase_start": "bench.view.task",
+    "display_task_implement_resume": "bench.view.task",
+    "display_task_implement_start": "bench.view.task",
+    "display_task_implement_stopped": "bench.view.task",
+    "display_task_implement_up_to_date": "bench.view.task",
+    "display_task_list": "bench.view.task",
+    "display_task_refine_complete": "bench.view.task",
+    "display_task_refine_start": "bench.view.task",
+    "display_teardown_progress": "bench.view.workbench",
+    "display_workbench_activated": "bench.view.workbench",
+    "display_workbench_created": "bench.view.workbench",
+    "display_workbench_deleted": "bench.view.workbench",
+    "display_workbench_error": "bench.view.workbench",
+    "display_workbench_list": "bench.view.workbench",
+    "display_workbench_retired": "bench.view.workbench",
+    "display_workbench_updated": "bench.view.workbench",
+    "display_worktree_created": "bench.view.workbench",
+    "display_worktree_failed": "bench.view.workbench",
+    "display_worktree_rolled_back": "bench.view.workbench",
+}
 
 __all__ = [
     "display_discuss_error",
@@ -58,7 +171,10 @@ __all__ = [
     "display_init_error",
     "display_init_success",
     "display_map_error",
+    "display_map_init_summary",
+    "display_map_repo_done",
     "display_map_status",
+    "display_map_update_summary",
     "display_populate_agents_error",
     "display_populate_agents_start",
     "display_populate_agents_warning",
@@ -67,11 +183,27 @@ __all__ = [
     "display_populate_prompts_preview",
     "display_populate_prompts_start",
     "display_populate_prompts_up_to_date",
+    "display_queue_added",
+    "display_queue_error",
+    "display_queue_job_finished",
+    "display_queue_job_started",
+    "display_queue_removed",
+    "display_queue_run_summary",
+    "display_queue_status",
+    "display_script_output",
+    "display_script_skipped",
+    "display_script_timed_out",
+    "display_scripts_concurrent",
+    "display_scripts_finished",
+    "display_scripts_invalid",
+    "display_session_retry",
     "display_source_added",
     "display_source_error",
     "display_source_list",
     "display_source_removed",
     "display_source_updated",
+    "display_stats",
+    "display_stats_error",
     "display_status",
     "display_task_completed",
     "display_task_created",
@@ -79,9 +211,14 @@ __all__ = [
     "display_task_followup_complete",
     "display_task_followup_start",
     "display_task_implement_complete",
+    "display_task_implement_concurrent",
     "display_task_implement_phase_complete",
+    "display_task_implement_phase_failed",
     "display_task_implement_phase_start",
+    "display_task_implement_resume",
     "display_task_implement_start",
+    "display_task_implement_stopped",
+    "display_task_implement_up_to_date",
     "display_task_list",
     "display_task_refine_complete",
     "display_task_refine_start",
@@ -89,6 +226,7 @@ __all__ = [
     "display_script_failed",
     "display_script_not_executable",
     "display_script_running",
+    "display_teardown_progress",
     "display_workbench_activated",
     "display_workbench_created",
     "display_workbench_deleted",
@@ -96,4 +234,16 @@ __all__ = [
     "display_workbench_list",
     "display_workbench_retired",
     "display_workbench_updated",
+    "display_worktree_created",
+    "display_worktree_failed",
+    "display_worktree_rolled_back",
 ]
+
+
+def __getattr__(name: str) -> object:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
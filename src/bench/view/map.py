@@ -1,3 +1,5 @@
+from typing import Any
+
 from rich.console import Console
 
 console = Console()
@@ -19,3 +21,71 @@ def display_map_status(message: str) -> None:
         message: The status message to display.
     """
     console.print(f"[bold]{message}[/bold]")
+
+
+def display_map_update_summary(summary: dict[str, list[str]]) -> None:
+    """Display which repositories had their maps updated or were skipped.
+
+    Args:
+        summary: Dict with "updated" and "unchanged" lists of repo names.
+    """
+    if summary["unchanged"]:
+        console.print(
+            "[dim]Unchanged since last mapped, skipped: "
+            f"{', '.join(summary['unchanged'])}[/dim]"
+        )
+    if summary["updated"]:
+        console.print(
+            f"[green]Updated maps for: {', '.join(summary['updated'])}[/green]"
+        )
+    else:
+        console.print("[green]Maps are up to date.[/green]")
+
+
+def display_map_repo_done(row: dict[str, str | None]) -> None:
+    """Display a progress message after a repo's map session finishes.
+
+    Args:
+        row: Dict with "dir", "status" ("mapped" or "failed"), "error" and
+             "log" (path of the session's output).
+    """
+    if row["status"] == "mapped":
+        console.print(f"  Mapped [cyan]{row['dir']}[/cyan]")
+    else:
+        console.print(
+            f"  [bold red]Failed:[/bold red] [cyan]{row['dir']}[/cyan]: "
+            f"{row['error']} [dim](log: {row['log']})[/dim]"
+        )
+
+
+def display_map_init_summary(summary: dict[str, Any]) -> None:
+    """Display the outcome of map initialization.
+
+    Args:
+        summary: Dict with "repos" (list of {"dir", "status", "error", "log"}
+                 dicts), "metamap" ("written", "failed" or "pending") and
+                 "failures".
+    """
+    by_status: dict[str, list[str]] = {}
+    for row in summary["repos"]:
+        by_status.setdefault(row["status"], []).append(row["dir"])
+
+    if "skipped" in by_status:
+        console.print(
+            "[dim]Already mapped by an earlier run, skipped: "
+            f"{', '.join(by_status['skipped'])}[/dim]"
+        )
+    if "mapped" in by_status:
+        console.print(f"[green]Mapped: {', '.join(by_status['mapped'])}[/green]")
+    if "failed" in by_status:
+        console.print(
+            f"[bold red]Failed:[/bold red] {', '.join(by_status['failed'])}. "
+            "Run 'bench map init --parallel' again to retry only these repositories."
+        )
+    elif summary["metamap"] == "failed":
+        console.print(
+            "[bold red]Failed:[/bold red] metamap.md was not written. "
+            "Run 'bench map init --parallel' again to retry."
+        )
+    else:
+        console.print("[green]Maps initialized.[/green]")
@@ -0,0 +1,21 @@
+from rich.console import Console
+
+console = Console()
+
+
+def display_session_retry(
+    label: str, reason: str, attempt: int, attempts: int, delay: float
+) -> None:
+    """Display that a failed headless agent session will be retried.
+
+    Args:
+        label: What the session does (e.g., 'phase "Tests"').
+        reason: Why the failed attempt is retried (e.g., "timed out after 600s").
+        attempt: Number of the attempt about to start.
+        attempts: Maximum number of attempts.
+        delay: Seconds until the next attempt starts.
+    """
+    console.print(
+        f"[yellow]Retrying[/yellow] {label} in {delay:g}s "
+        f"(attempt {attempt}/{attempts}): {reason}"
+    )
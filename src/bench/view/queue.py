@@ -0,0 +1,157 @@
+from pathlib import Path
+
+from rich.console import Console
+from rich.table import Table
+
+from bench.model.queue import JobStatus, QueueJob
+
+console = Console()
+
+# Rich markup for each job status
+_JOB_STATUSES: dict[JobStatus, str] = {
+    JobStatus.QUEUED: "[dim]queued[/dim]",
+    JobStatus.RUNNING: "[yellow]running[/yellow]",
+    JobStatus.DONE: "[green]done[/green]",
+    JobStatus.FAILED: "[bold red]failed[/bold red]",
+}
+
+
+def _format_time(timestamp: str | None) -> str:
+    """Format an ISO timestamp as "YYYY-MM-DD HH:MM" for the status table."""
+    if timestamp is None:
+        return "-"
+    return timestamp.replace("T", " ")[:16]
+
+
+def _job_label(job: QueueJob) -> str:
+    return f'{job.id} ({job.workbench}: "{job.task}")'
+
+
+def display_queue_added(jobs: list[QueueJob]) -> None:
+    """Display the jobs just added to the queue.
+
+    Args:
+        jobs: The queued jobs.
+    """
+    for job in jobs:
+        console.print(f"[green]Queued job {_job_label(job)}[/green]")
+    console.print("[dim]Run 'bench queue run' to start the queued jobs.[/dim]")
+
+
+def display_queue_job_started(job: QueueJob, log_path: Path) -> None:
+    """Display a progress line when a job starts.
+
+    Args:
+        job: The job that started.
+        log_path: File the job's output is written to.
+    """
+    console.print(
+        f"[bold yellow]Started[/bold yellow] job {_job_label(job)} [dim]({log_path})[/dim]"
+    )
+
+
+def display_queue_job_finished(job: QueueJob, log_path: Path | None) -> None:
+    """Display a progress line when a job finishes.
+
+    Args:
+        job: The job as recorded after it finished.
+        log_path: File the job's output was written to, or None if it never
+            started.
+    """
+    if job.status == JobStatus.DONE:
+        console.print(f"[bold green]Done[/bold green] job {_job_label(job)}")
+        return
+    if job.error is not None:
+        reason = job.error
+    else:
+        reason = f"exited with code {job.exit_code}"
+    see_log = f" See {log_path}" if log_path is not None else ""
+    console.print(
+        f"[bold red]Failed[/bold red] job {_job_label(job)}: {reason}.{see_log}"
+    )
+
+
+def display_queue_run_summary(summary: dict[str, object]) -> None:
+    """Display the outcome of a queue run.
+
+    Args:
+        summary: Dict with keys: done, failed, recovered, queued, interrupted.
+    """
+    done = summary["done"]
+    failed = summary["failed"]
+    assert isinstance(done, list)
+    assert isinstance(failed, list)
+    recovered = summary["recovered"]
+    queued = summary["queued"]
+
+    if recovered:
+        console.print(
+            f"[dim]{recovered} job(s) left running by a stopped runner were queued again.[/dim]"
+        )
+    if summary["interrupted"]:
+        console.print(
+            "[yellow]Interrupted:[/yellow] running jobs were stopped and queued again."
+        )
+    color = "red" if failed else "green"
+    console.print(
+        f"[bold {color}]Queue run finished:[/bold {color}] {len(done)} done, "
+        f"{len(failed)} failed, {queued} still queued"
+    )
+
+
+def display_queue_status(jobs: list[QueueJob]) -> None:
+    """Display a table of the queued jobs or an empty-state message.
+
+    Args:
+        jobs: Every job in the queue, oldest first.
+    """
+    if not jobs:
+        console.print("[dim]The queue is empty.[/dim]")
+        return
+
+    table = Table()
+    table.add_column("ID", justify="right")
+    table.add_column("Workbench")
+    table.add_column("Task")
+    table.add_column("Status")
+    table.add_column("Added")
+    table.add_column("Started")
+    table.add_column("Finished")
+    table.add_column("Exit")
+
+    for job in jobs:
+        exit_code = "-" if job.exit_code is None else str(job.exit_code)
+        table.add_row(
+            str(job.id),
+            job.workbench,
+            job.task,
+            _JOB_STATUSES[job.status],
+            _format_time(job.added),
+            _format_time(job.started),
+            _format_time(job.finished),
+            exit_code,
+        )
+
+    console.print(table)
+
+
+def display_queue_removed(jobs: list[QueueJob]) -> None:
+    """Display the jobs removed from the queue.
+
+    Args:
+        jobs: The removed jobs.
+    """
+    if not jobs:
+        console.print("[dim]No jobs removed.[/dim]")
+        return
+    for job in jobs:
+        console.print(f"[green]Removed job {_job_label(job)}[/green]")
+
+
+def display_queue_error(message: str) -> None:
+    """Display an error message for queue operations.
+
+    Args:
+        message: The error message to display.
+    """
+    console.print(f"[bold red]Error:[/bold red] {message}")
@@ -0,0 +1,70 @@
+from rich.console import Console
+from rich.table import Table
+
+from bench.model.telemetry import StatsGroup, StatsRow
+
+console = Console()
+
+
+def _format_duration(seconds: float) -> str:
+    """Format a duration as "12.3s", "4m 05s" or "1h 02m"."""
+    if seconds < 60:
+        return f"{seconds:.1f}s"
+    minutes, secs = divmod(round(seconds), 60)
+    if minutes < 60:
+        return f"{minutes}m {secs:02d}s"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes:02d}m"
+
+
+def _format_count(value: int | None) -> str:
+    return "-" if value is None else f"{value:,}"
+
+
+def display_stats(rows: list[StatsRow], group: StatsGroup) -> None:
+    """Display aggregated agent session telemetry or an empty-state message.
+
+    Args:
+        rows: One aggregated row per key of group.
+        group: What the rows are grouped by (the first column's heading).
+    """
+    if not rows:
+        console.print("[dim]No agent sessions recorded yet.[/dim]")
+        return
+
+    table = Table()
+    table.add_column(group.value.capitalize())
+    table.add_column("Runs", justify="right")
+    table.add_column("Failed", justify="right")
+    table.add_column("Total", justify="right")
+    table.add_column("Mean", justify="right")
+    table.add_column("Max", justify="right")
+    table.add_column("Tokens in", justify="right")
+    table.add_column("Tokens out", justify="right")
+    table.add_column("Cost", justify="right")
+
+    for row in rows:
+        failed = f"[red]{row.failed}[/red]" if row.failed else "0"
+        cost = "-" if row.cost is None else f"${row.cost:.2f}"
+        table.add_row(
+            row.key,
+            str(row.sessions),
+            failed,
+            _format_duration(row.total_duration),
+            _format_duration(row.mean_duration),
+            _format_duration(row.max_duration),
+            _format_count(row.input_tokens),
+            _format_count(row.output_tokens),
+            cost,
+        )
+
+    console.print(table)
+
+
+def display_stats_error(message: str) -> None:
+    """Display an error message for the stats command.
+
+    Args:
+        message: The error message to display.
+    """
+    console.print(f"[bold red]Error:[/bold red] {message}")
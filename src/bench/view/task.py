@@ -1,3 +1,5 @@
+from pathlib import Path
+
 from rich.console import Console
 from rich.table import Table
 
@@ -108,8 +110,68 @@ def display_task_implement_start(
     console.print()
 
 
+def display_task_implement_resume(
+    up_to_date: list[int], total_phases: int, changed: list[str]
+) -> None:
+    """Display which phases are skipped because their checkpoints are up to date.
+
+    Args:
+        up_to_date: 1-based numbers of the phases skipped as up to date.
+        total_phases: Total number of phases in the flow.
+        changed: Flow files changed since the last run.
+    """
+    if changed:
+        console.print(f"  [cyan]Changed since last run:[/cyan] {', '.join(changed)}")
+    if up_to_date == list(range(1, len(up_to_date) + 1)):
+        completed = len(up_to_date)
+        if completed:
+            done = "Phase 1 is" if completed == 1 else f"Phases 1-{completed} are"
+            console.print(
+                f"  [cyan]Resuming at phase {completed + 1}/{total_phases}:[/cyan] "
+                f"{done} up to date"
+            )
+    else:
+        numbers = ", ".join(str(i) for i in up_to_date)
+        console.print(
+            f"  [cyan]Skipping up-to-date phases:[/cyan] {numbers} of {total_phases}"
+        )
+    if changed or up_to_date:
+        console.print()
+
+
+def display_task_implement_concurrent(max_phases: int, logs_dir: Path) -> None:
+    """Display a message before running independent phases concurrently.
+
+    Args:
+        max_phases: Maximum number of phases running at the same time.
+        logs_dir: Directory the phases' output is written to.
+    """
+    console.print(
+        f"[cyan]Running independent phases concurrently (up to {max_phases} at "
+        f"a time); output is written to {logs_dir}[/cyan]"
+    )
+    console.print()
+
+
+def display_task_implement_up_to_date(task_name: str, total_phases: int) -> None:
+    """Display a message when every phase is checkpointed and nothing changed.
+
+    Args:
+        task_name: The task name.
+        total_phases: Total number of phases in the flow.
+    """
+    console.print(
+        f'[bold green]Task "{task_name}" is up to date:[/bold green] all '
+        f"{total_phases} phases completed and their inputs are unchanged. "
+        "Use --from-phase to run phases again."
+    )
+
+
 def display_task_implement_phase_start(
-    phase_number: int, total_phases: int, phase_label: str
+    phase_number: int,
+    total_phases: int,
+    phase_label: str,
+    log_path: Path | None = None,
 ) -> None:
     """Display a progress message before launching a phase.
 
@@ -117,7 +179,14 @@ def display_task_implement_phase_start(
         phase_number: The 1-based index of the current phase.
         total_phases: Total number of phases to execute.
         phase_label: Human-readable description of the phase.
+        log_path: File the phase's output is written to, if not the terminal.
     """
+    if log_path is not None:
+        console.print(
+            f"[bold yellow]Phase {phase_number}/{total_phases} started:[/bold yellow] "
+            f"{phase_label} [dim]({log_path.name})[/dim]"
+        )
+        return
     console.print(
         f"[bold yellow]Phase {phase_number}/{total_phases}:[/bold yellow] {phase_label}..."
     )
@@ -125,7 +194,10 @@ def display_task_implement_phase_start(
 
 
 def display_task_implement_phase_complete(
-    phase_number: int, total_phases: int, phase_label: str
+    phase_number: int,
+    total_phases: int,
+    phase_label: str,
+    log_path: Path | None = None,
 ) -> None:
     """Display a completion message after a phase finishes successfully.
 
@@ -133,12 +205,57 @@ def display_task_implement_phase_complete(
         phase_number: The 1-based index of the completed phase.
         total_phases: Total number of phases to execute.
         phase_label: Human-readable description of the phase.
+        log_path: File the phase's output was written to, if not the terminal.
     """
-    console.print()
+    if log_path is None:
+        console.print()
     console.print(
         f"[bold green]Phase {phase_number}/{total_phases} complete:[/bold green] {phase_label}"
     )
-    console.print()
+    if log_path is None:
+        console.print()
+
+
+def display_task_implement_phase_failed(
+    phase_number: int,
+    total_phases: int,
+    phase_label: str,
+    error: str,
+    log_path: Path | None = None,
+) -> None:
+    """Display an error message when a phase fails.
+
+    Args:
+        phase_number: The 1-based index of the failed phase.
+        total_phases: Total number of phases to execute.
+        phase_label: Human-readable description of the phase.
+        error: Why the phase failed.
+        log_path: File the phase's output was written to, if not the terminal.
+    """
+    if log_path is None:
+        console.print()
+    console.print(
+        f"[bold red]Phase {phase_number}/{total_phases} failed:[/bold red] "
+        f"{phase_label}: {error}"
+    )
+
+
+def display_task_implement_stopped(
+    task_name: str, failed: int, not_started: int
+) -> None:
+    """Display an error message when a phase failure stopped the implementation.
+
+    Args:
+        task_name: The task name.
+        failed: Number of phases that failed.
+        not_started: Number of phases that never started because of it.
+    """
+    failed_suffix = "s" if failed != 1 else ""
+    console.print(
+        f'[bold red]Task "{task_name}" implementation stopped:[/bold red] '
+        f"{failed} phase{failed_suffix} failed, {not_started} not started. "
+        "Run the command again to resume."
+    )
 
 
 def display_task_implement_complete(task_name: str, phases_run: int) -> None:
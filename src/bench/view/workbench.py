@@ -1,10 +1,21 @@
 from rich.console import Console
+from rich.markup import escape
 from rich.table import Table
 
 from bench.model import WorkbenchEntry, WorkbenchFilter, WorkbenchStatus
 
 console = Console()
 
+# Rich markup for the outcome of a teardown step, keyed by the service's status
+_TEARDOWN_OUTCOMES: dict[str, str] = {
+    "removed": "[green]removed[/green]",
+    "deleted": "[green]deleted[/green]",
+    "absent": "[dim]-[/dim]",
+    "failed": "[bold red]failed[/bold red]",
+}
+
+_NO_MATCH_MESSAGE: str = "No workbenches match."
+
 _WORKBENCH_EMPTY_MESSAGES: dict[WorkbenchFilter, str] = {
     WorkbenchFilter.ACTIVE: "No active workbenches.",
     WorkbenchFilter.INACTIVE: "No inactive workbenches.",
@@ -36,26 +47,39 @@ def display_workbench_created(summary: dict[str, object]) -> None:
 
 
 def display_workbench_activated(summary: dict[str, object]) -> None:
-    """Display a success message after workbench activation.
+    """Display the outcome of activating one or more workbenches.
 
     Args:
-        summary: Dict with keys: name, source, git_branch, repos.
+        summary: Dict with keys: workbenches (each with name, source,
+                 git_branch, repos, error), failures.
     """
-    name = summary["name"]
-    source = summary["source"]
-    git_branch = summary["git_branch"]
-    repos: list[dict[str, str]] = summary.get("repos", [])  # type: ignore[assignment]
+    workbenches: list[dict[str, object]] = summary["workbenches"]  # type: ignore[assignment]
+    if not workbenches:
+        console.print(f"[dim]{_NO_MATCH_MESSAGE}[/dim]")
+        return
 
-    console.print(f'[bold green]Workbench "{name}" activated successfully[/bold green]')
-    console.print(f"  Source: [cyan]{source}[/cyan]")
-    console.print(f"  Git branch: [cyan]{git_branch}[/cyan]")
+    for workbench in workbenches:
+        name = workbench["name"]
+        if workbench["error"]:
+            console.print(f'[bold red]Workbench "{name}" not activated[/bold red]')
+            console.print(f"  [red]{workbench['error']}[/red]")
+            continue
 
-    if repos:
-        console.print("  Repositories:")
-        for repo in repos:
-            console.print(
-                f"    [bold]{repo['dir']}[/bold] -> [dim]{repo['worktree_path']}[/dim]"
-            )
+        repos: list[dict[str, str]] = workbench.get("repos", [])  # type: ignore[assignment]
+        console.print(
+            f'[bold green]Workbench "{name}" activated successfully[/bold green]'
+        )
+        console.print(f"  Source: [cyan]{workbench['source']}[/cyan]")
+        console.print(f"  Git branch: [cyan]{workbench['git_branch']}[/cyan]")
+
+        if repos:
+            console.print("  Repositories:")
+            for repo in repos:
+                console.print(
+                    f"    [bold]{repo['dir']}[/bold] -> [dim]{repo['worktree_path']}[/dim]"
+                )
+
+    _display_bulk_total(len(workbenches), summary["failures"], "activated")  # type: ignore[arg-type]
 
 
 def display_workbench_updated(message: str) -> None:
@@ -67,42 +91,120 @@ def display_workbench_updated(message: str) -> None:
     console.print(f"[bold green]{message}[/bold green]")
 
 
+def _display_teardown_table(
+    repos: list[dict[str, str | None]], show_branch: bool
+) -> None:
+    """Display the per-repo outcome of a workbench teardown as a table."""
+    if not repos:
+        return
+
+    table = Table(show_header=True, header_style="bold", box=None, padding=(0, 2))
+    table.add_column("Repo", style="cyan")
+    table.add_column("Worktree")
+    if show_branch:
+        table.add_column("Branch")
+    table.add_column("Error", style="red")
+
+    for repo in repos:
+        row = [repo["dir"] or "", _TEARDOWN_OUTCOMES[repo["worktree"] or "absent"]]
+        if show_branch:
+            row.append(_TEARDOWN_OUTCOMES[repo["branch"] or "absent"])
+        row.append(repo["error"] or "")
+        table.add_row(*row)
+
+    console.print(table)
+
+
+def _display_bulk_total(selected: int, failures: int, action: str) -> None:
+    """Display a closing count line when several workbenches were processed."""
+    if selected < 2:
+        return
+    if failures:
+        console.print(
+            f"[bold yellow]{selected} workbenches {action}, {failures} with "
+            f"failures[/bold yellow]"
+        )
+    else:
+        console.print(f"[bold green]{selected} workbenches {action}[/bold green]")
+
+
 def display_workbench_retired(summary: dict[str, object]) -> None:
-    """Display a success message after workbench retirement.
+    """Display the outcome of retiring one or more workbenches.
 
     Args:
-        summary: Dict with keys: name, repos_pruned, bench_dir_preserved.
+        summary: Dict with keys: workbenches (each with name, repos, error,
+                 bench_dir_preserved), failures.
     """
-    name = summary["name"]
-    repos_pruned = summary["repos_pruned"]
-    bench_dir = summary["bench_dir_preserved"]
+    workbenches: list[dict[str, object]] = summary["workbenches"]  # type: ignore[assignment]
+    if not workbenches:
+        console.print(f"[dim]{_NO_MATCH_MESSAGE}[/dim]")
+        return
 
-    console.print(f'[bold green]Workbench "{name}" retired successfully[/bold green]')
-    console.print(f"  Repos pruned: [cyan]{repos_pruned}[/cyan]")
-    console.print(f"  Preserved: [dim]{bench_dir}[/dim]")
+    for workbench in workbenches:
+        name = workbench["name"]
+        repos: list[dict[str, str | None]] = workbench["repos"]  # type: ignore[assignment]
+        failures = sum(1 for repo in repos if repo["error"])
+
+        if workbench["error"]:
+            console.print(f'[bold red]Workbench "{name}" not retired[/bold red]')
+            _display_teardown_table(repos, show_branch=False)
+            console.print(f"  [red]{workbench['error']}[/red]")
+            continue
+        if failures:
+            console.print(
+                f'[bold yellow]Workbench "{name}" retired with {failures} failed '
+                f"repo(s)[/bold yellow]"
+            )
+        else:
+            console.print(
+                f'[bold green]Workbench "{name}" retired successfully[/bold green]'
+            )
+        _display_teardown_table(repos, show_branch=False)
+        console.print(f"  Preserved: [dim]{workbench['bench_dir_preserved']}[/dim]")
+
+    _display_bulk_total(len(workbenches), summary["failures"], "retired")  # type: ignore[arg-type]
 
 
 def display_workbench_deleted(summary: dict[str, object]) -> None:
-    """Display a success message after workbench deletion.
+    """Display the outcome of deleting one or more workbenches.
 
     Args:
-        summary: Dict with keys: name, was_active, workspace_removed,
-                 scaffold_removed, branches_deleted.
+        summary: Dict with keys: workbenches (each with name, was_active,
+                 workspace_removed, scaffold_removed, branches_deleted, repos,
+                 error), failures.
     """
-    name = summary["name"]
-    was_active = summary["was_active"]
-    workspace_removed = summary["workspace_removed"]
-    scaffold_removed = summary["scaffold_removed"]
-    branches_deleted: list[str] = summary.get("branches_deleted", [])  # type: ignore[assignment]
-
-    console.print(f'[bold green]Workbench "{name}" deleted successfully[/bold green]')
-    if was_active:
-        console.print(f"  Workspace removed: [dim]{workspace_removed}[/dim]")
-    console.print(f"  Scaffold removed: [dim]{scaffold_removed}[/dim]")
-    if branches_deleted:
-        console.print(f"  Branches deleted: [cyan]{', '.join(branches_deleted)}[/cyan]")
-    else:
-        console.print("  Branches deleted: [dim]none[/dim]")
+    workbenches: list[dict[str, object]] = summary["workbenches"]  # type: ignore[assignment]
+    if not workbenches:
+        console.print(f"[dim]{_NO_MATCH_MESSAGE}[/dim]")
+        return
+
+    for workbench in workbenches:
+        name = workbench["name"]
+        repos: list[dict[str, str | None]] = workbench["repos"]  # type: ignore[assignment]
+        failures = sum(1 for repo in repos if repo["error"])
+
+        if workbench["error"]:
+            console.print(f'[bold red]Workbench "{name}" not deleted[/bold red]')
+            _display_teardown_table(repos, show_branch=True)
+            console.print(f"  [red]{workbench['error']}[/red]")
+            continue
+        if failures:
+            console.print(
+                f'[bold yellow]Workbench "{name}" deleted with {failures} failed '
+                f"repo(s)[/bold yellow]"
+            )
+        else:
+            console.print(
+                f'[bold green]Workbench "{name}" deleted successfully[/bold green]'
+            )
+        _display_teardown_table(repos, show_branch=True)
+        if workbench["workspace_removed"]:
+            console.print(
+                f"  Workspace removed: [dim]{workbench['workspace_removed']}[/dim]"
+            )
+        console.print(f"  Scaffold removed: [dim]{workbench['scaffold_removed']}[/dim]")
+
+    _display_bulk_total(len(workbenches), summary["failures"], "deleted")  # type: ignore[arg-type]
 
 
 def display_workbench_list(
@@ -155,24 +257,113 @@ def display_workbench_list(
     console.print(table)
 
 
+def display_worktree_created(repo_dir: str) -> None:
+    """Display a progress message after a repo's worktree is created."""
+    console.print(f"  Worktree for [cyan]{repo_dir}[/cyan] created")
+
+
+def display_worktree_failed(repo_dir: str, message: str) -> None:
+    """Display a progress message when a repo's worktree could not be created."""
+    console.print(
+        f"  [bold red]Failed:[/bold red] worktree for [cyan]{repo_dir}[/cyan]: {message}"
+    )
+
+
+def display_worktree_rolled_back(repo_dir: str) -> None:
+    """Display a message after a repo's worktree is removed during rollback."""
+    console.print(f"  [dim]Rolled back worktree for[/dim] [cyan]{repo_dir}[/cyan]")
+
+
+def display_teardown_progress(repo_dir: str, step: str, error: str | None) -> None:
+    """Display a progress message as a teardown step finishes for one repo.
+
+    Args:
+        repo_dir: The repository directory name.
+        step: The step that finished: "worktree" or "branch".
+        error: The error message if the step failed, otherwise None.
+    """
+    if error is not None:
+        console.print(
+            f"  [bold red]Failed:[/bold red] {step} for [cyan]{repo_dir}[/cyan]: {error}"
+        )
+    elif step == "worktree":
+        console.print(f"  Worktree for [cyan]{repo_dir}[/cyan] removed")
+    else:
+        console.print(f"  Branch in [cyan]{repo_dir}[/cyan] deleted")
+
+
+def _format_script_duration(seconds: float) -> str:
+    """Format a script's run time as "12.3s" or "4m 05s"."""
+    if seconds < 60:
+        return f"{seconds:.1f}s"
+    minutes, secs = divmod(round(seconds), 60)
+    return f"{minutes}m {secs:02d}s"
+
+
+def display_scripts_concurrent(max_scripts: int) -> None:
+    """Display a message before running independent setup scripts concurrently."""
+    console.print(
+        f"  [cyan]Running independent scripts concurrently (up to {max_scripts} "
+        f"at a time); output lines are prefixed with the script name[/cyan]"
+    )
+
+
 def display_script_running(script_name: str) -> None:
     """Display a message before running a script."""
     console.print(f"  Running script [cyan]{script_name}[/cyan]...")
 
 
-def display_script_completed(script_name: str) -> None:
+def display_script_output(script_name: str, line: str) -> None:
+    """Display a line of a script's captured output, prefixed with its name."""
+    console.print(
+        f"  [dim]\\[{escape(script_name)}][/dim] {escape(line)}", highlight=False
+    )
+
+
+def display_script_completed(script_name: str, duration: float) -> None:
     """Display a message after a script completes successfully."""
-    console.print(f"  Script [cyan]{script_name}[/cyan] completed")
+    console.print(
+        f"  Script [cyan]{script_name}[/cyan] completed "
+        f"in {_format_script_duration(duration)}"
+    )
 
 
-def display_script_failed(script_name: str, exit_code: int) -> None:
+def display_script_failed(script_name: str, exit_code: int, duration: float) -> None:
     """Display a warning when a script fails."""
     console.print(
         f"  [bold yellow]Warning:[/bold yellow] Script [cyan]{script_name}[/cyan] "
-        f"failed (exit code {exit_code})"
+        f"failed (exit code {exit_code}) after {_format_script_duration(duration)}"
+    )
+
+
+def display_script_timed_out(script_name: str, duration: float) -> None:
+    """Display a warning when a script is stopped at its time limit."""
+    console.print(
+        f"  [bold yellow]Warning:[/bold yellow] Script [cyan]{script_name}[/cyan] "
+        f"timed out and was stopped after {_format_script_duration(duration)}"
+    )
+
+
+def display_script_skipped(script_name: str, reason: str) -> None:
+    """Display a warning when a script is not run."""
+    console.print(
+        f"  [bold yellow]Warning:[/bold yellow] Script [cyan]{script_name}[/cyan] "
+        f"skipped: {reason}"
     )
 
 
+def display_scripts_invalid(message: str) -> None:
+    """Display a warning when the setup scripts cannot be run as declared."""
+    console.print(
+        f"  [bold yellow]Warning:[/bold yellow] Setup scripts not run: {message}"
+    )
+
+
+def display_scripts_finished(count: int, duration: float) -> None:
+    """Display the total run time of the setup scripts."""
+    console.print(f"  Ran {count} script(s) in {_format_script_duration(duration)}")
+
+
 def display_script_not_executable(script_name: str) -> None:
     """Display a warning when a script is not executable."""
     console.print(